@@ -0,0 +1,163 @@
+"""
+Samurai pose baker for TDG
+
+Bakes every frame of the clips in samurai-animations.json into per-channel
+2D affine matrices, so the enemy animators can look a pose up instead of
+interpolating keyframes and composing pivot transforms for every enemy on
+every frame.
+
+Each channel matrix is the full canvas transform for that part,
+    translate(pivot + offset) * rotate(rot) * translate(-pivot)
+stored as the (a, b, c, d, e, f) arguments of ctx.transform(), so the part
+rectangle is drawn at its rest position with no pivot maths at runtime.
+Keyframes are resampled SUBSTEPS times per key. A channel value a key
+leaves out is the rest pose (0), so limbs ease back instead of popping at
+the next key; clips with "loop": false hold their last key.
+
+Output (little-endian):
+    'TDGP'  u16 version  u16 reserved  u32 header bytes
+    header  UTF-8 JSON, space padded to a 4 byte boundary
+    data    float32 frames; each frame is 6 floats per channel followed
+            by opacity and flash (0/1)
+
+The header lists the channel order, the runtime pivots, and for each channel
+the Blender parts it drives (create_samurai_enemy.PART_CHANNELS) with their
+model-space joint, so offline renderers can pose the 3D parts too.
+
+Usage:
+    python bake_samurai_poses.py
+    python bake_samurai_poses.py --substeps 8 -o ../animation/samurai-poses.bin
+"""
+
+import argparse
+import json
+import math
+import os
+import struct
+import sys
+from array import array
+
+from create_samurai_enemy import PART_CHANNELS, channel_pivot
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ANIMATIONS = os.path.normpath(os.path.join(HERE, '..', 'animation', 'samurai-animations.json'))
+OUTPUT = os.path.normpath(os.path.join(HERE, '..', 'animation', 'samurai-poses.bin'))
+
+MAGIC = b'TDGP'
+VERSION = 1
+SUBSTEPS = 4
+
+# Channel order and runtime pivots (sprite pixels) - must match PIVOTS in
+# src/entities/enemyAnimator.js and src/animation/enemyAnimators/SamuraiAnimator.js
+CHANNELS = ['torso', 'head', 'helmet', 'lLeg', 'rLeg', 'lArm', 'rArm', 'blade', 'handle']
+RUNTIME_PIVOTS = {
+    'torso': (0, -40), 'head': (0, -82), 'helmet': (0, -100),
+    'lLeg': (-8, -10), 'rLeg': (8, -10),
+    'lArm': (-28, -55), 'rArm': (23, -55),
+    'blade': (22, -45), 'handle': (22, -18),
+}
+FRAME_FLOATS = 6 * len(CHANNELS) + 2
+
+
+def _number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def lerp_frame(a, b, t):
+    """Blend two keyframes. Channel values missing from either key are the
+    rest pose (0); flags set on *a* snap at t = 0.5 like lerpFrame()."""
+    out = {}
+    for key in list(a) + [k for k in b if k not in a]:
+        va, vb = a.get(key), b.get(key)
+        if isinstance(va, dict) or isinstance(vb, dict):
+            va, vb = va or {}, vb or {}
+            out[key] = {prop: (va.get(prop) or 0) + ((vb.get(prop) or 0) - (va.get(prop) or 0)) * t
+                        for prop in list(va) + [p for p in vb if p not in va]
+                        if _number(va.get(prop, 0)) and _number(vb.get(prop, 0))}
+        elif _number(va):
+            out[key] = va + ((va if vb is None else vb) - va) * t
+        elif key in a:
+            out[key] = va if t < 0.5 else vb
+    return out
+
+
+def channel_matrix(channel, data):
+    """ctx.transform() arguments for one channel of an interpolated frame."""
+    px, py = RUNTIME_PIVOTS[channel]
+    rot = math.radians(data.get('rot') or 0)
+    ox, oy = data.get('x') or 0, data.get('y') or 0
+    c, s = math.cos(rot), math.sin(rot)
+    return (c, s, -s, c, px + ox - (c * px - s * py), py + oy - (s * px + c * py))
+
+
+def bake_clip(clip, substeps=SUBSTEPS):
+    """Float32 frames for one clip."""
+    keys = clip['frames']
+    data = array('f')
+    for i in range(len(keys) * substeps):
+        k, t = divmod(i, substeps)
+        nxt = (k + 1) % len(keys) if clip.get('loop', True) else min(k + 1, len(keys) - 1)
+        frame = lerp_frame(keys[k], keys[nxt], t / substeps)
+        for channel in CHANNELS:
+            data.extend(channel_matrix(channel, frame.get(channel) or {}))
+        data.append(frame.get('opacity', 1))
+        data.append(1.0 if frame.get('flash') else 0.0)
+    return data
+
+
+def bake(animations, substeps=SUBSTEPS):
+    """Return (header dict, float32 array) for every clip."""
+    data = array('f')
+    clips = {}
+    for name, clip in animations.items():
+        frames = bake_clip(clip, substeps)
+        clips[name] = {
+            'offset': len(data) // FRAME_FLOATS,
+            'frames': len(frames) // FRAME_FLOATS,
+            'fps': clip.get('defaultSpeed', 8) * substeps,
+            'loop': clip.get('loop', True),
+        }
+        data.extend(frames)
+    parts = {ch: {'parts': [p for p, c in PART_CHANNELS.items() if c == ch],
+                  'joint': [round(v, 4) for v in channel_pivot(ch)]} for ch in CHANNELS}
+    header = {
+        'channels': CHANNELS,
+        'frameFloats': FRAME_FLOATS,
+        'substeps': substeps,
+        'pivots': {ch: list(RUNTIME_PIVOTS[ch]) for ch in CHANNELS},
+        'parts': parts,
+        'clips': clips,
+    }
+    return header, data
+
+
+def write_bank(path, header, data):
+    blob = json.dumps(header, separators=(',', ':')).encode('utf-8')
+    blob += b' ' * (-len(blob) % 4)
+    if sys.byteorder == 'big':
+        data = array('f', data)
+        data.byteswap()
+    with open(path, 'wb') as f:
+        f.write(MAGIC + struct.pack('<HHI', VERSION, 0, len(blob)))
+        f.write(blob)
+        f.write(data.tobytes())
+    return 12 + len(blob) + len(data) * 4
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Bake samurai keyframes into per-part affine matrices.")
+    ap.add_argument('animations', nargs='?', default=ANIMATIONS)
+    ap.add_argument('-o', '--output', default=OUTPUT)
+    ap.add_argument('--substeps', type=int, default=SUBSTEPS, help="baked frames per keyframe")
+    args = ap.parse_args()
+
+    with open(args.animations) as f:
+        animations = json.load(f)
+    header, data = bake(animations, args.substeps)
+    size = write_bank(args.output, header, data)
+    clips = ", ".join(f"{n} {c['frames']}f" for n, c in header['clips'].items())
+    print(f"Written {args.output}: {clips}, {size} bytes")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,260 @@
+"""
+Keyframe animation compiler for TDG
+
+Animation JSON repeats every channel on every key, including empty {}
+entries and values that never change, and is parsed into a deep object
+graph at startup. This compiler turns each clip into sparse per-channel
+curves in a few flat typed arrays:
+
+  1. clips     any object with a "frames" or "keyframes" list of objects
+               (samurai-animations.json clips, church tower tier animations)
+  2. resample  every channel (lLeg.rot, bell.rotation, glow, flash, ...) is
+               put on the full key grid; looping clips get a closing key
+               equal to the first so the wrap segment is explicit
+  3. fit       numeric channels become piecewise-linear curves: a key is
+               dropped when the segment around it stays within --tolerance
+               of every original key; flags keep only the keys where they
+               change; channels that are 0 throughout are dropped
+
+Missing values follow the runtime rules: a part value a key leaves out is
+the rest pose (0), a top-level number holds its last value, and a flag is
+off unless the key sets it.
+
+Output (.anim.bin, little-endian):
+    'TDGA'  u16 version  u16 reserved  u32 header bytes
+    header  UTF-8 JSON {names, clips, channelCount, keyCount}, space padded
+            to a 4 byte boundary
+    table   u32 x 4 per channel: name index, interp, first key, key count
+    times   float32 key positions (keyframe units, like EnemyAnimator.time)
+    values  float32 key values
+
+interp is 0 for a linear curve and 1 for a flag. Like EnemyAnimator.lerpFrame,
+a flag comes on at its key and goes off half a key before the key clearing it.
+
+Usage:
+    python compile_animations.py                      # samurai + church tower
+    python compile_animations.py samurai-animations.json --tolerance 0.1
+"""
+
+import argparse
+import json
+import os
+import struct
+import sys
+import timeit
+from array import array
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_SOURCES = [
+    os.path.normpath(os.path.join(HERE, '..', 'animation', 'samurai-animations.json')),
+    os.path.normpath(os.path.join(HERE, '..', '..', 'towers', 'church_tower_config.json')),
+]
+
+MAGIC = b'TDGA'
+VERSION = 1
+TOLERANCE = 0.01
+
+LINEAR, FLAG = 0, 1
+
+
+def _number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+# ─── Clips ───────────────────────────────────────────────────────
+
+def find_clips(doc, path=()):
+    """Yield (name, clip dict, key list) for every keyframed clip in *doc*."""
+    if not isinstance(doc, dict):
+        return
+    for field in ('frames', 'keyframes'):
+        keys = doc.get(field)
+        if isinstance(keys, list) and keys and all(isinstance(k, dict) for k in keys):
+            yield '.'.join(path), doc, keys
+            return
+    for name, value in doc.items():
+        yield from find_clips(value, path + (name,))
+
+
+def channel_kinds(keys):
+    """Channel path -> interp for every animated value in a key list."""
+    kinds = {}
+    for key in keys:
+        for name, value in key.items():
+            items = value.items() if isinstance(value, dict) else [(None, value)]
+            for prop, v in items:
+                path = name if prop is None else f'{name}.{prop}'
+                if isinstance(v, bool):
+                    kinds[path] = FLAG
+                elif _number(v):
+                    kinds.setdefault(path, LINEAR)
+    return kinds
+
+
+def resample(keys, path, kind, loop):
+    """Channel value on every key (plus the closing key of a loop)."""
+    name, _, prop = path.partition('.')
+    raw = []
+    for key in keys:
+        value = key.get(name)
+        if prop:
+            value = value.get(prop) if isinstance(value, dict) else None
+            raw.append(float(value or 0))
+        elif kind == FLAG:
+            raw.append(1.0 if value else 0.0)
+        else:
+            raw.append(None if value is None else float(value))
+    if None in raw:
+        # top-level numbers hold their last value (first defined one before that)
+        last = next(v for v in raw if v is not None)
+        for i, v in enumerate(raw):
+            raw[i] = last = last if v is None else v
+    if loop:
+        raw.append(raw[0])
+    return raw
+
+
+# ─── Curve fitting ───────────────────────────────────────────────
+
+def _within(values, i, j, tol):
+    """True if keys strictly between i and j lie within tol of the i-j line."""
+    vi, vj = values[i], values[j]
+    return all(abs(vi + (vj - vi) * (k - i) / (j - i) - values[k]) <= tol for k in range(i + 1, j))
+
+
+def fit_linear(values, tol=TOLERANCE):
+    """Indices of the keys a piecewise-linear curve needs to stay within tol."""
+    keep = [0]
+    i = 0
+    while i < len(values) - 1:
+        j = i + 1
+        while j + 1 < len(values) and _within(values, i, j + 1, tol):
+            j += 1
+        keep.append(j)
+        i = j
+    return keep
+
+
+def fit_step(values):
+    """Indices where a flag changes value."""
+    return [0] + [i for i in range(1, len(values)) if values[i] != values[i - 1]]
+
+
+def sample(times, values, kind, t):
+    """Value of a compiled curve at key position t (clamped to its ends)."""
+    if t <= times[0] or len(times) == 1:
+        return values[0]
+    for k in range(1, len(times)):
+        if t < times[k]:
+            if kind == FLAG:
+                return values[k - 1] if t < times[k] - 0.5 else min(values[k - 1], values[k])
+            f = (t - times[k - 1]) / (times[k] - times[k - 1])
+            return values[k - 1] + (values[k] - values[k - 1]) * f
+    return values[-1]
+
+
+# ─── Compile ─────────────────────────────────────────────────────
+
+def compile_doc(doc, tol=TOLERANCE):
+    """Return (header, table, times, values, stats) for every clip in *doc*."""
+    names, clips = [], []
+    table, times, values = array('I'), array('f'), array('f')
+    stats = {'keys_in': 0, 'keys_out': 0, 'dropped': 0, 'max_error': 0.0}
+
+    for clip_name, clip, keys in find_clips(doc):
+        loop = clip.get('loop', True)
+        fps = clip.get('fps', clip.get('defaultSpeed', 8))
+        first = len(table) // 4
+        for path, kind in sorted(channel_kinds(keys).items()):
+            grid = resample(keys, path, kind, loop)
+            stats['keys_in'] += len(keys)
+            if not any(grid):
+                stats['dropped'] += 1
+                continue
+            keep = fit_step(grid) if kind == FLAG else fit_linear(grid, tol)
+            kt, kv = [float(i) for i in keep], [grid[i] for i in keep]
+            err = max(abs(sample(kt, kv, kind, i) - v) for i, v in enumerate(grid))
+            stats['max_error'] = max(stats['max_error'], err)
+            stats['keys_out'] += len(keep)
+
+            if path not in names:
+                names.append(path)
+            table.extend((names.index(path), kind, len(times), len(keep)))
+            times.extend(kt)
+            values.extend(kv)
+        clips.append({'name': clip_name, 'fps': fps, 'loop': loop, 'length': len(keys),
+                      'first': first, 'count': len(table) // 4 - first})
+
+    header = {'names': names, 'clips': clips,
+              'channelCount': len(table) // 4, 'keyCount': len(times)}
+    return header, table, times, values, stats
+
+
+def pack(header, table, times, values):
+    """Serialise a compiled document to bytes."""
+    blob = json.dumps(header, separators=(',', ':')).encode('utf-8')
+    blob += b' ' * (-len(blob) % 4)
+    arrays = [array(a.typecode, a) for a in (table, times, values)]
+    if sys.byteorder == 'big':
+        for a in arrays:
+            a.byteswap()
+    return (MAGIC + struct.pack('<HHI', VERSION, 0, len(blob)) + blob
+            + b''.join(a.tobytes() for a in arrays))
+
+
+def unpack(data):
+    """Inverse of pack(); returns (header, table, times, values)."""
+    if data[:4] != MAGIC:
+        raise ValueError(f"not an animation pack (magic {data[:4]!r})")
+    _, _, size = struct.unpack_from('<HHI', data, 4)
+    header = json.loads(data[12:12 + size])
+    at = 12 + size
+    out = []
+    for code, count in (('I', header['channelCount'] * 4), ('f', header['keyCount']), ('f', header['keyCount'])):
+        a = array(code)
+        a.frombytes(data[at:at + count * 4])
+        if sys.byteorder == 'big':
+            a.byteswap()
+        out.append(a)
+        at += count * 4
+    return (header, *out)
+
+
+# ─── CLI ─────────────────────────────────────────────────────────
+
+def _parse_seconds(fn, repeat=200):
+    return min(timeit.repeat(fn, number=repeat, repeat=5)) / repeat
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Compile keyframe JSON into sparse typed-array curves.")
+    ap.add_argument('sources', nargs='*', default=DEFAULT_SOURCES)
+    ap.add_argument('--tolerance', type=float, default=TOLERANCE,
+                    help="max deviation from the source keys (value units)")
+    args = ap.parse_args()
+
+    for path in args.sources:
+        with open(path, 'rb') as f:
+            text = f.read()
+        doc = json.loads(text)
+        header, table, times, values, stats = compile_doc(doc, args.tolerance)
+        data = pack(header, table, times, values)
+        out = os.path.splitext(path)[0] + '.anim.bin'
+        with open(out, 'wb') as f:
+            f.write(data)
+
+        clip_json = sum(len(json.dumps(clip)) for _, clip, _ in find_clips(doc))
+        t_json = _parse_seconds(lambda: json.loads(text))
+        t_pack = _parse_seconds(lambda: unpack(data))
+        print(f"{os.path.basename(path)} -> {os.path.basename(out)}")
+        print(f"  clips {len(header['clips'])}, channels {header['channelCount']} "
+              f"({stats['dropped']} all-zero dropped), keys {stats['keys_in']} -> {stats['keys_out']}, "
+              f"max error {stats['max_error']:.4g}")
+        print(f"  size  {clip_json} B of clip json ({len(text)} B file) -> {len(data)} B "
+              f"({len(data) / clip_json:.0%})")
+        print(f"  parse {t_json * 1e6:.1f} us json.loads -> {t_pack * 1e6:.1f} us unpack "
+              f"({t_json / t_pack:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
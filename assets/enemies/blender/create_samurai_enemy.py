@@ -4,12 +4,17 @@ Creates a low-poly samurai model optimized for tower defense game
 Scale: 1 Blender unit = 1 game unit (adjust SCALE_FACTOR if needed)
 """
 
-import bpy
 import math
 
+try:
+    import bpy
+except ImportError:  # imported outside Blender for the part table (bake_samurai_poses.py)
+    bpy = None
+
 # Configuration
 SCALE_FACTOR = 1.0  # Adjust based on your game's unit scale
 PIXEL_ART_SIZE = 32  # Texture resolution (32x32 pixels)
+JOIN_PARTS = True  # False keeps every part as its own object, origin at its pivot
 
 # Color palette (RGB)
 COLORS = {
@@ -22,6 +27,65 @@ COLORS = {
     'handle': (0.102, 0.102, 0.102, 1.0),          # Black handle
 }
 
+# Part table: name -> (group, location, scale, color, rotation in degrees)
+# Cubes are added at size 2, so scale is the half extent on each axis.
+KATANA_TILT = (0, 25, 15)
+PARTS = {
+    # Body
+    "Torso":          ('body',   (0, 0, 0.8),        (0.35, 0.25, 0.6),  'armor_dark',   None),
+    "Chest_Armor":    ('body',   (0, -0.28, 0.9),    (0.38, 0.05, 0.5),  'armor_accent', None),
+    "Leg_Left":       ('body',   (-0.15, 0, 0.15),   (0.12, 0.12, 0.35), 'cloth_black',  None),
+    "Leg_Right":      ('body',   (0.15, 0, 0.15),    (0.12, 0.12, 0.35), 'cloth_black',  None),
+    "Foot_Left":      ('body',   (-0.15, 0.05, -0.15), (0.13, 0.18, 0.08), 'armor_dark', None),
+    "Foot_Right":     ('body',   (0.15, 0.05, -0.15),  (0.13, 0.18, 0.08), 'armor_dark', None),
+    # Arms (the right one holds the sword)
+    "Shoulder_Left":  ('arms',   (-0.45, 0, 1.2),    (0.15, 0.15, 0.2),  'armor_dark',   None),
+    "Arm_Left":       ('arms',   (-0.5, 0, 0.7),     (0.1, 0.1, 0.35),   'cloth_black',  None),
+    "Shoulder_Right": ('arms',   (0.45, 0, 1.2),     (0.15, 0.15, 0.2),  'armor_dark',   None),
+    "Arm_Right":      ('arms',   (0.5, 0, 0.7),      (0.1, 0.1, 0.35),   'cloth_black',  None),
+    # Head, helmet (kabuto), crest (maedate) and side horns
+    "Head":           ('head',   (0, 0, 1.65),       (0.25, 0.25, 0.25), 'skin',         None),
+    "Helmet":         ('head',   (0, 0, 1.85),       (0.32, 0.32, 0.15), 'helmet',       None),
+    "Helmet_Crest":   ('head',   (0, -0.35, 1.95),   (0.08, 0.08, 0.25), 'armor_accent', None),
+    "Horn_Left":      ('head',   (-0.28, 0, 1.9),    (0.06, 0.06, 0.15), 'metal',        None),
+    "Horn_Right":     ('head',   (0.28, 0, 1.9),     (0.06, 0.06, 0.15), 'metal',        None),
+    # Katana: blade, handle (tsuka), guard (tsuba)
+    "Katana_Blade":   ('katana', (0.55, 0.15, 0.9),  (0.04, 0.04, 0.5),  'metal',        KATANA_TILT),
+    "Katana_Handle":  ('katana', (0.52, 0.08, 0.35), (0.06, 0.06, 0.15), 'handle',       KATANA_TILT),
+    "Katana_Guard":   ('katana', (0.535, 0.12, 0.52), (0.12, 0.02, 0.12), 'armor_accent', KATANA_TILT),
+}
+
+# Animation channel (samurai-animations.json / SamuraiAnimator.js) driving each part
+PART_CHANNELS = {
+    "Torso": 'torso', "Chest_Armor": 'torso',
+    "Leg_Left": 'lLeg', "Foot_Left": 'lLeg', "Leg_Right": 'rLeg', "Foot_Right": 'rLeg',
+    "Shoulder_Left": 'lArm', "Arm_Left": 'lArm', "Shoulder_Right": 'rArm', "Arm_Right": 'rArm',
+    "Head": 'head',
+    "Helmet": 'helmet', "Helmet_Crest": 'helmet', "Horn_Left": 'helmet', "Horn_Right": 'helmet',
+    "Katana_Blade": 'blade', "Katana_Handle": 'handle', "Katana_Guard": 'handle',
+}
+
+# Joint each channel rotates about: (part, anchor) with anchor 'top', 'bottom' or 'center'
+CHANNEL_JOINTS = {
+    'torso': ("Torso", 'center'),
+    'head': ("Head", 'bottom'),
+    'helmet': ("Helmet", 'bottom'),
+    'lLeg': ("Leg_Left", 'top'),
+    'rLeg': ("Leg_Right", 'top'),
+    'lArm': ("Shoulder_Left", 'center'),
+    'rArm': ("Shoulder_Right", 'center'),
+    'blade': ("Katana_Guard", 'center'),
+    'handle': ("Katana_Guard", 'center'),
+}
+
+
+def channel_pivot(channel):
+    """Model-space (x, y, z) pivot of an animation channel."""
+    part, anchor = CHANNEL_JOINTS[channel]
+    _, (x, y, z), (_, _, sz), _, _ = PARTS[part]
+    return (x, y, z + {'top': sz, 'bottom': -sz, 'center': 0}[anchor])
+
+
 def clear_scene():
     """Clear all objects from the scene"""
     bpy.ops.object.select_all(action='SELECT')
@@ -62,193 +126,44 @@ def create_cube_at(location, scale, name, material=None):
     
     return obj
 
+def create_group(group, mats):
+    """Create every part of one PARTS group, in table order"""
+    parts = []
+    for name, (part_group, location, scale, color, rotation) in PARTS.items():
+        if part_group != group:
+            continue
+        obj = create_cube_at(location=location, scale=scale, name=name, material=mats[color])
+        if rotation:
+            obj.rotation_euler = tuple(math.radians(a) for a in rotation)
+        parts.append(obj)
+    return parts
+
 def create_samurai_body():
     """Create the main body structure"""
-    parts = []
-    
-    # Create materials
     mats = {key: create_material(f"Mat_{key}", color) for key, color in COLORS.items()}
-    
-    # Torso (main body)
-    torso = create_cube_at(
-        location=(0, 0, 0.8),
-        scale=(0.35, 0.25, 0.6),
-        name="Torso",
-        material=mats['armor_dark']
-    )
-    parts.append(torso)
-    
-    # Chest armor plate
-    chest = create_cube_at(
-        location=(0, -0.28, 0.9),
-        scale=(0.38, 0.05, 0.5),
-        name="Chest_Armor",
-        material=mats['armor_accent']
-    )
-    parts.append(chest)
-    
-    # Legs (2)
-    leg_left = create_cube_at(
-        location=(-0.15, 0, 0.15),
-        scale=(0.12, 0.12, 0.35),
-        name="Leg_Left",
-        material=mats['cloth_black']
-    )
-    parts.append(leg_left)
-    
-    leg_right = create_cube_at(
-        location=(0.15, 0, 0.15),
-        scale=(0.12, 0.12, 0.35),
-        name="Leg_Right",
-        material=mats['cloth_black']
-    )
-    parts.append(leg_right)
-    
-    # Feet
-    foot_left = create_cube_at(
-        location=(-0.15, 0.05, -0.15),
-        scale=(0.13, 0.18, 0.08),
-        name="Foot_Left",
-        material=mats['armor_dark']
-    )
-    parts.append(foot_left)
-    
-    foot_right = create_cube_at(
-        location=(0.15, 0.05, -0.15),
-        scale=(0.13, 0.18, 0.08),
-        name="Foot_Right",
-        material=mats['armor_dark']
-    )
-    parts.append(foot_right)
-    
-    return parts, mats
+    return create_group('body', mats), mats
 
 def create_samurai_arms(mats):
     """Create arms and shoulders"""
-    parts = []
-    
-    # Left arm
-    shoulder_left = create_cube_at(
-        location=(-0.45, 0, 1.2),
-        scale=(0.15, 0.15, 0.2),
-        name="Shoulder_Left",
-        material=mats['armor_dark']
-    )
-    parts.append(shoulder_left)
-    
-    arm_left = create_cube_at(
-        location=(-0.5, 0, 0.7),
-        scale=(0.1, 0.1, 0.35),
-        name="Arm_Left",
-        material=mats['cloth_black']
-    )
-    parts.append(arm_left)
-    
-    # Right arm (holding sword)
-    shoulder_right = create_cube_at(
-        location=(0.45, 0, 1.2),
-        scale=(0.15, 0.15, 0.2),
-        name="Shoulder_Right",
-        material=mats['armor_dark']
-    )
-    parts.append(shoulder_right)
-    
-    arm_right = create_cube_at(
-        location=(0.5, 0, 0.7),
-        scale=(0.1, 0.1, 0.35),
-        name="Arm_Right",
-        material=mats['cloth_black']
-    )
-    parts.append(arm_right)
-    
-    return parts
+    return create_group('arms', mats)
 
 def create_samurai_head(mats):
     """Create head and helmet"""
-    parts = []
-    
-    # Head
-    head = create_cube_at(
-        location=(0, 0, 1.65),
-        scale=(0.25, 0.25, 0.25),
-        name="Head",
-        material=mats['skin']
-    )
-    parts.append(head)
-    
-    # Helmet base (kabuto)
-    helmet = create_cube_at(
-        location=(0, 0, 1.85),
-        scale=(0.32, 0.32, 0.15),
-        name="Helmet",
-        material=mats['helmet']
-    )
-    parts.append(helmet)
-    
-    # Helmet crest (maedate) - front decoration
-    crest = create_cube_at(
-        location=(0, -0.35, 1.95),
-        scale=(0.08, 0.08, 0.25),
-        name="Helmet_Crest",
-        material=mats['armor_accent']
-    )
-    parts.append(crest)
-    
-    # Side horn decorations (optional, smaller)
-    horn_left = create_cube_at(
-        location=(-0.28, 0, 1.9),
-        scale=(0.06, 0.06, 0.15),
-        name="Horn_Left",
-        material=mats['metal']
-    )
-    parts.append(horn_left)
-    
-    horn_right = create_cube_at(
-        location=(0.28, 0, 1.9),
-        scale=(0.06, 0.06, 0.15),
-        name="Horn_Right",
-        material=mats['metal']
-    )
-    parts.append(horn_right)
-    
-    return parts
+    return create_group('head', mats)
 
 def create_katana(mats):
     """Create samurai sword (katana)"""
-    parts = []
-    
-    # Blade
-    blade = create_cube_at(
-        location=(0.55, 0.15, 0.9),
-        scale=(0.04, 0.04, 0.5),
-        name="Katana_Blade",
-        material=mats['metal']
-    )
-    # Rotate blade slightly
-    blade.rotation_euler = (0, math.radians(25), math.radians(15))
-    parts.append(blade)
-    
-    # Handle (tsuka)
-    handle = create_cube_at(
-        location=(0.52, 0.08, 0.35),
-        scale=(0.06, 0.06, 0.15),
-        name="Katana_Handle",
-        material=mats['handle']
-    )
-    handle.rotation_euler = (0, math.radians(25), math.radians(15))
-    parts.append(handle)
-    
-    # Guard (tsuba)
-    guard = create_cube_at(
-        location=(0.535, 0.12, 0.52),
-        scale=(0.12, 0.02, 0.12),
-        name="Katana_Guard",
-        material=mats['armor_accent']
-    )
-    guard.rotation_euler = (0, math.radians(25), math.radians(15))
-    parts.append(guard)
-    
-    return parts
+    return create_group('katana', mats)
+
+def set_part_pivots(parts):
+    """Move each separate part's origin to the joint of the channel that drives it"""
+    for part in parts:
+        bpy.context.scene.cursor.location = channel_pivot(PART_CHANNELS[part.name])
+        bpy.ops.object.select_all(action='DESELECT')
+        part.select_set(True)
+        bpy.context.view_layer.objects.active = part
+        bpy.ops.object.origin_set(type='ORIGIN_CURSOR')
+    bpy.context.scene.cursor.location = (0, 0, 0)
 
 def create_full_samurai():
     """Create complete samurai enemy model"""
@@ -272,6 +187,11 @@ def create_full_samurai():
     weapon_parts = create_katana(mats)
     all_parts.extend(weapon_parts)
     
+    if not JOIN_PARTS:
+        set_part_pivots(all_parts)
+        print(f"✓ Samurai enemy created: {len(all_parts)} separate parts")
+        return all_parts
+
     # Select all parts and join them
     bpy.ops.object.select_all(action='DESELECT')
     for part in all_parts:
@@ -413,4 +333,6 @@ def main():
     print("  ✓ Game-ready scale")
 
 if __name__ == "__main__":
+    if bpy is None:
+        raise SystemExit("Run this script inside Blender: blender --python create_samurai_enemy.py")
     main()
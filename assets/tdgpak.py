@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Asset pack (.tdgpak): one memory-mappable file for the game's loose assets.
+
+The Electron build opened and parsed dozens of files at startup (tower
+OBJ/MTL, animation JSON and binaries, sprite atlases, maps, waves). The
+packer bundles them into one archive that the game reads once and slices
+lazily (src/core/assetPack.js):
+
+  'TDPK', u16 version, u16 reserved, u32 index length
+  index       JSON, padded with spaces to ALIGN bytes:
+              {"align": 64, "entries": [{"name", "offset", "length",
+               "size", "codec", "crc32"}]}
+  payloads    each starting at a multiple of ALIGN from the file start
+
+name is the path relative to the repo root with '/' separators, exactly as
+the game fetches it ('maps/spiral.json'). offset/length locate the stored
+bytes, size is the unpacked size and crc32 covers the unpacked bytes.
+codec is 'none' or 'deflate' (zlib stream, DecompressionStream('deflate')
+in the browser). Aligned raw payloads can be viewed as typed arrays in
+place; with --compress auto only text formats that shrink by at least
+MIN_SAVING are deflated.
+
+Usage:
+  python tdgpak.py build                       # -> assets/game.tdgpak
+  python tdgpak.py build --compress none -o /tmp/raw.tdgpak
+  python tdgpak.py list assets/game.tdgpak
+  python tdgpak.py extract assets/game.tdgpak maps/spiral.json -o spiral.json
+"""
+
+import argparse
+import glob
+import json
+import mmap
+import os
+import struct
+import sys
+import zlib
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+OUTPUT = os.path.join(HERE, 'game.tdgpak')
+
+MAGIC = b'TDPK'
+VERSION = 1
+ALIGN = 64              # payload alignment (bytes); covers Float64 views and cache lines
+MIN_SAVING = 0.1        # --compress auto: deflate only when it saves this fraction
+TEXT_TYPES = ('.obj', '.mtl', '.json', '.jsx', '.js')
+
+# what the game loads, relative to the repo root
+INCLUDE = (
+    'assets/towers/models/*.obj',
+    'assets/towers/models/*.mtl',
+    'assets/towers/models/*.meta.json',
+    'assets/towers/models/*.delta.json',
+    'assets/towers/animation/*.png',
+    'assets/towers/*.anim.bin',
+    'assets/towers/church_tower_config.json',
+    'assets/enemies/*.png',
+    'assets/enemies/*.obj',
+    'assets/enemies/*.mtl',
+    'assets/enemies/animation/*.json',
+    'assets/enemies/animation/*.bin',
+    'maps/*.json',
+    'maps/*.bin',
+    'maps/backgrounds/*',
+    'data/*.json',
+)
+# precompress.mjs siblings of the text assets; the pack deflates on its own
+EXCLUDE = ('.gz', '.br')
+
+
+# ─── Writing ─────────────────────────────────────────────────────
+
+def collect(patterns=INCLUDE, root=ROOT, exclude=EXCLUDE):
+    """Sorted repo-relative names of the files matched by *patterns*, minus
+    names ending in *exclude*."""
+    names = set()
+    for pattern in patterns:
+        for path in glob.glob(os.path.join(root, pattern)):
+            if os.path.isfile(path) and not path.endswith(exclude):
+                names.add(os.path.relpath(path, root).replace(os.sep, '/'))
+    return sorted(names)
+
+
+def _encode(name, data, compress):
+    if compress == 'none' or not data:
+        return 'none', data
+    if compress == 'auto' and not name.endswith(TEXT_TYPES):
+        return 'none', data
+    packed = zlib.compress(data, 9)
+    if compress == 'auto' and len(packed) > len(data) * (1 - MIN_SAVING):
+        return 'none', data
+    return 'deflate', packed
+
+
+def _index_blob(entries, align):
+    blob = json.dumps({'align': align, 'entries': entries}, separators=(',', ':')).encode('utf-8')
+    return blob + b' ' * (-(12 + len(blob)) % align)
+
+
+def write_pack(path, files, compress='auto', align=ALIGN):
+    """Write *files* ({name: bytes}) to *path*; returns the index entries."""
+    entries, payloads = [], []
+    for name in sorted(files):
+        data = files[name]
+        codec, stored = _encode(name, data, compress)
+        entries.append({'name': name, 'offset': 0, 'length': len(stored), 'size': len(data),
+                        'codec': codec, 'crc32': zlib.crc32(data) & 0xffffffff})
+        payloads.append(stored)
+
+    # offsets change the index length and the index length moves the offsets: settle both
+    blob = b''
+    while True:
+        at = 12 + len(blob)
+        for entry in entries:
+            at += -at % align
+            entry['offset'] = at
+            at += entry['length']
+        settled = len(blob)
+        blob = _index_blob(entries, align)
+        if len(blob) == settled:
+            break
+
+    with open(path, 'wb') as f:
+        f.write(MAGIC + struct.pack('<HHI', VERSION, 0, len(blob)) + blob)
+        for entry, stored in zip(entries, payloads):
+            f.write(b'\0' * (entry['offset'] - f.tell()))
+            f.write(stored)
+    return entries
+
+
+# ─── Reading ─────────────────────────────────────────────────────
+
+class AssetPack:
+    """Random access to a .tdgpak through mmap. Use as a context manager."""
+
+    def __init__(self, path):
+        self._file = open(path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic = self._map[:4]
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"not an asset pack (magic {magic!r})")
+        self.version, _, size = struct.unpack_from('<HHI', self._map, 4)
+        index = json.loads(self._map[12:12 + size])
+        self.align = index['align']
+        self.entries = {e['name']: e for e in index['entries']}
+
+    def __contains__(self, name):
+        return name in self.entries
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def view(self, name):
+        """Stored bytes of an entry as a zero-copy memoryview (compressed if deflated)."""
+        e = self.entries[name]
+        return memoryview(self._map)[e['offset']:e['offset'] + e['length']]
+
+    def read(self, name, verify=False):
+        """Unpacked bytes of an entry."""
+        e = self.entries[name]
+        view = self.view(name)
+        try:
+            data = zlib.decompress(view) if e['codec'] == 'deflate' else bytes(view)
+        finally:
+            view.release()
+        if verify and zlib.crc32(data) & 0xffffffff != e['crc32']:
+            raise ValueError(f"{name}: checksum mismatch")
+        return data
+
+    def close(self):
+        if not self._map.closed:
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# ─── CLI ─────────────────────────────────────────────────────────
+
+def _build(args):
+    names = collect(args.include or INCLUDE)
+    output = os.path.abspath(args.output)
+    names = [n for n in names if os.path.join(ROOT, n) != output and not n.endswith('.tdgpak')]
+    files = {}
+    for name in names:
+        with open(os.path.join(ROOT, name), 'rb') as f:
+            files[name] = f.read()
+    entries = write_pack(output, files, args.compress, args.align)
+    raw = sum(e['size'] for e in entries)
+    deflated = sum(e['codec'] == 'deflate' for e in entries)
+    print(f"{len(entries)} files, {raw} B -> {os.path.getsize(output)} B "
+          f"({deflated} deflated) -> {output}")
+
+
+def _list(args):
+    with AssetPack(args.pack) as pack:
+        for name, e in pack.entries.items():
+            print(f"{e['offset']:>10} {e['length']:>9} {e['size']:>9} {e['codec']:<8} {name}")
+
+
+def _extract(args):
+    with AssetPack(args.pack) as pack:
+        data = pack.read(args.name, verify=True)
+    if args.output:
+        with open(args.output, 'wb') as f:
+            f.write(data)
+    else:
+        sys.stdout.buffer.write(data)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Build and inspect .tdgpak asset packs.")
+    sub = ap.add_subparsers(dest='command', required=True)
+    b = sub.add_parser('build', help="pack the game's assets")
+    b.add_argument('-o', '--output', default=OUTPUT)
+    b.add_argument('--compress', choices=('auto', 'none', 'all'), default='auto')
+    b.add_argument('--align', type=int, default=ALIGN)
+    b.add_argument('--include', action='append', help="glob relative to the repo root (repeatable)")
+    b.set_defaults(run=_build)
+    li = sub.add_parser('list', help="print the index")
+    li.add_argument('pack')
+    li.set_defaults(run=_list)
+    ex = sub.add_parser('extract', help="write one entry to a file or stdout")
+    ex.add_argument('pack')
+    ex.add_argument('name')
+    ex.add_argument('-o', '--output')
+    ex.set_defaults(run=_extract)
+    args = ap.parse_args()
+    args.run(args)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,288 @@
-import base64, sys
-b64 = sys.stdin.read().strip()
-data = base64.b64decode(b64)
-with open(r'C:\Users\Adam Murphy\AI\TDG\assets\towers\models\basic_t2.obj', 'wb') as f:
-    f.write(data)
-print(f'Written {len(data)} bytes')
+#!/usr/bin/env python3
+"""
+Move files through a pipe as one base64 stream, decoded in fixed-size chunks.
+
+The stream carries any number of files, each framed with its name, length
+and CRC-32:
+
+  'TDGS', u16 version, u16 reserved
+  per file:   u16 name length, name (UTF-8, '/' separators, relative),
+              u64 payload length, payload, u32 crc32 of the payload
+  end:        u16 0
+
+The whole stream is base64 text (whitespace ignored) unless --raw is given.
+Memory stays bounded at roughly CHUNK * (MAX_PENDING + 2) however large the
+files are: input is decoded CHUNK bytes at a time and payload chunks are
+handed to a pool of writer threads. Files are written to '<name>.part' and
+renamed once the checksum matches; a mismatch removes the partial file and
+makes the tool exit non-zero.
+
+Usage:
+  python _decode.py < stream.b64                      # files land in the cwd
+  python _decode.py -C assets/towers/models < stream.b64
+  python _decode.py --encode basic_t2.obj basic_t2.mtl > stream.b64
+  python _decode.py --single basic_t2.obj < plain.b64 # one bare base64 file
+"""
+
+import argparse
+import base64
+import os
+import struct
+import sys
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+MAGIC = b'TDGS'
+VERSION = 1
+CHUNK = 1 << 20         # decoded bytes per read / write
+MAX_PENDING = 8         # payload chunks queued for the writers
+WORKERS = 4
+LINE = 76               # base64 line length when encoding
+WHITESPACE = b' \t\r\n'
+
+
+# ─── Input ───────────────────────────────────────────────────────
+
+def base64_chunks(stream, chunk=CHUNK):
+    """Decoded bytes of a base64 text *stream*, about *chunk* bytes at a time."""
+    carry = b''
+    while True:
+        text = stream.read(chunk * 4 // 3)
+        if not text:
+            break
+        text = carry + text.translate(None, WHITESPACE)
+        cut = len(text) - len(text) % 4
+        carry = text[cut:]
+        if cut:
+            yield base64.b64decode(text[:cut], validate=True)
+    if carry:
+        raise ValueError(f"truncated base64 input ({len(carry)} trailing characters)")
+
+
+def raw_chunks(stream, chunk=CHUNK):
+    while True:
+        data = stream.read(chunk)
+        if not data:
+            break
+        yield data
+
+
+class Reader:
+    """Exact-length reads over an iterator of byte chunks."""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._buffer = bytearray()
+
+    def _fill(self, n):
+        while len(self._buffer) < n:
+            data = next(self._chunks, None)
+            if data is None:
+                raise ValueError(f"stream ended early (wanted {n} bytes, have {len(self._buffer)})")
+            self._buffer += data
+
+    def read(self, n):
+        self._fill(n)
+        data = bytes(self._buffer[:n])
+        del self._buffer[:n]
+        return data
+
+    def read_some(self, limit):
+        """Up to *limit* bytes (at least one), without buffering more than a chunk."""
+        if not self._buffer:
+            self._fill(1)
+        data = bytes(self._buffer[:limit])
+        del self._buffer[:limit]
+        return data
+
+    def at_end(self):
+        if self._buffer:
+            return False
+        data = next(self._chunks, None)
+        if data is None:
+            return True
+        self._buffer += data
+        return False
+
+
+# ─── Decoding ────────────────────────────────────────────────────
+
+def safe_path(root, name):
+    """*name* joined to *root*; rejects absolute paths and '..'."""
+    parts = name.split('/')
+    if not name or name.startswith('/') or '\\' in name or ':' in name or \
+            any(part in ('', '.', '..') for part in parts):
+        raise ValueError(f"refusing unsafe file name {name!r}")
+    return os.path.join(root, *parts)
+
+
+class _Output:
+    """One file being written by the pool; chunks land at fixed offsets."""
+
+    def __init__(self, path):
+        self.path = path
+        self.part = path + '.part'
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._file = open(self.part, 'wb')
+        self._lock = threading.Lock()
+
+    def write_at(self, offset, data):
+        with self._lock:
+            self._file.seek(offset)
+            self._file.write(data)
+
+    def finish(self, ok):
+        self._file.close()
+        if ok:
+            os.replace(self.part, self.path)
+        else:
+            os.remove(self.part)
+
+
+def decode_stream(chunks, root='.', workers=WORKERS, log=print):
+    """Unpack a framed stream into *root*. Returns (written, failed) name lists."""
+    reader = Reader(chunks)
+    magic = reader.read(4)
+    if magic != MAGIC:
+        raise ValueError(f"not a file stream (magic {magic!r}); use --single for bare base64")
+    version, _ = struct.unpack('<HH', reader.read(4))
+    if version != VERSION:
+        raise ValueError(f"unsupported stream version {version}")
+
+    written, failed, errors = [], [], []
+    slots = threading.Semaphore(MAX_PENDING)
+    open_files = []     # [name, output, futures, checksum ok (None while reading), size]
+
+    def write(output, offset, data):
+        try:
+            output.write_at(offset, data)
+        except OSError as e:
+            errors.append(e)
+        finally:
+            slots.release()
+
+    def settle(wait):
+        for item in list(open_files):
+            name, output, futures, ok, size = item
+            if ok is None or (not wait and not all(f.done() for f in futures)):
+                continue
+            open_files.remove(item)
+            ok = ok and not errors
+            output.finish(ok)
+            (written if ok else failed).append(name)
+            log(f"  {name}: {size} bytes" if ok else f"  {name}: checksum mismatch, discarded")
+
+    try:
+        with ThreadPoolExecutor(workers) as pool:
+            while True:
+                (name_len,) = struct.unpack('<H', reader.read(2))
+                if name_len == 0:
+                    break
+                name = reader.read(name_len).decode('utf-8')
+                (size,) = struct.unpack('<Q', reader.read(8))
+                item = [name, _Output(safe_path(root, name)), [], None, size]
+                open_files.append(item)
+                crc, offset = 0, 0
+                while offset < size:
+                    data = reader.read_some(min(CHUNK, size - offset))
+                    crc = zlib.crc32(data, crc)
+                    slots.acquire()
+                    item[2].append(pool.submit(write, item[1], offset, data))
+                    offset += len(data)
+                (expected,) = struct.unpack('<I', reader.read(4))
+                item[3] = crc == expected
+                # close files whose writes are done so handles do not pile up
+                settle(wait=False)
+    finally:
+        # the pool has drained by now; anything still open is incomplete
+        settle(wait=True)
+        for name, output, *_ in open_files:
+            output.finish(False)
+    if not reader.at_end():
+        log("warning: data after the end marker was ignored")
+    if errors:
+        raise errors[0]
+    return written, failed
+
+
+# ─── Encoding ────────────────────────────────────────────────────
+
+def encode_frames(paths, names=None, chunk=CHUNK):
+    """Framed stream bytes for *paths*, chunk by chunk."""
+    yield MAGIC + struct.pack('<HH', VERSION, 0)
+    for i, path in enumerate(paths):
+        name = (names[i] if names else os.path.basename(path)).replace(os.sep, '/').encode('utf-8')
+        yield struct.pack('<H', len(name)) + name + struct.pack('<Q', os.path.getsize(path))
+        crc = 0
+        with open(path, 'rb') as f:
+            while True:
+                data = f.read(chunk)
+                if not data:
+                    break
+                crc = zlib.crc32(data, crc)
+                yield data
+        yield struct.pack('<I', crc)
+    yield struct.pack('<H', 0)
+
+
+def write_base64(frames, out, line=LINE):
+    """Base64 text of *frames* on *out*, wrapped at *line* characters."""
+    carry = b''
+    width = line * 3 // 4
+    for data in frames:
+        data = carry + data
+        cut = len(data) - len(data) % width
+        carry = data[cut:]
+        for at in range(0, cut, width):
+            out.write(base64.b64encode(data[at:at + width]) + b'\n')
+    if carry:
+        out.write(base64.b64encode(carry) + b'\n')
+
+
+# ─── CLI ─────────────────────────────────────────────────────────
+
+def main():
+    ap = argparse.ArgumentParser(description="Stream files through a pipe as framed base64.")
+    ap.add_argument('-C', '--directory', default='.', help="where decoded files are written")
+    ap.add_argument('--encode', nargs='+', metavar='FILE', help="write a stream of FILEs to stdout")
+    ap.add_argument('--single', metavar='NAME', help="stdin is one file as bare base64")
+    ap.add_argument('--raw', action='store_true', help="stream is binary, not base64")
+    ap.add_argument('--workers', type=int, default=WORKERS)
+    args = ap.parse_args()
+    stdin, stdout = sys.stdin.buffer, sys.stdout.buffer
+
+    if args.encode:
+        frames = encode_frames(args.encode)
+        if args.raw:
+            for data in frames:
+                stdout.write(data)
+        else:
+            write_base64(frames, stdout)
+        return
+
+    chunks = raw_chunks(stdin) if args.raw else base64_chunks(stdin)
+    if args.single:
+        output = _Output(safe_path(args.directory, args.single))
+        size = 0
+        try:
+            for data in chunks:
+                output.write_at(size, data)
+                size += len(data)
+        except ValueError:
+            output.finish(False)
+            raise
+        output.finish(True)
+        print(f"Written {size} bytes", file=sys.stderr)
+        return
+
+    written, failed = decode_stream(chunks, args.directory, args.workers,
+                                    log=lambda msg: print(msg, file=sys.stderr))
+    print(f"Written {len(written)} files" + (f", {len(failed)} failed" if failed else ""),
+          file=sys.stderr)
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,283 @@
+"""
+Per-vertex ambient occlusion for the tower meshes.
+
+The towers only have flat Kd materials, so stacked floors, eaves and
+railings all read as the same flat colour. This stage bakes an occlusion
+term per vertex offline:
+
+  1. build a bounding-volume hierarchy over the mesh triangles (median
+     split on the longest centroid axis, flattened into arrays)
+  2. per vertex, cast `samples` cosine-weighted rays over the hemisphere
+     around the area-weighted vertex normal; every vertex uses the same
+     Hammersley pattern, spun by a seeded per-vertex angle
+  3. trace the rays in batches: each batch walks the BVH breadth-first as
+     one array of (ray, node) pairs, so slab and Moller-Trumbore tests run
+     on whole arrays; batches are spread over worker processes, which
+     attach to the BVH and rays in shared memory (mesh_core.SharedArrays)
+     and receive only index ranges
+  4. AO = fraction of rays that escape within `distance` (1 = open sky)
+
+The result is stored as grey OBJ vertex colours (mesh.colors), which
+write_obj() emits as `v x y z r g b`. Output is deterministic for a given
+seed, whatever the number of processes. Vertices buried inside another
+part come out black, so bake --union meshes where overlaps matter
+(build_towers.py --union --ao).
+
+Usage:
+  python ao_bake.py sniper_t1.obj sniper_t2.obj sniper_t3.obj   # benchmark
+  python ao_bake.py basic_t3.obj --samples 128 --processes 4
+  python ao_bake.py sniper_t3.obj --write                       # store colours
+
+Requires: numpy
+"""
+
+import argparse
+import os
+import time
+from multiprocessing import Pool
+
+import numpy as np
+
+from mesh_core import SharedArrays, attach_arrays, read_obj, write_obj
+
+SAMPLES = 64          # rays per vertex
+DISTANCE = 0.08       # max occluder distance, fraction of the bounding-box diagonal
+LEAF_SIZE = 4         # triangles per BVH leaf
+BATCH = 4096          # rays per traced batch
+SEED = 1
+
+
+# ─── BVH ─────────────────────────────────────────────────────────
+
+class BVH:
+    """Flattened BVH. Inner nodes have count 0 and children left/right;
+    leaves cover tris[start:start + count]."""
+
+    def __init__(self, lo, hi, left, right, start, count, tris):
+        self.lo, self.hi = lo, hi
+        self.left, self.right = left, right
+        self.start, self.count = start, count
+        self.tris = tris
+
+    @property
+    def node_count(self):
+        return len(self.lo)
+
+
+def build_bvh(tris, leaf_size=LEAF_SIZE):
+    """BVH over (T, 3, 3) triangle corners; the triangles are stored reordered."""
+    centroids = tris.mean(1)
+    tri_lo, tri_hi = tris.min(1), tris.max(1)
+    order = np.arange(len(tris))
+    lo, hi, left, right, start, count = [], [], [], [], [], []
+    stack = [(0, len(tris), -1, False)]
+    while stack:
+        a, b, parent, is_right = stack.pop()
+        node = len(lo)
+        if parent >= 0:
+            (right if is_right else left)[parent] = node
+        idx = order[a:b]
+        lo.append(tri_lo[idx].min(0))
+        hi.append(tri_hi[idx].max(0))
+        left.append(-1)
+        right.append(-1)
+        if b - a <= leaf_size:
+            start.append(a)
+            count.append(b - a)
+            continue
+        start.append(0)
+        count.append(0)
+        c = centroids[idx]
+        axis = int(np.argmax(c.max(0) - c.min(0)))
+        mid = (b - a) // 2
+        order[a:b] = idx[np.argpartition(c[:, axis], mid)]
+        stack.append((a + mid, b, node, True))
+        stack.append((a, a + mid, node, False))
+    return BVH(np.array(lo), np.array(hi), np.array(left), np.array(right),
+               np.array(start), np.array(count), tris[order])
+
+
+# ─── Tracing ─────────────────────────────────────────────────────
+
+def _ray_box(origin, inv_dir, lo, hi, tmax):
+    t0 = (lo - origin) * inv_dir
+    t1 = (hi - origin) * inv_dir
+    tn, tf = np.minimum(t0, t1), np.maximum(t0, t1)
+    near = np.maximum(np.maximum(tn[:, 0], tn[:, 1]), tn[:, 2])
+    far = np.minimum(np.minimum(tf[:, 0], tf[:, 1]), tf[:, 2])
+    return (near <= far) & (far >= 0) & (near <= tmax)
+
+
+def _ray_tri(origin, direction, tri, tmax, eps=1e-9):
+    """Two-sided Moller-Trumbore: does each ray hit its triangle within (eps, tmax]?"""
+    e1 = tri[:, 1] - tri[:, 0]
+    e2 = tri[:, 2] - tri[:, 0]
+    p = np.cross(direction, e2)
+    det = (e1 * p).sum(1)
+    ok = np.abs(det) > eps
+    inv = 1.0 / np.where(ok, det, 1.0)
+    s = origin - tri[:, 0]
+    u = (s * p).sum(1) * inv
+    q = np.cross(s, e1)
+    v = (direction * q).sum(1) * inv
+    t = (e2 * q).sum(1) * inv
+    return ok & (u >= 0) & (v >= 0) & (u + v <= 1) & (t > eps) & (t <= tmax)
+
+
+def occluded(bvh, origins, directions, tmax):
+    """Any-hit test for a batch of rays: (R,) bool."""
+    safe = np.where(np.abs(directions) > 1e-12, directions, 1e-12)
+    inv_dir = 1.0 / safe
+    hit = np.zeros(len(origins), dtype=bool)
+    ray = np.arange(len(origins))
+    node = np.zeros(len(origins), dtype=np.int64)
+    while len(ray):
+        live = ~hit[ray]
+        ray, node = ray[live], node[live]
+        near = _ray_box(origins[ray], inv_dir[ray], bvh.lo[node], bvh.hi[node], tmax)
+        ray, node = ray[near], node[near]
+        n = bvh.count[node]
+        leaf = n > 0
+        if leaf.any():
+            lr, n = ray[leaf], n[leaf]
+            # one (ray, triangle) pair per triangle of each reached leaf
+            r = np.repeat(lr, n)
+            t = np.repeat(bvh.start[node[leaf]], n) + np.arange(n.sum()) - np.repeat(np.cumsum(n) - n, n)
+            hit[r[_ray_tri(origins[r], directions[r], bvh.tris[t], tmax)]] = True
+        inner = node[~leaf]
+        ray = np.r_[ray[~leaf], ray[~leaf]]
+        node = np.r_[bvh.left[inner], bvh.right[inner]]
+    return hit
+
+
+BVH_FIELDS = ('lo', 'hi', 'left', 'right', 'start', 'count', 'tris')
+
+_worker = None
+
+
+def _use_arrays(arrays):
+    global _worker
+    bvh = BVH(*(arrays[k] for k in BVH_FIELDS))
+    _worker = (bvh, arrays['origins'], arrays['directions'])
+
+
+def _init_worker(descriptor):
+    _use_arrays(attach_arrays(descriptor))
+
+
+def _trace(job):
+    start, stop, tmax = job
+    bvh, origins, directions = _worker
+    return occluded(bvh, origins[start:stop], directions[start:stop], tmax)
+
+
+# ─── Sampling ────────────────────────────────────────────────────
+
+def vertex_normals(mesh):
+    """Area-weighted average of the normals of the faces using each vertex."""
+    weighted = mesh.face_normals() * mesh.face_areas()[:, None]
+    acc = np.zeros((mesh.vertex_count, 3))
+    np.add.at(acc, mesh.quads.ravel(), np.repeat(weighted, 4, axis=0))
+    length = np.linalg.norm(acc, axis=1, keepdims=True)
+    # vertices where opposite faces cancel out (thin sheets) fall back to +Y
+    return np.where(length > 1e-9, acc / np.maximum(length, 1e-9), [0.0, 1.0, 0.0])
+
+
+def hemisphere_directions(normals, samples=SAMPLES, seed=SEED):
+    """(V, samples, 3) cosine-weighted directions around each normal."""
+    i = np.arange(samples)
+    u = (i + 0.5) / samples
+    bits = i.astype(np.uint32)
+    bits = ((bits << 16) | (bits >> 16)) & 0xffffffff
+    bits = ((bits & 0x55555555) << 1) | ((bits & 0xaaaaaaaa) >> 1)
+    bits = ((bits & 0x33333333) << 2) | ((bits & 0xcccccccc) >> 2)
+    bits = ((bits & 0x0f0f0f0f) << 4) | ((bits & 0xf0f0f0f0) >> 4)
+    bits = ((bits & 0x00ff00ff) << 8) | ((bits & 0xff00ff00) >> 8)
+    v = bits / 2.0 ** 32                     # radical inverse: Hammersley second axis
+    spin = np.random.default_rng(seed).random(len(normals))
+    phi = 2 * np.pi * (v[None, :] + spin[:, None])
+    r = np.sqrt(u)[None, :]
+    local = np.stack([r * np.cos(phi), r * np.sin(phi), np.broadcast_to(np.sqrt(1 - u), phi.shape)], -1)
+
+    # orthonormal basis per normal (Duff et al. 2017)
+    n = normals
+    sign = np.where(n[:, 2] >= 0, 1.0, -1.0)
+    a = -1.0 / (sign + n[:, 2])
+    b = n[:, 0] * n[:, 1] * a
+    tx = np.stack([1 + sign * n[:, 0] ** 2 * a, sign * b, -sign * n[:, 0]], -1)
+    ty = np.stack([b, sign + n[:, 1] ** 2 * a, -n[:, 1]], -1)
+    return local[..., :1] * tx[:, None] + local[..., 1:2] * ty[:, None] + local[..., 2:] * n[:, None]
+
+
+# ─── Bake ────────────────────────────────────────────────────────
+
+def bake_ao(mesh, samples=SAMPLES, distance=DISTANCE, processes=None, seed=SEED, stats=None):
+    """Per-vertex AO in [0, 1]; also stored on the mesh as grey vertex colours.
+
+    processes: worker count (None = all CPUs, 1 = trace in this process).
+    stats: optional dict that receives timings and sizes for benchmarking.
+    """
+    t0 = time.perf_counter()
+    tri_idx, _ = mesh.triangles()
+    bvh = build_bvh(mesh.positions[tri_idx])
+    t_build = time.perf_counter() - t0
+
+    lo, hi = mesh.bounds()
+    diag = float(np.linalg.norm(hi - lo)) or 1.0
+    normals = vertex_normals(mesh)
+    directions = hemisphere_directions(normals, samples, seed).reshape(-1, 3)
+    origins = np.repeat(mesh.positions + normals * diag * 1e-5, samples, axis=0)
+    tmax = distance * diag
+    jobs = [(i, i + BATCH, tmax) for i in range(0, len(origins), BATCH)]
+    arrays = {k: getattr(bvh, k) for k in BVH_FIELDS}
+    arrays.update(origins=origins, directions=directions)
+
+    t0 = time.perf_counter()
+    processes = min(processes or os.cpu_count() or 1, len(jobs)) or 1
+    if processes == 1:
+        _use_arrays(arrays)
+        hits = [_trace(job) for job in jobs]
+    else:
+        with SharedArrays(arrays) as shared, \
+                Pool(processes, initializer=_init_worker, initargs=(shared.descriptor,)) as pool:
+            hits = pool.map(_trace, jobs)
+    t_trace = time.perf_counter() - t0
+
+    hit = np.concatenate(hits) if hits else np.zeros(0, dtype=bool)
+    ao = 1.0 - hit.reshape(-1, samples).mean(1) if len(hit) else np.ones(mesh.vertex_count)
+    mesh.colors = np.repeat(ao[:, None], 3, axis=1)
+    if stats is not None:
+        stats.update(vertices=mesh.vertex_count, triangles=len(tri_idx), nodes=bvh.node_count,
+                     rays=len(origins), processes=processes, build_s=t_build, trace_s=t_trace)
+    return ao
+
+
+# ─── CLI ─────────────────────────────────────────────────────────
+
+def main():
+    ap = argparse.ArgumentParser(description="Bake per-vertex ambient occlusion and report timings per tier.")
+    ap.add_argument('objs', nargs='+', help="tower OBJs")
+    ap.add_argument('--samples', type=int, default=SAMPLES, help="rays per vertex")
+    ap.add_argument('--distance', type=float, default=DISTANCE,
+                    help="max occluder distance as a fraction of the bounding-box diagonal")
+    ap.add_argument('--processes', type=int, help="worker processes (default: all CPUs)")
+    ap.add_argument('--write', action='store_true', help="rewrite the OBJs with AO vertex colours")
+    args = ap.parse_args()
+
+    for path in args.objs:
+        mesh = read_obj(path)
+        stats = {}
+        ao = bake_ao(mesh, args.samples, args.distance, args.processes, stats=stats)
+        rate = stats['rays'] / stats['trace_s'] / 1e6 if stats['trace_s'] else 0.0
+        print(f"{os.path.basename(path)}: {stats['vertices']} verts, {stats['triangles']} tris, "
+              f"{stats['nodes']} BVH nodes in {stats['build_s'] * 1e3:.1f} ms; "
+              f"{stats['rays']} rays on {stats['processes']} proc in {stats['trace_s']:.2f} s "
+              f"({rate:.2f} Mrays/s); AO mean {ao.mean():.3f}, min {ao.min():.3f}")
+        if args.write:
+            with open(path) as f:
+                title = f.readline()[1:].strip()
+            write_obj(mesh, path, title)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Build driver for the generated tower models.
+
+Runs every generator builder, validates the result (mesh_validate.py) and
+writes the OBJ/MTL files plus a <name>.meta.json sidecar (tower_meta.py).
+With --deltas each upgrade tier also gets a <name>.delta.json against the
+tier below it (tier_delta.py), and with --ao the OBJs carry baked ambient
+occlusion as vertex colours (ao_bake.py); --single-draw also writes a
+<name>.baked.obj with the materials folded into vertex colours
+(color_bake.py). The church tiers (church_tower_generator.LAYOUTS, exported
+from Blender) are validated too, through church_part_table.tier_mesh(),
+but not written. The validation reports are collected into
+build_report.json next to the models (--validate-only writes nothing and
+only prints the summaries); with --strict any tower that has errors
+(z-fighting, degenerate faces) fails the build. With --processes the
+exports (union, AO, culling, OBJ writing) run in a process pool; each
+frozen mesh goes to the workers through shared memory (mesh_core.SharedMesh)
+rather than being pickled.
+
+Usage:
+  python build_towers.py                      # build everything
+  python build_towers.py sniper_t3 basic_t3   # build a subset
+  python build_towers.py church_t3            # validate one church tier
+  python build_towers.py --validate-only --strict
+  python build_towers.py --union --cull-hidden   # smallest meshes
+  python build_towers.py --deltas                # + upgrade deltas
+  python build_towers.py --union --ao            # + AO vertex colours
+  python build_towers.py --ao --single-draw      # + one-draw baked meshes
+  python build_towers.py --union --ao --processes 4
+"""
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+
+import gen_basic_t2
+import gen_basic_t3
+import gen_sniper_all
+from church_part_table import tier_mesh
+from ao_bake import SAMPLES
+from color_bake import export_baked
+from csg_union import csg_union
+from mesh_core import (SharedMesh, attach_mesh, compute_normals, export_mesh, from_builder,
+                       read_mtl, read_obj)
+from mesh_validate import summarize, validate
+from tier_delta import diff_tiers, write_delta
+from tower_meta import tower_metadata, write_metadata
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# name -> (builder factory, MTL palette or None when the .mtl is hand-kept, title)
+TOWERS = {
+    'sniper_t1': (gen_sniper_all.build_t1, gen_sniper_all.t1_mats, "Sniper T1 - Buddhist Pagoda"),
+    'sniper_t2': (gen_sniper_all.build_t2, gen_sniper_all.t2_mats, "Sniper T2 - Enhanced Pagoda"),
+    'sniper_t3': (gen_sniper_all.build_t3, gen_sniper_all.t3_mats, "Sniper T3 - Grand Pagoda"),
+    'basic_t2': (gen_basic_t2.build, None, "Basic Tower T2 - Enhanced Shinto Shrine"),
+    'basic_t3': (gen_basic_t3.build, None, "Basic Tower T3 - Grand Shinto Shrine"),
+}
+
+# name -> church_tower_generator.LAYOUTS key; validated only, the models come from Blender
+CHURCH_TIERS = {'church_t1': 'T1', 'church_t2': 'T2', 'church_t3': 'T3'}
+
+# Upgrade order per tower family (basic_t1.obj is hand-kept, not generated)
+TIER_CHAINS = [
+    ('sniper_t1', 'sniper_t2', 'sniper_t3'),
+    ('basic_t1', 'basic_t2', 'basic_t3'),
+]
+
+
+def _write_baked(exported, name, mats, title, outdir):
+    palette = mats or read_mtl(os.path.join(HERE, f"{name}.mtl"))
+    ao = None if exported.colors is None else exported.colors[:, 0]
+    export_baked(exported, palette, os.path.join(outdir, f"{name}.baked.obj"), title, ao)
+
+
+def _export_shared(descriptor, name, mats, title, outdir, options, single_draw):
+    """Pool task: export one tower from its SharedMesh."""
+    exported = export_mesh(attach_mesh(descriptor), os.path.join(outdir, f"{name}.obj"), title, *options,
+                           ao_processes=1)
+    if single_draw:
+        _write_baked(exported, name, mats, title, outdir)
+    return name
+
+
+def build(names, outdir=HERE, validate_only=False, cull_views=None, smooth_angle=None, union=False,
+          ao_samples=None, single_draw=False, processes=1):
+    """Build and validate the named towers (church tiers are only validated). Returns the list of reports.
+
+    processes > 1 exports the towers in a process pool.
+    """
+    reports, frozen = [], []
+    options = (cull_views, smooth_angle, False, ao_samples)     # unioned below, before validation
+    for name in names:
+        if name in CHURCH_TIERS:
+            report = validate(compute_normals(tier_mesh(CHURCH_TIERS[name])), name)
+            reports.append(report)
+            print(summarize(report))
+            continue
+        factory, mats, title = TOWERS[name]
+        builder = factory()
+        mesh = from_builder(builder)
+        solid = mesh
+        if union:
+            # union once: the validated surface is the one exported
+            solid = csg_union(mesh)
+            print(f"  union {mesh.face_count} -> {solid.face_count} faces")
+        report = validate(compute_normals(solid), name)
+        reports.append(report)
+        print(summarize(report))
+        if validate_only:
+            continue
+        if processes > 1:
+            frozen.append((name, solid, mats, title))
+        else:
+            exported = export_mesh(solid, os.path.join(outdir, f"{name}.obj"), title, *options)
+            if single_draw:
+                _write_baked(exported, name, mats, title, outdir)
+        write_metadata(tower_metadata(mesh, name), os.path.join(outdir, f"{name}.meta.json"))
+        if mats:
+            gen_sniper_all.write_mtl(os.path.join(outdir, f"{name}.mtl"), mats, title)
+
+    if frozen:
+        # the blocks outlive the pool, and are unlinked even if a worker dies
+        with ExitStack() as stack:
+            shared = [stack.enter_context(SharedMesh(mesh)) for _, mesh, _, _ in frozen]
+            with ProcessPoolExecutor(min(processes, len(frozen))) as pool:
+                futures = [pool.submit(_export_shared, block.descriptor, name, mats, title, outdir, options,
+                                       single_draw)
+                           for block, (name, _, mats, title) in zip(shared, frozen)]
+                for future in futures:
+                    future.result()
+    return reports
+
+
+def write_deltas(names, outdir=HERE):
+    """Write <tier>.delta.json for every built tier that has a lower tier on disk."""
+    for chain in TIER_CHAINS:
+        for base, name in zip(chain, chain[1:]):
+            paths = [os.path.join(outdir, f"{n}.obj") for n in (base, name)]
+            if name not in names or not all(os.path.exists(p) for p in paths):
+                continue
+            delta = diff_tiers(*(read_obj(p) for p in paths))
+            out = os.path.join(outdir, f"{name}.delta.json")
+            write_delta(delta, out, base)
+            print(f"{name}: delta vs {base}, {len(delta['kept'])} kept / {len(delta['added'])} added parts, "
+                  f"{os.path.getsize(out)} B")
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Build and validate the generated tower models.")
+    ap.add_argument('towers', nargs='*',
+                    help=f"towers to build (default: all of {', '.join([*TOWERS, *CHURCH_TIERS])})")
+    ap.add_argument('--outdir', default=HERE)
+    ap.add_argument('--validate-only', action='store_true', help="run the checks without writing models")
+    ap.add_argument('--strict', action='store_true', help="exit non-zero if any tower has validation errors")
+    ap.add_argument('--cull-hidden', nargs='?', const='65:45', metavar='PITCH:YAW,...',
+                    help="strip faces hidden from these views (default: the game camera)")
+    ap.add_argument('--smooth', type=float, metavar='ANGLE',
+                    help="smooth normals across edges flatter than ANGLE degrees")
+    ap.add_argument('--union', action='store_true',
+                    help="replace overlapping boxes with the exterior surface of their union")
+    ap.add_argument('--ao', nargs='?', type=int, const=SAMPLES, metavar='SAMPLES',
+                    help=f"bake ambient occlusion into vertex colours (default {SAMPLES} rays per vertex)")
+    ap.add_argument('--single-draw', action='store_true',
+                    help="also write <name>.baked.obj with materials baked into vertex colours")
+    ap.add_argument('--deltas', action='store_true', help="write upgrade deltas against the tier below")
+    ap.add_argument('--processes', type=int, default=1, help="export towers in this many worker processes")
+    args = ap.parse_args()
+    unknown = set(args.towers) - set(TOWERS) - set(CHURCH_TIERS)
+    if unknown:
+        ap.error(f"unknown tower(s): {', '.join(sorted(unknown))}")
+
+    os.makedirs(args.outdir, exist_ok=True)
+    reports = build(args.towers or [*TOWERS, *CHURCH_TIERS], args.outdir, args.validate_only, args.cull_hidden,
+                    args.smooth, args.union, args.ao, args.single_draw, args.processes)
+    if args.deltas and not args.validate_only:
+        write_deltas(args.towers or list(TOWERS), args.outdir)
+    if not args.validate_only:
+        with open(os.path.join(args.outdir, 'build_report.json'), 'w') as f:
+            json.dump(reports, f, indent=2)
+
+    failed = [r['name'] for r in reports if not r['ok']]
+    if failed:
+        print(f"Validation errors in: {', '.join(failed)}"
+              + ("" if args.validate_only else " (see build_report.json)"))
+    if args.strict and failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""
+Game camera helpers for the offline tower tooling.
+
+The game only ever shows towers from the fixed camera set up in
+assets/towers/blender/create_tower_models.py (`setup_scene`): Blender euler
+(65°, 0°, 45°). Everything here works in the Y-up space of the exported OBJ
+files, where a Blender vector (x, y, z) becomes (x, z, -y).
+
+Requires: numpy
+"""
+
+import math
+
+import numpy as np
+
+GAME_PITCH = 65.0
+GAME_YAW = 45.0
+
+
+def view_direction(pitch=GAME_PITCH, yaw=GAME_YAW):
+    """Unit vector pointing from the model towards a camera at Blender euler (pitch, 0, yaw)."""
+    p, y = math.radians(pitch), math.radians(yaw)
+    return np.array([math.sin(p) * math.sin(y), math.cos(p), math.sin(p) * math.cos(y)])
+
+
+GAME_VIEW = view_direction()
+
+
+def parse_views(spec):
+    """Parse 'pitch:yaw,pitch:yaw' (degrees) into a list of view directions."""
+    views = []
+    for item in spec.split(','):
+        pitch, _, yaw = item.partition(':')
+        views.append(view_direction(float(pitch), float(yaw or GAME_YAW)))
+    return views
+
+
+def view_basis(toward):
+    """Orthonormal (right, up, forward) rows for an orthographic camera; forward looks into the screen."""
+    forward = -np.asarray(toward, dtype=np.float64)
+    forward /= np.linalg.norm(forward)
+    world_up = np.array([0.0, 1.0, 0.0])
+    if abs(forward @ world_up) > 0.999:
+        world_up = np.array([0.0, 0.0, -1.0])
+    right = np.cross(forward, world_up)
+    right /= np.linalg.norm(right)
+    return np.stack([right, np.cross(right, forward), forward])
+
+
+def project(positions, toward):
+    """Orthographic projection. Returns (screen_xy, depth); y is up, larger depth is farther."""
+    p = np.asarray(positions, dtype=np.float64) @ view_basis(toward).T
+    return p[:, :2], p[:, 2]
+
+
+def fit_viewport(screen_xy, resolution, margin=1.0):
+    """Map screen coordinates to pixels (y down) so the longest side spans *resolution*.
+
+    Returns (pixel_xy, width, height, scale) where scale is pixels per model unit.
+    """
+    lo, hi = screen_xy.min(0), screen_xy.max(0)
+    extent = np.maximum(hi - lo, 1e-9)
+    scale = (resolution - 2 * margin) / extent.max()
+    width, height = (np.ceil(extent * scale + 2 * margin)).astype(int)
+    px = (screen_xy[:, 0] - lo[0]) * scale + margin
+    py = (hi[1] - screen_xy[:, 1]) * scale + margin
+    return np.stack([px, py], axis=1), int(width), int(height), scale
@@ -0,0 +1,479 @@
+"""
+Church tower part tables and part atlas, derived from the 3D generator.
+
+ChurchTowerAnimator.js used to hand-maintain 2D rects that mirrored the
+named parts in church_tower_generator.py. This exporter rebuilds every
+named part from the generator's tier layouts (T1_LAYOUT...; no Blender
+needed), projects it through the game camera and writes:
+
+  churchTowerParts.js   per tier: part names, colours, glow flags and an
+                        Int16Array of (x, y, w, h, sx, sy) per part, sorted
+                        back to front; x/y are pixels from the tower's
+                        bottom centre, sx/sy the part's place in the atlas
+  church_parts.png      every visible part pre-rasterized (4x supersampled,
+                        flat-shaded per face) and shelf-packed
+  church_glow.png       per tier, an additive glow layer: only the visible
+                        stained-glass pixels, unshaded, Gaussian-blurred
+                        (separable, GLOW_SIGMA px) and scaled by
+                        GLOW_STRENGTH * tier; drawn with 'lighter' compositing
+
+church_tower_generator.py defines no emissive material; the glass glow is
+an adaptation of the builder towers' emissive glow (tower_glow.py bakes the
+real Glow/GlowGold faces), with the strength ramping per tier the same way.
+
+Both atlases come as a mip chain (MIP_LEVELS): everything is rendered once
+at the largest level (2x, for HiDPI screens) and area-averaged down to 1x,
+1/2 and 1/4, each level on its own atlas pages (church_parts@2x.png, ...,
+1x keeps the plain names). The module lists the levels in CHURCH_LEVELS so
+the animator can pick the one closest to its on-screen size.
+
+All parts of a tier share one z-buffer, so each sprite holds only the
+pixels of its part that the camera can see; parts hidden entirely (the
+bells inside their towers) are dropped from the table.
+
+tier_mesh() rebuilds a tier as a quad mesh_core.Mesh, one part per layout
+entry, so build_towers.py can run mesh_validate over the church tiers too.
+
+Usage:
+  python church_part_table.py
+  python church_part_table.py --scale 16 --atlas out.png --module out.js
+  python church_part_table.py --workers 4      # rasterize tiles concurrently
+
+Requires: numpy
+"""
+
+import argparse
+import math
+import os
+
+import numpy as np
+
+from camera import GAME_VIEW, project
+from church_tower_generator import COLORS, LAYOUTS, material_name
+from mesh_core import Mesh
+from png_io import write_png
+from raster import rasterize_tiled
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.normpath(os.path.join(HERE, '..', '..', '..'))
+ATLAS = os.path.join(ROOT, 'assets', 'towers', 'animation', 'church_parts.png')
+GLOW_ATLAS = os.path.join(ROOT, 'assets', 'towers', 'animation', 'church_glow.png')
+MODULE = os.path.join(ROOT, 'src', 'animation', 'towerAnimators', 'churchTowerParts.js')
+
+PX_PER_UNIT = 14     # sprite pixels per Blender unit (T3 ends up ~190 px tall)
+SUPERSAMPLE = 4
+ATLAS_WIDTH = 256    # at 1x; other levels scale it (min MIN_ATLAS_WIDTH)
+MIN_ATLAS_WIDTH = 64
+MIP_LEVELS = (2, 1, 0.5, 0.25)  # sprite pixels per 1x pixel, largest first
+LIGHT = np.array([-0.45, 0.8, 0.4])  # Y-up, from the upper left of the game view
+GLOW_SIGMA = 3.0     # glow blur radius (sprite pixels)
+GLOW_STRENGTH = 0.75 # x tier: glass stands in for emission, ramped per tier like create_tower_models.py
+
+
+# ─── Blender primitives ──────────────────────────────────────────
+# Each returns (verts, faces) in Blender space (Z up), matching the bpy.ops
+# primitive the generator calls, with its location/rotation applied.
+
+def _euler(rx=0.0, ry=0.0, rz=0.0):
+    cx, sx, cy, sy, cz, sz = math.cos(rx), math.sin(rx), math.cos(ry), math.sin(ry), math.cos(rz), math.sin(rz)
+    x = np.array([[1, 0, 0], [0, cx, -sx], [0, sx, cx]])
+    y = np.array([[cy, 0, sy], [0, 1, 0], [-sy, 0, cy]])
+    z = np.array([[cz, -sz, 0], [sz, cz, 0], [0, 0, 1]])
+    return z @ y @ x
+
+
+def _place(verts, location, rotation=(0, 0, 0)):
+    return np.asarray(verts, dtype=np.float64) @ _euler(*rotation).T + np.asarray(location, dtype=np.float64)
+
+
+def box(location, size):
+    h = np.asarray(size, dtype=np.float64) / 2
+    verts = np.array([[x, y, z] for x in (-1, 1) for y in (-1, 1) for z in (-1, 1)]) * h
+    faces = [[0, 1, 3, 2], [4, 6, 7, 5], [0, 4, 5, 1], [2, 3, 7, 6], [0, 2, 6, 4], [1, 5, 7, 3]]
+    return _place(verts, location), faces
+
+
+def cone(location, n, radius, depth, rotation=(0, 0, 0)):
+    a = 2 * math.pi * np.arange(n) / n
+    ring = np.stack([radius * np.cos(a), radius * np.sin(a), np.full(n, -depth / 2)], axis=1)
+    verts = np.vstack([ring, [[0, 0, depth / 2]]])
+    faces = [list(range(n))] + [[i, (i + 1) % n, n] for i in range(n)]
+    return _place(verts, location, rotation), faces
+
+
+def cylinder(location, n, radius, depth, rotation=(0, 0, 0)):
+    a = 2 * math.pi * np.arange(n) / n
+    ring = np.stack([radius * np.cos(a), radius * np.sin(a)], axis=1)
+    verts = np.vstack([np.c_[ring, np.full(n, -depth / 2)], np.c_[ring, np.full(n, depth / 2)]])
+    faces = [list(range(n)), list(range(n, 2 * n))] + [[i, (i + 1) % n, n + (i + 1) % n, n + i] for i in range(n)]
+    return _place(verts, location, rotation), faces
+
+
+def uv_sphere(location, segments, rings, radius, z_scale=1.0):
+    verts = [[0, 0, -radius * z_scale]]
+    for r in range(1, rings):
+        polar = math.pi * r / rings
+        for s in range(segments):
+            a = 2 * math.pi * s / segments
+            verts.append([radius * math.sin(polar) * math.cos(a), radius * math.sin(polar) * math.sin(a),
+                          -radius * math.cos(polar) * z_scale])
+    verts.append([0, 0, radius * z_scale])
+    top = len(verts) - 1
+    ring = lambda r, s: 1 + (r - 1) * segments + s % segments
+    faces = [[0, ring(1, s + 1), ring(1, s)] for s in range(segments)]
+    faces += [[ring(r, s), ring(r, s + 1), ring(r + 1, s + 1), ring(r + 1, s)]
+              for r in range(1, rings - 1) for s in range(segments)]
+    faces += [[ring(rings - 1, s), ring(rings - 1, s + 1), top] for s in range(segments)]
+    return _place(verts, location), faces
+
+
+def part_solids(shape, location, *args):
+    """(verts, faces, color key) solids making up one layout entry."""
+    x, y, z = location
+    if shape == 'box':
+        return [(*box(location, args[0]), args[1])]
+    if shape == 'pyramid':
+        base, height, color = args
+        return [(*cone((x, y, z + height / 2), 4, max(base) / 2, height, (0, 0, math.pi / 4)), color)]
+    if shape == 'cross':
+        (t, span, height), color = args
+        return [(*box((x, y, z + height / 2), (t, t, height)), color),
+                (*box((x, y, z + height * 0.65), (span, t, t)), color)]
+    if shape == 'lancet':
+        size, color = args
+        top = (x, y, z + size[2] / 2 + size[0] * 0.4)
+        return [(*box(location, size), color),
+                (*cone(top, 3, size[0] / 2, size[0] * 0.8, (0, math.pi / 2, math.pi / 2)), color)]
+    if shape == 'bell':
+        size, color = args
+        return [(*uv_sphere(location, 8, 6, size[0] / 2, 1.2), color)]
+    if shape == 'rose':
+        size, outer, inner = args
+        return [(*cylinder(location, 12, size / 2, 0.1, (0, math.pi / 2, 0)), outer),
+                (*cylinder(location, 12, size / 3, 0.12, (0, math.pi / 2, 0)), inner)]
+    if shape == 'disc':
+        radius, depth, n, color = args
+        return [(*cylinder(location, n, radius, depth, (0, math.pi / 2, 0)), color)]
+    raise ValueError(f"unknown shape {shape!r}")
+
+
+# ─── Validation mesh ─────────────────────────────────────────────
+
+def _quads(verts, faces):
+    """Convex faces as outward-wound quads: quads pass through, every other
+    face is split at its centroid and edge midpoints (one quad per corner).
+    Returns (positions (V, 3), quads (Q, 4)) with shared corners welded."""
+    centre = verts.mean(0)
+    out = []
+    for face in faces:
+        p = verts[face]
+        if np.cross(p[1] - p[0], p[2] - p[0]) @ (p.mean(0) - centre) < 0:
+            p = p[::-1]
+        if len(p) == 4:
+            out.append(p)
+            continue
+        mid = (p + np.roll(p, -1, axis=0)) / 2
+        g = p.mean(0)
+        out += [[p[i], mid[i], g, mid[i - 1]] for i in range(len(p))]
+    positions, index = np.unique(np.array(out).reshape(-1, 3), axis=0, return_inverse=True)
+    return positions, index.reshape(-1, 4)
+
+
+def tier_mesh(tier):
+    """A tier as a mesh_core.Mesh (OBJ Y-up, one part per layout entry) for mesh_validate."""
+    positions, quads, face_material, face_part, materials, names = [], [], [], [], [], []
+    base = 0
+    for shape, name, location, *args in LAYOUTS[tier]:
+        for verts, faces, color in part_solids(shape, location, *args):
+            p, q = _quads(verts, faces)
+            positions.append(p)
+            quads.append(q + base)
+            base += len(p)
+            mat = material_name(color)
+            if mat not in materials:
+                materials.append(mat)
+            face_material += [materials.index(mat)] * len(q)
+            face_part += [len(names)] * len(q)
+        names.append(name)
+    # Blender (x, y, z) -> OBJ Y-up (x, z, -y)
+    positions = np.concatenate(positions)[:, [0, 2, 1]] * [1, 1, -1]
+    return Mesh(positions, np.concatenate(quads), materials, face_material, face_part=face_part, part_names=names)
+
+
+# ─── Projection and raster ───────────────────────────────────────
+
+def part_key(name):
+    """'T2_TowerLeft' -> 'towerLeft'"""
+    base = name.split('_', 1)[1]
+    return base[0].lower() + base[1:]
+
+
+def hex_color(key):
+    return '#' + ''.join(f'{round(c * 255):02x}' for c in COLORS[key][:3])
+
+
+def _triangles(verts, faces):
+    """Fan-triangulate convex faces, wound outward. Returns (tris (T, 3, 3), normals (T, 3))."""
+    centre = verts.mean(0)
+    tris, normals = [], []
+    for face in faces:
+        p = verts[face]
+        n = np.cross(p[1] - p[0], p[2] - p[0])
+        if n @ (p.mean(0) - centre) < 0:
+            p, n = p[::-1], -n
+        n = n / (np.linalg.norm(n) or 1)
+        for i in range(1, len(p) - 1):
+            tris.append([p[0], p[i], p[i + 1]])
+            normals.append(n)
+    return np.array(tris), np.array(normals)
+
+
+def gaussian_blur(image, sigma):
+    """Separable Gaussian blur of an (H, W, C) array; the result grows by 3 sigma on every side."""
+    radius = max(1, math.ceil(3 * sigma))
+    x = np.arange(-radius, radius + 1)
+    kernel = np.exp(-0.5 * (x / sigma) ** 2)
+    kernel /= kernel.sum()
+    out = np.pad(image, ((2 * radius, 2 * radius), (2 * radius, 2 * radius), (0, 0)))
+    for axis in (0, 1):
+        windows = np.lib.stride_tricks.sliding_window_view(out, len(kernel), axis=axis)
+        out = windows @ kernel
+    return out
+
+
+def glow_layer(emit_rgb, cover, strength, sigma=GLOW_SIGMA):
+    """Blurred additive RGBA layer from emissive colour and coverage (H, W).
+
+    Stored so that 'lighter' compositing adds rgb * alpha, i.e. the blurred
+    premultiplied emission.
+    """
+    light = np.clip(gaussian_blur(emit_rgb * cover[..., None], sigma) * strength, 0, 1)
+    alpha = light.max(2)
+    rgb = np.divide(light, alpha[..., None], out=np.zeros_like(light), where=alpha[..., None] > 0)
+    return np.round(np.concatenate([rgb, alpha[..., None]], axis=2) * 255).astype(np.uint8)
+
+
+def render_tier(tier, scale=PX_PER_UNIT, ss=SUPERSAMPLE, view=GAME_VIEW, workers=1):
+    """Rasterize a tier (*workers* tile threads).
+
+    Returns (parts, hidden, glow): part dicts with their cropped RGBA sprite,
+    the names of parts with no visible pixels, and the tier's glow layer as
+    {'x', 'y', 'sprite'} (None when no glass is visible).
+    """
+    view = np.asarray(view, dtype=np.float64)
+    tris, normals, tri_part, tri_color, names = [], [], [], [], []
+    for shape, name, location, *args in LAYOUTS[tier]:
+        for verts, faces, color in part_solids(shape, location, *args):
+            t, n = _triangles(verts, faces)
+            tris.append(t)
+            normals.append(n)
+            tri_part += [len(names)] * len(t)
+            tri_color += [color] * len(t)
+        names.append((name, args[-1], shape))
+
+    # Blender (x, y, z) -> OBJ Y-up (x, z, -y), then the game camera
+    tris = np.concatenate(tris)[..., [0, 2, 1]] * [1, 1, -1]
+    normals = np.concatenate(normals)[:, [0, 2, 1]] * [1, 1, -1]
+    tri_part = np.array(tri_part)
+    xy, depth = project(tris.reshape(-1, 3), view)
+    origin = project(np.zeros((1, 3)), view)[0][0]
+    px = (xy - origin) * [scale, -scale]          # pixels from the ground centre, y down
+    bottom = math.ceil(px[:, 1].max())
+    left, top = math.floor(px[:, 0].min()), math.floor(px[:, 1].min())
+    width, height = math.ceil(px[:, 0].max()) - left, bottom - top
+    pix = (px - [left, top]) * ss
+
+    light = LIGHT / np.linalg.norm(LIGHT)
+    shade = 0.6 + 0.4 * np.clip(normals @ light, 0, 1)
+    base = np.array([COLORS[c][:3] for c in tri_color])
+    rgb = np.clip(base * shade[:, None], 0, 1)
+
+    _, idbuf = rasterize_tiled(pix.reshape(-1, 3, 2), depth.reshape(-1, 3), width * ss, height * ss, workers)
+    idbuf = idbuf.reshape(height * ss, width * ss)
+
+    parts = []
+    for i, (name, color, shape) in enumerate(names):
+        hit = (idbuf >= 0) & (tri_part[np.maximum(idbuf, 0)] == i)
+        if not hit.any():
+            continue
+        cover = hit.reshape(height, ss, width, ss).mean((1, 3))
+        colour = np.where(hit[..., None], rgb[np.maximum(idbuf, 0)], 0.0)
+        colour = colour.reshape(height, ss, width, ss, 3).sum((1, 3)) / np.maximum(hit.reshape(height, ss, width, ss).sum((1, 3)), 1)[..., None]
+        rows, cols = np.flatnonzero(cover.any(1)), np.flatnonzero(cover.any(0))
+        r0, r1, c0, c1 = rows[0], rows[-1] + 1, cols[0], cols[-1] + 1
+        sprite = np.concatenate([colour[r0:r1, c0:c1], cover[r0:r1, c0:c1, None]], axis=2)
+        mask = hit.reshape(height, ss, width, ss).any((1, 3))
+        parts.append({
+            'name': part_key(name),
+            'color': color,
+            'glow': color.startswith('glass'),
+            'x': int(left + c0), 'y': int(top + r0 - bottom),
+            'sprite': np.round(sprite * 255).astype(np.uint8),
+            'depth': float(depth.reshape(-1, 3)[tri_part == i].mean()),
+            'pixels': int(mask.sum()),
+        })
+    # back to front
+    parts.sort(key=lambda p: -p['depth'])
+    hidden = [part_key(n) for n, _, _ in names if part_key(n) not in {p['name'] for p in parts}]
+
+    glass = np.array([color.startswith('glass') for _, color, _ in names])
+    tri_glass = glass[tri_part]
+    emit = (idbuf >= 0) & tri_glass[np.maximum(idbuf, 0)]
+    if not emit.any():
+        return parts, hidden, None
+    cover = emit.reshape(height, ss, width, ss).mean((1, 3))
+    emit_rgb = np.where(emit[..., None], base[np.maximum(idbuf, 0)], 0.0)
+    emit_rgb = emit_rgb.reshape(height, ss, width, ss, 3).sum((1, 3)) / np.maximum(
+        emit.reshape(height, ss, width, ss).sum((1, 3)), 1)[..., None]
+    sprite = glow_layer(emit_rgb, cover, GLOW_STRENGTH * int(tier[1:]), GLOW_SIGMA * scale / PX_PER_UNIT)
+    pad = (sprite.shape[0] - height) // 2
+    rows, cols = np.flatnonzero(sprite[..., 3].any(1)), np.flatnonzero(sprite[..., 3].any(0))
+    r0, r1, c0, c1 = rows[0], rows[-1] + 1, cols[0], cols[-1] + 1
+    glow = {'x': int(left - pad + c0), 'y': int(top - pad + r0 - bottom), 'sprite': sprite[r0:r1, c0:c1]}
+    return parts, hidden, glow
+
+
+# ─── Mip chain ───────────────────────────────────────────────────
+
+def downsample(sprite, x, y, factor):
+    """Area-average an RGBA sprite whose top-left pixel sits at (x, y) by an integer factor.
+
+    The sprite is placed on the coarser pixel grid first, so every level
+    keeps the same origin. Colour is averaged premultiplied. Returns
+    (sprite, x, y) in the coarser level's pixels.
+    """
+    if factor == 1:
+        return sprite, x, y
+    x0, y0 = x // factor, y // factor
+    ox, oy = x - x0 * factor, y - y0 * factor
+    h, w = sprite.shape[:2]
+    rows, cols = -(-(oy + h) // factor), -(-(ox + w) // factor)
+    rgba = sprite / 255.0
+    buf = np.zeros((rows * factor, cols * factor, 4))
+    buf[oy:oy + h, ox:ox + w, :3] = rgba[..., :3] * rgba[..., 3:]
+    buf[oy:oy + h, ox:ox + w, 3] = rgba[..., 3]
+    blocks = buf.reshape(rows, factor, cols, factor, 4).mean((1, 3))
+    alpha = blocks[..., 3:]
+    rgb = np.divide(blocks[..., :3], alpha, out=np.zeros_like(blocks[..., :3]), where=alpha > 0)
+    return np.round(np.concatenate([rgb, alpha], axis=2) * 255).astype(np.uint8), int(x0), int(y0)
+
+
+def level_path(path, scale):
+    """church_parts.png -> church_parts@2x.png (1x keeps the plain name)."""
+    if scale == 1:
+        return path
+    stem, ext = os.path.splitext(path)
+    return f"{stem}@{scale:g}x{ext}"
+
+
+# ─── Atlas and module ────────────────────────────────────────────
+
+def pack_atlas(sprites, width=ATLAS_WIDTH, pad=1):
+    """Shelf-pack sprites (tallest first). Returns ((H, W, 4) atlas, [(sx, sy)])."""
+    order = sorted(range(len(sprites)), key=lambda i: -sprites[i].shape[0])
+    places, x, y, shelf = [None] * len(sprites), 0, 0, 0
+    for i in order:
+        h, w = sprites[i].shape[:2]
+        if x + w > width:
+            x, y, shelf = 0, y + shelf + pad, 0
+        places[i] = (x, y)
+        x += w + pad
+        shelf = max(shelf, h)
+    atlas = np.zeros((y + shelf, width, 4), dtype=np.uint8)
+    for (sx, sy), s in zip(places, sprites):
+        atlas[sy:sy + s.shape[0], sx:sx + s.shape[1]] = s
+    return atlas, places
+
+
+def _rects(items):
+    """Int16Array literal of x, y, w, h, sx, sy per (x, y, sprite, sx, sy)."""
+    return "new Int16Array([" + ', '.join(f"{x}, {y}, {sprite.shape[1]}, {sprite.shape[0]}, {sx}, {sy}"
+                                          for x, y, sprite, sx, sy in items) + "])"
+
+
+def write_module(path, tiers, glows, levels):
+    lines = [
+        "// src/animation/towerAnimators/churchTowerParts.js",
+        "// Generated by assets/towers/models/church_part_table.py from the church tower",
+        "// generator layouts - do not edit by hand, re-run the exporter instead.",
+        "// CHURCH_LEVELS is the sprite mip chain, largest first: scale is sprite pixels",
+        "// per 1x pixel. Parts are sorted back to front; rects[level] holds x, y, w, h",
+        "// (level pixels from the tower's bottom centre) and sx, sy (position in that",
+        "// level's atlas) per part. glowRects[level] is the same for the tier's",
+        "// pre-blurred additive glow layer.",
+        "",
+        "export const CHURCH_LEVELS = [",
+    ]
+    lines += [f"  {{ scale: {scale:g}, atlas: '{atlas}', glowAtlas: '{glow}' }}," for scale, atlas, glow in levels]
+    lines += ["];", "", "export const CHURCH_PARTS = {"]
+    for tier, parts in tiers.items():
+        lines += [
+            f"  {tier[1:]}: {{",
+            f"    names: [{', '.join(repr(p['name']) for p in parts)}],",
+            f"    colors: [{', '.join(repr(hex_color(p['color'])) for p in parts)}],",
+            f"    glow: [{', '.join(str(i) for i, p in enumerate(parts) if p['glow'])}],",
+            "    rects: [",
+        ]
+        lines += [f"      {_rects(p['levels'][i] for p in parts)}," for i in range(len(levels))]
+        lines.append("    ],")
+        if tier in glows:
+            lines.append("    glowRects: [")
+            lines += [f"      {_rects([glows[tier]['levels'][i]])}," for i in range(len(levels))]
+            lines.append("    ],")
+        else:
+            lines.append("    glowRects: null,")
+        lines.append("  },")
+    lines += ["};", ""]
+    with open(path, 'w') as f:
+        f.write('\n'.join(lines))
+
+
+def _pack_level(items, width):
+    """Pack [(sprite, x, y)] into an atlas; returns (atlas, [(x, y, sprite, sx, sy)])."""
+    atlas, places = pack_atlas([sprite for sprite, _, _ in items], width)
+    return atlas, [(x, y, sprite, sx, sy) for (sprite, x, y), (sx, sy) in zip(items, places)]
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Export church tower part tables and a part atlas.")
+    ap.add_argument('--scale', type=float, default=PX_PER_UNIT, help="sprite pixels per model unit")
+    ap.add_argument('--atlas', default=ATLAS)
+    ap.add_argument('--glow-atlas', default=GLOW_ATLAS)
+    ap.add_argument('--module', default=MODULE)
+    ap.add_argument('--workers', type=int, default=1, help="rasterizer tile threads")
+    args = ap.parse_args()
+
+    top = MIP_LEVELS[0]
+    tiers, glows = {}, {}
+    for tier in LAYOUTS:
+        parts, hidden, glow = render_tier(tier, args.scale * top, workers=args.workers)
+        tiers[tier] = parts
+        if glow is not None:
+            glows[tier] = glow
+        print(f"{tier}: {len(parts)} parts, {sum(p['pixels'] for p in parts)} px at {top:g}x"
+              + (f", glow {glow['sprite'].shape[1]}x{glow['sprite'].shape[0]}" if glow else "")
+              + (f", hidden: {', '.join(hidden)}" if hidden else ""))
+
+    everything = [p for parts in tiers.values() for p in parts]
+    for p in everything + list(glows.values()):
+        p['levels'] = []
+    levels = []
+    for scale in MIP_LEVELS:
+        factor = round(top / scale)
+        width = max(MIN_ATLAS_WIDTH, round(ATLAS_WIDTH * scale))
+        urls = []
+        for group, path in ((everything, args.atlas), (list(glows.values()), args.glow_atlas)):
+            atlas, packed = _pack_level([downsample(p['sprite'], p['x'], p['y'], factor) for p in group], width)
+            for p, item in zip(group, packed):
+                p['levels'].append(item)
+            out = level_path(path, scale)
+            write_png(out, atlas)
+            urls.append('./' + os.path.relpath(out, ROOT).replace(os.sep, '/'))
+            print(f"{scale:g}x atlas {atlas.shape[1]}x{atlas.shape[0]} -> {out}")
+        levels.append((scale, *urls))
+    write_module(args.module, tiers, glows, levels)
+    print(f"Part table -> {args.module}")
+
+
+if __name__ == '__main__':
+    main()
@@ -4,10 +4,14 @@ Generates T1 Chapel, T2 Parish Church, and T3 Grand Cathedral
 Supports OBJ export and interactive preview
 """
 
-import bpy
-import bmesh
 from math import pi, sin, cos
 
+try:
+    import bpy
+    import bmesh
+except ImportError:  # layouts stay importable outside Blender (church_part_table.py)
+    bpy = bmesh = None
+
 # ─── Color Palette ───
 COLORS = {
     'stone': (0.54, 0.49, 0.44, 1.0),          # Warm stone
@@ -199,274 +203,182 @@ def create_rose_window(name, location, size, material_outer, material_inner):
     
     return outer
 
-# ═══════════════════════════════════════════════════════════════
-# T1 CHAPEL
-# ═══════════════════════════════════════════════════════════════
+def create_disc(name, location, radius, depth, vertices, material):
+    """Create one flat layer of a rose window"""
+    bpy.ops.mesh.primitive_cylinder_add(
+        vertices=vertices,
+        radius=radius,
+        depth=depth,
+        location=location
+    )
+    obj = bpy.context.active_object
+    obj.name = name
+    obj.rotation_euler[1] = pi/2
 
-def create_t1_chapel():
-    """Create T1 Chapel tower"""
-    print("Creating T1 Chapel...")
-    
-    # Materials
-    mat_stone = create_material("Stone", COLORS['stone'])
-    mat_stone_dark = create_material("StoneDark", COLORS['stone_dark'])
-    mat_stone_light = create_material("StoneLight", COLORS['stone_light'])
-    mat_slate = create_material("Slate", COLORS['slate'])
-    mat_gold = create_material("Gold", COLORS['gold'])
-    mat_wood = create_material("Wood", COLORS['wood'])
-    mat_glass_blue = create_material("GlassBlue", COLORS['glass_blue'])
-    mat_glass_red = create_material("GlassRed", COLORS['glass_red'])
-    mat_dark = create_material("Dark", COLORS['dark'])
-    
-    parts = []
-    
-    # Base
-    parts.append(create_box("T1_Base", (0, 0, 0.6), (3.2, 3.2, 0.5), mat_stone))
-    
-    # Foundation
-    parts.append(create_box("T1_Foundation", (0, 0, 1.3), (3.5, 3.5, 0.4), mat_stone_dark))
-    
-    # Main wall
-    parts.append(create_box("T1_Wall", (0, 0, 3.65), (3.0, 3.0, 1.85), mat_stone_light))
-    
-    # Doorway
-    parts.append(create_box("T1_Doorway", (0, -1.5, 2.2), (0.8, 0.05, 0.9), mat_dark))
-    # Door arch
-    parts.append(create_box("T1_DoorArch", (0, -1.5, 2.95), (1.0, 0.05, 0.2), mat_stone))
-    
-    # Stained glass windows
-    parts.append(create_lancet_window("T1_WindowLeft", (-1.1, -1.5, 3.85), (0.4, 0.05, 0.7), mat_glass_blue))
-    parts.append(create_lancet_window("T1_WindowRight", (1.1, -1.5, 3.85), (0.4, 0.05, 0.7), mat_glass_red))
-    
-    # Roof base
-    parts.append(create_box("T1_RoofBase", (0, 0, 4.65), (3.3, 3.3, 0.25), mat_stone_dark))
-    
-    # Roof pyramid
-    parts.append(create_pyramid("T1_Roof", (0, 0, 4.9), (2.8, 2.8), 1.25, mat_slate))
-    
-    # Bell
-    parts.append(create_bell("T1_Bell", (0, 0, 5.0), (0.5, 0.5, 0.4), mat_wood))
-    
-    # Cross on top
-    parts.append(create_cross("T1_Cross", (0, 0, 6.3), (0.2, 0.6, 0.9), mat_gold))
-    
-    # Join all parts
-    bpy.context.view_layer.objects.active = parts[0]
-    for obj in parts[1:]:
-        obj.select_set(True)
-    bpy.ops.object.join()
-    
-    tower = bpy.context.active_object
-    tower.name = "ChurchTower_T1"
-    tower.location = (0, 0, 0)
-    
-    print("T1 Chapel created successfully!")
-    return tower
+    if material:
+        if obj.data.materials:
+            obj.data.materials[0] = material
+        else:
+            obj.data.materials.append(material)
+
+    return obj
 
 # ═══════════════════════════════════════════════════════════════
-# T2 PARISH CHURCH
+# TIER LAYOUTS
 # ═══════════════════════════════════════════════════════════════
+# One entry per named part: (shape, name, location, size..., color key).
+# Shapes map to the create_* helpers above; church_part_table.py reads the
+# same tables to build the 2D part tables without Blender.
 
-def create_t2_parish():
-    """Create T2 Parish Church tower"""
-    print("Creating T2 Parish Church...")
-    
-    # Materials
-    mat_stone = create_material("Stone", COLORS['stone'])
-    mat_stone_dark = create_material("StoneDark", COLORS['stone_dark'])
-    mat_stone_light = create_material("StoneLight", COLORS['stone_light'])
-    mat_slate = create_material("Slate", COLORS['slate'])
-    mat_slate_dark = create_material("SlateDark", COLORS['slate_dark'])
-    mat_gold = create_material("Gold", COLORS['gold'])
-    mat_wood = create_material("Wood", COLORS['wood'])
-    mat_glass_blue = create_material("GlassBlue", COLORS['glass_blue'])
-    mat_glass_red = create_material("GlassRed", COLORS['glass_red'])
-    mat_glass_purple = create_material("GlassPurple", COLORS['glass_purple'])
-    mat_glass_green = create_material("GlassGreen", COLORS['glass_green'])
-    mat_glass_orange = create_material("GlassOrange", COLORS['glass_orange'])
-    mat_dark = create_material("Dark", COLORS['dark'])
-    
-    parts = []
-    
-    # Base
-    parts.append(create_box("T2_Base", (0, 0, 0.6), (4.0, 4.0, 0.6), mat_stone))
-    
-    # Foundation
-    parts.append(create_box("T2_Foundation", (0, 0, 1.45), (4.3, 4.3, 0.5), mat_stone_dark))
-    
-    # Main nave
-    parts.append(create_box("T2_Nave", (0, 0, 4.35), (3.5, 3.5, 2.15), mat_stone_light))
-    
-    # Doorway
-    parts.append(create_box("T2_Doorway", (0, -1.75, 2.85), (1.0, 0.05, 1.1), mat_dark))
-    # Door arches (layered)
-    parts.append(create_box("T2_DoorArchOuter", (0, -1.75, 3.75), (1.2, 0.05, 0.25), mat_stone))
-    parts.append(create_box("T2_DoorArchInner", (0, -1.75, 3.65), (1.0, 0.05, 0.2), mat_stone_light))
-    
-    # Side windows (4 lancet windows)
-    parts.append(create_lancet_window("T2_WindowL1", (-1.6, -1.75, 3.85), (0.35, 0.05, 0.8), mat_glass_purple))
-    parts.append(create_lancet_window("T2_WindowL2", (-1.6, -1.75, 2.65), (0.35, 0.05, 0.8), mat_glass_green))
-    parts.append(create_lancet_window("T2_WindowR1", (1.6, -1.75, 3.85), (0.35, 0.05, 0.8), mat_glass_orange))
-    parts.append(create_lancet_window("T2_WindowR2", (1.6, -1.75, 2.65), (0.35, 0.05, 0.8), mat_glass_blue))
-    
-    # Rose window
-    parts.append(create_rose_window("T2_RoseWindow", (0, -1.8, 4.65), 1.2, mat_glass_blue, mat_glass_red))
-    
-    # Roof base
-    parts.append(create_box("T2_RoofBase", (0, 0, 5.55), (3.8, 3.8, 0.25), mat_stone_dark))
-    
-    # Main roof
-    parts.append(create_pyramid("T2_Roof", (0, 0, 5.8), (3.3, 3.3), 1.25, mat_slate))
-    
+T1_LAYOUT = [
+    ('box', "T1_Base", (0, 0, 0.6), (3.2, 3.2, 0.5), 'stone'),
+    ('box', "T1_Foundation", (0, 0, 1.3), (3.5, 3.5, 0.4), 'stone_dark'),
+    ('box', "T1_Wall", (0, 0, 3.65), (3.0, 3.0, 1.85), 'stone_light'),
+    ('box', "T1_Doorway", (0, -1.5, 2.2), (0.8, 0.05, 0.9), 'dark'),
+    ('box', "T1_DoorArch", (0, -1.5, 2.95), (1.0, 0.05, 0.2), 'stone'),
+    ('lancet', "T1_WindowLeft", (-1.1, -1.5, 3.85), (0.4, 0.05, 0.7), 'glass_blue'),
+    ('lancet', "T1_WindowRight", (1.1, -1.5, 3.85), (0.4, 0.05, 0.7), 'glass_red'),
+    ('box', "T1_RoofBase", (0, 0, 4.65), (3.3, 3.3, 0.25), 'stone_dark'),
+    ('pyramid', "T1_Roof", (0, 0, 4.9), (2.8, 2.8), 1.25, 'slate'),
+    ('bell', "T1_Bell", (0, 0, 5.0), (0.5, 0.5, 0.4), 'wood'),
+    ('cross', "T1_Cross", (0, 0, 6.3), (0.2, 0.6, 0.9), 'gold'),
+]
+
+T2_LAYOUT = [
+    ('box', "T2_Base", (0, 0, 0.6), (4.0, 4.0, 0.6), 'stone'),
+    ('box', "T2_Foundation", (0, 0, 1.45), (4.3, 4.3, 0.5), 'stone_dark'),
+    ('box', "T2_Nave", (0, 0, 4.35), (3.5, 3.5, 2.15), 'stone_light'),
+    ('box', "T2_Doorway", (0, -1.75, 2.85), (1.0, 0.05, 1.1), 'dark'),
+    ('box', "T2_DoorArchOuter", (0, -1.75, 3.75), (1.2, 0.05, 0.25), 'stone'),
+    ('box', "T2_DoorArchInner", (0, -1.75, 3.65), (1.0, 0.05, 0.2), 'stone_light'),
+    ('lancet', "T2_WindowL1", (-1.6, -1.75, 3.85), (0.35, 0.05, 0.8), 'glass_purple'),
+    ('lancet', "T2_WindowL2", (-1.6, -1.75, 2.65), (0.35, 0.05, 0.8), 'glass_green'),
+    ('lancet', "T2_WindowR1", (1.6, -1.75, 3.85), (0.35, 0.05, 0.8), 'glass_orange'),
+    ('lancet', "T2_WindowR2", (1.6, -1.75, 2.65), (0.35, 0.05, 0.8), 'glass_blue'),
+    ('rose', "T2_RoseWindow", (0, -1.8, 4.65), 1.2, 'glass_blue', 'glass_red'),
+    ('box', "T2_RoofBase", (0, 0, 5.55), (3.8, 3.8, 0.25), 'stone_dark'),
+    ('pyramid', "T2_Roof", (0, 0, 5.8), (3.3, 3.3), 1.25, 'slate'),
     # Left tower
-    parts.append(create_box("T2_TowerLeft", (-1.9, 0, 6.75), (0.9, 0.9, 1.5), mat_stone))
-    parts.append(create_box("T2_BellOpenLeft", (-1.9, -0.45, 6.6), (0.5, 0.05, 0.6), mat_dark))
-    parts.append(create_bell("T2_BellLeft", (-1.9, 0, 6.65), (0.3, 0.3, 0.3), mat_wood))
-    parts.append(create_pyramid("T2_SpireLeft", (-1.9, 0, 7.6), (0.5, 0.5), 1.0, mat_slate_dark))
-    parts.append(create_cross("T2_CrossLeft", (-1.9, 0, 8.7), (0.2, 0.4, 0.7), mat_gold))
-    
+    ('box', "T2_TowerLeft", (-1.9, 0, 6.75), (0.9, 0.9, 1.5), 'stone'),
+    ('box', "T2_BellOpenLeft", (-1.9, -0.45, 6.6), (0.5, 0.05, 0.6), 'dark'),
+    ('bell', "T2_BellLeft", (-1.9, 0, 6.65), (0.3, 0.3, 0.3), 'wood'),
+    ('pyramid', "T2_SpireLeft", (-1.9, 0, 7.6), (0.5, 0.5), 1.0, 'slate_dark'),
+    ('cross', "T2_CrossLeft", (-1.9, 0, 8.7), (0.2, 0.4, 0.7), 'gold'),
     # Right tower
-    parts.append(create_box("T2_TowerRight", (1.9, 0, 6.75), (0.9, 0.9, 1.5), mat_stone))
-    parts.append(create_box("T2_BellOpenRight", (1.9, -0.45, 6.6), (0.5, 0.05, 0.6), mat_dark))
-    parts.append(create_bell("T2_BellRight", (1.9, 0, 6.65), (0.3, 0.3, 0.3), mat_wood))
-    parts.append(create_pyramid("T2_SpireRight", (1.9, 0, 7.6), (0.5, 0.5), 1.0, mat_slate_dark))
-    parts.append(create_cross("T2_CrossRight", (1.9, 0, 8.7), (0.2, 0.4, 0.7), mat_gold))
-    
-    # Join all parts
-    bpy.context.view_layer.objects.active = parts[0]
-    for obj in parts[1:]:
-        obj.select_set(True)
-    bpy.ops.object.join()
-    
-    tower = bpy.context.active_object
-    tower.name = "ChurchTower_T2"
-    tower.location = (0, 0, 0)
-    
-    print("T2 Parish Church created successfully!")
-    return tower
-
-# ═══════════════════════════════════════════════════════════════
-# T3 GRAND CATHEDRAL
-# ═══════════════════════════════════════════════════════════════
+    ('box', "T2_TowerRight", (1.9, 0, 6.75), (0.9, 0.9, 1.5), 'stone'),
+    ('box', "T2_BellOpenRight", (1.9, -0.45, 6.6), (0.5, 0.05, 0.6), 'dark'),
+    ('bell', "T2_BellRight", (1.9, 0, 6.65), (0.3, 0.3, 0.3), 'wood'),
+    ('pyramid', "T2_SpireRight", (1.9, 0, 7.6), (0.5, 0.5), 1.0, 'slate_dark'),
+    ('cross', "T2_CrossRight", (1.9, 0, 8.7), (0.2, 0.4, 0.7), 'gold'),
+]
 
-def create_t3_cathedral():
-    """Create T3 Grand Cathedral tower"""
-    print("Creating T3 Grand Cathedral...")
-    
-    # Materials
-    mat_stone = create_material("Stone", COLORS['stone'])
-    mat_stone_dark = create_material("StoneDark", COLORS['stone_dark'])
-    mat_stone_light = create_material("StoneLight", COLORS['stone_light'])
-    mat_slate = create_material("Slate", COLORS['slate'])
-    mat_slate_dark = create_material("SlateDark", COLORS['slate_dark'])
-    mat_gold = create_material("Gold", COLORS['gold'])
-    mat_wood = create_material("Wood", COLORS['wood'])
-    mat_glass_blue = create_material("GlassBlue", COLORS['glass_blue'])
-    mat_glass_red = create_material("GlassRed", COLORS['glass_red'])
-    mat_glass_purple = create_material("GlassPurple", COLORS['glass_purple'])
-    mat_glass_green = create_material("GlassGreen", COLORS['glass_green'])
-    mat_glass_orange = create_material("GlassOrange", COLORS['glass_orange'])
-    mat_dark = create_material("Dark", COLORS['dark'])
-    
-    parts = []
-    
-    # Base
-    parts.append(create_box("T3_Base", (0, 0, 0.75), (4.8, 4.8, 0.75), mat_stone))
-    
-    # Foundation
-    parts.append(create_box("T3_Foundation", (0, 0, 1.85), (5.2, 5.2, 0.65), mat_stone_dark))
-    
-    # Main cathedral body
-    parts.append(create_box("T3_Cathedral", (0, 0, 5.35), (4.4, 4.4, 2.85), mat_stone_light))
-    
+T3_LAYOUT = [
+    ('box', "T3_Base", (0, 0, 0.75), (4.8, 4.8, 0.75), 'stone'),
+    ('box', "T3_Foundation", (0, 0, 1.85), (5.2, 5.2, 0.65), 'stone_dark'),
+    ('box', "T3_Cathedral", (0, 0, 5.35), (4.4, 4.4, 2.85), 'stone_light'),
     # Grand entrance
-    parts.append(create_box("T3_Doorway", (0, -2.2, 3.25), (1.4, 0.05, 1.4), mat_dark))
-    parts.append(create_box("T3_DoorArchOuter", (0, -2.2, 4.4), (1.8, 0.05, 0.3), mat_stone))
-    parts.append(create_box("T3_DoorArchInner", (0, -2.2, 4.3), (1.6, 0.05, 0.2), mat_stone_light))
-    
+    ('box', "T3_Doorway", (0, -2.2, 3.25), (1.4, 0.05, 1.4), 'dark'),
+    ('box', "T3_DoorArchOuter", (0, -2.2, 4.4), (1.8, 0.05, 0.3), 'stone'),
+    ('box', "T3_DoorArchInner", (0, -2.2, 4.3), (1.6, 0.05, 0.2), 'stone_light'),
     # Side lancet windows (6 total)
-    parts.append(create_lancet_window("T3_WindowL1", (-2.0, -2.2, 5.55), (0.4, 0.05, 1.0), mat_glass_purple))
-    parts.append(create_lancet_window("T3_WindowL2", (-2.0, -2.2, 4.05), (0.4, 0.05, 1.0), mat_glass_green))
-    parts.append(create_lancet_window("T3_WindowL3", (-1.4, -2.2, 4.05), (0.4, 0.05, 1.0), mat_glass_orange))
-    parts.append(create_lancet_window("T3_WindowR1", (2.0, -2.2, 5.55), (0.4, 0.05, 1.0), mat_glass_red))
-    parts.append(create_lancet_window("T3_WindowR2", (2.0, -2.2, 4.05), (0.4, 0.05, 1.0), mat_glass_blue))
-    parts.append(create_lancet_window("T3_WindowR3", (1.4, -2.2, 4.05), (0.4, 0.05, 1.0), mat_glass_green))
-    
+    ('lancet', "T3_WindowL1", (-2.0, -2.2, 5.55), (0.4, 0.05, 1.0), 'glass_purple'),
+    ('lancet', "T3_WindowL2", (-2.0, -2.2, 4.05), (0.4, 0.05, 1.0), 'glass_green'),
+    ('lancet', "T3_WindowL3", (-1.4, -2.2, 4.05), (0.4, 0.05, 1.0), 'glass_orange'),
+    ('lancet', "T3_WindowR1", (2.0, -2.2, 5.55), (0.4, 0.05, 1.0), 'glass_red'),
+    ('lancet', "T3_WindowR2", (2.0, -2.2, 4.05), (0.4, 0.05, 1.0), 'glass_blue'),
+    ('lancet', "T3_WindowR3", (1.4, -2.2, 4.05), (0.4, 0.05, 1.0), 'glass_green'),
     # Grand rose window (3 layers)
-    bpy.ops.mesh.primitive_cylinder_add(
-        vertices=16,
-        radius=0.9,
-        depth=0.1,
-        location=(0, -2.25, 5.65)
-    )
-    rose_outer = bpy.context.active_object
-    rose_outer.rotation_euler[1] = pi/2
-    rose_outer.data.materials.append(mat_glass_blue)
-    parts.append(rose_outer)
-    
-    bpy.ops.mesh.primitive_cylinder_add(
-        vertices=12,
-        radius=0.7,
-        depth=0.12,
-        location=(0, -2.25, 5.65)
-    )
-    rose_mid = bpy.context.active_object
-    rose_mid.rotation_euler[1] = pi/2
-    rose_mid.data.materials.append(mat_glass_red)
-    parts.append(rose_mid)
-    
-    bpy.ops.mesh.primitive_cylinder_add(
-        vertices=8,
-        radius=0.4,
-        depth=0.14,
-        location=(0, -2.25, 5.65)
-    )
-    rose_center = bpy.context.active_object
-    rose_center.rotation_euler[1] = pi/2
-    rose_center.data.materials.append(mat_glass_green)
-    parts.append(rose_center)
-    
-    # Main roof base
-    parts.append(create_box("T3_RoofBase", (0, 0, 6.9), (4.6, 4.6, 0.25), mat_stone_dark))
-    
-    # Main roof
-    parts.append(create_pyramid("T3_Roof", (0, 0, 7.2), (4.0, 4.0), 1.5, mat_slate))
-    
+    ('disc', "T3_RoseOuter", (0, -2.25, 5.65), 0.9, 0.1, 16, 'glass_blue'),
+    ('disc', "T3_RoseMiddle", (0, -2.25, 5.65), 0.7, 0.12, 12, 'glass_red'),
+    ('disc', "T3_RoseCenter", (0, -2.25, 5.65), 0.4, 0.14, 8, 'glass_green'),
+    ('box', "T3_RoofBase", (0, 0, 6.9), (4.6, 4.6, 0.25), 'stone_dark'),
+    ('pyramid', "T3_Roof", (0, 0, 7.2), (4.0, 4.0), 1.5, 'slate'),
     # Left side tower
-    parts.append(create_box("T3_TowerLeft", (-2.3, 0, 8.5), (1.1, 1.1, 1.75), mat_stone))
-    parts.append(create_box("T3_BellOpenLeft", (-2.3, -0.55, 8.25), (0.7, 0.05, 0.8), mat_dark))
-    parts.append(create_bell("T3_BellLeft", (-2.3, 0, 8.3), (0.4, 0.4, 0.4), mat_wood))
-    parts.append(create_pyramid("T3_SpireLeft", (-2.3, 0, 9.5), (0.7, 0.7), 1.25, mat_slate_dark))
-    parts.append(create_cross("T3_CrossLeft", (-2.3, 0, 10.85), (0.2, 0.5, 0.7), mat_gold))
-    
+    ('box', "T3_TowerLeft", (-2.3, 0, 8.5), (1.1, 1.1, 1.75), 'stone'),
+    ('box', "T3_BellOpenLeft", (-2.3, -0.55, 8.25), (0.7, 0.05, 0.8), 'dark'),
+    ('bell', "T3_BellLeft", (-2.3, 0, 8.3), (0.4, 0.4, 0.4), 'wood'),
+    ('pyramid', "T3_SpireLeft", (-2.3, 0, 9.5), (0.7, 0.7), 1.25, 'slate_dark'),
+    ('cross', "T3_CrossLeft", (-2.3, 0, 10.85), (0.2, 0.5, 0.7), 'gold'),
     # Right side tower
-    parts.append(create_box("T3_TowerRight", (2.3, 0, 8.5), (1.1, 1.1, 1.75), mat_stone))
-    parts.append(create_box("T3_BellOpenRight", (2.3, -0.55, 8.25), (0.7, 0.05, 0.8), mat_dark))
-    parts.append(create_bell("T3_BellRight", (2.3, 0, 8.3), (0.4, 0.4, 0.4), mat_wood))
-    parts.append(create_pyramid("T3_SpireRight", (2.3, 0, 9.5), (0.7, 0.7), 1.25, mat_slate_dark))
-    parts.append(create_cross("T3_CrossRight", (2.3, 0, 10.85), (0.2, 0.5, 0.7), mat_gold))
-    
+    ('box', "T3_TowerRight", (2.3, 0, 8.5), (1.1, 1.1, 1.75), 'stone'),
+    ('box', "T3_BellOpenRight", (2.3, -0.55, 8.25), (0.7, 0.05, 0.8), 'dark'),
+    ('bell', "T3_BellRight", (2.3, 0, 8.3), (0.4, 0.4, 0.4), 'wood'),
+    ('pyramid', "T3_SpireRight", (2.3, 0, 9.5), (0.7, 0.7), 1.25, 'slate_dark'),
+    ('cross', "T3_CrossRight", (2.3, 0, 10.85), (0.2, 0.5, 0.7), 'gold'),
     # Central tower (tallest)
-    parts.append(create_box("T3_CentralTowerBase", (0, 0, 7.75), (1.6, 1.6, 0.75), mat_stone_dark))
-    parts.append(create_box("T3_CentralTower", (0, 0, 9.95), (1.4, 1.4, 2.25), mat_stone))
-    parts.append(create_box("T3_CentralBellOpen", (0, -0.7, 9.7), (1.0, 0.05, 0.9), mat_dark))
-    parts.append(create_bell("T3_BellCenter", (0, 0, 9.75), (0.6, 0.6, 0.5), mat_wood))
-    parts.append(create_pyramid("T3_CentralSpire", (0, 0, 11.2), (1.0, 1.0), 1.5, mat_slate_dark))
-    parts.append(create_cross("T3_CrossCenter", (0, 0, 13.0), (0.2, 0.6, 0.9), mat_gold))
-    
+    ('box', "T3_CentralTowerBase", (0, 0, 7.75), (1.6, 1.6, 0.75), 'stone_dark'),
+    ('box', "T3_CentralTower", (0, 0, 9.95), (1.4, 1.4, 2.25), 'stone'),
+    ('box', "T3_CentralBellOpen", (0, -0.7, 9.7), (1.0, 0.05, 0.9), 'dark'),
+    ('bell', "T3_BellCenter", (0, 0, 9.75), (0.6, 0.6, 0.5), 'wood'),
+    ('pyramid', "T3_CentralSpire", (0, 0, 11.2), (1.0, 1.0), 1.5, 'slate_dark'),
+    ('cross', "T3_CrossCenter", (0, 0, 13.0), (0.2, 0.6, 0.9), 'gold'),
+]
+
+LAYOUTS = {'T1': T1_LAYOUT, 'T2': T2_LAYOUT, 'T3': T3_LAYOUT}
+
+
+def material_name(color_key):
+    """'stone_dark' -> 'StoneDark'"""
+    return ''.join(word.title() for word in color_key.split('_'))
+
+
+def build_tower(tier, label):
+    """Create every part of a tier layout and join them into ChurchTower_<tier>"""
+    print(f"Creating {label}...")
+
+    materials = {}
+
+    def mat(key):
+        if key not in materials:
+            materials[key] = create_material(material_name(key), COLORS[key])
+        return materials[key]
+
+    parts = []
+    for shape, name, location, *args in LAYOUTS[tier]:
+        if shape == 'box':
+            parts.append(create_box(name, location, args[0], mat(args[1])))
+        elif shape == 'pyramid':
+            parts.append(create_pyramid(name, location, args[0], args[1], mat(args[2])))
+        elif shape == 'cross':
+            parts.append(create_cross(name, location, args[0], mat(args[1])))
+        elif shape == 'lancet':
+            parts.append(create_lancet_window(name, location, args[0], mat(args[1])))
+        elif shape == 'bell':
+            parts.append(create_bell(name, location, args[0], mat(args[1])))
+        elif shape == 'rose':
+            parts.append(create_rose_window(name, location, args[0], mat(args[1]), mat(args[2])))
+        elif shape == 'disc':
+            parts.append(create_disc(name, location, args[0], args[1], args[2], mat(args[3])))
+
     # Join all parts
     bpy.context.view_layer.objects.active = parts[0]
     for obj in parts[1:]:
         obj.select_set(True)
     bpy.ops.object.join()
-    
+
     tower = bpy.context.active_object
-    tower.name = "ChurchTower_T3"
+    tower.name = f"ChurchTower_{tier}"
     tower.location = (0, 0, 0)
-    
-    print("T3 Grand Cathedral created successfully!")
+
+    print(f"{label} created successfully!")
     return tower
 
+# ═══════════════════════════════════════════════════════════════
+# T1 CHAPEL / T2 PARISH CHURCH / T3 GRAND CATHEDRAL
+# ═══════════════════════════════════════════════════════════════
+
+def create_t1_chapel():
+    """Create T1 Chapel tower"""
+    return build_tower('T1', "T1 Chapel")
+
+def create_t2_parish():
+    """Create T2 Parish Church tower"""
+    return build_tower('T2', "T2 Parish Church")
+
+def create_t3_cathedral():
+    """Create T3 Grand Cathedral tower"""
+    return build_tower('T3', "T3 Grand Cathedral")
+
 # ═══════════════════════════════════════════════════════════════
 # EXPORT & UTILITIES
 # ═══════════════════════════════════════════════════════════════
@@ -564,6 +476,8 @@ def main(tier="T1", export_path=None):
 
 # Execute
 if __name__ == "__main__":
+    if bpy is None:
+        raise SystemExit("Run this script inside Blender (bpy not available)")
     # Change these parameters as needed
     TIER = "ALL"  # "T1", "T2", "T3", or "ALL"
     EXPORT_PATH = "/tmp"  # Set to None to skip export, or provide path
@@ -0,0 +1,119 @@
+"""
+Single-draw export: bake material colours into vertex colours.
+
+The tower OBJs switch materials 8-14 times (usemtl Wood, Stone, Gold, ...)
+and every switch is a separate draw or state change for a renderer. This
+stage folds each face's Kd (optionally times the baked AO, ao_bake.py)
+into per-vertex colours and regroups the faces into at most two ranges:
+
+  Baked          every lit material, one contiguous face range
+  BakedEmissive  emissive materials (Glow, GlowGold), unlit and not
+                 darkened by AO; flagged in the MTL with `Ke 1 1 1`
+
+Vertices shared by faces of different materials are split so each vertex
+carries one colour. Face order inside a range follows the source mesh.
+
+Usage:
+  python color_bake.py sniper_t3.obj            # -> sniper_t3.baked.obj/.mtl
+  python color_bake.py sniper_t*.obj --ao       # multiply by AO (ao_bake.py)
+  python color_bake.py basic_t3.obj --emissive Glow,GlowGold,Lantern
+
+Requires: numpy
+"""
+
+import argparse
+import os
+
+import numpy as np
+
+from ao_bake import SAMPLES, bake_ao
+from mesh_core import Mesh, read_mtl, read_obj, write_obj
+
+EMISSIVE = ('Glow', 'GlowGold')
+BAKED = 'Baked'
+BAKED_EMISSIVE = 'BakedEmissive'
+
+
+def bake_vertex_colors(mesh, palette, ao=None, emissive=EMISSIVE):
+    """Mesh with one lit and (if needed) one emissive material, colours per vertex.
+
+    palette: material name -> Kd; ao: optional per-vertex AO in [0, 1].
+    """
+    missing = sorted(set(mesh.materials) - set(palette))
+    if missing:
+        raise ValueError(f"no Kd for material(s): {', '.join(missing)}")
+    kd = np.array([palette[m] for m in mesh.materials], dtype=np.float64).reshape(-1, 3)
+    glow = np.array([m in emissive for m in mesh.materials], dtype=bool)
+
+    # one vertex per (position, material) pair
+    corner_mat = np.repeat(mesh.face_material, 4)
+    keys = mesh.quads.ravel().astype(np.int64) * len(mesh.materials) + corner_mat
+    unique, corner_vertex = np.unique(keys, return_inverse=True)
+    source = unique // len(mesh.materials)
+    material = unique % len(mesh.materials)
+    colors = kd[material]
+    if ao is not None:
+        shade = np.asarray(ao, dtype=np.float64)[source]
+        colors = np.where(glow[material][:, None], colors, colors * shade[:, None])
+
+    face_glow = glow[mesh.face_material]
+    order = np.argsort(face_glow, kind='stable')
+    materials = [BAKED, BAKED_EMISSIVE] if face_glow.any() else [BAKED]
+    return Mesh(mesh.positions[source], corner_vertex.reshape(-1, 4)[order], materials,
+                face_glow[order].astype(np.int32), mesh.normals, mesh.corner_normal[order],
+                mesh.face_smooth[order], mesh.face_part[order], mesh.part_names, colors)
+
+
+def draw_ranges(mesh):
+    """(material, first face, face count) per usemtl run, in file order."""
+    change = np.flatnonzero(np.diff(mesh.face_material)) + 1
+    starts = np.r_[0, change] if mesh.face_count else np.zeros(0, dtype=int)
+    counts = np.diff(np.r_[starts, mesh.face_count])
+    return [(mesh.materials[mesh.face_material[s]], int(s), int(c)) for s, c in zip(starts, counts)]
+
+
+def write_baked_mtl(filename, title="Tower"):
+    """Material library for a baked mesh: white lit material plus the emissive flag."""
+    with open(filename, 'w') as f:
+        f.write(f"# Materials for {title} (colours in the vertices)\n\n")
+        f.write(f"newmtl {BAKED}\nKa 0.0000 0.0000 0.0000\nKd 1.0000 1.0000 1.0000\n"
+                "Ks 0.0000 0.0000 0.0000\nNs 0.0\nd 1.0\n\n")
+        f.write(f"newmtl {BAKED_EMISSIVE}\nKa 0.0000 0.0000 0.0000\nKd 1.0000 1.0000 1.0000\n"
+                "Ke 1.0000 1.0000 1.0000\nKs 0.0000 0.0000 0.0000\nNs 0.0\nd 1.0\nillum 0\n\n")
+
+
+def export_baked(mesh, palette, filename, title, ao=None, emissive=EMISSIVE):
+    """Bake *mesh* and write <filename> plus its .mtl; returns the baked mesh."""
+    baked = bake_vertex_colors(mesh, palette, ao, emissive)
+    write_obj(baked, filename, title)
+    write_baked_mtl(os.path.splitext(filename)[0] + '.mtl', title)
+    return baked
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Bake material colours into vertex colours for single-draw meshes.")
+    ap.add_argument('objs', nargs='+', help="tower OBJs (their .mtl must sit next to them)")
+    ap.add_argument('--ao', nargs='?', type=int, const=SAMPLES, metavar='SAMPLES',
+                    help="multiply the lit colours by baked ambient occlusion")
+    ap.add_argument('--emissive', default=','.join(EMISSIVE), help="comma-separated emissive materials")
+    args = ap.parse_args()
+
+    emissive = tuple(m for m in args.emissive.split(',') if m)
+    for path in args.objs:
+        mesh = read_obj(path)
+        palette = read_mtl(os.path.splitext(path)[0] + '.mtl')
+        # OBJs written by ao_bake.py --write already carry the AO as grey colours
+        ao = None if mesh.colors is None else mesh.colors[:, 0]
+        if args.ao:
+            ao = bake_ao(mesh, args.ao)
+        with open(path) as f:
+            title = f.readline()[1:].strip()
+        out = os.path.splitext(path)[0] + '.baked.obj'
+        baked = export_baked(mesh, palette, out, title, ao, emissive)
+        ranges = ', '.join(f"{m} {first}+{count}" for m, first, count in draw_ranges(baked))
+        print(f"{os.path.basename(path)}: {len(draw_ranges(mesh))} material runs -> {ranges} faces; "
+              f"{mesh.vertex_count} -> {baked.vertex_count} verts -> {out}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,203 @@
+"""
+Axis-aligned CSG union for the tower meshes.
+
+The generators build towers from overlapping boxes: pillars run through
+floors, brackets wrap pillars, trim sits on walls. Every buried face is
+still emitted, costing triangles and z-fighting where two boxes share a
+plane. This pass replaces the box parts with the exterior surface of
+their union:
+
+  1. box detection    parts that are closed, axis-aligned boxes; anything
+                      else (flared roofs) passes through untouched
+  2. sweep-and-prune  boxes sorted on x, overlap tested on y/z, so only
+                      touching boxes are joined into clusters
+  3. grid             each cluster is cut on the unique box coordinates;
+                      every cell records the box that fills it (smaller
+                      boxes win, so trim keeps its material over the body)
+  4. surface          faces between a solid cell and an empty one are
+                      kept, merged into rectangles per material and plane
+
+Faces where two different materials touch are interior too and are
+dropped, so the union is per material on the outside and solid inside.
+Merged rectangles can leave T-junctions; at sprite bake sizes they do
+not crack.
+
+Usage:
+  python csg_union.py sniper_t3.obj               # -> sniper_t3_union.obj
+  python csg_union.py basic_t3.obj -o out.obj
+
+Requires: numpy
+"""
+
+import argparse
+import os
+
+import numpy as np
+
+from mesh_core import Mesh, compute_normals, connected_components, read_obj, write_obj
+
+SNAP_DECIMALS = 6  # box coordinates closer than this are treated as equal
+
+
+# ─── Boxes ───────────────────────────────────────────────────────
+
+def box_parts(mesh):
+    """Boolean mask over parts: True for closed axis-aligned boxes."""
+    parts = len(mesh.part_names)
+    n = mesh.face_normals()
+    axis = np.abs(n).argmax(1)
+    aligned = np.abs(n).max(1) > 1 - 1e-6
+    side = axis * 2 + (n[np.arange(len(n)), axis] > 0)
+    sides = np.zeros((parts, 6), dtype=np.int64)
+    np.add.at(sides, (mesh.face_part, side), 1)
+
+    lo, hi = mesh.part_bounds()
+    p = mesh.positions[mesh.quads]
+    plo, phi = lo[mesh.face_part][:, None], hi[mesh.face_part][:, None]
+    on_box = (np.isclose(p, plo) | np.isclose(p, phi)).all((1, 2)) & aligned
+    bad = np.bincount(mesh.face_part, ~on_box, minlength=parts) > 0
+    return (sides == 1).all(1) & ~bad & ((hi - lo) > 10.0 ** -SNAP_DECIMALS).all(1)
+
+
+def sweep_and_prune(lo, hi, eps=0.0):
+    """All (a, b) pairs of touching or overlapping boxes (lo/hi are (N, 3))."""
+    order = np.argsort(lo[:, 0], kind='stable')
+    start = lo[order, 0]
+    end = np.searchsorted(start, hi[order, 0] + eps, side='right')
+    n = np.maximum(end - np.arange(len(order)) - 1, 0)
+    a = np.repeat(np.arange(len(order)), n)
+    b = a + 1 + (np.arange(n.sum()) - np.repeat(np.cumsum(n) - n, n))
+    a, b = order[a], order[b]
+    hit = ((lo[a] <= hi[b] + eps) & (lo[b] <= hi[a] + eps)).all(1)
+    return a[hit], b[hit]
+
+
+# ─── Surface extraction ──────────────────────────────────────────
+
+def _greedy(need, free):
+    todo = need.copy()
+    out = []
+    for r, c in np.argwhere(need):
+        if not todo[r, c]:
+            continue
+        c1 = c + 1
+        while c1 < need.shape[1] and todo[r, c1]:
+            c1 += 1
+        r1 = r + 1
+        while r1 < need.shape[0] and (todo[r1, c:c1] | free[r1, c:c1]).all():
+            r1 += 1
+        while not todo[r1 - 1, c:c1].any():
+            r1 -= 1
+        todo[r:r1, c:c1] = False
+        out.append((r, c, r1, c1))
+    return out
+
+
+def _rectangles(need, free):
+    """Greedy cover of the *need* cells of a 2D mask by rectangles lying inside
+    need | free, scanning both ways and keeping the smaller cover.
+    Returns (r0, c0, r1, c1) tuples, end-exclusive."""
+    rows = _greedy(need, free)
+    cols = [(r0, c0, r1, c1) for c0, r0, c1, r1 in _greedy(need.T, free.T)]
+    return cols if len(cols) < len(rows) else rows
+
+
+def _surface(coords, owner, box_mat):
+    """Exterior rectangles of a labelled cell grid as (corners, owner box) lists.
+
+    Rectangles are merged per material and may run through cells buried on
+    both sides, so a pillar passing through a floor stays one face per side.
+    Each rectangle is credited to the box owning its first cell.
+    """
+    quads, owners = [], []
+    for axis in range(3):
+        u, v = (axis + 1) % 3, (axis + 2) % 3
+        lab = np.transpose(owner, (axis, u, v))
+        pad = np.full((1,) + lab.shape[1:], -1, dtype=lab.dtype)
+        lab = np.concatenate([pad, lab, pad])
+        below, above = lab[:-1], lab[1:]
+        buried = (below >= 0) & (above >= 0)
+        for facing, mask, label in ((+1, (below >= 0) & (above < 0), below),
+                                    (-1, (below < 0) & (above >= 0), above)):
+            mat = np.where(mask, box_mat[label], -1)
+            for plane in np.flatnonzero(mask.any((1, 2))):
+                w = coords[axis][plane]
+                for m in np.unique(mat[plane][mask[plane]]):
+                    for r0, c0, r1, c1 in _rectangles(mat[plane] == m, buried[plane]):
+                        a0, a1 = coords[u][r0], coords[u][r1]
+                        b0, b1 = coords[v][c0], coords[v][c1]
+                        ring = [(a0, b0), (a1, b0), (a1, b1), (a0, b1)]
+                        if facing < 0:
+                            ring.reverse()
+                        corner = np.zeros((4, 3))
+                        corner[:, axis] = w
+                        corner[:, u], corner[:, v] = np.array(ring).T
+                        quads.append(corner)
+                        owners.append(label[plane][r0, c0])
+    return quads, owners
+
+
+# ─── Union ───────────────────────────────────────────────────────
+
+def csg_union(mesh):
+    """Return a new mesh where every cluster of touching boxes is replaced by
+    the exterior surface of its union. Normals are left for compute_normals."""
+    is_box = box_parts(mesh)
+    boxes = np.flatnonzero(is_box)
+    if not len(boxes):
+        return mesh
+    lo, hi = mesh.part_bounds()
+    lo, hi = np.round(lo[boxes], SNAP_DECIMALS), np.round(hi[boxes], SNAP_DECIMALS)
+    part_mat = np.zeros(len(mesh.part_names), dtype=np.int32)
+    part_mat[mesh.face_part] = mesh.face_material
+
+    a, b = sweep_and_prune(lo, hi, 10.0 ** -SNAP_DECIMALS)
+    cluster = connected_components(len(boxes), a, b)
+    volume = (hi - lo).prod(1)
+
+    corners, face_part = [], []
+    for c in np.unique(cluster):
+        members = np.flatnonzero(cluster == c)
+        coords = [np.unique(np.r_[lo[members, k], hi[members, k]]) for k in range(3)]
+        owner = np.full([len(x) - 1 for x in coords], -1, dtype=np.int32)
+        for m in members[np.argsort(-volume[members], kind='stable')]:
+            i0 = [np.searchsorted(coords[k], lo[m, k]) for k in range(3)]
+            i1 = [np.searchsorted(coords[k], hi[m, k]) for k in range(3)]
+            owner[i0[0]:i1[0], i0[1]:i1[1], i0[2]:i1[2]] = m
+        quads, owners = _surface(coords, owner, part_mat[boxes])
+        corners += quads
+        face_part += [boxes[o] for o in owners]
+
+    rest = mesh.subset(~is_box[mesh.face_part])
+    corners = np.concatenate([rest.positions[rest.quads].reshape(-1, 3),
+                              np.asarray(corners).reshape(-1, 3)])
+    face_part = np.r_[rest.face_part, np.asarray(face_part, dtype=np.int32)]
+    positions, quads = np.unique(np.round(corners, SNAP_DECIMALS), axis=0, return_inverse=True)
+    quads = quads.reshape(-1, 4)
+
+    used, face_part = np.unique(face_part, return_inverse=True)
+    face_part = face_part.reshape(-1)
+    face_material = part_mat[used][face_part]
+    order = np.argsort(face_material, kind='stable')
+    return Mesh(positions, quads[order], mesh.materials, face_material[order],
+                face_part=face_part[order], part_names=[mesh.part_names[p] for p in used])
+
+
+# ─── CLI ─────────────────────────────────────────────────────────
+
+def main():
+    ap = argparse.ArgumentParser(description="Replace overlapping boxes with the surface of their union.")
+    ap.add_argument('obj', help="input OBJ written by one of the generators")
+    ap.add_argument('-o', '--output', help="output path (default: <name>_union.obj)")
+    args = ap.parse_args()
+
+    mesh = read_obj(args.obj)
+    merged = compute_normals(csg_union(mesh))
+    out = args.output or os.path.splitext(args.obj)[0] + '_union.obj'
+    write_obj(merged, out, os.path.basename(args.obj))
+    print(f"{args.obj}: {mesh.face_count} -> {merged.face_count} faces, "
+          f"{mesh.vertex_count} -> {merged.vertex_count} verts -> {out}")
+
+
+if __name__ == '__main__':
+    main()
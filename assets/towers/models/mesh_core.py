@@ -0,0 +1,511 @@
+"""
+Array-backed mesh core for the offline tower tooling.
+
+The generator scripts (gen_sniper_all.py, gen_basic_t2.py, gen_basic_t3.py,
+gen_sniper_t1.py) build meshes with small list-based builders. The tools in
+this directory (culling, baking, validation...) work on a frozen NumPy copy
+of that data instead, so every pass can be written as whole-array maths.
+
+Layout:
+  positions     (V, 3) float64  vertex positions, Y-up like the OBJ files
+  quads         (F, 4) int32    zero-based vertex indices, CCW = outward
+  face_material (F,)   int32    index into `materials`
+  normals       (N, 3) float64  OBJ `vn` table, deduplicated
+  corner_normal (F, 4) int32    index into `normals` for each quad corner
+  face_smooth   (F,)   int32    OBJ smoothing group, 0 = off
+  face_part     (F,)   int32    index into `part_names`; a part is one builder
+                                primitive (add_box/add_flared_roof/box/roof)
+  colors        (V, 3) float64  optional OBJ vertex colours (`v x y z r g b`),
+                                None when the mesh has none
+
+For process pools the arrays can be moved into one shared-memory block
+(SharedMesh); workers get a small picklable descriptor and attach_mesh()
+turns it into a Mesh over zero-copy views.
+
+Requires: numpy
+"""
+
+import os
+import weakref
+from multiprocessing import shared_memory
+
+import numpy as np
+
+NORMAL_DECIMALS = 4  # matches the %.4f the OBJ writer prints
+
+class Mesh:
+    def __init__(self, positions, quads, materials, face_material, normals=None, corner_normal=None,
+                 face_smooth=None, face_part=None, part_names=None, colors=None):
+        self.positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+        self.quads = np.asarray(quads, dtype=np.int32).reshape(-1, 4)
+        self.materials = list(materials)
+        self.face_material = np.asarray(face_material, dtype=np.int32).reshape(-1)
+        if normals is None:
+            normals, corner_normal = np.zeros((0, 3)), np.full(self.quads.shape, -1)
+        self.normals = np.asarray(normals, dtype=np.float64).reshape(-1, 3)
+        self.corner_normal = np.asarray(corner_normal, dtype=np.int32).reshape(-1, 4)
+        if face_smooth is None:
+            face_smooth = np.zeros(len(self.quads))
+        self.face_smooth = np.asarray(face_smooth, dtype=np.int32).reshape(-1)
+        if face_part is None:
+            face_part, part_names = _connected_parts(self.quads, self.face_material, self.materials)
+        self.face_part = np.asarray(face_part, dtype=np.int32).reshape(-1)
+        self.part_names = list(part_names)
+        self.colors = None if colors is None else np.asarray(colors, dtype=np.float64).reshape(-1, 3)
+
+    @property
+    def face_count(self):
+        return len(self.quads)
+
+    @property
+    def vertex_count(self):
+        return len(self.positions)
+
+    def triangles(self):
+        """Split every quad along its 0-2 diagonal. Returns (tris, tri_face)."""
+        tris = self.quads[:, [0, 1, 2, 0, 2, 3]].reshape(-1, 3)
+        return tris, np.repeat(np.arange(self.face_count, dtype=np.int32), 2)
+
+    def face_normals(self):
+        """Geometric unit normals from the winding (Newell's method)."""
+        p = self.positions[self.quads]
+        q = np.roll(p, -1, axis=1)
+        n = np.stack([
+            ((p[..., 1] - q[..., 1]) * (p[..., 2] + q[..., 2])).sum(1),
+            ((p[..., 2] - q[..., 2]) * (p[..., 0] + q[..., 0])).sum(1),
+            ((p[..., 0] - q[..., 0]) * (p[..., 1] + q[..., 1])).sum(1),
+        ], axis=1)
+        length = np.linalg.norm(n, axis=1, keepdims=True)
+        return np.divide(n, length, out=np.zeros_like(n), where=length > 0)
+
+    def face_areas(self):
+        p = self.positions[self.quads]
+        a = np.cross(p[:, 1] - p[:, 0], p[:, 2] - p[:, 0])
+        b = np.cross(p[:, 2] - p[:, 0], p[:, 3] - p[:, 0])
+        return 0.5 * (np.linalg.norm(a, axis=1) + np.linalg.norm(b, axis=1))
+
+    def bounds(self):
+        if not self.vertex_count:
+            return np.zeros(3), np.zeros(3)
+        return self.positions.min(0), self.positions.max(0)
+
+    def subset(self, face_mask):
+        """New mesh with only the selected faces; unused vertices/normals dropped."""
+        keep = np.asarray(face_mask)
+        used_v, quads = np.unique(self.quads[keep].ravel(), return_inverse=True)
+        corner_normal = self.corner_normal[keep]
+        normals = self.normals
+        if len(normals) and corner_normal.size:
+            used_n, corner_normal = np.unique(corner_normal.ravel(), return_inverse=True)
+            normals = normals[used_n]
+        return Mesh(self.positions[used_v], quads.reshape(-1, 4), self.materials,
+                    self.face_material[keep], normals, corner_normal.reshape(-1, 4),
+                    self.face_smooth[keep], self.face_part[keep], self.part_names,
+                    None if self.colors is None else self.colors[used_v])
+
+    def part_bounds(self):
+        """Per-part AABBs as (lo, hi), each (P, 3). Parts with no faces get +inf/-inf."""
+        p = self.positions[self.quads]
+        lo = np.full((len(self.part_names), 3), np.inf)
+        hi = np.full((len(self.part_names), 3), -np.inf)
+        np.minimum.at(lo, self.face_part, p.min(1))
+        np.maximum.at(hi, self.face_part, p.max(1))
+        return lo, hi
+
+
+def connected_components(count, a, b):
+    """Connected-component labels via repeated min-label propagation."""
+    labels = np.arange(count)
+    while True:
+        before = labels.copy()
+        np.minimum.at(labels, a, labels[b])
+        np.minimum.at(labels, b, labels[a])
+        labels = labels[labels]
+        if np.array_equal(labels, before):
+            return labels
+
+
+def _connected_parts(quads, face_material, materials):
+    """Group faces that share vertex indices; the builders never share vertices between primitives."""
+    if not len(quads):
+        return np.zeros(0, np.int32), []
+    corner_face = np.repeat(np.arange(len(quads)), 4)
+    order = np.argsort(quads.ravel(), kind='stable')
+    v = quads.ravel()[order]
+    first = order[np.r_[0, np.flatnonzero(v[1:] != v[:-1]) + 1]]
+    head = first[np.cumsum(np.r_[True, v[1:] != v[:-1]]) - 1]
+    labels = connected_components(len(quads), corner_face[order], corner_face[head])
+    part = np.unique(labels, return_inverse=True)[1].reshape(-1).astype(np.int32)
+    first_face = np.unique(part, return_index=True)[1]
+    counts, names = {}, []
+    for mat in face_material[first_face]:
+        counts[mat] = counts.get(mat, 0) + 1
+        names.append(f"{materials[mat]}.{counts[mat]}")
+    return part, names
+
+
+# ─── Builder conversion ─────────────────────────────────────────
+
+def from_builder(builder):
+    """Freeze an OBJBuilder (vertices/faces) or compact B builder (v/f) into a Mesh.
+
+    Part labels set on the builder (set_part / pt) name the parts they cover;
+    unlabelled parts keep their material-based names.
+    """
+    if hasattr(builder, 'faces'):
+        verts, table, marks = builder.vertices, builder.normals, getattr(builder, 'part_marks', [])
+        records = [(m, [vi for vi, _ in fv], fv[0][1]) for m, fv in builder.faces]
+    else:
+        verts, table, marks = builder.v, builder.n, getattr(builder, 'pm', [])
+        records = [(m, vis, ni) for m, faces in builder.f.items() for vis, ni in faces]
+
+    materials = []
+    for m, _, _ in records:
+        if m not in materials:
+            materials.append(m)
+    lookup = {m: i for i, m in enumerate(materials)}
+    quads = np.array([vis for _, vis, _ in records], dtype=np.int32).reshape(-1, 4) - 1
+    face_material = np.array([lookup[m] for m, _, _ in records], dtype=np.int32)
+    face_normal = np.array([ni for _, _, ni in records], dtype=np.int32) - 1
+    mesh = Mesh(verts, quads, materials, face_material, table, np.repeat(face_normal[:, None], 4, 1))
+    if marks:
+        mesh.part_names = _label_parts(mesh, marks)
+    return mesh
+
+
+def _label_parts(mesh, marks):
+    """Rename parts after the builder label active when their first vertex was added."""
+    first = np.full(len(mesh.part_names), np.iinfo(np.int32).max)
+    np.minimum.at(first, mesh.face_part, mesh.quads.min(1))
+    starts = np.array([start for start, _ in marks])
+    active = np.searchsorted(starts, first, side='right') - 1
+    labels = [marks[i][1] if i >= 0 else None for i in active]
+    totals = {}
+    for label in labels:
+        totals[label] = totals.get(label, 0) + 1
+    seen, names = {}, []
+    for label, default in zip(labels, mesh.part_names):
+        if label is None:
+            names.append(default)
+            continue
+        seen[label] = seen.get(label, 0) + 1
+        names.append(label if totals[label] == 1 else f"{label}.{seen[label]}")
+    return names
+
+
+def part_label(name):
+    """Builder label of a part name: 'bell.3' -> 'bell', 'Gold.2' -> 'Gold'."""
+    head, _, tail = name.rpartition('.')
+    return head if head and tail.isdigit() else name
+
+
+# ─── Normals ────────────────────────────────────────────────────
+
+def dedupe_normals(vectors, decimals=NORMAL_DECIMALS):
+    """Quantize unit vectors to the OBJ print precision and dedupe. Returns (table, index)."""
+    q = np.round(np.asarray(vectors, dtype=np.float64).reshape(-1, 3), decimals) + 0.0
+    table, index = np.unique(q, axis=0, return_inverse=True)
+    return table, index.reshape(-1).astype(np.int32)
+
+
+def _smooth_pairs(mesh, normals, cos_limit):
+    """All (corner, neighbour face) pairs that meet at a welded vertex within the crease angle."""
+    weld = np.unique(np.round(mesh.positions, NORMAL_DECIMALS), axis=0, return_inverse=True)[1].reshape(-1)
+    corner_pos = weld[mesh.quads].ravel()
+    corner_face = np.repeat(np.arange(mesh.face_count), 4)
+    order = np.argsort(corner_pos, kind='stable')
+    sorted_pos = corner_pos[order]
+    starts = np.flatnonzero(np.r_[True, sorted_pos[1:] != sorted_pos[:-1]])
+    sizes = np.diff(np.r_[starts, len(order)])
+    # Cartesian product of the corners in each weld group.
+    group = np.repeat(np.arange(len(starts)), sizes)
+    rep = sizes[group]
+    a = np.repeat(np.arange(len(order)), rep)
+    b = starts[group].repeat(rep) + (np.arange(rep.sum()) - np.repeat(np.cumsum(rep) - rep, rep))
+    a, b = order[a], order[b]
+    fa, fb = corner_face[a], corner_face[b]
+    ok = (normals[fa] * normals[fb]).sum(1) >= cos_limit
+    return a[ok], fa[ok], fb[ok]
+
+
+def compute_normals(mesh, smooth_angle=None, decimals=NORMAL_DECIMALS):
+    """Replace the mesh's normals with real geometric ones, in place.
+
+    Flat (default): one normal per face, shared through a deduplicated table.
+    smooth_angle (degrees): corners average the area-weighted normals of the
+    faces meeting at that position whose normals differ by less than the
+    angle; faces joined that way share an OBJ smoothing group.
+    """
+    normals = mesh.face_normals()
+    if smooth_angle is None:
+        mesh.normals, index = dedupe_normals(normals, decimals)
+        mesh.corner_normal = np.repeat(index[:, None], 4, 1)
+        mesh.face_smooth = np.zeros(mesh.face_count, dtype=np.int32)
+        return mesh
+
+    corner, fa, fb = _smooth_pairs(mesh, normals, np.cos(np.radians(smooth_angle)) - 1e-9)
+    weighted = normals * mesh.face_areas()[:, None]
+    acc = np.zeros((mesh.face_count * 4, 3))
+    np.add.at(acc, corner, weighted[fb])
+    length = np.linalg.norm(acc, axis=1, keepdims=True)
+    flat = np.repeat(normals, 4, axis=0)
+    acc = np.where(length > 1e-12, acc / np.maximum(length, 1e-12), flat)
+    mesh.normals, index = dedupe_normals(acc, decimals)
+    mesh.corner_normal = index.reshape(-1, 4)
+
+    joined = fa != fb
+    labels = connected_components(mesh.face_count, fa[joined], fb[joined])
+    groups = np.unique(labels, return_inverse=True)[1].reshape(-1)
+    shared = np.bincount(groups)[groups] > 1
+    mesh.face_smooth = np.zeros(mesh.face_count, dtype=np.int32)
+    mesh.face_smooth[shared] = np.unique(groups[shared], return_inverse=True)[1].reshape(-1) + 1
+    return mesh
+
+
+# ─── OBJ export ─────────────────────────────────────────────────
+
+def write_obj(mesh, filename, title="Tower"):
+    """Write *mesh* in the same layout the builders use (v, vn, usemtl runs, f v//n).
+
+    Smoothing groups are only emitted when the mesh has any; vertex colours
+    only when the mesh carries them.
+    """
+    mtl = os.path.basename(filename.replace('\\', '/')).replace('.obj', '.mtl')
+    lines = [f"# {title}", f"# Vertices: {mesh.vertex_count}, Faces: {mesh.face_count}",
+             f"mtllib {mtl}", ""]
+    if mesh.colors is None:
+        lines += [f"v {x:.4f} {y:.4f} {z:.4f}" for x, y, z in mesh.positions]
+    else:
+        lines += [f"v {x:.4f} {y:.4f} {z:.4f} {r:.4f} {g:.4f} {b:.4f}"
+                  for (x, y, z), (r, g, b) in zip(mesh.positions, mesh.colors)]
+    lines.append("")
+    lines += [f"vn {x:.4f} {y:.4f} {z:.4f}" for x, y, z in mesh.normals]
+    lines.append("")
+    current, smooth = None, 0
+    smoothing = bool(mesh.face_smooth.any())
+    for quad, mat, ns, group in zip(mesh.quads + 1, mesh.face_material, mesh.corner_normal + 1,
+                                    mesh.face_smooth):
+        if mat != current:
+            lines.append(f"\nusemtl {mesh.materials[mat]}")
+            current = mat
+        if smoothing and group != smooth:
+            lines.append(f"s {group}" if group else "s off")
+            smooth = group
+        lines.append("f " + " ".join(f"{vi}//{ni}" for vi, ni in zip(quad, ns)))
+    with open(filename, 'w') as f:
+        f.write("\n".join(lines) + "\n")
+
+
+def read_obj(path):
+    """Minimal reader for the quad-only OBJ files written by the generators."""
+    verts, colors, normals, quads, fmat, fnorm, fsmooth, materials = [], [], [], [], [], [], [], []
+    current, smooth = None, 0
+    with open(path) as f:
+        for line in f:
+            parts = line.split()
+            if not parts:
+                continue
+            if parts[0] == 'v':
+                verts.append([float(x) for x in parts[1:4]])
+                if len(parts) >= 7:
+                    colors.append([float(x) for x in parts[4:7]])
+            elif parts[0] == 'vn':
+                normals.append([float(x) for x in parts[1:4]])
+            elif parts[0] == 'usemtl':
+                current = parts[1]
+                if current not in materials:
+                    materials.append(current)
+            elif parts[0] == 's':
+                smooth = 0 if parts[1] == 'off' else int(parts[1])
+            elif parts[0] == 'f' and len(parts) == 5:
+                refs = [p.split('/') for p in parts[1:]]
+                quads.append([int(r[0]) - 1 for r in refs])
+                fnorm.append([int(r[-1]) - 1 if len(r) == 3 else -1 for r in refs])
+                fmat.append(materials.index(current) if current else 0)
+                fsmooth.append(smooth)
+    return Mesh(verts, quads, materials or ['Default'], fmat, normals, fnorm, fsmooth,
+                colors=colors if colors and len(colors) == len(verts) else None)
+
+
+def read_mtl(path):
+    """Material name -> Kd colour from an MTL file."""
+    palette, current = {}, None
+    with open(path) as f:
+        for line in f:
+            parts = line.split()
+            if not parts:
+                continue
+            if parts[0] == 'newmtl':
+                current = parts[1]
+            elif parts[0] == 'Kd' and current:
+                palette[current] = tuple(float(x) for x in parts[1:4])
+    return palette
+
+
+def export_builder(builder, filename, title, cull_views=None, smooth_angle=None, union=False, ao_samples=None):
+    """Shared export path for the generator builders.
+
+    Freezes the builder, optionally replaces overlapping boxes with their
+    *union* surface, recomputes real normals (flat unless *smooth_angle*),
+    optionally bakes ambient occlusion into vertex colours (*ao_samples* rays
+    per vertex), optionally strips faces hidden from *cull_views* and writes
+    the OBJ.
+    """
+    return export_mesh(from_builder(builder), filename, title, cull_views, smooth_angle, union, ao_samples)
+
+
+def export_mesh(mesh, filename, title, cull_views=None, smooth_angle=None, union=False, ao_samples=None,
+                ao_processes=None):
+    """export_builder() for an already frozen mesh.
+
+    The passes replace the mesh's arrays rather than writing into them, so
+    a read-only attach_mesh() view can be exported directly.
+    ao_processes: AO worker count; pass 1 from inside a pool worker.
+    """
+    if union:
+        from csg_union import csg_union
+        merged = csg_union(mesh)
+        print(f"  union {mesh.face_count} -> {merged.face_count} faces")
+        mesh = merged
+    mesh = compute_normals(mesh, smooth_angle)
+    if ao_samples:
+        # before culling: hidden faces still cast occlusion
+        from ao_bake import bake_ao
+        stats = {}
+        ao = bake_ao(mesh, ao_samples, processes=ao_processes, stats=stats)
+        print(f"  ao {stats['rays']} rays in {stats['trace_s']:.2f} s, mean {ao.mean():.3f}")
+    if cull_views is not None:
+        from view_cull import cull_hidden_faces
+        from camera import parse_views
+        views = parse_views(cull_views) if isinstance(cull_views, str) else cull_views
+        culled = cull_hidden_faces(mesh, views)
+        print(f"  culled {mesh.face_count - culled.face_count}/{mesh.face_count} faces "
+              f"({mesh.vertex_count} -> {culled.vertex_count} verts)")
+        mesh = culled
+    write_obj(mesh, filename, title)
+    return mesh
+
+
+# ─── Shared memory ──────────────────────────────────────────────
+
+SHARED_ALIGN = 64     # array offsets inside a block; cache-line aligned
+
+_attached = {}        # block name -> (SharedMemory, views), per process
+
+
+def _release(shm, unlink):
+    try:
+        shm.close()
+    except BufferError:
+        pass          # views still alive; the mapping goes when they do
+    if unlink:
+        try:
+            shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def _views(shm, layout, writable):
+    views = {}
+    for name, dtype, shape, offset in layout:
+        count = int(np.prod(shape, dtype=np.int64))
+        view = np.frombuffer(shm.buf, dtype=dtype, count=count, offset=offset).reshape(shape)
+        view.flags.writeable = writable
+        views[name] = view
+    return views
+
+
+class SharedArrays:
+    """Named arrays copied into one multiprocessing.shared_memory block.
+
+    The creating process owns the block: close() (or leaving a with block,
+    or the object being collected) unmaps and unlinks it. Workers attach
+    through `descriptor`, a small picklable dict, with attach_arrays(). If
+    a worker dies its mapping dies with it; if the owner dies without
+    closing, the multiprocessing resource tracker unlinks the block (POSIX;
+    on Windows it goes with the last handle). None values are skipped.
+    """
+
+    def __init__(self, arrays, meta=None):
+        arrays = {name: np.ascontiguousarray(a) for name, a in arrays.items() if a is not None}
+        layout, size = [], 0
+        for name, a in arrays.items():
+            size += -size % SHARED_ALIGN
+            layout.append((name, a.dtype.str, a.shape, size))
+            size += a.nbytes
+        self._shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        self._finalizer = weakref.finalize(self, _release, self._shm, True)
+        self.descriptor = {'block': self._shm.name, 'layout': layout, 'meta': meta or {}}
+        self.arrays = _views(self._shm, layout, writable=True)
+        for name, a in arrays.items():
+            self.arrays[name][...] = a
+
+    @property
+    def nbytes(self):
+        return self._shm.size
+
+    def close(self):
+        self.arrays = {}
+        self._finalizer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def attach_arrays(descriptor, writable=False):
+    """Views into a SharedArrays block, read-only unless *writable*.
+
+    Attachments are cached per process, so pool tasks can call this for
+    every job; detach() releases them.
+    """
+    name = descriptor['block']
+    if name not in _attached:
+        shm = shared_memory.SharedMemory(name=name)
+        _attached[name] = (shm, _views(shm, descriptor['layout'], writable=True))
+    views = _attached[name][1]
+    if writable:
+        return dict(views)
+    return {key: _readonly(view) for key, view in views.items()}
+
+
+def _readonly(view):
+    view = view.view()
+    view.flags.writeable = False
+    return view
+
+
+def detach(descriptor=None):
+    """Drop this process's attachment to one block (default: all of them)."""
+    names = [descriptor['block']] if descriptor else list(_attached)
+    for name in names:
+        entry = _attached.pop(name, None)
+        if entry:
+            _release(entry[0], unlink=False)
+
+
+def _mesh_arrays(mesh):
+    return {'positions': mesh.positions, 'quads': mesh.quads, 'face_material': mesh.face_material,
+            'normals': mesh.normals, 'corner_normal': mesh.corner_normal, 'face_smooth': mesh.face_smooth,
+            'face_part': mesh.face_part, 'colors': mesh.colors}
+
+
+class SharedMesh(SharedArrays):
+    """A Mesh in shared memory; pass `descriptor` to workers, which call attach_mesh()."""
+
+    def __init__(self, mesh):
+        super().__init__(_mesh_arrays(mesh), {'materials': mesh.materials, 'part_names': mesh.part_names})
+
+
+def attach_mesh(descriptor):
+    """Mesh over read-only zero-copy views of a SharedMesh block.
+
+    Passes that return a new mesh or reassign arrays (compute_normals,
+    subset, csg_union, bake_ao) work as usual; in-place writes raise.
+    """
+    a = attach_arrays(descriptor)
+    meta = descriptor['meta']
+    return Mesh(a['positions'], a['quads'], meta['materials'], a['face_material'], a['normals'],
+                a['corner_normal'], a['face_smooth'], a['face_part'], meta['part_names'], a.get('colors'))
@@ -0,0 +1,227 @@
+"""
+Mesh validation for the tower generators.
+
+Checks a built mesh for the problems that show up as flicker or wasted
+triangles once the towers are rendered:
+
+  zfight      same-facing, coplanar faces of different parts and materials
+              that overlap where the game camera can see them
+  degenerate  zero-area faces, repeated corners, non-planar quads
+  thin        slab parts whose thickness is far below their other extents,
+              e.g. the 0.05 glass panes; they z-fight at coarser depth precision
+  subpixel    parts too small to cover a pixel at the sprite bake size
+  budget      face / vertex / material totals over the tower budget
+
+Candidate face pairs come from a uniform spatial hash over face AABBs:
+every face is binned into the grid cells its box touches, and only faces
+sharing a cell are compared, so the pass is O(n) expected rather than
+O(n^2). All narrow-phase tests run over the candidate arrays at once.
+
+Usage:
+  python mesh_validate.py sniper_t3.obj basic_t3.obj [--json]
+
+Requires: numpy
+"""
+
+import argparse
+import json
+import sys
+
+import numpy as np
+
+from camera import GAME_VIEW
+from mesh_core import read_obj
+from view_cull import visible_faces
+
+DEFAULT_BUDGET = {
+    'max_faces': 1024,
+    'max_vertices': 1536,
+    'max_materials': 16,
+    'sprite_px': 64,         # width the tower is baked at
+    'min_part_px': 1.0,      # parts smaller than this on screen are wasted
+}
+COPLANAR_TOLERANCE = 1e-4    # fraction of the model's bounding diagonal
+SLAB_RATIO = 0.15            # thickness / median extent below which a part is a slab
+SLAB_MAX_THICKNESS = 0.01    # ... and thinner than this fraction of the diagonal
+
+ERRORS = ('zfight', 'degenerate')
+
+
+# ─── Spatial hash ────────────────────────────────────────────────
+
+def _group_pairs(keys, items):
+    """All (a, b) item pairs, a < b, that share a key."""
+    order = np.argsort(keys, kind='stable')
+    k = keys[order]
+    starts = np.flatnonzero(np.r_[True, k[1:] != k[:-1]])
+    sizes = np.diff(np.r_[starts, len(k)])
+    group = np.repeat(np.arange(len(starts)), sizes)
+    rep = sizes[group]
+    a = np.repeat(np.arange(len(k)), rep)
+    b = np.repeat(starts[group], rep) + (np.arange(rep.sum()) - np.repeat(np.cumsum(rep) - rep, rep))
+    a, b = items[order[a]], items[order[b]]
+    keep = a < b
+    return a[keep], b[keep]
+
+
+def spatial_hash_pairs(lo, hi, cell=None):
+    """Candidate pairs of boxes (lo/hi are (N, 3)) that share at least one hash cell."""
+    if len(lo) < 2:
+        return np.zeros(0, np.int64), np.zeros(0, np.int64)
+    if cell is None:
+        extent = (hi - lo).max(1)
+        diag = float(np.linalg.norm(hi.max(0) - lo.min(0)))
+        cell = max(float(np.median(extent)), diag / 64, 1e-9)
+    c0 = np.floor(lo / cell).astype(np.int64)
+    c1 = np.floor(hi / cell).astype(np.int64)
+    dims = c1 - c0 + 1
+    counts = dims.prod(1)
+    item = np.repeat(np.arange(len(lo)), counts)
+    local = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    d = dims[item]
+    ix = c0[item, 0] + local % d[:, 0]
+    iy = c0[item, 1] + (local // d[:, 0]) % d[:, 1]
+    iz = c0[item, 2] + local // (d[:, 0] * d[:, 1])
+    gmin = c0.min(0)
+    span = c1.max(0) - gmin + 1
+    key = ((ix - gmin[0]) * span[1] + (iy - gmin[1])) * span[2] + (iz - gmin[2])
+    a, b = _group_pairs(key, item)
+    pair = np.unique(a * len(lo) + b)
+    return pair // len(lo), pair % len(lo)
+
+
+# ─── Checks ──────────────────────────────────────────────────────
+
+def _plane_basis(n):
+    """Two in-plane axes per normal (rows of (N, 3))."""
+    helper = np.where(np.abs(n[:, 1:2]) < 0.9, [[0.0, 1.0, 0.0]], [[1.0, 0.0, 0.0]])
+    u = np.cross(n, helper)
+    u /= np.maximum(np.linalg.norm(u, axis=1, keepdims=True), 1e-12)
+    return u, np.cross(n, u)
+
+
+def find_zfighting(mesh, tolerance):
+    """Pairs of overlapping, same-facing coplanar faces from different parts."""
+    p = mesh.positions[mesh.quads]
+    a, b = spatial_hash_pairs(p.min(1) - tolerance, p.max(1) + tolerance)
+    other = mesh.face_part[a] != mesh.face_part[b]
+    a, b = a[other], b[other]
+    n = mesh.face_normals()
+    same = (n[a] * n[b]).sum(1) > 1 - 1e-6
+    a, b = a[same], b[same]
+    dist = np.abs(((p[b] - p[a][:, :1]) * n[a][:, None]).sum(2)).max(1)
+    a, b = a[dist <= tolerance], b[dist <= tolerance]
+    u, v = _plane_basis(n[a])
+    pa = np.stack([(p[a] * u[:, None]).sum(2), (p[a] * v[:, None]).sum(2)], 2)
+    pb = np.stack([(p[b] * u[:, None]).sum(2), (p[b] * v[:, None]).sum(2)], 2)
+    overlap = np.clip(np.minimum(pa.max(1), pb.max(1)) - np.maximum(pa.min(1), pb.min(1)), 0, None)
+    area = overlap.prod(1)
+    hit = area > tolerance * tolerance
+    return a[hit], b[hit], area[hit]
+
+
+def find_degenerate(mesh, tolerance):
+    """Faces with zero area, repeated corners or a corner off the face plane."""
+    q = np.sort(mesh.quads, axis=1)
+    repeated = (q[:, 1:] == q[:, :-1]).any(1)
+    zero = mesh.face_areas() <= tolerance * tolerance
+    p = mesh.positions[mesh.quads]
+    n = mesh.face_normals()
+    off_plane = np.abs(((p - p[:, :1]) * n[:, None]).sum(2)).max(1) > tolerance
+    reasons = np.where(repeated, 'repeated-corner', np.where(zero, 'zero-area', 'non-planar'))
+    bad = repeated | zero | off_plane
+    return np.flatnonzero(bad), reasons[bad]
+
+
+def find_thin_parts(mesh, diag):
+    lo, hi = mesh.part_bounds()
+    ext = np.sort(hi - lo, axis=1)
+    slab = (ext[:, 0] < SLAB_RATIO * ext[:, 1]) & (ext[:, 0] < SLAB_MAX_THICKNESS * diag)
+    return np.flatnonzero(slab), ext[slab, 0]
+
+
+def find_subpixel_parts(mesh, budget):
+    lo, hi = mesh.bounds()
+    footprint = max(hi[0] - lo[0], hi[2] - lo[2], 1e-9)
+    px_per_unit = budget['sprite_px'] / footprint
+    plo, phi = mesh.part_bounds()
+    size = (phi - plo).max(1) * px_per_unit
+    small = size < budget['min_part_px']
+    return np.flatnonzero(small), size[small]
+
+
+# ─── Report ──────────────────────────────────────────────────────
+
+def validate(mesh, name="mesh", budget=None, tolerance=COPLANAR_TOLERANCE, views=(GAME_VIEW,)):
+    """Run every check and return a JSON-ready report dict.
+
+    Z-fighting is only reported for faces visible from *views*; pass
+    views=None to check every face.
+    """
+    budget = {**DEFAULT_BUDGET, **(budget or {})}
+    lo, hi = mesh.bounds()
+    diag = float(np.linalg.norm(hi - lo)) or 1.0
+    eps = tolerance * diag
+    parts, mats = mesh.part_names, mesh.materials
+    issues = {key: [] for key in ('zfight', 'degenerate', 'thin', 'subpixel', 'budget')}
+
+    fa, fb, area = find_zfighting(mesh, eps)
+    shown = mesh.face_material[fa] != mesh.face_material[fb]
+    if views is not None:
+        seen = visible_faces(mesh, views)
+        shown &= seen[fa] & seen[fb]
+    for fa, fb, area in zip(fa[shown], fb[shown], area[shown]):
+        issues['zfight'].append({
+            'faces': [int(fa), int(fb)],
+            'parts': [parts[mesh.face_part[fa]], parts[mesh.face_part[fb]]],
+            'area': round(float(area), 4),
+        })
+    for f, why in zip(*find_degenerate(mesh, eps)):
+        issues['degenerate'].append({'face': int(f), 'part': parts[mesh.face_part[f]], 'reason': str(why)})
+    for pi, thickness in zip(*find_thin_parts(mesh, diag)):
+        issues['thin'].append({'part': parts[pi], 'thickness': round(float(thickness), 4)})
+    for pi, px in zip(*find_subpixel_parts(mesh, budget)):
+        issues['subpixel'].append({'part': parts[pi], 'pixels': round(float(px), 2)})
+
+    totals = {'faces': mesh.face_count, 'vertices': mesh.vertex_count,
+              'materials': len(set(mesh.face_material.tolist()))}
+    for key, value in totals.items():
+        limit = budget[f'max_{key}']
+        if value > limit:
+            issues['budget'].append({'metric': key, 'value': value, 'limit': limit})
+
+    return {
+        'name': name,
+        **totals,
+        'parts': len(parts),
+        'issues': issues,
+        'ok': not any(issues[k] for k in ERRORS),
+        'material_names': [mats[i] for i in sorted(set(mesh.face_material.tolist()))],
+    }
+
+
+def summarize(report):
+    counts = ", ".join(f"{k}={len(v)}" for k, v in report['issues'].items() if v) or "clean"
+    status = "OK  " if report['ok'] else "FAIL"
+    return f"{status} {report['name']}: {report['faces']} faces, {report['parts']} parts - {counts}"
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Validate generator OBJ files.")
+    ap.add_argument('objs', nargs='+')
+    ap.add_argument('--json', action='store_true', help="print the full reports as JSON")
+    ap.add_argument('--all-faces', action='store_true', help="report z-fighting on hidden faces too")
+    args = ap.parse_args()
+
+    views = None if args.all_faces else (GAME_VIEW,)
+    reports = [validate(read_obj(path), path, views=views) for path in args.objs]
+    if args.json:
+        print(json.dumps(reports, indent=2))
+    else:
+        for r in reports:
+            print(summarize(r))
+    sys.exit(0 if all(r['ok'] for r in reports) else 1)
+
+
+if __name__ == '__main__':
+    main()
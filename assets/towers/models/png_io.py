@@ -0,0 +1,29 @@
+"""
+Minimal PNG writer for the offline tower tooling (8-bit RGBA, no filters).
+
+Requires: numpy
+"""
+
+import struct
+import zlib
+
+import numpy as np
+
+
+def _chunk(kind, data):
+    return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data) & 0xffffffff)
+
+
+def encode_png(rgba, level=9):
+    """PNG bytes for an (H, W, 4) uint8 array."""
+    rgba = np.ascontiguousarray(rgba, dtype=np.uint8)
+    height, width = rgba.shape[:2]
+    rows = np.concatenate([np.zeros((height, 1), np.uint8), rgba.reshape(height, -1)], axis=1)
+    header = struct.pack('>IIBBBBB', width, height, 8, 6, 0, 0, 0)
+    return (b'\x89PNG\r\n\x1a\n' + _chunk(b'IHDR', header)
+            + _chunk(b'IDAT', zlib.compress(rows.tobytes(), level)) + _chunk(b'IEND', b''))
+
+
+def write_png(path, rgba, level=9):
+    with open(path, 'wb') as f:
+        f.write(encode_png(rgba, level))
@@ -0,0 +1,280 @@
+"""
+Vectorized triangle rasterizer for the offline tower tooling.
+
+Triangles are scan-converted all at once: every triangle's pixel bounding
+box is expanded into candidate pixel centres with np.repeat, barycentric
+weights are evaluated for the whole batch, and the surviving fragments are
+resolved against a z-buffer with a single sort. Batches are capped at
+MAX_FRAGMENTS candidates to keep memory bounded on large renders.
+
+For large renders rasterize_tiled() bins the triangles into TILE x TILE
+pixel tiles (by bounding box) and resolves each tile on its own, so tiles
+can run concurrently: thread workers (the sorts and array maths release
+the GIL) or process workers that attach to the triangles and write their
+tiles into z/id buffers in shared memory (mesh_core.SharedArrays). Every
+tile keeps its triangles in index order, so the result is identical to
+rasterize() whatever the tiling or worker count.
+
+Usage:
+  python raster.py sniper_t3.obj --size 4096           # benchmark 1/2/4/8 workers
+  python raster.py sniper_t3.obj --workers 1 4 --mode process
+
+Requires: numpy
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import Pool
+
+import numpy as np
+
+from mesh_core import SharedArrays, attach_arrays
+
+MAX_FRAGMENTS = 1 << 22
+TILE = 128           # tile edge in pixels
+BENCH_WORKERS = (1, 2, 4, 8)
+
+
+def _batches(counts, limit):
+    """Split triangle indices into runs whose candidate-pixel total stays under *limit*."""
+    start, total = 0, 0
+    for i, c in enumerate(counts):
+        if total and total + c > limit:
+            yield start, i
+            start, total = i, 0
+        total += c
+    if start < len(counts):
+        yield start, len(counts)
+
+
+def _pixel_bounds(tri_xy, x_lo, y_lo, x_hi, y_hi):
+    """Inclusive pixel-centre ranges (x0, x1, y0, y1) covered by each triangle's box,
+    clipped to [x_lo, x_hi) x [y_lo, y_hi); empty ranges have x1 < x0 or y1 < y0."""
+    x0 = np.clip(np.ceil(tri_xy[..., 0].min(1) - 0.5), x_lo, x_hi).astype(np.int64)
+    x1 = np.clip(np.floor(tri_xy[..., 0].max(1) - 0.5), x_lo - 1, x_hi - 1).astype(np.int64)
+    y0 = np.clip(np.ceil(tri_xy[..., 1].min(1) - 0.5), y_lo, y_hi).astype(np.int64)
+    y1 = np.clip(np.floor(tri_xy[..., 1].max(1) - 0.5), y_lo - 1, y_hi - 1).astype(np.int64)
+    return x0, x1, y0, y1
+
+
+def _signed_area(tri_xy):
+    a, b, c = tri_xy[:, 0], tri_xy[:, 1], tri_xy[:, 2]
+    return (b[:, 0] - a[:, 0]) * (c[:, 1] - a[:, 1]) - (b[:, 1] - a[:, 1]) * (c[:, 0] - a[:, 0])
+
+
+def fragments(tri_xy, tri_depth, width, height, limit=MAX_FRAGMENTS, rect=None):
+    """Yield (tri_index, pixel_index, depth) arrays for every covered pixel centre.
+
+    tri_xy is (T, 3, 2) in pixel units (y down), tri_depth is (T, 3).
+    Edges are inclusive, so shared edges produce fragments on both sides.
+    rect (x0, y0, x1, y1) limits the fragments to that pixel rectangle;
+    pixel indices stay relative to the full width.
+    """
+    tri_xy = np.asarray(tri_xy, dtype=np.float64)
+    tri_depth = np.asarray(tri_depth, dtype=np.float64)
+    x0, x1, y0, y1 = _pixel_bounds(tri_xy, *(rect or (0, 0, width, height)))
+    nx = np.maximum(x1 - x0 + 1, 0)
+    ny = np.maximum(y1 - y0 + 1, 0)
+    a, b, c = tri_xy[:, 0], tri_xy[:, 1], tri_xy[:, 2]
+    area = _signed_area(tri_xy)
+    counts = np.where(np.abs(area) > 1e-12, nx * ny, 0)
+
+    for lo, hi in _batches(counts, limit):
+        n = counts[lo:hi]
+        total = int(n.sum())
+        if not total:
+            continue
+        tri = np.repeat(np.arange(lo, hi), n)
+        local = np.arange(total) - np.repeat(np.cumsum(n) - n, n)
+        px = x0[tri] + local % nx[tri] + 0.5
+        py = y0[tri] + local // nx[tri] + 0.5
+        ta, tb, tc = a[tri], b[tri], c[tri]
+        inv = 1.0 / area[tri]
+        w0 = ((tb[:, 0] - px) * (tc[:, 1] - py) - (tb[:, 1] - py) * (tc[:, 0] - px)) * inv
+        w1 = ((tc[:, 0] - px) * (ta[:, 1] - py) - (tc[:, 1] - py) * (ta[:, 0] - px)) * inv
+        w2 = 1.0 - w0 - w1
+        inside = (w0 >= -1e-9) & (w1 >= -1e-9) & (w2 >= -1e-9)
+        tri, px, py = tri[inside], px[inside], py[inside]
+        d = tri_depth[tri]
+        depth = w0[inside] * d[:, 0] + w1[inside] * d[:, 1] + w2[inside] * d[:, 2]
+        pixel = py.astype(np.int64) * width + px.astype(np.int64)
+        yield tri, pixel, depth
+
+
+def resolve(tri, pixel, depth, pixel_count):
+    """Z-buffer the fragments. Returns (zbuf, idbuf) with idbuf = -1 where nothing was drawn."""
+    zbuf = np.full(pixel_count, np.inf)
+    idbuf = np.full(pixel_count, -1, dtype=np.int64)
+    if len(tri):
+        order = np.lexsort((depth, pixel))
+        p = pixel[order]
+        first = np.ones(len(p), dtype=bool)
+        first[1:] = p[1:] != p[:-1]
+        win = order[first]
+        zbuf[pixel[win]] = depth[win]
+        idbuf[pixel[win]] = tri[win]
+    return zbuf, idbuf
+
+
+def rasterize(tri_xy, tri_depth, width, height):
+    """Depth-tested render of all triangles. Returns (zbuf, idbuf, fragments) where
+    fragments is the concatenated (tri, pixel, depth) tuple for callers that need
+    more than the front-most layer."""
+    parts = list(fragments(tri_xy, tri_depth, width, height))
+    if parts:
+        frags = tuple(np.concatenate(col) for col in zip(*parts))
+    else:
+        frags = (np.zeros(0, np.int64), np.zeros(0, np.int64), np.zeros(0))
+    zbuf, idbuf = resolve(*frags, width * height)
+    return zbuf, idbuf, frags
+
+
+# ─── Tiles ───────────────────────────────────────────────────────
+
+def bin_triangles(tri_xy, width, height, tile=TILE):
+    """Bin triangles into tile x tile pixel tiles by bounding box.
+
+    Returns (tiles_x, offsets, tris): tile t (row-major, tiles_x per row)
+    owns tris[offsets[t]:offsets[t + 1]], in ascending triangle order.
+    """
+    tri_xy = np.asarray(tri_xy, dtype=np.float64)
+    tiles_x, tiles_y = -(-width // tile), -(-height // tile)
+    x0, x1, y0, y1 = _pixel_bounds(tri_xy, 0, 0, width, height)
+    live = (x1 >= x0) & (y1 >= y0) & (np.abs(_signed_area(tri_xy)) > 1e-12)
+    tx0, ty0 = x0 // tile, y0 // tile
+    nx = np.where(live, x1 // tile - tx0 + 1, 0)
+    ny = np.where(live, y1 // tile - ty0 + 1, 0)
+    counts = nx * ny
+    tri = np.repeat(np.arange(len(tri_xy)), counts)
+    local = np.arange(len(tri)) - np.repeat(np.cumsum(counts) - counts, counts)
+    tile_id = (ty0[tri] + local // nx[tri]) * tiles_x + tx0[tri] + local % nx[tri]
+    order = np.argsort(tile_id, kind='stable')
+    offsets = np.searchsorted(tile_id[order], np.arange(tiles_x * tiles_y + 1))
+    return tiles_x, offsets, tri[order]
+
+
+def _render_tile(t, tri_xy, tri_depth, tiles_x, offsets, tris, zbuf, idbuf, tile):
+    """Resolve tile *t* into the (H, W) zbuf/idbuf. Returns its fragment count."""
+    ids = tris[offsets[t]:offsets[t + 1]]
+    if not len(ids):
+        return 0
+    height, width = zbuf.shape
+    x0, y0 = (t % tiles_x) * tile, (t // tiles_x) * tile
+    x1, y1 = min(x0 + tile, width), min(y0 + tile, height)
+    parts = list(fragments(tri_xy[ids], tri_depth[ids], width, height, rect=(x0, y0, x1, y1)))
+    if not parts:
+        return 0
+    tri, pixel, depth = (np.concatenate(col) for col in zip(*parts))
+    tw, th = x1 - x0, y1 - y0
+    local = (pixel // width - y0) * tw + pixel % width - x0
+    z, i = resolve(ids[tri], local, depth, tw * th)
+    zbuf[y0:y1, x0:x1] = z.reshape(th, tw)
+    idbuf[y0:y1, x0:x1] = i.reshape(th, tw)
+    return len(tri)
+
+
+_worker = None
+
+
+def _init_worker(descriptor, tiles_x, tile):
+    global _worker
+    _worker = (attach_arrays(descriptor, writable=True), tiles_x, tile)
+
+
+def _tile_job(t):
+    a, tiles_x, tile = _worker
+    return _render_tile(t, a['tri_xy'], a['tri_depth'], tiles_x, a['offsets'], a['tris'], a['zbuf'], a['idbuf'],
+                        tile)
+
+
+def rasterize_tiled(tri_xy, tri_depth, width, height, workers=1, mode='thread', tile=TILE, stats=None):
+    """rasterize() by tiles. Returns (zbuf, idbuf), flat like rasterize()'s.
+
+    workers: tiles rendered concurrently; mode: 'thread' or 'process'.
+    stats: optional dict that receives tile counts and timings.
+    """
+    tri_xy = np.ascontiguousarray(tri_xy, dtype=np.float64)
+    tri_depth = np.ascontiguousarray(tri_depth, dtype=np.float64)
+    t0 = time.perf_counter()
+    tiles_x, offsets, tris = bin_triangles(tri_xy, width, height, tile)
+    # busiest tiles first so the last ones to finish are short
+    jobs = [int(t) for t in np.argsort(-np.diff(offsets), kind='stable') if offsets[t + 1] > offsets[t]]
+    t_bin = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    zbuf = np.full((height, width), np.inf)
+    idbuf = np.full((height, width), -1, dtype=np.int64)
+    if workers <= 1 or len(jobs) <= 1:
+        frags = [_render_tile(t, tri_xy, tri_depth, tiles_x, offsets, tris, zbuf, idbuf, tile) for t in jobs]
+    elif mode == 'thread':
+        with ThreadPoolExecutor(workers) as pool:
+            frags = list(pool.map(lambda t: _render_tile(t, tri_xy, tri_depth, tiles_x, offsets, tris, zbuf, idbuf,
+                                                         tile), jobs))
+    elif mode == 'process':
+        arrays = {'tri_xy': tri_xy, 'tri_depth': tri_depth, 'offsets': offsets, 'tris': tris,
+                  'zbuf': zbuf, 'idbuf': idbuf}
+        with SharedArrays(arrays) as shared, \
+                Pool(workers, initializer=_init_worker, initargs=(shared.descriptor, tiles_x, tile)) as pool:
+            frags = pool.map(_tile_job, jobs, chunksize=1)
+            zbuf, idbuf = shared.arrays['zbuf'].copy(), shared.arrays['idbuf'].copy()
+    else:
+        raise ValueError(f"unknown mode {mode!r} (expected 'thread' or 'process')")
+    if stats is not None:
+        stats.update(tiles=len(jobs), binned=len(tris), fragments=int(sum(frags)), bin_s=t_bin,
+                     render_s=time.perf_counter() - t0)
+    return zbuf.reshape(-1), idbuf.reshape(-1)
+
+
+# ─── Benchmark ───────────────────────────────────────────────────
+
+def benchmark_scene(path, size):
+    """Triangles of an OBJ through the game camera, fitted to *size* pixels."""
+    from camera import GAME_VIEW, fit_viewport, project
+    from mesh_core import read_obj
+    mesh = read_obj(path)
+    tri_idx, _ = mesh.triangles()
+    xy, depth = project(mesh.positions, GAME_VIEW)
+    pix, width, height, _ = fit_viewport(xy, size)
+    return pix[tri_idx], depth[tri_idx], width, height
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Benchmark tiled rasterization at several worker counts.")
+    ap.add_argument('objs', nargs='+', help="OBJ files to render through the game camera")
+    ap.add_argument('--size', type=int, default=4096, help="longest image side in pixels")
+    ap.add_argument('--tile', type=int, default=TILE)
+    ap.add_argument('--workers', type=int, nargs='+', default=list(BENCH_WORKERS))
+    ap.add_argument('--mode', choices=('thread', 'process', 'both'), default='both')
+    ap.add_argument('--repeat', type=int, default=3, help="best of this many runs")
+    args = ap.parse_args()
+    modes = ('thread', 'process') if args.mode == 'both' else (args.mode,)
+    print(f"{os.cpu_count()} CPUs")
+
+    for path in args.objs:
+        tri_xy, tri_depth, width, height = benchmark_scene(path, args.size)
+        t0 = time.perf_counter()
+        ref_z, ref_id, _ = rasterize(tri_xy, tri_depth, width, height)
+        t_ref = time.perf_counter() - t0
+        print(f"{os.path.basename(path)}: {len(tri_xy)} tris at {width}x{height}; "
+              f"rasterize() {t_ref:.2f} s")
+        for mode in modes:
+            base = None
+            for workers in args.workers:
+                best, stats = None, {}
+                for _ in range(args.repeat):
+                    t0 = time.perf_counter()
+                    z, ids = rasterize_tiled(tri_xy, tri_depth, width, height, workers, mode, args.tile, stats)
+                    elapsed = time.perf_counter() - t0
+                    best = elapsed if best is None else min(best, elapsed)
+                base = base or best
+                same = np.array_equal(ids, ref_id) and np.array_equal(z, ref_z)
+                print(f"  {mode:<7} {workers:>2} workers: {best:.2f} s, "
+                      f"{width * height / best / 1e6:6.1f} Mpx/s, x{base / best:.2f}; "
+                      f"{stats['tiles']} tiles, {stats['fragments']} frags"
+                      f"{'' if same else ' MISMATCH vs rasterize()'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,197 @@
+"""
+Upgrade deltas between consecutive tower tiers.
+
+Most of a T(n+1) tower is T(n) geometry again: the same boxes and roofs,
+usually resized or moved for the bigger tier. This stage matches every
+part of the upgraded mesh against the parts of the base tier by material
+and topology (same faces over the same vertex order), up to a per-axis
+scale and translation, and writes the upgrade as a delta:
+
+  removed   base part ids that do not appear in the upgrade
+  kept      [base id, sx, sy, sz, tx, ty, tz] for base parts that stay,
+            possibly resized or moved (identity transforms are just [id])
+  added     parts with no match: a copy of a base part ([id, s..., t...],
+            same as kept) or raw geometry {material, positions, quads}
+  order     per upgrade part, in OBJ order: its index into kept + added
+
+apply_delta() rebuilds the full upgraded mesh from the base mesh already in
+memory; the result has the faces, parts and part names of read_obj() on the
+exported OBJ, so deltas chain (T1 -> T2 -> T3), and gets its normals from
+compute_normals().
+
+Usage:
+  python tier_delta.py sniper_t1.obj sniper_t2.obj sniper_t3.obj
+      # -> sniper_t2.delta.json (vs t1), sniper_t3.delta.json (vs t2)
+      # each tier is rebuilt from the previous rebuilt tier and must match
+      # its OBJ exactly; exits non-zero otherwise
+
+Requires: numpy
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+from mesh_core import Mesh, compute_normals, part_label, read_obj
+
+DECIMALS = 4       # same precision as the OBJ files
+TOLERANCE = 5e-4   # max vertex error of a transformed match (model units)
+
+
+# ─── Parts ───────────────────────────────────────────────────────
+
+def mesh_parts(mesh):
+    """Per part: (label, material name, local positions, local quads)."""
+    parts = []
+    for p, name in enumerate(mesh.part_names):
+        faces = np.flatnonzero(mesh.face_part == p)
+        used, local = np.unique(mesh.quads[faces], return_inverse=True)
+        material = mesh.materials[mesh.face_material[faces[0]]] if len(faces) else None
+        parts.append((part_label(name), material, mesh.positions[used], local.reshape(-1, 4)))
+    return parts
+
+
+def fit_transform(src, dst, tol=TOLERANCE):
+    """Per-axis (scale, translation) with dst = src * scale + translation, or None."""
+    lo, hi = src.min(0), src.max(0)
+    dlo, dhi = dst.min(0), dst.max(0)
+    extent = hi - lo
+    scale = np.where(extent > tol, (dhi - dlo) / np.where(extent > tol, extent, 1), 1.0)
+    shift = dlo - lo * scale
+    if (scale <= 0).any() or np.abs(src * scale + shift - dst).max() > tol:
+        return None
+    return scale, shift
+
+
+def _entry(base_id, fit):
+    scale, shift = fit
+    if np.allclose(scale, 1) and np.allclose(shift, 0, atol=10.0 ** -DECIMALS):
+        return [base_id]
+    return [base_id] + np.round(np.r_[scale, shift], DECIMALS + 2).tolist()
+
+
+# ─── Diff / apply ────────────────────────────────────────────────
+
+def diff_tiers(base, target, tol=TOLERANCE):
+    """Delta that turns mesh *base* into mesh *target*."""
+    base_parts = mesh_parts(base)
+    index = {}
+    for i, (_, material, pos, quads) in enumerate(base_parts):
+        index.setdefault((material, len(pos), quads.tobytes()), []).append(i)
+
+    kept, added, order, used = [], [], [], set()
+    for label, material, pos, quads in mesh_parts(target):
+        candidates = index.get((material, len(pos), quads.tobytes()), [])
+        # unused base parts with the same label first, then any unused, then copies
+        ranked = sorted(candidates, key=lambda i: (i in used, base_parts[i][0] != label))
+        for i in ranked:
+            fit = fit_transform(base_parts[i][2], pos, tol)
+            if fit is None:
+                continue
+            if i in used:
+                order.append(('added', len(added)))
+                added.append(_entry(i, fit))
+            else:
+                order.append(('kept', len(kept)))
+                kept.append(_entry(i, fit))
+            used.add(i)
+            break
+        else:
+            order.append(('added', len(added)))
+            added.append({'material': material,
+                          'positions': np.round(pos, DECIMALS).ravel().tolist(),
+                          'quads': quads.ravel().tolist()})
+
+    return {
+        'base_parts': len(base_parts),
+        'removed': [i for i in range(len(base_parts)) if i not in used],
+        'kept': kept,
+        'added': added,
+        'order': [i if kind == 'kept' else len(kept) + i for kind, i in order],
+    }
+
+
+def apply_delta(base, delta):
+    """Rebuild the upgraded mesh from *base* and a delta from diff_tiers()."""
+    base_parts = mesh_parts(base)
+    if len(base_parts) != delta['base_parts']:
+        raise ValueError(f"delta expects {delta['base_parts']} base parts, mesh has {len(base_parts)}")
+
+    entries = delta['kept'] + delta['added']
+    pieces = []
+    for entry in (entries[i] for i in delta['order']):
+        if isinstance(entry, dict):
+            pieces.append((entry['material'], np.reshape(entry['positions'], (-1, 3)),
+                           np.reshape(entry['quads'], (-1, 4))))
+            continue
+        _, material, pos, quads = base_parts[entry[0]]
+        if len(entry) > 1:
+            pos = pos * entry[1:4] + entry[4:7]
+        pieces.append((material, pos, quads))
+
+    materials = list(dict.fromkeys(m for m, _, _ in pieces))
+    positions, quads, face_material, offset = [], [], [], 0
+    for material, pos, q in pieces:
+        positions.append(pos)
+        quads.append(q + offset)
+        face_material += [materials.index(material)] * len(q)
+        offset += len(pos)
+    # parts and their names come from connectivity, exactly as read_obj() finds them
+    return compute_normals(Mesh(np.concatenate(positions), np.concatenate(quads), materials, face_material))
+
+
+def same_mesh(a, b, decimals=3):
+    """True when *a* and *b* have the same materials, parts and faces in the same order."""
+    if a.materials != b.materials or a.part_names != b.part_names or len(a.quads) != len(b.quads):
+        return False
+    return (np.array_equal(a.face_material, b.face_material) and np.array_equal(a.face_part, b.face_part)
+            and np.array_equal(np.round(a.positions[a.quads], decimals), np.round(b.positions[b.quads], decimals)))
+
+
+# ─── CLI ─────────────────────────────────────────────────────────
+
+def write_delta(delta, filename, base_name):
+    with open(filename, 'w') as f:
+        json.dump({'base': base_name, **delta}, f, separators=(',', ':'))
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Write upgrade deltas between consecutive tier OBJs.")
+    ap.add_argument('objs', nargs='+', help="tier OBJs in upgrade order")
+    args = ap.parse_args()
+
+    meshes = [read_obj(p) for p in args.objs]
+    chained, failed = meshes[0], False
+    for (base_path, base), (path, target) in zip(zip(args.objs, meshes), zip(args.objs[1:], meshes[1:])):
+        delta = diff_tiers(base, target)
+        out = os.path.splitext(path)[0] + '.delta.json'
+        write_delta(delta, out, os.path.basename(os.path.splitext(base_path)[0]))
+        # rebuild from the previous rebuilt tier, as the game applies upgrades one after another
+        chained = apply_delta(chained, delta)
+        ok = same_mesh(chained, target)
+        failed |= not ok
+
+        t0 = time.perf_counter()
+        read_obj(path)
+        t_full = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        with open(out) as f:
+            apply_delta(base, json.load(f))
+        t_delta = time.perf_counter() - t0
+
+        raw = sum(1 for a in delta['added'] if isinstance(a, dict))
+        print(f"{os.path.basename(path)}: {len(delta['kept'])} kept, {len(delta['removed'])} removed, "
+              f"{len(delta['added']) - raw} copied, {raw} new parts; "
+              f"{os.path.getsize(path)} B obj -> {os.path.getsize(out)} B delta; "
+              f"load {t_full * 1e3:.1f} ms -> {t_delta * 1e3:.1f} ms; "
+              f"{'round-trip OK' if ok else 'ROUND-TRIP MISMATCH'} -> {out}")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,152 @@
+"""
+Pre-blurred additive glow layers for the builder towers.
+
+The upgraded towers carry emissive materials (EMISSIVE: Glow, GlowGold;
+emission=0.5*tier in create_tower_models.py). Faking that on the canvas
+means a shadowBlur per tower per frame, so this bake renders each builder
+tier through the game camera, keeps only the visible pixels of its emissive
+faces (unshaded), blurs them with the separable Gaussian of
+church_part_table.glow_layer and scales them by EMISSION_PER_TIER * tier:
+
+  tower_glow.png   every glowing tier's layer, shelf-packed
+  towerGlow.js     per tower and tier: x, y (pixels from the tower's bottom
+                   centre, y down), w, h and sx, sy (place in the atlas)
+
+The game adds a layer with one drawImage under 'lighter' compositing. Weapon
+parts that turn with the aim (turret_sprites.TURRETS) are left out here:
+turret_sprites.py bakes their glow into the turret strips. All faces share
+one z-buffer, so glow behind a wall does not shine through it. Tiers
+without visible emissive faces get no layer.
+
+Usage:
+  python tower_glow.py
+  python tower_glow.py --scale 4 --atlas out.png --module out.js
+
+Requires: numpy
+"""
+
+import argparse
+import math
+import os
+
+import numpy as np
+
+import gen_basic_t2
+import gen_basic_t3
+import gen_sniper_all
+from camera import GAME_VIEW, project
+from church_part_table import pack_atlas
+from color_bake import EMISSIVE
+from mesh_core import from_builder, read_mtl
+from png_io import write_png
+from raster import rasterize
+from turret_sprites import PX_PER_UNIT, SUPERSAMPLE, TURRETS, glow_sprite, split_turret
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.normpath(os.path.join(HERE, '..', '..', '..'))
+ATLAS = os.path.join(ROOT, 'assets', 'towers', 'animation', 'tower_glow.png')
+MODULE = os.path.join(ROOT, 'src', 'animation', 'towerAnimators', 'towerGlow.js')
+ATLAS_WIDTH = 128
+
+# tower -> tier -> (builder factory, MTL palette or None for the hand-kept <tower>_t<tier>.mtl)
+GLOWING = {
+    'sniper': {
+        2: (gen_sniper_all.build_t2, gen_sniper_all.t2_mats),
+        3: (gen_sniper_all.build_t3, gen_sniper_all.t3_mats),
+    },
+    'basic': {
+        2: (gen_basic_t2.build, None),
+        3: (gen_basic_t3.build, None),
+    },
+}
+
+
+def render_glow(mesh, palette, tier, scale=PX_PER_UNIT, ss=SUPERSAMPLE, view=GAME_VIEW):
+    """The glow layer of *mesh* as {'x', 'y', 'sprite'}, or None when no emissive face is visible."""
+    view = np.asarray(view, dtype=np.float64)
+    tri_idx, tri_face = mesh.triangles()
+    xy, depth = project(mesh.positions, view)
+    origin = project(np.zeros((1, 3)), view)[0][0]
+    px = (xy - origin) * [scale, -scale]          # pixels from the ground centre, y down
+    left, top = math.floor(px[:, 0].min()), math.floor(px[:, 1].min())
+    width, height = math.ceil(px[:, 0].max()) - left, math.ceil(px[:, 1].max()) - top
+
+    materials = np.array(mesh.materials)[mesh.face_material[tri_face]]
+    emissive = np.isin(materials, EMISSIVE)
+    kd = np.array([palette[m] if m in palette else (0.0, 0.0, 0.0) for m in materials])
+    _, idbuf, _ = rasterize(((px - [left, top]) * ss)[tri_idx], depth[tri_idx], width * ss, height * ss)
+    idbuf = idbuf.reshape(height, ss, width, ss)
+    emit = (idbuf >= 0) & emissive[np.maximum(idbuf, 0)]
+    if not emit.any():
+        return None
+    emit_rgb = np.where(emit[..., None], kd[np.maximum(idbuf, 0)], 0.0).sum((1, 3))
+    emit_rgb /= np.maximum(emit.sum((1, 3)), 1)[..., None]
+    sprite, pad = glow_sprite(np.concatenate([emit_rgb, emit.mean((1, 3))[..., None]], 2), tier, scale)
+    rows, cols = np.flatnonzero(sprite[..., 3].any(1)), np.flatnonzero(sprite[..., 3].any(0))
+    r0, r1, c0, c1 = rows[0], rows[-1] + 1, cols[0], cols[-1] + 1
+    return {'x': int(left - pad + c0), 'y': int(top - pad + r0), 'sprite': sprite[r0:r1, c0:c1]}
+
+
+def tower_glow(tower, tier, scale=PX_PER_UNIT):
+    """Glow layer of a builder tower tier without its turning weapon parts."""
+    factory, palette = GLOWING[tower][tier]
+    palette = palette or read_mtl(os.path.join(HERE, f"{tower}_t{tier}.mtl"))
+    mesh = from_builder(factory())
+    if tier in TURRETS.get(tower, {}):
+        mesh, _ = split_turret(mesh, TURRETS[tower][tier][2])
+    return render_glow(mesh, palette, tier, scale)
+
+
+def write_module(path, glows, atlas_url):
+    lines = [
+        "// src/animation/towerAnimators/towerGlow.js",
+        "// Generated by assets/towers/models/tower_glow.py from the tower builders",
+        "// - do not edit by hand, re-run the exporter instead.",
+        "// Per tower and tier, the pre-blurred additive glow layer of its emissive",
+        "// (Glow/GlowGold) faces: x, y are pixels from the tower's bottom centre, sx, sy",
+        "// the layer's place in the atlas. Draw it with 'lighter' compositing.",
+        "",
+        f"export const TOWER_GLOW_ATLAS = '{atlas_url}';",
+        "",
+        "export const TOWER_GLOW = {",
+    ]
+    for tower, tiers in glows.items():
+        lines.append(f"  {tower}: {{")
+        for tier, g in tiers.items():
+            h, w = g['sprite'].shape[:2]
+            lines.append(f"    {tier}: {{ x: {g['x']}, y: {g['y']}, w: {w}, h: {h}, sx: {g['sx']}, sy: {g['sy']} }},")
+        lines.append("  },")
+    lines += ["};", ""]
+    with open(path, 'w') as f:
+        f.write('\n'.join(lines))
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Bake additive glow layers for the builder towers.")
+    ap.add_argument('--scale', type=float, default=PX_PER_UNIT, help="sprite pixels per model unit")
+    ap.add_argument('--atlas', default=ATLAS)
+    ap.add_argument('--module', default=MODULE)
+    args = ap.parse_args()
+
+    glows = {}
+    for tower, tiers in GLOWING.items():
+        for tier in tiers:
+            glow = tower_glow(tower, tier, args.scale)
+            if glow is None:
+                print(f"{tower} T{tier}: no visible emissive faces")
+                continue
+            glows.setdefault(tower, {})[tier] = glow
+            print(f"{tower} T{tier}: glow {glow['sprite'].shape[1]}x{glow['sprite'].shape[0]}")
+
+    flat = [g for tiers in glows.values() for g in tiers.values()]
+    atlas, places = pack_atlas([g['sprite'] for g in flat], ATLAS_WIDTH)
+    for g, (sx, sy) in zip(flat, places):
+        g['sx'], g['sy'] = sx, sy
+    write_png(args.atlas, atlas)
+    write_module(args.module, glows, './' + os.path.relpath(args.atlas, ROOT).replace(os.sep, '/'))
+    print(f"Atlas {atlas.shape[1]}x{atlas.shape[0]} -> {args.atlas}")
+    print(f"Glow table -> {args.module}")
+
+
+if __name__ == '__main__':
+    main()
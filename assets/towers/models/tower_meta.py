@@ -0,0 +1,165 @@
+"""
+Per-tier tower metadata, computed at build time.
+
+Writes a JSON sidecar (<name>.meta.json) next to each tower OBJ so the game
+can read placement and targeting data instead of deriving it from sprites:
+
+  aabb        model-space bounds, Y up like the OBJ files
+  sphere      bounding sphere (Ritter's pass, then grown to fit every vertex)
+  footprint   convex hull of the ground contact (vertices within
+              GROUND_EPSILON of the lowest point), as CCW [x, z] pairs, plus
+              its area; overhanging roofs and eaves are not part of it
+  top_anchor  centre of the highest point, where projectiles spawn
+  pivots      per builder label (set_part / pt): base centre, centre and
+              bounds of all parts carrying that label
+  screen      top anchor and pivots seen through the game camera, as
+              fractions of the projected sprite bounds (0..1, y down)
+
+Usage:
+  python tower_meta.py sniper_t3.obj basic_t3.obj   # -> *.meta.json
+
+Requires: numpy
+"""
+
+import argparse
+import json
+import os
+
+import numpy as np
+
+from camera import GAME_VIEW, project
+from mesh_core import part_label, read_obj
+
+DECIMALS = 4
+GROUND_EPSILON = 1e-3    # model units above aabb.min.y that still count as standing on the ground
+
+
+def _r(values):
+    return np.round(np.asarray(values, dtype=np.float64), DECIMALS).tolist()
+
+
+# ─── Geometry ────────────────────────────────────────────────────
+
+def bounding_sphere(points):
+    """(centre, radius) of a sphere containing every point."""
+    p = np.asarray(points, dtype=np.float64)
+    a = p[np.argmax(((p - p[0]) ** 2).sum(1))]
+    b = p[np.argmax(((p - a) ** 2).sum(1))]
+    centre, radius = (a + b) / 2, np.linalg.norm(b - a) / 2
+    while True:
+        dist = np.linalg.norm(p - centre, axis=1)
+        far = np.argmax(dist)
+        if dist[far] <= radius * (1 + 1e-9):
+            return centre, radius
+        new_radius = (radius + dist[far]) / 2
+        centre = centre + (p[far] - centre) * (new_radius - radius) / dist[far]
+        radius = new_radius
+
+
+def convex_hull_2d(points):
+    """Andrew's monotone chain. Returns the hull as CCW (H, 2), no repeated end point."""
+    p = np.unique(np.round(np.asarray(points, dtype=np.float64), DECIMALS), axis=0)
+    if len(p) < 3:
+        return p
+
+    def turn(o, a, b):
+        return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+    def half(seq):
+        out = []
+        for q in seq:
+            while len(out) >= 2 and turn(out[-2], out[-1], q) <= 0:
+                out.pop()
+            out.append(q)
+        return out[:-1]
+
+    return np.array(half(p) + half(p[::-1]))
+
+
+def polygon_area(poly):
+    x, y = poly[:, 0], poly[:, 1]
+    return 0.5 * abs(float(np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1))))
+
+
+# ─── Metadata ────────────────────────────────────────────────────
+
+def _label_groups(mesh):
+    """Builder label -> part indices, skipping parts that only carry material names."""
+    groups = {}
+    for i, name in enumerate(mesh.part_names):
+        label = part_label(name)
+        if label not in mesh.materials:
+            groups.setdefault(label, []).append(i)
+    return groups
+
+
+def tower_metadata(mesh, name="tower", view=GAME_VIEW):
+    """JSON-ready metadata dict for *mesh*."""
+    pos = mesh.positions
+    lo, hi = mesh.bounds()
+    centre, radius = bounding_sphere(pos)
+    footprint = convex_hull_2d(pos[pos[:, 1] <= lo[1] + GROUND_EPSILON][:, [0, 2]])
+    if len(footprint) < 3:
+        # stands on a point or an edge: fall back to the whole shadow
+        footprint = convex_hull_2d(pos[:, [0, 2]])
+    top = pos[pos[:, 1] >= hi[1] - 10.0 ** -DECIMALS]
+    anchor = np.array([top[:, 0].mean(), hi[1], top[:, 2].mean()])
+
+    plo, phi = mesh.part_bounds()
+    pivots = {}
+    for label, parts in _label_groups(mesh).items():
+        glo, ghi = plo[parts].min(0), phi[parts].max(0)
+        pivots[label] = {
+            'pivot': _r([(glo[0] + ghi[0]) / 2, glo[1], (glo[2] + ghi[2]) / 2]),
+            'center': _r((glo + ghi) / 2),
+            'min': _r(glo), 'max': _r(ghi),
+            'parts': len(parts),
+        }
+
+    xy, _ = project(pos, np.asarray(view, dtype=np.float64))
+    slo, span = xy.min(0), np.maximum(xy.max(0) - xy.min(0), 1e-9)
+
+    def screen(point):
+        (sx, sy), = project(np.asarray([point]), np.asarray(view, dtype=np.float64))[0]
+        return _r([(sx - slo[0]) / span[0], 1 - (sy - slo[1]) / span[1]])
+
+    return {
+        'name': name,
+        'units': 'model',
+        'up': 'y',
+        'aabb': {'min': _r(lo), 'max': _r(hi)},
+        'sphere': {'center': _r(centre), 'radius': round(float(radius), DECIMALS)},
+        'footprint': _r(footprint),
+        'footprint_area': round(polygon_area(footprint), DECIMALS),
+        'top_anchor': _r(anchor),
+        'pivots': pivots,
+        'screen': {
+            'view': _r(view),
+            'aspect': round(float(span[0] / span[1]), DECIMALS),
+            'top_anchor': screen(anchor),
+            'pivots': {label: screen(p['pivot']) for label, p in pivots.items()},
+        },
+    }
+
+
+def write_metadata(meta, filename):
+    with open(filename, 'w') as f:
+        json.dump(meta, f, indent=2)
+
+
+# ─── CLI ─────────────────────────────────────────────────────────
+
+def main():
+    ap = argparse.ArgumentParser(description="Write bounds, footprint and pivot sidecars for tower OBJs.")
+    ap.add_argument('objs', nargs='+')
+    args = ap.parse_args()
+    for path in args.objs:
+        base = os.path.splitext(path)[0]
+        meta = tower_metadata(read_obj(path), os.path.basename(base))
+        write_metadata(meta, base + '.meta.json')
+        print(f"{path}: radius {meta['sphere']['radius']}, footprint {len(meta['footprint'])} pts "
+              f"-> {base}.meta.json")
+
+
+if __name__ == '__main__':
+    main()
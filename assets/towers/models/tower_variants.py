@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+Seeded variants of the builder towers, so instances on a map can differ.
+
+Every tier is one handcrafted layout. This tool records a builder once as a
+box program: each add_box/add_flared_roof (box/roof) call becomes one
+frustum row (cx, cz, y0, y1, bottom half x/z, top half x/z). A seed then
+picks, from a few discrete levels each:
+
+  ornaments   parts in the tower's ORNAMENTS move as a group: a radial
+              scale around the tower axis and a vertical lift
+  optional    parts in the tower's OPTIONAL are dropped (DROP_CHANCE)
+  palette     every material's Kd steps darker or lighter by SHADE
+
+A batch of seeds is applied at once: the rows are broadcast to
+(variants, prims, 8 corners, 3) and perturbed as whole arrays, a CHUNK of
+variants at a time. As the levels are discrete, many seeds build the same
+tower; variants are deduplicated on a hash of their quantized corners with
+dropped rows blanked, so a palette change alone never makes a new variant.
+Only a budget of distinct variants is kept: the unperturbed layout first,
+then greedily the one whose geometry levels differ most from all kept so
+far. A candidate is rejected when it has a problem the unperturbed layout
+does not: a primitive that no longer touches anything connected to the
+ground, or a mesh_validate error. The palette is applied to the kept
+variants only; they are written as <tower>_vNN.obj/.mtl with a
+variants.json manifest (seed, hash, levels) for the sprite bake.
+
+Usage:
+  python tower_variants.py                                # all towers, 4096 seeds, keep 8
+  python tower_variants.py sniper_t3 --count 20000 --budget 12 --seed 7
+  python tower_variants.py --dry-run                      # statistics only
+
+Requires: numpy
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import time
+
+import numpy as np
+
+import gen_basic_t3
+import gen_sniper_all
+from mesh_core import Mesh, compute_normals, connected_components, from_builder, part_label, read_mtl, write_obj
+from mesh_validate import validate
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+OUTDIR = os.path.join(HERE, 'variants')
+
+COUNT = 4096          # seeds per tower
+BUDGET = 8            # variants kept per tower
+CHUNK = 512           # variants perturbed per array pass
+SHADE = 0.08          # Kd step per palette level
+DROP_CHANCE = 0.25    # per optional part
+LEVELS = (-1, 0, 1)
+DECIMALS = 4          # hash precision, as printed in the OBJ
+CONTACT = 1e-3        # gap below which two primitives touch
+
+# name -> (builder factory, palette or MTL file, title,
+#          {ornament label: (radial step, lift step)}, optional labels)
+TOWERS = {
+    'sniper_t1': (gen_sniper_all.build_t1, gen_sniper_all.t1_mats, "Sniper T1 - Buddhist Pagoda",
+                  {}, ()),
+    'sniper_t2': (gen_sniper_all.build_t2, gen_sniper_all.t2_mats, "Sniper T2 - Enhanced Pagoda",
+                  {'bell': (0.05, 0.3)}, ('bell',)),
+    'sniper_t3': (gen_sniper_all.build_t3, gen_sniper_all.t3_mats, "Sniper T3 - Grand Pagoda",
+                  {'bell': (0.05, 0.3), 'prayer_wheel': (0.0, 1.5), 'flag': (0.04, 0.0)},
+                  ('flag', 'prayer_wheel')),
+    'basic_t3': (gen_basic_t3.build, 'basic_t3.mtl', "Basic Tower T3 - Grand Shinto Shrine",
+                 {'lantern': (0.02, 0.0), 'guardian': (0.05, 0.0)},
+                 ('lantern', 'guardian', 'offering_box')),
+}
+
+# corner k of a frustum: x sign, top (0/1), z sign; the builders' own order
+CORNER_X = np.array([-1, 1, 1, -1, -1, 1, 1, -1])
+CORNER_TOP = np.array([0, 0, 1, 1, 0, 0, 1, 1])
+CORNER_Z = np.array([1, 1, 1, 1, -1, -1, -1, -1])
+QUADS = np.array([[0, 1, 2, 3], [5, 4, 7, 6], [3, 2, 6, 7], [4, 5, 1, 0], [1, 5, 6, 2], [4, 0, 3, 7]])
+
+
+# ─── Box program ─────────────────────────────────────────────────
+
+class BoxProgram:
+    """A builder's primitives as rows of `params` (P, 8):
+    cx, cz, y0, y1, bottom half x, bottom half z, top half x, top half z."""
+
+    def __init__(self, params, prim_material, prim_label, materials):
+        self.params = params
+        self.prim_material = prim_material
+        self.prim_label = prim_label
+        self.materials = materials
+
+    @property
+    def prim_count(self):
+        return len(self.params)
+
+    def label_mask(self, label):
+        return np.array([name == label for name in self.prim_label])
+
+
+def record(builder):
+    """BoxProgram of a builder; every primitive adds 8 vertices and 6 quads."""
+    mesh = from_builder(builder)
+    if mesh.vertex_count % 8 or mesh.face_count != mesh.vertex_count // 8 * 6:
+        raise ValueError("builder has faces that are not boxes or roofs")
+    corners = mesh.positions.reshape(-1, 8, 3)
+    order = np.argsort(corners[..., 1], axis=1, kind='stable')
+    ordered = np.take_along_axis(corners, order[..., None], axis=1)
+    bottom, top = ordered[:, :4], ordered[:, 4:]
+    lo_b, hi_b, lo_t, hi_t = bottom.min(1), bottom.max(1), top.min(1), top.max(1)
+    params = np.stack([(lo_b[:, 0] + hi_b[:, 0]) / 2, (lo_b[:, 2] + hi_b[:, 2]) / 2, lo_b[:, 1], hi_t[:, 1],
+                       (hi_b[:, 0] - lo_b[:, 0]) / 2, (hi_b[:, 2] - lo_b[:, 2]) / 2,
+                       (hi_t[:, 0] - lo_t[:, 0]) / 2, (hi_t[:, 2] - lo_t[:, 2]) / 2], 1)
+
+    prim = mesh.quads[:, 0] // 8
+    prim_material = np.zeros(len(params), dtype=np.int32)
+    prim_material[prim] = mesh.face_material
+    prim_part = np.zeros(len(params), dtype=np.int32)
+    prim_part[prim] = mesh.face_part
+    labels = [part_label(mesh.part_names[p]) for p in prim_part]
+    return BoxProgram(params, prim_material, labels, mesh.materials)
+
+
+def corners(params):
+    """(..., P, 8, 3) corner positions of frustum rows (..., P, 8)."""
+    p = params[..., None, :]
+    half_x = np.where(CORNER_TOP, p[..., 6], p[..., 4])
+    half_z = np.where(CORNER_TOP, p[..., 7], p[..., 5])
+    return np.stack([p[..., 0] + CORNER_X * half_x,
+                     np.where(CORNER_TOP, p[..., 3], p[..., 2]),
+                     p[..., 1] + CORNER_Z * half_z], -1)
+
+
+def mesh_rows(program, kept=None):
+    """Program rows of a mesh's primitives: the kept rows, stably grouped by material."""
+    rows = np.flatnonzero(np.ones(program.prim_count, bool) if kept is None else kept)
+    return rows[np.argsort(program.prim_material[rows], kind='stable')]
+
+
+def to_mesh(program, params, kept=None):
+    """Mesh of a program's (kept) rows, faces in the builders' winding and one
+    run per material, as from_builder() groups them."""
+    rows = mesh_rows(program, kept)
+    quads = (QUADS[None] + 8 * np.arange(len(rows))[:, None, None]).reshape(-1, 4)
+    return Mesh(corners(params[rows]).reshape(-1, 3), quads, program.materials,
+                np.repeat(program.prim_material[rows], 6))
+
+
+# ─── Variants ────────────────────────────────────────────────────
+
+class VariantSpace:
+    """Level columns of one tower: one per ornament move with a non-zero
+    step, then drop per optional part (together the geometry columns), then
+    shade per material."""
+
+    def __init__(self, program, ornaments, optional):
+        self.program = program
+        # (label, axis, step) with axis 0 = radial, 1 = lift
+        self.moves = [(label, axis, step[axis]) for axis in (0, 1)
+                      for label, step in ornaments.items() if step[axis]]
+        self.optional = list(optional)
+        self.geometry = len(self.moves) + len(self.optional)
+        self.columns = ([f"{label}.{('radial', 'lift')[axis]}" for label, axis, _ in self.moves] +
+                        [f"{label}.drop" for label in self.optional] +
+                        [f"{m}.shade" for m in program.materials])
+
+    def levels(self, seed):
+        """Level row (K,) int8 of one seed; moves of dropped parts are zeroed."""
+        rng = np.random.default_rng(seed)
+        moves = rng.choice(LEVELS, len(self.moves))
+        shades = rng.choice(LEVELS, len(self.program.materials))
+        drops = rng.random(len(self.optional)) < DROP_CHANCE
+        dropped = {label for label, drop in zip(self.optional, drops) if drop}
+        moves[[label in dropped for label, _, _ in self.moves]] = 0
+        return np.concatenate([moves, drops, shades]).astype(np.int8)
+
+    def apply(self, levels):
+        """Perturbed (params (N, P, 8), kept (N, P)) for level rows (N, K)."""
+        n, o = len(levels), len(self.moves)
+        params = np.repeat(self.program.params[None], n, axis=0)
+        for j, (label, axis, step) in enumerate(self.moves):
+            mask = self.program.label_mask(label)
+            if axis == 0:
+                scale = 1.0 + step * levels[:, j, None]
+                params[:, mask, 0] *= scale
+                params[:, mask, 1] *= scale
+            else:
+                params[:, mask, 2:4] += (step * levels[:, j])[:, None, None]
+        kept = np.ones((n, self.program.prim_count), dtype=bool)
+        for j, label in enumerate(self.optional):
+            kept &= ~(levels[:, o + j, None].astype(bool) & self.program.label_mask(label))
+        return params, kept
+
+    def shade(self, levels, palette):
+        """Material colours kd (N, M, 3) for level rows (N, K)."""
+        base = np.array([palette[name] for name in self.program.materials])
+        steps = levels[:, self.geometry:, None]
+        return np.round(np.clip(base[None] * (1.0 + SHADE * steps), 0, 1), DECIMALS)
+
+
+def variant_hashes(params, kept):
+    """Hex digest per variant of its quantized corners, dropped rows blanked."""
+    q = np.round(corners(params) * 10 ** DECIMALS).astype(np.int32)
+    q[~kept] = np.iinfo(np.int32).min
+    return [hashlib.blake2b(row.tobytes(), digest_size=16).hexdigest() for row in q.reshape(len(q), -1)]
+
+
+def generate(space, seeds, chunk=CHUNK):
+    """Distinct variants among *seeds*: (seeds, levels (D, K), hashes), first seed per hash.
+    The unperturbed layout comes first with seed None."""
+    base = np.zeros((1, len(space.columns)), dtype=np.int8)
+    found = dict.fromkeys(variant_hashes(*space.apply(base)))
+    firsts, rows = [None], [base[0]]
+    for start in range(0, len(seeds), chunk):
+        batch = seeds[start:start + chunk]
+        levels = np.stack([space.levels(s) for s in batch])
+        for seed, row, digest in zip(batch, levels, variant_hashes(*space.apply(levels))):
+            if digest not in found:
+                found[digest] = None
+                firsts.append(seed)
+                rows.append(row)
+    return firsts, np.stack(rows), list(found)
+
+
+def loose_rows(program, params, kept):
+    """Kept rows of one variant that touch nothing connected to the ground."""
+    c = corners(params)
+    lo, hi = c.min(1), c.max(1)
+    rows = np.flatnonzero(kept)
+    lo, hi = lo[rows], hi[rows]
+    touch = ((lo[:, None] <= hi[None] + CONTACT) & (lo[None] <= hi[:, None] + CONTACT)).all(-1)
+    a, b = np.nonzero(np.triu(touch, 1))
+    labels = connected_components(len(rows), a, b)
+    ground = lo[:, 1] <= lo[:, 1].min() + CONTACT
+    return rows[~np.isin(labels, labels[ground])]
+
+
+def problems(program, params, kept, name="variant"):
+    """What is wrong with one variant, keyed by program row: ('loose', row),
+    ('zfight', row, row) and ('degenerate', row) from mesh_validate."""
+    found = {('loose', int(r)) for r in loose_rows(program, params, kept)}
+    rows = mesh_rows(program, kept)
+    issues = validate(compute_normals(to_mesh(program, params, kept)), name)['issues']
+    for issue in issues['zfight']:
+        found.add(('zfight',) + tuple(sorted(int(rows[f // 6]) for f in issue['faces'])))
+    for issue in issues['degenerate']:
+        found.add(('degenerate', int(rows[issue['face'] // 6])))
+    return found
+
+
+def select(levels, budget, accept=None):
+    """Indices of *budget* rows: row 0, then farthest-point on L1 level distance.
+    Picks that *accept* (called with a row index) turns down are skipped."""
+    chosen = [0]
+    gap = np.abs(levels.astype(np.int32) - levels[0]).sum(1)
+    while len(chosen) < min(budget, len(levels)):
+        pick = int(np.argmax(gap))
+        if gap[pick] == 0:
+            break
+        if accept is not None and not accept(pick):
+            gap[pick] = 0
+            continue
+        chosen.append(pick)
+        gap = np.minimum(gap, np.abs(levels.astype(np.int32) - levels[pick]).sum(1))
+    return chosen
+
+
+# ─── CLI ─────────────────────────────────────────────────────────
+
+def palette_of(source):
+    return dict(source) if isinstance(source, dict) else read_mtl(os.path.join(HERE, source))
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Generate seeded tower variants and keep a distinct, budgeted set.")
+    ap.add_argument('towers', nargs='*', help=f"towers (default: all of {', '.join(TOWERS)})")
+    ap.add_argument('--count', type=int, default=COUNT, help="seeds tried per tower")
+    ap.add_argument('--budget', type=int, default=BUDGET, help="variants kept per tower")
+    ap.add_argument('--seed', type=int, default=0, help="first seed")
+    ap.add_argument('--outdir', default=OUTDIR)
+    ap.add_argument('--dry-run', action='store_true', help="report counts without writing files")
+    args = ap.parse_args()
+    unknown = set(args.towers) - set(TOWERS)
+    if unknown:
+        ap.error(f"unknown tower(s): {', '.join(sorted(unknown))}")
+
+    manifest = {}
+    for name in args.towers or list(TOWERS):
+        factory, source, title, ornaments, optional = TOWERS[name]
+        palette = palette_of(source)
+        space = VariantSpace(record(factory()), ornaments, optional)
+        seeds = list(range(args.seed, args.seed + args.count))
+        t0 = time.perf_counter()
+        firsts, levels, hashes = generate(space, seeds)
+        elapsed = time.perf_counter() - t0
+
+        program = space.program
+        baseline = problems(program, program.params, np.ones(program.prim_count, bool), name)
+        rejected = []
+
+        def accept(i):
+            params, kept = space.apply(levels[i:i + 1])
+            new = problems(program, params[0], kept[0], name) - baseline
+            if new:
+                rejected.append(i)
+            return not new
+
+        chosen = select(levels[:, :space.geometry], args.budget, accept)
+        print(f"{name}: {program.prim_count} prims, {len(space.columns)} levels; "
+              f"{len(seeds)} seeds -> {len(firsts)} distinct in {elapsed:.2f} s "
+              f"({len(seeds) / elapsed:.0f} variants/s), keeping {len(chosen)}, "
+              f"{len(rejected)} rejected")
+        if args.dry_run:
+            continue
+
+        os.makedirs(args.outdir, exist_ok=True)
+        kept_entries = []
+        for k, i in enumerate(chosen):
+            params, kept = space.apply(levels[i:i + 1])
+            kd = space.shade(levels[i:i + 1], palette)
+            stem = f"{name}_v{k:02d}"
+            mesh = compute_normals(to_mesh(space.program, params[0], kept[0]))
+            write_obj(mesh, os.path.join(args.outdir, f"{stem}.obj"), f"{title} (variant {k})")
+            gen_sniper_all.write_mtl(os.path.join(args.outdir, f"{stem}.mtl"),
+                                     dict(zip(space.program.materials, map(tuple, kd[0]))), title)
+            kept_entries.append({
+                'file': f"{stem}.obj", 'seed': firsts[i], 'hash': hashes[i],
+                'levels': {c: int(v) for c, v in zip(space.columns, levels[i]) if v},
+            })
+        manifest[name] = {'title': title, 'seeds': len(seeds), 'distinct': len(firsts),
+                          'rejected': len(rejected), 'variants': kept_entries}
+
+    if not args.dry_run:
+        path = os.path.join(args.outdir, 'variants.json')
+        with open(path, 'w') as f:
+            json.dump(manifest, f, indent=2)
+        print(f"Manifest -> {path}")
+
+
+if __name__ == '__main__':
+    main()
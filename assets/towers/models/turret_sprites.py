@@ -0,0 +1,303 @@
+"""
+Pre-rotated turret sprites for the aiming towers.
+
+Sniper (and rapid, which reuses the sniper animator) towers turn their
+weapon toward the target. Instead of a canvas transform per tower per frame,
+this bake splits the weapon parts (TURRETS) off the builder meshes, spins
+them around their pivot to N evenly spaced aim directions (32 by default)
+and renders each through the game camera into a strip of equal cells:
+
+  turrets.png       one row per tower tier, one cell per aim direction; a
+                    tier whose weapon carries emissive faces (EMISSIVE,
+                    the Glow muzzle) gets a second row of pre-blurred
+                    additive glow cells, drawn with 'lighter' compositing
+  turretSprites.js  per tower and tier: frame count, cell size, row and
+                    pivot (the turret's turning point inside a cell), the
+                    same for the glow row (null without one), and anchor:
+                    where the turning point sits on the whole tower, as
+                    fractions of its projected sprite box (0..1, y down,
+                    like the screen pivots of tower_meta.py)
+
+Frame k shows the weapon pointing along screen angle 2*pi*k/N (0 = +x,
+clockwise with y down, the convention of Math.atan2 in Tower.update), so
+the runtime turns Tower.angle into a cell with one multiply and a round.
+The remaining parts are the static base, which the animator keeps drawing;
+its glow layer comes from tower_glow.py. Glow is the emissive colour only,
+unshaded, blurred with church_part_table.glow_layer and scaled by
+EMISSION_PER_TIER * tier like the Blender materials (emission=0.5*tier in
+create_tower_models.py).
+With --processes the directions are rendered by a worker pool that attaches
+to the turret mesh and the output cells in shared memory (mesh_core.SharedMesh).
+
+Usage:
+  python turret_sprites.py
+  python turret_sprites.py --frames 64 --scale 5 --processes 4
+
+Requires: numpy
+"""
+
+import argparse
+import math
+import os
+from multiprocessing import Pool
+
+import numpy as np
+
+import gen_sniper_all
+from camera import GAME_VIEW, view_basis, project
+from church_part_table import GLOW_SIGMA, glow_layer
+from color_bake import EMISSIVE
+from mesh_core import SharedArrays, SharedMesh, attach_arrays, attach_mesh, from_builder, part_label
+from png_io import write_png
+from raster import rasterize
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.normpath(os.path.join(HERE, '..', '..', '..'))
+ATLAS = os.path.join(ROOT, 'assets', 'towers', 'animation', 'turrets.png')
+MODULE = os.path.join(ROOT, 'src', 'animation', 'towerAnimators', 'turretSprites.js')
+
+FRAMES = 32
+PX_PER_UNIT = 3      # roughly the scale of the sniper animator's 2D parts (T3: 50 units ~ 185 px)
+SUPERSAMPLE = 4
+LIGHT = np.array([-0.45, 0.8, 0.4])  # same key light as church_part_table.py
+EMISSION_PER_TIER = 0.5  # glow strength per tier, as the Blender emission materials
+
+# tower -> tier -> (builder factory, palette, weapon part labels)
+TURRETS = {
+    'sniper': {
+        2: (gen_sniper_all.build_t2, gen_sniper_all.t2_mats, ('scope', 'muzzle')),
+        3: (gen_sniper_all.build_t3, gen_sniper_all.t3_mats, ('scope', 'muzzle')),
+    },
+}
+
+
+# ─── Split and aim ───────────────────────────────────────────────
+
+def split_turret(mesh, labels):
+    """(base, turret) meshes: faces of parts whose label is in *labels* go to the turret."""
+    turret_part = np.array([part_label(name) in labels for name in mesh.part_names])
+    faces = turret_part[mesh.face_part]
+    return mesh.subset(~faces), mesh.subset(faces)
+
+
+def screen_to_ground(view=GAME_VIEW):
+    """2x2 matrix taking a screen direction (x right, y down) to a ground (x, z) direction."""
+    right, up, _ = view_basis(view)
+    # ground (x, z) -> screen (x, y down)
+    to_screen = np.array([[right[0], right[2]], [-up[0], -up[2]]])
+    return np.linalg.inv(to_screen)
+
+
+def aim_rotations(frames, view=GAME_VIEW):
+    """Y rotations (radians) that point the weapon's -Z axis along each frame's screen angle."""
+    inverse = screen_to_ground(view)
+    theta = 2 * np.pi * np.arange(frames) / frames
+    ground = np.stack([np.cos(theta), np.sin(theta)], 1) @ inverse.T
+    # R_y(a) @ (0, 0, -1) = (-sin a, 0, -cos a)
+    return np.arctan2(-ground[:, 0], -ground[:, 1])
+
+
+def turret_pivot(turret):
+    """Turning point of a turret: its box centre height, on the tower axis."""
+    lo, hi = turret.bounds()
+    return np.array([0.0, (lo[1] + hi[1]) / 2, 0.0])
+
+
+def screen_anchor(mesh, point, view=GAME_VIEW):
+    """*point* as fractions (x, y down) of the projected bounds of *mesh*."""
+    view = np.asarray(view, dtype=np.float64)
+    xy, _ = project(mesh.positions, view)
+    lo, span = xy.min(0), np.maximum(xy.max(0) - xy.min(0), 1e-9)
+    (sx, sy), = project(np.asarray([point]), view)[0]
+    return [round(float((sx - lo[0]) / span[0]), 4), round(float(1 - (sy - lo[1]) / span[1]), 4)]
+
+
+def rotate_y(points, angle, pivot):
+    c, s = math.cos(angle), math.sin(angle)
+    p = points - pivot
+    return np.stack([c * p[:, 0] + s * p[:, 2], p[:, 1], -s * p[:, 0] + c * p[:, 2]], 1) + pivot
+
+
+# ─── Rendering ───────────────────────────────────────────────────
+
+def render_cell(turret, kd, emissive, angle, pivot, origin, half, scale=PX_PER_UNIT, ss=SUPERSAMPLE,
+                view=GAME_VIEW):
+    """One (2 * half, 2 * half, 4) RGBA cell with the weapon turned by *angle*, and the
+    cell's emission as float (rgb, coverage): the unshaded colour of the visible
+    triangles flagged in *emissive*."""
+    size = 2 * half
+    tri_idx, tri_face = turret.triangles()
+    light = LIGHT / np.linalg.norm(LIGHT)
+    xy, depth = project(rotate_y(turret.positions, angle, pivot), view)
+    px = ((xy - origin) * [scale, -scale] + half) * ss
+    normals = turret.face_normals()
+    c, s = math.cos(angle), math.sin(angle)
+    normals = np.stack([c * normals[:, 0] + s * normals[:, 2], normals[:, 1],
+                        -s * normals[:, 0] + c * normals[:, 2]], 1)
+    shade = 0.6 + 0.4 * np.clip(normals[tri_face] @ light, 0, 1)
+    rgb = np.clip(kd * shade[:, None], 0, 1)
+    _, idbuf, _ = rasterize(px[tri_idx], depth[tri_idx], size * ss, size * ss)
+    idbuf = idbuf.reshape(size, ss, size, ss)
+    hit = idbuf >= 0
+    cover = hit.mean((1, 3))
+    colour = np.where(hit[..., None], rgb[np.maximum(idbuf, 0)], 0.0).sum((1, 3))
+    colour /= np.maximum(hit.sum((1, 3)), 1)[..., None]
+    emit = hit & emissive[np.maximum(idbuf, 0)]
+    emit_rgb = np.where(emit[..., None], kd[np.maximum(idbuf, 0)], 0.0).sum((1, 3))
+    emit_rgb /= np.maximum(emit.sum((1, 3)), 1)[..., None]
+    glow = np.concatenate([emit_rgb, emit.mean((1, 3))[..., None]], 2)
+    return np.round(np.concatenate([colour, cover[..., None]], 2) * 255).astype(np.uint8), glow
+
+
+def glow_sprite(emit, tier, scale=PX_PER_UNIT):
+    """Blurred additive RGBA layer from an emission array (H, W, 4) of render_cell().
+    The layer grows by the blur on every side; returns (sprite, pad)."""
+    sprite = glow_layer(emit[..., :3], emit[..., 3], EMISSION_PER_TIER * tier, GLOW_SIGMA * scale / PX_PER_UNIT)
+    return sprite, (sprite.shape[0] - emit.shape[0]) // 2
+
+
+_worker = None
+
+
+def _init_worker(mesh_descriptor, cells_descriptor, args):
+    global _worker
+    _worker = (attach_mesh(mesh_descriptor), attach_arrays(cells_descriptor, writable=True), args)
+
+
+def _render_job(job):
+    k, angle = job
+    turret, out, (kd, emissive, pivot, origin, half, scale, ss, view) = _worker
+    out['cells'][k], out['emit'][k] = render_cell(turret, kd, emissive, angle, pivot, origin, half, scale, ss,
+                                                   view)
+
+
+def render_frames(turret, palette, frames=FRAMES, scale=PX_PER_UNIT, ss=SUPERSAMPLE, view=GAME_VIEW,
+                  processes=1):
+    """RGBA cells (frames, H, W, 4), their emission (frames, H, W, 4) as
+    render_cell() returns it, and the pivot (px, py) inside a cell.
+
+    processes > 1 renders the directions in a pool; workers read the mesh
+    and write their cells through shared memory.
+    """
+    pivot = turret_pivot(turret)
+    _, tri_face = turret.triangles()
+    kd = np.array([palette[m] for m in turret.materials])[turret.face_material[tri_face]]
+    emissive = np.isin(np.array(turret.materials), EMISSIVE)[turret.face_material[tri_face]]
+
+    rotations = aim_rotations(frames, view)
+    origin = project(pivot[None], view)[0][0]
+    # one cell size for all directions, centred on the pivot
+    reach = max(np.abs(project(rotate_y(turret.positions, a, pivot), view)[0] - origin).max(0).max()
+                for a in rotations)
+    half = math.ceil(reach * scale) + 1
+    size = 2 * half
+
+    cells = np.zeros((frames, size, size, 4), dtype=np.uint8)
+    emit = np.zeros((frames, size, size, 4), dtype=np.float32)
+    if processes <= 1:
+        for k, angle in enumerate(rotations):
+            cells[k], emit[k] = render_cell(turret, kd, emissive, angle, pivot, origin, half, scale, ss, view)
+        return cells, emit, (half, half)
+
+    args = (kd, emissive, pivot, origin, half, scale, ss, view)
+    with SharedMesh(turret) as mesh, SharedArrays({'cells': cells, 'emit': emit}) as out:
+        with Pool(processes, initializer=_init_worker, initargs=(mesh.descriptor, out.descriptor, args)) as pool:
+            pool.map(_render_job, list(enumerate(rotations)))
+        cells, emit = out.arrays['cells'].copy(), out.arrays['emit'].copy()
+    return cells, emit, (half, half)
+
+
+def crop_cells(cells, pivot):
+    """Trim the empty border shared by every frame; returns (cells, pivot)."""
+    alpha = cells[..., 3].any(0)
+    rows, cols = np.flatnonzero(alpha.any(1)), np.flatnonzero(alpha.any(0))
+    r0, r1, c0, c1 = rows[0], rows[-1] + 1, cols[0], cols[-1] + 1
+    return cells[:, r0:r1, c0:c1], (pivot[0] - c0, pivot[1] - r0)
+
+
+# ─── Atlas and module ────────────────────────────────────────────
+
+def write_module(path, entries, atlas_url):
+    lines = [
+        "// src/animation/towerAnimators/turretSprites.js",
+        "// Generated by assets/towers/models/turret_sprites.py from the tower builders",
+        "// - do not edit by hand, re-run the exporter instead.",
+        "// Each tier is one row of the atlas: `frames` cells of w x h starting at y = row.",
+        "// Cell k shows the weapon aimed along screen angle 2*PI*k/frames (atan2, y down);",
+        "// pivot is the turning point inside a cell, in pixels. glow is the same for the",
+        "// row of pre-blurred additive glow cells (null when the weapon has no emissive faces).",
+        "// anchor is where the turning point sits on the tower, as fractions (x, y down)",
+        "// of the tower's projected box; the animator maps it onto its structure.",
+        "",
+        f"export const TURRET_ATLAS = '{atlas_url}';",
+        "",
+        "export const TURRETS = {",
+    ]
+
+    def cell(e):
+        return f"w: {e['w']}, h: {e['h']}, row: {e['row']}, pivot: [{e['pivot'][0]}, {e['pivot'][1]}]"
+
+    for tower, tiers in entries.items():
+        lines.append(f"  {tower}: {{")
+        for tier, e in tiers.items():
+            glow = f"{{ {cell(e['glow'])} }}" if e['glow'] else 'null'
+            lines.append(f"    {tier}: {{ frames: {e['frames']}, {cell(e)}, glow: {glow}, "
+                         f"anchor: [{e['anchor'][0]}, {e['anchor'][1]}] }},")
+        lines.append("  },")
+    lines += ["};", ""]
+    with open(path, 'w') as f:
+        f.write('\n'.join(lines))
+
+
+def strip(cells):
+    """(frames, h, w, 4) cells side by side as one (h, frames * w, 4) row."""
+    frames, h, w = cells.shape[:3]
+    return cells.transpose(1, 0, 2, 3).reshape(h, frames * w, 4)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Bake pre-rotated turret sprite strips for the aiming towers.")
+    ap.add_argument('--frames', type=int, default=FRAMES, help="aim directions per turret")
+    ap.add_argument('--scale', type=float, default=PX_PER_UNIT, help="sprite pixels per model unit")
+    ap.add_argument('--atlas', default=ATLAS)
+    ap.add_argument('--module', default=MODULE)
+    ap.add_argument('--processes', type=int, default=1, help="render worker processes")
+    args = ap.parse_args()
+
+    rows, entries, row = [], {}, 0
+    for tower, tiers in TURRETS.items():
+        for tier, (factory, palette, labels) in tiers.items():
+            mesh = from_builder(factory())
+            base, turret = split_turret(mesh, labels)
+            cells, emit, centre = render_frames(turret, palette, args.frames, args.scale, processes=args.processes)
+            cells, pivot = crop_cells(cells, centre)
+            h, w = cells.shape[1:3]
+            entry = {'frames': args.frames, 'w': w, 'h': h, 'row': row, 'pivot': [int(pivot[0]), int(pivot[1])],
+                     'glow': None, 'anchor': screen_anchor(mesh, turret_pivot(turret))}
+            rows.append((row, strip(cells)))
+            row += h + 1
+            if emit[..., 3].any():
+                glows = [glow_sprite(e, tier, args.scale) for e in emit]
+                pad = glows[0][1]
+                glows, glow_pivot = crop_cells(np.stack([g for g, _ in glows]), (centre[0] + pad, centre[1] + pad))
+                gh, gw = glows.shape[1:3]
+                entry['glow'] = {'w': gw, 'h': gh, 'row': row, 'pivot': [int(glow_pivot[0]), int(glow_pivot[1])]}
+                rows.append((row, strip(glows)))
+                row += gh + 1
+            entries.setdefault(tower, {})[tier] = entry
+            print(f"{tower} T{tier}: {turret.face_count} turret / {base.face_count} base faces, "
+                  f"{args.frames} cells of {w}x{h}"
+                  + (f", glow cells {entry['glow']['w']}x{entry['glow']['h']}" if entry['glow'] else ""))
+
+    width = max(s.shape[1] for _, s in rows)
+    atlas = np.zeros((row - 1, width, 4), dtype=np.uint8)
+    for at, s in rows:
+        atlas[at:at + s.shape[0], :s.shape[1]] = s
+    write_png(args.atlas, atlas)
+    write_module(args.module, entries, './' + os.path.relpath(args.atlas, ROOT).replace(os.sep, '/'))
+    print(f"Atlas {atlas.shape[1]}x{atlas.shape[0]} -> {args.atlas}")
+    print(f"Turret table -> {args.module}")
+
+
+if __name__ == '__main__':
+    main()
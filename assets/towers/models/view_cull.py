@@ -0,0 +1,98 @@
+"""
+Camera-aware hidden-face stripping for tower meshes.
+
+A face is kept only if, for at least one of the given view directions, it
+faces the camera and wins (or ties) at least one pixel of a coarse z-buffer
+rendered from that direction. Faces too small to cover a pixel centre are
+tested at their centroid instead, so slivers are never dropped just for
+being small. Bottom faces, faces turned away from the game camera and faces
+buried inside other parts all go.
+
+Usage:
+  python view_cull.py sniper_t3.obj                  # game camera only
+  python view_cull.py sniper_t3.obj --views 65:45,65:135 --resolution 512
+
+Requires: numpy
+"""
+
+import argparse
+import os
+
+import numpy as np
+
+from camera import GAME_VIEW, fit_viewport, parse_views, project
+from mesh_core import read_obj, write_obj
+from raster import rasterize
+
+DEFAULT_RESOLUTION = 256
+DEPTH_TOLERANCE = 1e-3  # fraction of the model's bounding diagonal
+
+
+def _visible_from(mesh, toward, resolution, tolerance):
+    normals = mesh.face_normals()
+    front = normals @ toward > 1e-6
+    if not front.any():
+        return front
+
+    tris, tri_face = mesh.triangles()
+    keep = front[tri_face]
+    tris, tri_face = tris[keep], tri_face[keep]
+    xy, depth = project(mesh.positions, toward)
+    pix, width, height, _ = fit_viewport(xy, resolution)
+
+    zbuf, _, (tri, pixel, frag_depth) = rasterize(pix[tris], depth[tris], width, height)
+    visible = np.zeros(mesh.face_count, dtype=bool)
+    hit = frag_depth <= zbuf[pixel] + tolerance
+    visible[tri_face[tri[hit]]] = True
+
+    # Sub-pixel faces: sample the z-buffer under the face centroid.
+    covered = np.zeros(mesh.face_count, dtype=bool)
+    covered[tri_face[tri]] = True
+    small = np.flatnonzero(front & ~covered)
+    if len(small):
+        quads = mesh.quads[small]
+        c = pix[quads].mean(1)
+        cx = np.clip(c[:, 0].astype(int), 0, width - 1)
+        cy = np.clip(c[:, 1].astype(int), 0, height - 1)
+        cz = depth[quads].min(1)
+        visible[small] = cz <= zbuf[cy * width + cx] + tolerance
+    return visible
+
+
+def visible_faces(mesh, views=(GAME_VIEW,), resolution=DEFAULT_RESOLUTION, tolerance=DEPTH_TOLERANCE):
+    """Boolean face mask: True where the face can be seen from at least one view."""
+    lo, hi = mesh.bounds()
+    eps = tolerance * float(np.linalg.norm(hi - lo))
+    visible = np.zeros(mesh.face_count, dtype=bool)
+    for toward in views:
+        toward = np.asarray(toward, dtype=np.float64)
+        visible |= _visible_from(mesh, toward / np.linalg.norm(toward), resolution, eps)
+    return visible
+
+
+def cull_hidden_faces(mesh, views=(GAME_VIEW,), resolution=DEFAULT_RESOLUTION):
+    """Return a copy of *mesh* without faces that no view can see."""
+    return mesh.subset(visible_faces(mesh, views, resolution))
+
+
+# ─── CLI ─────────────────────────────────────────────────────────
+
+def main():
+    ap = argparse.ArgumentParser(description="Strip faces the game camera can never see.")
+    ap.add_argument('obj', help="input OBJ written by one of the generators")
+    ap.add_argument('-o', '--output', help="output path (default: <name>_culled.obj)")
+    ap.add_argument('--views', help="comma separated pitch:yaw pairs in degrees (default: game camera)")
+    ap.add_argument('--resolution', type=int, default=DEFAULT_RESOLUTION)
+    args = ap.parse_args()
+
+    mesh = read_obj(args.obj)
+    views = parse_views(args.views) if args.views else [GAME_VIEW]
+    culled = cull_hidden_faces(mesh, views, args.resolution)
+    out = args.output or os.path.splitext(args.obj)[0] + '_culled.obj'
+    write_obj(culled, out, os.path.basename(args.obj))
+    print(f"{args.obj}: {mesh.face_count} -> {culled.face_count} faces, "
+          f"{mesh.vertex_count} -> {culled.vertex_count} verts -> {out}")
+
+
+if __name__ == '__main__':
+    main()
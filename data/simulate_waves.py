@@ -0,0 +1,418 @@
+#!/usr/bin/env python3
+"""
+Headless wave simulator for balancing.
+
+Plays waves (data/waves.json, or Config.waves with --waves config) against
+a tower layout without the browser, following the game's rules:
+
+  spawning    WaveManager: one shared spawn timer, enemy counts scaled by
+              the difficulty's enemyCountMultiplier
+  movement    enemies advance along the map's arc-length table
+              (<map>.path.bin from maps/compile_maps.py) at their speed
+  towers      every tower targets the closest live enemy in range (from its
+              centre to the enemy position) and fires when fireRate ms have
+              passed; tier 2/3 stats come from the upgrade table
+  projectiles home on the target's centre at Config.projectile.speed and
+              hit within hitThreshold; a dead target makes them miss
+
+Enemies, towers and projectiles are structure-of-arrays; the targeting of a
+frame is one towers x enemies distance matrix. Stats come from
+src/config.js (read through node). Idle stretches between spawns are
+skipped in one step.
+
+A sweep runs every map x difficulty x random layout (placed on the map's
+buildable cells within the difficulty's starting money) over a process pool
+and reports the outcome per map and difficulty.
+
+Usage:
+  python simulate_waves.py --map spiral --layout towers.json
+  python simulate_waves.py --sweep --maps default,spiral --layouts 200
+  python simulate_waves.py --sweep --multipliers 0.5,1,2 --waves config --csv runs.csv
+
+A layout file is a JSON list of {"type", "tier", "x", "y"} tower centres.
+
+Requires: numpy, node
+"""
+
+import argparse
+import csv
+import json
+import os
+import subprocess
+import sys
+import time
+from multiprocessing import Pool
+
+import numpy as np
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+MAPS = os.path.join(ROOT, 'maps')
+sys.path.insert(0, MAPS)
+
+from compile_maps import unpack, unpack_path  # noqa: E402
+
+WAVES = os.path.join(HERE, 'waves.json')
+CONFIG = os.path.join(ROOT, 'src', 'config.js')
+TOWER_GAP = 10        # extra spacing between towers (Game.isValidTowerPosition)
+MAX_SECONDS = 600     # safety stop per wave
+
+
+# ─── Inputs ──────────────────────────────────────────────────────
+
+def load_config(path=CONFIG):
+    """The game's Config object, evaluated by node."""
+    url = 'file://' + os.path.abspath(path).replace(os.sep, '/')
+    script = f"import({json.dumps(url)}).then(m => process.stdout.write(JSON.stringify(m.default)))"
+    out = subprocess.run(['node', '--input-type=module', '-e', script],
+                         check=True, capture_output=True, text=True).stdout
+    return json.loads(out)
+
+
+def load_waves(source, config):
+    if source == 'config':
+        return config['waves']
+    with open(source) as f:
+        return json.load(f)
+
+
+def load_map(name):
+    """(arc-length table, compiled grid, starting lives) of maps/<name>; run
+    compile_maps.py first. Lives come from the map's settings, as in
+    Game.loadMapFromFile; None falls back to Config.game.startingLives."""
+    with open(os.path.join(MAPS, f'{name}.path.bin'), 'rb') as f:
+        header, cumulative, samples = unpack_path(f.read())
+    path = {'length': header['length'], 'step': header['step'], 'samples': samples.astype(np.float64)}
+    with open(os.path.join(MAPS, f'{name}.grid.bin'), 'rb') as f:
+        grid = unpack(f.read())
+    with open(os.path.join(MAPS, f'{name}.json')) as f:
+        lives = json.load(f).get('settings', {}).get('startingLives') or None
+    return path, grid, lives
+
+
+class EnemyTable:
+    """Per enemy type stats as arrays, indexed by kind."""
+
+    def __init__(self, config):
+        self.names = list(config['enemy'])
+        e = [config['enemy'][n] for n in self.names]
+        self.health = np.array([x['health'] for x in e], dtype=np.float64)
+        self.speed = np.array([x['speed'] for x in e], dtype=np.float64)
+        self.damage = np.array([x['damage'] for x in e], dtype=np.float64)
+        self.reward = np.array([x['reward'] for x in e], dtype=np.float64)
+        self.half = np.array([[x['width'] / 2, x['height'] / 2] for x in e], dtype=np.float64)
+
+
+def tower_stats(config, kind, tier):
+    """(range, damage, fire interval ms, footprint) of a tower type at a tier."""
+    cfg = config['tower'][kind]
+    rng, dmg = cfg['range'], cfg['damage']
+    for upgrade in cfg.get('upgrades', [])[:tier - 1]:
+        rng, dmg = upgrade.get('range', rng), upgrade.get('dmg', dmg)
+    return rng, dmg, cfg['fireRate'], max(cfg['width'], cfg['height'])
+
+
+def tower_arrays(config, layout):
+    """(centres (T, 2), range, damage, fire interval ms) of a layout."""
+    stats = np.array([tower_stats(config, t['type'], t.get('tier', 1)) for t in layout],
+                     dtype=np.float64).reshape(-1, 4)
+    xy = np.array([[t['x'], t['y']] for t in layout], dtype=np.float64).reshape(-1, 2)
+    return xy, stats[:, 0], stats[:, 1], stats[:, 2]
+
+
+# ─── Spawning ────────────────────────────────────────────────────
+
+def spawn_schedule(wave, table, multiplier, dt):
+    """(frame, kind) per enemy of a wave, as WaveManager.update spawns them."""
+    entries = [(table.names.index(e['type']), max(1, round(e['count'] * multiplier)), e['interval'])
+               for e in wave['enemies']]
+    counts = [0] * len(entries)
+    frames, kinds = [], []
+    timer, frame = 0.0, 0
+    while any(c < n for c, (_, n, _) in zip(counts, entries)):
+        timer += dt
+        for i, (kind, n, interval) in enumerate(entries):
+            while counts[i] < n and timer >= interval:
+                frames.append(frame)
+                kinds.append(kind)
+                counts[i] += 1
+                timer = 0.0
+        frame += 1
+    return np.array(frames, dtype=np.int64), np.array(kinds, dtype=np.int64)
+
+
+# ─── Simulation ──────────────────────────────────────────────────
+
+WAITING, WALKING, LEAKED, KILLED = 0, 1, 2, 3
+
+
+def path_points(path, dist):
+    """(N, 2) positions at arc lengths *dist* (samplePath in src/core/pathTable.js)."""
+    samples = path['samples']
+    last = len(samples) - 1
+    f = np.clip(dist / path['step'], 0, last)
+    i = np.minimum(f.astype(np.int64), last - 1)
+    t = (f - i)[:, None]
+    return samples[i, :2] + (samples[i + 1, :2] - samples[i, :2]) * t
+
+
+def simulate_wave(wave, path, towers, table, config, multiplier=1.0, lives=None, fps=None):
+    """Play one wave; returns a result dict (kills, leaks, lives, money, seconds, shots, hits)."""
+    fps = fps or config['game']['fps']
+    dt = 1.0 / fps
+    lives = config['game']['startingLives'] if lives is None else lives
+    spawn_frame, kind = spawn_schedule(wave, table, multiplier, dt)
+    n = len(kind)
+    state = np.full(n, WAITING, dtype=np.int8)
+    hp = table.health[kind].copy()
+    dist = np.zeros(n)
+    speed_dt = table.speed[kind] * dt
+    half = table.half[kind]
+
+    txy, trange, tdamage, trate = towers
+    last_fire = np.zeros(len(txy))
+    range_sq = trange ** 2
+    proj = {'xy': np.zeros((0, 2)), 'target': np.zeros(0, dtype=np.int64), 'damage': np.zeros(0)}
+    step = config['projectile']['speed'] * dt
+    hit_sq = config['projectile']['hitThreshold'] ** 2
+
+    money = leaks = shots = hits = 0
+    spawned = 0
+    frame = 0
+    max_frames = int(MAX_SECONDS * fps)
+    while frame < max_frames and lives > 0:
+        walking = np.flatnonzero(state == WALKING)
+        if len(walking) == 0 and len(proj['target']) == 0:
+            if spawned == n:
+                break
+            # nothing moves until the next spawn: fast-forward
+            skip = spawn_frame[spawned] - frame
+            if skip > 0:
+                last_fire += skip * dt * 1000
+                frame += skip
+
+        # WaveManager.update
+        while spawned < n and spawn_frame[spawned] <= frame:
+            state[spawned] = WALKING
+            spawned += 1
+        walking = np.flatnonzero(state == WALKING)
+        pos = path_points(path, dist[walking])
+
+        # Tower.update: closest live enemy in range, fire when reloaded
+        last_fire += dt * 1000
+        if len(walking) and len(txy):
+            d2 = ((txy[:, None, :] - pos[None]) ** 2).sum(2)
+            d2 = np.where(d2 <= range_sq[:, None], d2, np.inf)
+            nearest = d2.argmin(1)
+            fire = np.isfinite(d2[np.arange(len(txy)), nearest]) & (last_fire >= trate)
+            if fire.any():
+                last_fire[fire] = 0
+                shots += int(fire.sum())
+                proj['xy'] = np.concatenate([proj['xy'], txy[fire]])
+                proj['target'] = np.concatenate([proj['target'], walking[nearest[fire]]])
+                proj['damage'] = np.concatenate([proj['damage'], tdamage[fire]])
+
+        # Enemy.update
+        dist[walking] += speed_dt[walking]
+        done = walking[dist[walking] >= path['length']]
+        if len(done):
+            state[done] = LEAKED
+            leaks += len(done)
+            lives -= table.damage[kind[done]].sum()
+
+        # Projectile.update: miss when the target is gone, hit within the threshold, else home in
+        if len(proj['target']):
+            live = state[proj['target']] == WALKING
+            for key in proj:
+                proj[key] = proj[key][live]
+            target = proj['target']
+            centre = path_points(path, dist[target]) + half[target]
+            delta = centre - proj['xy']
+            d2 = (delta ** 2).sum(1)
+            hit = d2 < hit_sq
+            if hit.any():
+                hits += int(hit.sum())
+                np.add.at(hp, target[hit], -proj['damage'][hit])
+                killed = np.unique(target[hit][hp[target[hit]] <= 0])
+                killed = killed[state[killed] == WALKING]
+                state[killed] = KILLED
+                money += table.reward[kind[killed]].sum()
+            move = ~hit
+            d = np.sqrt(d2[move])[:, None]
+            proj['xy'][move] += delta[move] / np.maximum(d, 1e-9) * step
+            for key in proj:
+                proj[key] = proj[key][move]
+        frame += 1
+
+    return {'enemies': n, 'kills': int((state == KILLED).sum()), 'leaks': leaks,
+            'lives': float(lives), 'money': float(money), 'seconds': frame * dt,
+            'shots': shots, 'hits': hits}
+
+
+def simulate_game(waves, path, towers, table, config, multiplier=1.0, fps=None, lives=None):
+    """All waves in order, lives carrying over; stops at game over."""
+    lives = config['game']['startingLives'] if lives is None else lives
+    results = []
+    for wave in waves:
+        result = simulate_wave(wave, path, towers, table, config, multiplier, lives, fps)
+        results.append(result)
+        lives = result['lives']
+        if lives <= 0:
+            break
+    return results
+
+
+# ─── Layouts ─────────────────────────────────────────────────────
+
+def random_layout(grid, config, budget, rng, kinds=None):
+    """Towers placed on buildable cells that reach the path, until the money runs
+    out; leftovers go into upgrades."""
+    header, sdf, buildable = grid
+    centre_dist = (sdf.ravel() / header['sdfScale'] + header['pathWidth'] / 2)
+    kinds = kinds or list(config['tower'])
+    cell = header['cellSize']
+    layout, money = [], budget
+    for _ in range(200):
+        affordable = [k for k in kinds if config['tower'][k]['cost'] <= money]
+        if not affordable:
+            break
+        kind = affordable[rng.integers(len(affordable))]
+        cfg = config['tower'][kind]
+        size = max(cfg['width'], cfg['height'])
+        if size not in buildable:
+            continue
+        cells = np.flatnonzero(buildable[size].ravel() & (centre_dist <= cfg['range']))
+        if len(cells) == 0:
+            continue
+        c = cells[rng.integers(len(cells))]
+        x, y = (c % header['cols'] + 0.5) * cell, (c // header['cols'] + 0.5) * cell
+        clear = all(np.hypot(t['x'] - x, t['y'] - y) >= size / 2 + t['size'] / 2 + TOWER_GAP for t in layout)
+        if not clear:
+            continue
+        layout.append({'type': kind, 'tier': 1, 'x': float(x), 'y': float(y), 'size': size})
+        money -= cfg['cost']
+    for t in rng.permutation(len(layout)):
+        tower = layout[t]
+        for upgrade in config['tower'][tower['type']].get('upgrades', [])[tower['tier'] - 1:]:
+            if upgrade['cost'] > money:
+                break
+            money -= upgrade['cost']
+            tower['tier'] += 1
+    return [{k: v for k, v in t.items() if k != 'size'} for t in layout]
+
+
+# ─── Sweeps ──────────────────────────────────────────────────────
+
+_ctx = {}
+
+
+def _init_worker(config, waves, fps):
+    _ctx.update(config=config, waves=waves, fps=fps, table=EnemyTable(config), maps={})
+
+
+def _run(job):
+    map_name, label, multiplier, budget, seed = job
+    config = _ctx['config']
+    if map_name not in _ctx['maps']:
+        _ctx['maps'][map_name] = load_map(map_name)
+    path, grid, lives = _ctx['maps'][map_name]
+    layout = random_layout(grid, config, budget, np.random.default_rng(seed))
+    results = simulate_game(_ctx['waves'], path, tower_arrays(config, layout), _ctx['table'],
+                            config, multiplier, _ctx['fps'], lives)
+    return {'map': map_name, 'difficulty': label, 'multiplier': multiplier, 'seed': seed,
+            'towers': len(layout), 'waves': len(results),
+            'cleared': sum(r['lives'] > 0 for r in results),
+            'lives': results[-1]['lives'], 'leaks': sum(r['leaks'] for r in results),
+            'kills': sum(r['kills'] for r in results), 'seconds': sum(r['seconds'] for r in results)}
+
+
+def sweep(config, waves, maps, settings, layouts, processes=None, fps=None, seed=0):
+    """Outcome per (map, difficulty, layout). settings: [(label, multiplier, budget)]."""
+    jobs = [(m, label, mult, budget, seed + i)
+            for m in maps for label, mult, budget in settings for i in range(layouts)]
+    processes = min(processes or os.cpu_count() or 1, len(jobs)) or 1
+    if processes == 1:
+        _init_worker(config, waves, fps)
+        return [_run(job) for job in jobs]
+    with Pool(processes, initializer=_init_worker, initargs=(config, waves, fps)) as pool:
+        return pool.map(_run, jobs, chunksize=max(1, len(jobs) // (processes * 8)))
+
+
+# ─── CLI ─────────────────────────────────────────────────────────
+
+def main():
+    ap = argparse.ArgumentParser(description="Simulate waves headlessly for balancing.")
+    ap.add_argument('--waves', default=WAVES, help="waves JSON, or 'config' for Config.waves")
+    ap.add_argument('--map', default='default', help="map for a single run")
+    ap.add_argument('--layout', help="tower layout JSON for a single run")
+    ap.add_argument('--difficulty', help="difficulty (single run: medium; sweep: comma-separated, default all)")
+    ap.add_argument('--multipliers', help="sweep these enemy count multipliers instead of difficulties")
+    ap.add_argument('--fps', type=float, help="simulation rate (default: Config.game.fps)")
+    ap.add_argument('--sweep', action='store_true', help="random layouts over maps x difficulties")
+    ap.add_argument('--maps', default='default,straight,serpentine,spiral')
+    ap.add_argument('--layouts', type=int, default=50, help="random layouts per map and difficulty")
+    ap.add_argument('--processes', type=int, help="worker processes (default: all CPUs)")
+    ap.add_argument('--seed', type=int, default=0)
+    ap.add_argument('--csv', help="write one row per simulated game")
+    args = ap.parse_args()
+
+    config = load_config()
+    waves = load_waves(args.waves, config)
+    table = EnemyTable(config)
+
+    if not args.sweep:
+        args.difficulty = args.difficulty or 'medium'
+        difficulty = config['difficulty'][args.difficulty]
+        path, grid, lives = load_map(args.map)
+        if args.layout:
+            with open(args.layout) as f:
+                layout = json.load(f)
+        else:
+            layout = random_layout(grid, config, difficulty['startingMoney'], np.random.default_rng(args.seed))
+        towers = tower_arrays(config, layout)
+        t0 = time.perf_counter()
+        results = simulate_game(waves, path, towers, table, config, difficulty['enemyCountMultiplier'],
+                                args.fps, lives)
+        elapsed = time.perf_counter() - t0
+        print(f"{args.map}, {args.difficulty}, {len(layout)} towers: "
+              + ', '.join(f"{t['type']} T{t['tier']}" for t in layout))
+        for i, r in enumerate(results, 1):
+            print(f"  wave {i}: {r['kills']}/{r['enemies']} killed, {r['leaks']} leaked, "
+                  f"{r['lives']:g} lives, +${r['money']:g}, {r['seconds']:.1f} s game time, "
+                  f"{r['hits']}/{r['shots']} shots hit")
+        print(f"{len(results)} waves in {elapsed * 1e3:.0f} ms")
+        return
+
+    if args.multipliers:
+        budget = config['game']['startingMoney']
+        settings = [(f"x{m:g}", m, budget) for m in map(float, args.multipliers.split(','))]
+    else:
+        names = args.difficulty.split(',') if args.difficulty else list(config['difficulty'])
+        settings = [(n, config['difficulty'][n]['enemyCountMultiplier'], config['difficulty'][n]['startingMoney'])
+                    for n in names]
+    maps = args.maps.split(',')
+    t0 = time.perf_counter()
+    runs = sweep(config, waves, maps, settings, args.layouts, args.processes, args.fps, args.seed)
+    elapsed = time.perf_counter() - t0
+
+    total_waves = sum(r['waves'] for r in runs)
+    print(f"{len(runs)} games, {total_waves} waves in {elapsed:.1f} s "
+          f"({total_waves / elapsed * 60:.0f} waves/min)")
+    print(f"{'map':<12}{'difficulty':<12}{'survive':>8}{'cleared':>9}{'lives':>8}{'leaks':>8}")
+    for m in maps:
+        for label, _, _ in settings:
+            group = [r for r in runs if r['map'] == m and r['difficulty'] == label]
+            survive = np.mean([r['lives'] > 0 and r['waves'] == len(waves) for r in group])
+            print(f"{m:<12}{label:<12}{survive:>8.0%}{np.mean([r['cleared'] for r in group]):>9.2f}"
+                  f"{np.mean([r['lives'] for r in group]):>8.1f}{np.mean([r['leaks'] for r in group]):>8.1f}")
+
+    if args.csv:
+        with open(args.csv, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=list(runs[0]))
+            writer.writeheader()
+            writer.writerows(runs)
+        print(f"Runs -> {args.csv}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,47 @@
-const { app, BrowserWindow } = require('electron');
+const { app, BrowserWindow, protocol, net } = require('electron');
+const fs = require('fs');
 const path = require('path');
+const { fileURLToPath } = require('url');
+const { promisify } = require('util');
+const zlib = require('zlib');
+
+const brotliDecompress = promisify(zlib.brotliDecompress);
+
+const CONTENT_TYPES = {
+    '.html': 'text/html; charset=utf-8',
+    '.js': 'text/javascript; charset=utf-8',
+    '.jsx': 'text/javascript; charset=utf-8',
+    '.json': 'application/json; charset=utf-8',
+    '.obj': 'text/plain; charset=utf-8',
+    '.mtl': 'text/plain; charset=utf-8',
+};
+
+/**
+ * Read text assets from their brotli siblings (scripts/precompress.mjs):
+ * a fraction of the bytes off disk, inflated here. Files without an
+ * up-to-date sibling are read as usual.
+ */
+function servePrecompressed() {
+    protocol.handle('file', async (request) => {
+        const file = fileURLToPath(request.url);
+        const type = CONTENT_TYPES[path.extname(file)];
+        if (type) {
+            try {
+                const [source, sibling] = await Promise.all([
+                    fs.promises.stat(file),
+                    fs.promises.stat(`${file}.br`)
+                ]);
+                if (sibling.mtimeMs >= source.mtimeMs) {
+                    const data = await brotliDecompress(await fs.promises.readFile(`${file}.br`));
+                    return new Response(data, { headers: { 'content-type': type } });
+                }
+            } catch {
+                // no sibling: fall through to the raw file
+            }
+        }
+        return net.fetch(request.url, { bypassCustomProtocolHandlers: true });
+    });
+}
 
 function createWindow() {
     const win = new BrowserWindow({
@@ -24,6 +66,7 @@ function createWindow() {
 }
 
 app.whenReady().then(() => {
+    servePrecompressed();
     createWindow();
 
     app.on('activate', () => {
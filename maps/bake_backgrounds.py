@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Prerendered map backgrounds.
+
+Game.render() filled the canvas and stroked the path polyline twice (border
+and road) every frame. This baker renders each map's static layer once per
+pixel ratio we ship and records the images in backgrounds/manifest.json:
+
+  background  canvas.backgroundColor
+  border      the path widened by BORDER_EXTRA px in BORDER_COLOR
+  road        path.width in path.color
+
+Both strokes use round joins and caps like the canvas code, so a pixel's
+coverage is its distance to the polyline against the stroke radius, with a
+one-pixel antialiasing ramp. The game draws the image for the current
+devicePixelRatio with one drawImage and falls back to stroking the path
+when a map has no entry.
+
+Usage:
+  python bake_backgrounds.py                  # every maps/*.json
+  python bake_backgrounds.py spiral.json --scales 1,2,3
+
+Requires: numpy
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+
+import numpy as np
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+sys.path.insert(0, os.path.join(ROOT, 'assets', 'towers', 'models'))
+
+from png_io import write_png  # noqa: E402
+
+OUT_DIR = os.path.join(HERE, 'backgrounds')
+SCALES = (1, 2)              # devicePixelRatio values we ship
+BORDER_COLOR = '#5a4a3a'     # darker edge under the road (Game.renderPath)
+BORDER_EXTRA = 4             # border stroke is this much wider than the road (px)
+
+
+# ─── Rendering ───────────────────────────────────────────────────
+
+def parse_color(hex_color):
+    h = hex_color.lstrip('#')
+    if len(h) == 3:
+        h = ''.join(c * 2 for c in h)
+    return np.array([int(h[i:i + 2], 16) for i in (0, 2, 4)], dtype=np.float64)
+
+
+def polyline_distance(width, height, scale, waypoints):
+    """(H, W) distance in canvas px from each device-pixel centre to the polyline."""
+    x = (np.arange(int(width * scale)) + 0.5) / scale
+    y = (np.arange(int(height * scale)) + 0.5) / scale
+    px, py = x[None, :], y[:, None]
+    best = np.full((len(y), len(x)), np.inf)
+    for (ax, ay), (bx, by) in zip(waypoints[:-1], waypoints[1:]):
+        dx, dy = bx - ax, by - ay
+        length_sq = dx * dx + dy * dy
+        t = np.clip(((px - ax) * dx + (py - ay) * dy) / (length_sq or 1.0), 0, 1)
+        np.minimum(best, np.hypot(px - ax - t * dx, py - ay - t * dy), out=best)
+    return best
+
+
+def render_background(doc, scale):
+    """(H, W, 4) uint8 static layer of a map document at *scale* device px per canvas px."""
+    width, height = doc['canvas']['width'], doc['canvas']['height']
+    path = doc['path']
+    waypoints = [(p['x'], p['y']) for p in path['waypoints']]
+    dist = polyline_distance(width, height, scale, waypoints)
+
+    rgb = np.broadcast_to(parse_color(doc['canvas'].get('backgroundColor', '#2d2d2d')),
+                          dist.shape + (3,)).copy()
+    strokes = ((path['width'] + BORDER_EXTRA, BORDER_COLOR), (path['width'], path.get('color', '#8b7355')))
+    for stroke_width, color in strokes:
+        cover = np.clip((stroke_width / 2 - dist) * scale + 0.5, 0, 1)[..., None]
+        rgb += (parse_color(color) - rgb) * cover
+    alpha = np.full(dist.shape + (1,), 255.0)
+    return np.round(np.concatenate([rgb, alpha], 2)).astype(np.uint8)
+
+
+def image_name(stem, scale):
+    return f"{stem}.png" if scale == 1 else f"{stem}@{scale:g}x.png"
+
+
+# ─── CLI ─────────────────────────────────────────────────────────
+
+def main():
+    ap = argparse.ArgumentParser(description="Prerender map backgrounds per pixel ratio.")
+    ap.add_argument('maps', nargs='*', help="map JSON files (default: every map in this directory)")
+    ap.add_argument('--scales', default=','.join(map(str, SCALES)), help="pixel ratios to render")
+    ap.add_argument('--out', default=OUT_DIR)
+    args = ap.parse_args()
+
+    paths = args.maps or sorted(glob.glob(os.path.join(HERE, '*.json')))
+    scales = sorted({float(s) for s in args.scales.split(',')})
+    scales = [int(s) if s.is_integer() else s for s in scales]
+    os.makedirs(args.out, exist_ok=True)
+    manifest_path = os.path.join(args.out, 'manifest.json')
+    manifest = {'maps': {}}
+    if os.path.exists(manifest_path):
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+
+    for path in paths:
+        with open(path) as f:
+            doc = json.load(f)
+        if 'path' not in doc:
+            print(f"{os.path.basename(path)}: no path, skipped", file=sys.stderr)
+            continue
+        stem = os.path.splitext(os.path.basename(path))[0]
+        images = []
+        for scale in scales:
+            rgba = render_background(doc, scale)
+            name = image_name(stem, scale)
+            write_png(os.path.join(args.out, name), rgba)
+            images.append({'scale': scale, 'file': name, 'width': rgba.shape[1], 'height': rgba.shape[0]})
+            print(f"{stem} @{scale:g}x: {rgba.shape[1]}x{rgba.shape[0]} -> {name}")
+        manifest['maps'][stem] = {
+            'source': os.path.basename(path),
+            'width': doc['canvas']['width'], 'height': doc['canvas']['height'],
+            'images': images,
+        }
+
+    manifest['maps'] = dict(sorted(manifest['maps'].items()))
+    with open(manifest_path, 'w') as f:
+        json.dump(manifest, f, indent=2)
+        f.write('\n')
+    print(f"Manifest -> {manifest_path}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Map compiler: path distance fields, buildable-cell bitmaps and arc-length
+tables.
+
+Game.isValidTowerPosition used to measure the distance from the cursor to
+every path segment on each hover and click. This compiler rasterizes each
+map's path.waypoints / path.width once, on a grid of cellSize-pixel cells,
+and writes <map>.grid.bin next to the map:
+
+  sdf       Int16 per cell, signed distance from the cell centre to the
+            path edge in 1/SDF_SCALE px (negative on the path)
+  bitmaps   per tower footprint in TOWER_SIZES, 1 bit per cell (row-major,
+            LSB first): 1 = a tower of that size centred anywhere in the
+            cell keeps the same clearance from the path (half width + half
+            size + MARGIN) and stays inside the canvas, like the old check.
+            The cell centre has to clear it by the cell's half diagonal
+            more, so clicks near the threshold are rejected rather than let
+            through closer to the path
+
+Layout (little-endian): 'TDGM', u16 version, u16 reserved, u32 header
+length, JSON header padded with spaces to 4 bytes, Int16 sdf[rows * cols],
+then one Uint8 bitmap of ceil(rows * cols / 8) bytes per tower size.
+
+Enemies walked the waypoint list with a sqrt per step; <map>.path.bin
+samples the path once so a position is one lookup by distance travelled:
+
+  cumulative  Float32 per waypoint, path length up to that waypoint
+  samples     Float32 (x, y, heading) every `step` px of arc length, the
+              first at the start and the last at the end; heading is the
+              screen angle (atan2, y down) of the segment being walked
+
+Layout (little-endian): 'TDGL', u16 version, u16 reserved, u32 header
+length, padded JSON header, Float32 cumulative[waypoints], Float32
+samples[samples * 3].
+
+Usage:
+  python compile_maps.py                  # every maps/*.json
+  python compile_maps.py spiral.json --cell 8 --step 1
+
+Requires: numpy
+"""
+
+import argparse
+import glob
+import json
+import os
+import struct
+import sys
+
+import numpy as np
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+MAGIC = b'TDGM'
+PATH_MAGIC = b'TDGL'
+VERSION = 1
+CELL_SIZE = 4          # px per cell
+SDF_SCALE = 16         # sdf units per px
+MARGIN = 15            # safety buffer of Game.isValidTowerPosition (px)
+TOWER_SIZES = (30, 35, 40)  # footprints of the tower types in src/config.js
+ARC_STEP = 2           # px of arc length between path samples (at most)
+
+
+# ─── Distance field ──────────────────────────────────────────────
+
+def segment_distance(points, waypoints):
+    """Distance from each (N, 2) point to the nearest segment of the polyline."""
+    a, b = waypoints[:-1], waypoints[1:]
+    ab = b - a
+    length_sq = (ab ** 2).sum(1)
+    ap = points[:, None, :] - a[None]
+    t = np.clip((ap * ab).sum(2) / np.where(length_sq > 0, length_sq, 1), 0, 1)
+    closest = a[None] + t[..., None] * ab[None]
+    return np.sqrt(((points[:, None, :] - closest) ** 2).sum(2)).min(1)
+
+
+def compile_map(doc, cell=CELL_SIZE, sizes=TOWER_SIZES, margin=MARGIN):
+    """Header dict, Int16 sdf (rows, cols) and {size: bool (rows, cols)} for a map document."""
+    width, height = doc['canvas']['width'], doc['canvas']['height']
+    path_width = doc['path']['width']
+    waypoints = np.array([[p['x'], p['y']] for p in doc['path']['waypoints']], dtype=np.float64)
+    cols, rows = -(-width // cell), -(-height // cell)
+
+    x = (np.arange(cols) + 0.5) * cell
+    y = (np.arange(rows) + 0.5) * cell
+    centres = np.stack(np.meshgrid(x, y), -1).reshape(-1, 2)
+    centre_dist = segment_distance(centres, waypoints).reshape(rows, cols)
+    sdf = np.clip(np.round((centre_dist - path_width / 2) * SDF_SCALE), -32768, 32767).astype(np.int16)
+
+    # every point of a cell is within half a cell per axis, half a diagonal overall, of its centre
+    reach = cell * np.sqrt(2) / 2
+    buildable = {}
+    for size in sizes:
+        half = size / 2 + cell / 2
+        inside = ((x - half >= 0) & (x + half <= width))[None, :] & ((y - half >= 0) & (y + half <= height))[:, None]
+        buildable[size] = inside & (centre_dist >= path_width / 2 + size / 2 + margin + reach)
+
+    header = {
+        'name': doc.get('name', ''),
+        'cellSize': cell, 'cols': int(cols), 'rows': int(rows),
+        'width': width, 'height': height, 'pathWidth': path_width,
+        'sdfScale': SDF_SCALE, 'margin': margin, 'towerSizes': list(sizes),
+        # the game drops a grid whose path no longer matches the map (mapGrid.matchesMap)
+        'waypoints': waypoints.ravel().tolist(),
+    }
+    return header, sdf, buildable
+
+
+# ─── Arc length ──────────────────────────────────────────────────
+
+def arc_length_table(waypoints, step=ARC_STEP):
+    """Cumulative length per waypoint and (samples, 3) x, y, heading at even arc lengths.
+
+    The sample spacing is the path length divided evenly into pieces of at
+    most *step* px, so the runtime index is distance / spacing.
+    """
+    seg = np.diff(waypoints, axis=0)
+    seg_len = np.sqrt((seg ** 2).sum(1))
+    cumulative = np.r_[0.0, np.cumsum(seg_len)]
+    length = cumulative[-1]
+    count = max(int(np.ceil(length / step)), 1) + 1
+    s = np.linspace(0.0, length, count)
+    # segment walked at each sample (zero-length segments never match)
+    i = np.clip(np.searchsorted(cumulative, s, side='right') - 1, 0, len(seg) - 1)
+    t = (s - cumulative[i]) / np.where(seg_len[i] > 0, seg_len[i], 1)
+    xy = waypoints[i] + t[:, None] * seg[i]
+    heading = np.arctan2(seg[i, 1], seg[i, 0])
+    return cumulative, np.column_stack([xy, heading]), length / (count - 1)
+
+
+# ─── Binary ──────────────────────────────────────────────────────
+
+def _header_blob(header):
+    blob = json.dumps(header, separators=(',', ':')).encode('utf-8')
+    return blob + b' ' * (-len(blob) % 4)
+
+
+def pack(header, sdf, buildable):
+    blob = _header_blob(header)
+    sdf = sdf.astype('<i2')
+    bitmaps = [np.packbits(buildable[s].ravel(), bitorder='little') for s in header['towerSizes']]
+    return (MAGIC + struct.pack('<HHI', VERSION, 0, len(blob)) + blob + sdf.tobytes()
+            + b''.join(b.tobytes() for b in bitmaps))
+
+
+def pack_path(name, cumulative, samples, spacing):
+    header = {'name': name, 'length': float(cumulative[-1]), 'step': float(spacing),
+              'waypoints': len(cumulative), 'samples': len(samples)}
+    blob = _header_blob(header)
+    return (PATH_MAGIC + struct.pack('<HHI', VERSION, 0, len(blob)) + blob
+            + cumulative.astype('<f4').tobytes() + samples.astype('<f4').tobytes())
+
+
+def unpack(data):
+    """Inverse of pack(); returns (header, sdf, {size: bool (rows, cols)})."""
+    if data[:4] != MAGIC:
+        raise ValueError(f"not a map grid (magic {data[:4]!r})")
+    _, _, size = struct.unpack_from('<HHI', data, 4)
+    header = json.loads(data[12:12 + size])
+    rows, cols = header['rows'], header['cols']
+    at = 12 + size
+    sdf = np.frombuffer(data, '<i2', rows * cols, at).reshape(rows, cols)
+    at += rows * cols * 2
+    nbytes = -(-rows * cols // 8)
+    buildable = {}
+    for s in header['towerSizes']:
+        bits = np.frombuffer(data, np.uint8, nbytes, at)
+        buildable[s] = np.unpackbits(bits, bitorder='little')[:rows * cols].reshape(rows, cols).astype(bool)
+        at += nbytes
+    return header, sdf, buildable
+
+
+def unpack_path(data):
+    """Inverse of pack_path(); returns (header, cumulative, samples (N, 3))."""
+    if data[:4] != PATH_MAGIC:
+        raise ValueError(f"not a path table (magic {data[:4]!r})")
+    _, _, size = struct.unpack_from('<HHI', data, 4)
+    header = json.loads(data[12:12 + size])
+    at = 12 + size
+    cumulative = np.frombuffer(data, '<f4', header['waypoints'], at)
+    at += cumulative.nbytes
+    samples = np.frombuffer(data, '<f4', header['samples'] * 3, at).reshape(-1, 3)
+    return header, cumulative, samples
+
+
+# ─── CLI ─────────────────────────────────────────────────────────
+
+def main():
+    ap = argparse.ArgumentParser(description="Compile map paths into distance fields and buildable bitmaps.")
+    ap.add_argument('maps', nargs='*', help="map JSON files (default: every map in this directory)")
+    ap.add_argument('--cell', type=int, default=CELL_SIZE, help="cell size in px")
+    ap.add_argument('--sizes', default=','.join(map(str, TOWER_SIZES)), help="tower footprints (px)")
+    ap.add_argument('--step', type=float, default=ARC_STEP, help="max px of arc length between path samples")
+    args = ap.parse_args()
+
+    paths = args.maps or sorted(glob.glob(os.path.join(HERE, '*.json')))
+    sizes = tuple(int(s) for s in args.sizes.split(','))
+    for path in paths:
+        with open(path) as f:
+            doc = json.load(f)
+        if 'path' not in doc:
+            print(f"{os.path.basename(path)}: no path, skipped", file=sys.stderr)
+            continue
+        header, sdf, buildable = compile_map(doc, args.cell, sizes)
+        data = pack(header, sdf, buildable)
+        out = os.path.splitext(path)[0] + '.grid.bin'
+        with open(out, 'wb') as f:
+            f.write(data)
+        share = ', '.join(f"{s}px {buildable[s].mean():.0%}" for s in sizes)
+        print(f"{os.path.basename(path)}: {header['cols']}x{header['rows']} cells, buildable {share}, "
+              f"{len(data)} B -> {out}")
+
+        waypoints = np.array([[p['x'], p['y']] for p in doc['path']['waypoints']], dtype=np.float64)
+        cumulative, samples, spacing = arc_length_table(waypoints, args.step)
+        data = pack_path(header['name'], cumulative, samples, spacing)
+        out = os.path.splitext(path)[0] + '.path.bin'
+        with open(out, 'wb') as f:
+            f.write(data)
+        print(f"{os.path.basename(path)}: path {cumulative[-1]:.1f} px, {len(samples)} samples "
+              f"every {spacing:.3f} px, {len(data)} B -> {out}")
+
+
+if __name__ == '__main__':
+    main()
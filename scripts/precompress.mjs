@@ -0,0 +1,152 @@
+// scripts/precompress.mjs
+// Build stage: gzip and brotli siblings for the text assets the game serves
+//
+// Every matching file under SOURCES gets <file>.gz (gzip level 9) and
+// <file>.br (brotli quality 11) next to it. The game then sends or reads
+// those bytes instead of compressing or transferring raw text (scripts/serve.mjs
+// and electron-main.cjs). Compression runs on the libuv thread pool, one
+// thread per core. Files whose SHA-256 matches the manifest and whose
+// siblings exist are skipped; siblings older than such a file (a checkout
+// or copy that only changed its mtime) get their mtime bumped, since the
+// servers only send siblings at least as new as the source. Variants that
+// do not shrink the file are not written.
+//
+// The manifest (precompressed.json) records per file: sha256, size, and the
+// gzip/br sizes (null when skipped as not worth it).
+//
+// Usage:
+//   node scripts/precompress.mjs            # or: npm run precompress
+//   node scripts/precompress.mjs --force    # recompress everything
+
+import { createHash } from 'crypto';
+import { existsSync } from 'fs';
+import { readFile, writeFile, readdir, stat, unlink, utimes } from 'fs/promises';
+import os from 'os';
+import path from 'path';
+import { fileURLToPath } from 'url';
+import { promisify } from 'util';
+import zlib from 'zlib';
+
+// The thread pool starts with the first async job, so this still applies
+process.env.UV_THREADPOOL_SIZE = String(Math.max(4, os.availableParallelism ? os.availableParallelism() : os.cpus().length));
+
+const gzip = promisify(zlib.gzip);
+const brotli = promisify(zlib.brotliCompress);
+
+const ROOT = path.resolve(path.dirname(fileURLToPath(import.meta.url)), '..');
+const MANIFEST = path.join(ROOT, 'precompressed.json');
+const SOURCES = ['index.html', 'src', 'assets', 'maps', 'data'];
+const TYPES = ['.html', '.js', '.mjs', '.jsx', '.json', '.obj', '.mtl', '.css'];
+const MIN_SIZE = 1024;     // bytes; smaller files are not worth a second request path
+const MIN_SAVING = 0.1;    // keep a variant only when it saves this fraction
+
+async function walk(rel, out) {
+  const abs = path.join(ROOT, rel);
+  if (!existsSync(abs)) return out;
+  const entries = await readdir(abs, { withFileTypes: true }).catch(() => null);
+  if (!entries) {
+    if (TYPES.includes(path.extname(rel))) out.push(rel);
+    return out;
+  }
+  for (const entry of entries) {
+    const child = path.posix.join(rel, entry.name);
+    if (entry.isDirectory()) {
+      if (entry.name !== '__pycache__' && entry.name !== 'node_modules') await walk(child, out);
+    } else if (TYPES.includes(path.extname(entry.name))) {
+      out.push(child);
+    }
+  }
+  return out;
+}
+
+async function writeVariant(file, data, size) {
+  if (data.length > size * (1 - MIN_SAVING)) {
+    if (existsSync(file)) await unlink(file);
+    return null;
+  }
+  await writeFile(file, data);
+  return data.length;
+}
+
+async function touchStale(abs, entry) {
+  const { mtimeMs } = await stat(abs);
+  for (const [ext, size] of [['.gz', entry.gzip], ['.br', entry.br]]) {
+    if (size === null) continue;
+    const sibling = `${abs}${ext}`;
+    if ((await stat(sibling)).mtimeMs < mtimeMs) {
+      const now = new Date();
+      await utimes(sibling, now, now);
+    }
+  }
+}
+
+async function precompress(rel, previous, force) {
+  const abs = path.join(ROOT, rel);
+  const source = await readFile(abs);
+  const sha256 = createHash('sha256').update(source).digest('hex');
+  const old = previous[rel];
+  const fresh = old && old.sha256 === sha256 &&
+    (old.gzip === null || existsSync(`${abs}.gz`)) && (old.br === null || existsSync(`${abs}.br`));
+  if (fresh && !force) {
+    await touchStale(abs, old);
+    return { rel, entry: old, skipped: true };
+  }
+  if (source.length < MIN_SIZE) {
+    return { rel, entry: { sha256, size: source.length, gzip: null, br: null }, skipped: false };
+  }
+
+  const [gz, br] = await Promise.all([
+    gzip(source, { level: zlib.constants.Z_BEST_COMPRESSION }),
+    brotli(source, {
+      params: {
+        [zlib.constants.BROTLI_PARAM_QUALITY]: zlib.constants.BROTLI_MAX_QUALITY,
+        [zlib.constants.BROTLI_PARAM_MODE]: zlib.constants.BROTLI_MODE_TEXT,
+        [zlib.constants.BROTLI_PARAM_SIZE_HINT]: source.length,
+      },
+    }),
+  ]);
+  const entry = {
+    sha256,
+    size: source.length,
+    gzip: await writeVariant(`${abs}.gz`, gz, source.length),
+    br: await writeVariant(`${abs}.br`, br, source.length),
+  };
+  return { rel, entry, skipped: false };
+}
+
+async function main() {
+  const force = process.argv.includes('--force');
+  const previous = existsSync(MANIFEST) ? JSON.parse(await readFile(MANIFEST, 'utf8')).files : {};
+  const files = [];
+  for (const rel of SOURCES) await walk(rel, files);
+
+  const started = Date.now();
+  const results = await Promise.all(files.sort().map((rel) => precompress(rel, previous, force)));
+  // siblings of files that are gone or no longer matched
+  for (const rel of Object.keys(previous)) {
+    if (files.includes(rel)) continue;
+    for (const ext of ['.gz', '.br']) {
+      const sibling = path.join(ROOT, rel + ext);
+      if (existsSync(sibling)) await unlink(sibling);
+    }
+  }
+
+  const manifest = { files: {} };
+  let raw = 0, gz = 0, br = 0, done = 0;
+  for (const { rel, entry, skipped } of results) {
+    manifest.files[rel] = entry;
+    raw += entry.size;
+    gz += entry.gzip ?? entry.size;
+    br += entry.br ?? entry.size;
+    if (!skipped) done++;
+  }
+  manifest.totals = { files: results.length, size: raw, gzip: gz, br };
+  await writeFile(MANIFEST, JSON.stringify(manifest, null, 2) + '\n');
+
+  const pct = (n) => `${((n / raw) * 100).toFixed(1)}%`;
+  console.log(`${results.length} files (${done} compressed, ${results.length - done} unchanged) ` +
+    `on ${process.env.UV_THREADPOOL_SIZE} threads in ${Date.now() - started} ms`);
+  console.log(`raw ${raw} B, gzip ${gz} B (${pct(gz)}), brotli ${br} B (${pct(br)}) -> ${path.relative(ROOT, MANIFEST)}`);
+}
+
+main();
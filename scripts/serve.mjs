@@ -0,0 +1,115 @@
+// scripts/serve.mjs
+// Static dev server that sends the precompressed siblings (scripts/precompress.mjs)
+//
+// For a request whose Accept-Encoding allows it, <file>.br or <file>.gz is
+// sent as-is with Content-Encoding instead of the raw file. A sibling
+// older than its source is ignored, so edits show up before the next
+// precompress run.
+//
+// Usage:
+//   node scripts/serve.mjs                  # or: npm run dev; http://localhost:3000
+//   PORT=8080 node scripts/serve.mjs
+
+import { createReadStream } from 'fs';
+import { stat } from 'fs/promises';
+import http from 'http';
+import path from 'path';
+import { fileURLToPath } from 'url';
+
+const ROOT = path.resolve(path.dirname(fileURLToPath(import.meta.url)), '..');
+
+const TYPES = {
+  '.html': 'text/html; charset=utf-8',
+  '.js': 'text/javascript; charset=utf-8',
+  '.mjs': 'text/javascript; charset=utf-8',
+  '.jsx': 'text/javascript; charset=utf-8',
+  '.css': 'text/css; charset=utf-8',
+  '.json': 'application/json; charset=utf-8',
+  '.obj': 'text/plain; charset=utf-8',
+  '.mtl': 'text/plain; charset=utf-8',
+  '.png': 'image/png',
+  '.bin': 'application/octet-stream',
+  '.tdgpak': 'application/octet-stream',
+};
+
+// preferred first
+const ENCODINGS = [['br', '.br'], ['gzip', '.gz']];
+
+/**
+ * Content codings the client accepts, from an Accept-Encoding header
+ * @param {string} header
+ * @returns {Set<string>}
+ */
+export function acceptedEncodings(header = '') {
+  const accepted = new Set();
+  for (const part of header.split(',')) {
+    const [name, ...params] = part.trim().toLowerCase().split(';');
+    const q = params.map((p) => p.trim()).find((p) => p.startsWith('q='));
+    if (name && !(q && parseFloat(q.slice(2)) === 0)) accepted.add(name);
+  }
+  return accepted;
+}
+
+async function fresh(sibling, source) {
+  try {
+    return (await stat(sibling)).mtimeMs >= source.mtimeMs;
+  } catch {
+    return false;
+  }
+}
+
+/**
+ * Request handler serving ROOT (or *root*)
+ */
+export function createHandler(root = ROOT) {
+  return async (req, res) => {
+    const url = new URL(req.url, 'http://localhost');
+    let file = path.join(root, decodeURIComponent(url.pathname));
+    if (file !== root && !file.startsWith(root + path.sep)) {
+      res.writeHead(403).end();
+      return;
+    }
+    let source;
+    try {
+      source = await stat(file);
+      if (source.isDirectory()) {
+        file = path.join(file, 'index.html');
+        source = await stat(file);
+      }
+    } catch {
+      res.writeHead(404).end('Not found');
+      return;
+    }
+
+    const headers = {
+      'Content-Type': TYPES[path.extname(file)] || 'application/octet-stream',
+      'Cache-Control': 'no-cache',
+      Vary: 'Accept-Encoding',
+    };
+    const accepted = acceptedEncodings(req.headers['accept-encoding']);
+    let body = file;
+    let size = source.size;
+    for (const [name, ext] of ENCODINGS) {
+      if (accepted.has(name) && await fresh(file + ext, source)) {
+        body = file + ext;
+        size = (await stat(body)).size;
+        headers['Content-Encoding'] = name;
+        break;
+      }
+    }
+    headers['Content-Length'] = size;
+    res.writeHead(200, headers);
+    if (req.method === 'HEAD') {
+      res.end();
+      return;
+    }
+    createReadStream(body).pipe(res);
+  };
+}
+
+if (process.argv[1] && path.resolve(process.argv[1]) === fileURLToPath(import.meta.url)) {
+  const port = Number(process.env.PORT) || 3000;
+  http.createServer(createHandler()).listen(port, () => {
+    console.log(`Serving ${ROOT} on http://localhost:${port}`);
+  });
+}
@@ -0,0 +1,106 @@
+// src/animation/animationPack.js
+// Reader for compiled keyframe packs (assets/enemies/blender/compile_animations.py)
+// Each clip is a run of sparse channels; each channel is a run of (time, value) keys
+
+import { fetchAsset } from '../core/assetPack.js';
+
+const MAGIC = 'TDGA';
+const FLAG = 1;
+
+/**
+ * Parse a compiled animation pack
+ * @param {ArrayBuffer} buffer - Contents of a .anim.bin written by the compiler
+ * @returns {Object} Pack with clips by name, the channel table and key arrays
+ */
+export function parseAnimationPack(buffer) {
+  const view = new DataView(buffer);
+  const magic = String.fromCharCode(...new Uint8Array(buffer, 0, 4));
+  if (magic !== MAGIC) {
+    throw new Error(`Not an animation pack (magic "${magic}")`);
+  }
+  const version = view.getUint16(4, true);
+  const headerBytes = view.getUint32(8, true);
+  const header = JSON.parse(new TextDecoder().decode(new Uint8Array(buffer, 12, headerBytes)));
+
+  let at = 12 + headerBytes;
+  const table = new Uint32Array(buffer, at, header.channelCount * 4);
+  at += table.byteLength;
+  const times = new Float32Array(buffer, at, header.keyCount);
+  const values = new Float32Array(buffer, at + times.byteLength, header.keyCount);
+
+  const clips = {};
+  for (const clip of header.clips) clips[clip.name] = clip;
+
+  return { version, names: header.names, clips, table, times, values };
+}
+
+/**
+ * Fetch and parse a compiled animation pack
+ * @param {string} url - Path to the .anim.bin
+ * @returns {Promise<Object>}
+ */
+export async function loadAnimationPack(url) {
+  const response = await fetchAsset(url);
+  if (!response.ok) {
+    throw new Error(`Failed to load animation pack: ${response.status} ${response.statusText}`);
+  }
+  return parseAnimationPack(await response.arrayBuffer());
+}
+
+/**
+ * Value of one channel at a key position (clamped to its first/last key).
+ * Flags follow EnemyAnimator.lerpFrame, which switches non-numeric values at
+ * t = 0.5 but only for keys that set them: a flag comes on at its key and goes
+ * off half a key before the key that clears it.
+ * @param {Object} pack - Parsed pack
+ * @param {number} channel - Row in pack.table
+ * @param {number} keyPos - Keyframe position
+ * @returns {number}
+ */
+export function sampleChannel(pack, channel, keyPos) {
+  const { table, times, values } = pack;
+  const first = table[channel * 4 + 2];
+  const last = first + table[channel * 4 + 3] - 1;
+  if (keyPos <= times[first]) return values[first];
+  if (keyPos >= times[last]) return values[last];
+
+  // Binary search for the segment containing keyPos
+  let lo = first, hi = last;
+  while (hi - lo > 1) {
+    const mid = (lo + hi) >> 1;
+    if (times[mid] <= keyPos) lo = mid; else hi = mid;
+  }
+  if (table[channel * 4 + 1] === FLAG) {
+    return keyPos < times[hi] - 0.5 ? values[lo] : Math.min(values[lo], values[hi]);
+  }
+  const t = (keyPos - times[lo]) / (times[hi] - times[lo]);
+  return values[lo] + (values[hi] - values[lo]) * t;
+}
+
+/**
+ * Sample every channel of a clip into a keyframe-shaped object,
+ * e.g. { lLeg: { rot: 12.5 }, opacity: 0.9, flash: false }
+ * Channels the compiler dropped (always 0) are left out
+ * @param {Object} pack - Parsed pack
+ * @param {string} clipName - Clip name from the compiler report
+ * @param {number} keyPos - Keyframe position; loops wrap, others clamp
+ * @param {Object} [out] - Object to fill instead of allocating one
+ * @returns {Object}
+ */
+export function sampleClip(pack, clipName, keyPos, out = {}) {
+  const clip = pack.clips[clipName];
+  const pos = clip.loop ? ((keyPos % clip.length) + clip.length) % clip.length : keyPos;
+  for (let c = clip.first; c < clip.first + clip.count; c++) {
+    const name = pack.names[pack.table[c * 4]];
+    let value = sampleChannel(pack, c, pos);
+    if (pack.table[c * 4 + 1] === FLAG) value = value > 0;
+    const dot = name.indexOf('.');
+    if (dot < 0) {
+      out[name] = value;
+    } else {
+      const part = name.slice(0, dot);
+      (out[part] ||= {})[name.slice(dot + 1)] = value;
+    }
+  }
+  return out;
+}
@@ -5,6 +5,8 @@
 import { lerp, lerpFrame } from '../interpolation.js';
 import { ParticleSystem } from '../Particle.js';
 import { AnimState } from '../AnimState.js';
+import { poseFrameOffset } from '../poseBank.js';
+import { sampleClip } from '../animationPack.js';
 
 // ═══════════════════════════════════════════════════════════════════════
 // BODY PARTS — 9 components for humanoid samurai
@@ -40,6 +42,13 @@ const PALETTES = {
   tank:  { armor: '#3c1a5c', cloth: '#0a0a2a', skin: '#b48564', helmet: '#1c1c3c', blade: '#a0a0b0', handle: '#0a0a1a', armorDetail: '#4c2a6c', crest: '#660066' },
 };
 
+// Palette entry used for each part
+const PART_COLORS = {
+  torso: 'armor', head: 'skin', helmet: 'helmet',
+  lLeg: 'cloth', rLeg: 'cloth', lArm: 'armor', rArm: 'armor',
+  blade: 'blade', handle: 'handle',
+};
+
 // WALK CYCLE — 8 frames
 const WALK_FRAMES = [
   { lLeg: { rot: 25 }, rLeg: { rot: -25 }, lArm: { rot: -15 }, rArm: { rot: 15 }, torso: { y: 0, rot: 0 }, head: { rot: 0, y: 0 }, helmet: { rot: 0, y: 0 }, blade: { rot: 5 }, handle: {} },
@@ -68,11 +77,34 @@ const DEATH_FRAMES = [
   { torso: { y: 50, rot: -90 }, head: { rot: 44, y: 42 }, helmet: { rot: 46, y: 38 }, lLeg: { rot: 65, y: 33 }, rLeg: { rot: -55, y: 33 }, lArm: { rot: -85, y: 35 }, rArm: { rot: 85, y: 36 }, blade: { rot: 90, y: 55 }, handle: { rot: 63, y: 52 }, opacity: 0 },
 ];
 
+// Baked pose bank shared by every samurai (see usePoseBank); null = interpolate keyframes
+let poseBank = null;
+
+// Compiled walk/death curves (see useAnimationPack); null = the keyframe tables above
+let animationPack = null;
+
 // ═══════════════════════════════════════════════════════════════════════
 // SAMURAI ANIMATOR CLASS
 // ═══════════════════════════════════════════════════════════════════════
 
 export class SamuraiAnimator {
+  /**
+   * Switch every samurai to baked matrices from bake_samurai_poses.py
+   * @param {Object|null} bank - Parsed pose bank, or null to interpolate keyframes again
+   */
+  static usePoseBank(bank) {
+    poseBank = bank;
+  }
+
+  /**
+   * Sample walk and death from compiled curves (compile_animations.py)
+   * when no pose bank is in use
+   * @param {Object|null} pack - Parsed animation pack, or null for the keyframe tables
+   */
+  static useAnimationPack(pack) {
+    animationPack = pack;
+  }
+
   constructor(variant = 'basic') {
     this.variant = variant;
     this.palette = PALETTES[variant] || PALETTES.basic;
@@ -95,6 +127,10 @@ export class SamuraiAnimator {
   }
 
   render(ctx, cx, cy, scale = 1) {
+    if (poseBank) {
+      this._renderBaked(ctx, cx, cy, scale);
+      return;
+    }
     const frame = this._getCurrentFrame();
     const opacity = frame.opacity ?? 1;
     const isFlash = (frame.flash || this.flashTimer > 0);
@@ -154,6 +190,8 @@ export class SamuraiAnimator {
   _getCurrentFrame() {
     const frames = this.state === AnimState.DEATH ? DEATH_FRAMES : WALK_FRAMES;
     const fps = this.state === AnimState.DEATH ? 6 : 8;
+    const clip = this.state === AnimState.DEATH ? 'death' : 'walk';
+    if (animationPack?.clips[clip]) return sampleClip(animationPack, clip, this.time * fps);
     const frameIndex = Math.floor(this.time * fps) % frames.length;
     const nextIndex = (frameIndex + 1) % frames.length;
     const t = (this.time * fps) % 1;
@@ -171,16 +209,58 @@ export class SamuraiAnimator {
     ctx.translate(pivot.x, pivot.y + offY);
     ctx.rotate(rot);
     
-    const colorMap = { torso: 'armor', head: 'skin', helmet: 'helmet',
-      lLeg: 'cloth', rLeg: 'cloth', lArm: 'armor', rArm: 'armor',
-      blade: 'blade', handle: 'handle' };
-    const color = this.palette[colorMap[partName]];
+    const color = this.palette[PART_COLORS[partName]];
     
     ctx.fillStyle = isFlash ? '#fff' : color;
     ctx.fillRect(part.x - pivot.x, part.y - pivot.y, part.w, part.h);
     ctx.restore();
   }
 
+  _renderBaked(ctx, cx, cy, scale) {
+    const data = poseBank.data;
+    const isDeath = this.state === AnimState.DEATH;
+    const base = poseFrameOffset(poseBank, isDeath ? 'death' : 'walk', this.time * (isDeath ? 6 : 8));
+    const extra = base + poseBank.channels.length * 6;
+    const isFlash = data[extra + 1] > 0 || this.flashTimer > 0;
+
+    ctx.save();
+    ctx.translate(cx, cy);
+    ctx.scale(scale, scale);
+    ctx.globalAlpha = data[extra];
+
+    // Same draw order as the interpolated path
+    for (const name of ['lLeg', 'rLeg', 'torso', 'lArm', 'rArm', 'handle', 'blade', 'head', 'helmet']) {
+      const part = SAMURAI_PARTS[name];
+      this._applyBaked(ctx, base, name);
+      ctx.fillStyle = isFlash ? '#fff' : this.palette[PART_COLORS[name]];
+      ctx.fillRect(part.x, part.y, part.w, part.h);
+      ctx.restore();
+    }
+
+    if (!isFlash) {
+      this._applyBaked(ctx, base, 'helmet');
+      ctx.fillStyle = this.palette.crest;
+      ctx.fillRect(-6, -110, 12, 4);
+      ctx.restore();
+
+      this._applyBaked(ctx, base, 'torso');
+      ctx.fillStyle = this.palette.armorDetail;
+      ctx.fillRect(-14, -65, 28, 3);
+      ctx.fillRect(-14, -58, 28, 3);
+      ctx.restore();
+    }
+
+    ctx.restore();
+    this.particleSystem.render(ctx, cx, cy);
+  }
+
+  _applyBaked(ctx, base, name) {
+    const data = poseBank.data;
+    const m = base + poseBank.channelIndex[name] * 6;
+    ctx.save();
+    ctx.transform(data[m], data[m + 1], data[m + 2], data[m + 3], data[m + 4], data[m + 5]);
+  }
+
   _renderArmorDetails(ctx, frame, opacity) {
     // Crest on helmet
     const hRot = ((frame.helmet?.rot || 0) * Math.PI) / 180;
@@ -0,0 +1,67 @@
+// src/animation/poseBank.js
+// Reader for baked pose banks (assets/enemies/blender/bake_samurai_poses.py)
+// Each frame holds one ctx.transform() matrix per channel plus opacity and flash
+
+import { fetchAsset } from '../core/assetPack.js';
+
+const MAGIC = 'TDGP';
+
+/**
+ * Parse a baked pose bank
+ * @param {ArrayBuffer} buffer - Contents of a .bin written by the baker
+ * @returns {Object} Bank with channels, clips, pivots and a Float32Array of frames
+ */
+export function parsePoseBank(buffer) {
+  const view = new DataView(buffer);
+  const magic = String.fromCharCode(...new Uint8Array(buffer, 0, 4));
+  if (magic !== MAGIC) {
+    throw new Error(`Not a pose bank (magic "${magic}")`);
+  }
+  const version = view.getUint16(4, true);
+  const headerBytes = view.getUint32(8, true);
+  const header = JSON.parse(new TextDecoder().decode(new Uint8Array(buffer, 12, headerBytes)));
+  const data = new Float32Array(buffer, 12 + headerBytes);
+
+  const channelIndex = {};
+  header.channels.forEach((name, i) => { channelIndex[name] = i; });
+
+  return { version, ...header, channelIndex, data };
+}
+
+/**
+ * Fetch and parse a pose bank
+ * @param {string} url - Path to the .bin file
+ * @returns {Promise<Object>} Parsed bank
+ */
+export async function loadPoseBank(url) {
+  const response = await fetchAsset(url);
+  if (!response.ok) {
+    throw new Error(`Failed to load pose bank: ${response.status} ${response.statusText}`);
+  }
+  return parsePoseBank(await response.arrayBuffer());
+}
+
+/**
+ * Frame of a clip at a (fractional) keyframe position
+ * Looping clips wrap, others hold their last frame
+ * @param {Object} bank - Parsed bank
+ * @param {string} clipName - e.g. 'walk' or 'death'
+ * @param {number} keyPos - Keyframe position, e.g. 2.5 = halfway from key 2 to key 3
+ * @returns {number} Frame index within the clip
+ */
+export function poseFrameIndex(bank, clipName, keyPos) {
+  const clip = bank.clips[clipName];
+  const i = Math.floor(keyPos * bank.substeps);
+  return clip.loop ? i % clip.frames : Math.min(i, clip.frames - 1);
+}
+
+/**
+ * Offset of the baked frame at a (fractional) keyframe position
+ * @param {Object} bank - Parsed bank
+ * @param {string} clipName - e.g. 'walk' or 'death'
+ * @param {number} keyPos - Keyframe position (see poseFrameIndex)
+ * @returns {number} Float offset of the frame in bank.data
+ */
+export function poseFrameOffset(bank, clipName, keyPos) {
+  return (bank.clips[clipName].offset + poseFrameIndex(bank, clipName, keyPos)) * bank.frameFloats;
+}
@@ -0,0 +1,151 @@
+// src/animation/spriteBaker.js
+// Bakes procedurally drawn animation frames into a sprite sheet
+// Identical and mirror-image frames share one cell; a frame table maps clip frames to cells
+
+// Frame table entry for a frame with no visible pixels
+export const EMPTY_FRAME = 0xffff;
+
+/**
+ * FNV-1a hash of RGBA pixel data, optionally read right-to-left per row
+ * @param {Uint8ClampedArray} pixels - RGBA data from getImageData()
+ * @param {number} width - Row length in pixels
+ * @param {boolean} mirrored - Hash the horizontally flipped image
+ * @returns {number} Unsigned 32-bit hash
+ */
+export function hashPixels(pixels, width, mirrored = false) {
+  const words = new Uint32Array(pixels.buffer, pixels.byteOffset, pixels.length >> 2);
+  const height = words.length / width;
+  let h = 0x811c9dc5;
+  for (let y = 0; y < height; y++) {
+    const row = y * width;
+    for (let x = 0; x < width; x++) {
+      h = Math.imul(h ^ words[row + (mirrored ? width - 1 - x : x)], 0x01000193);
+    }
+  }
+  return h >>> 0;
+}
+
+function samePixels(a, b, width, mirrored) {
+  const wa = new Uint32Array(a.buffer, a.byteOffset, a.length >> 2);
+  const wb = new Uint32Array(b.buffer, b.byteOffset, b.length >> 2);
+  for (let i = 0; i < wa.length; i++) {
+    const x = i % width;
+    if (wa[i] !== wb[mirrored ? i - x + width - 1 - x : i]) return false;
+  }
+  return true;
+}
+
+/**
+ * Collapse identical and mirrored frames
+ * @param {Uint8ClampedArray[]} frames - RGBA data, all the same size
+ * @param {number} width - Frame width in pixels
+ * @returns {{cells: number[], table: Uint16Array}} cells lists the frame kept for each
+ *   cell; table holds (cell << 1 | mirrored) per frame, or EMPTY_FRAME
+ */
+export function dedupeFrames(frames, width) {
+  const cells = [];
+  const byHash = new Map();
+  const table = new Uint16Array(frames.length);
+
+  frames.forEach((pixels, i) => {
+    if (!pixels.some((v, k) => (k & 3) === 3 && v !== 0)) {
+      table[i] = EMPTY_FRAME;
+      return;
+    }
+    for (const mirrored of [false, true]) {
+      for (const cell of byHash.get(hashPixels(pixels, width, mirrored)) || []) {
+        if (samePixels(frames[cells[cell]], pixels, width, mirrored)) {
+          table[i] = (cell << 1) | (mirrored ? 1 : 0);
+          return;
+        }
+      }
+    }
+    const hash = hashPixels(pixels, width);
+    if (!byHash.has(hash)) byHash.set(hash, []);
+    byHash.get(hash).push(cells.length);
+    table[i] = cells.length << 1;
+    cells.push(i);
+  });
+
+  return { cells, table };
+}
+
+function createCanvas(width, height) {
+  if (typeof OffscreenCanvas !== 'undefined') return new OffscreenCanvas(width, height);
+  const canvas = document.createElement('canvas');
+  canvas.width = width;
+  canvas.height = height;
+  return canvas;
+}
+
+/**
+ * Render every frame of a set of clips and pack the distinct ones into a sheet
+ * @param {Object} options
+ * @param {Object<string, number>} options.clips - Clip name -> frame count
+ * @param {number} options.width - Cell width in pixels
+ * @param {number} options.height - Cell height in pixels
+ * @param {Function} options.drawFrame - (ctx, clipName, frame) draws one frame into a cleared cell
+ * @returns {Object} Sheet with canvas, cell size, columns and a frame table per clip
+ */
+export function bakeSpriteSheet({ clips, width, height, drawFrame }) {
+  const scratch = createCanvas(width, height);
+  const sctx = scratch.getContext('2d', { willReadFrequently: true });
+  const frames = [];
+  const ranges = {};
+
+  for (const [name, count] of Object.entries(clips)) {
+    ranges[name] = [frames.length, frames.length + count];
+    for (let i = 0; i < count; i++) {
+      sctx.setTransform(1, 0, 0, 1, 0, 0);
+      sctx.clearRect(0, 0, width, height);
+      sctx.save();
+      drawFrame(sctx, name, i);
+      sctx.restore();
+      frames.push(sctx.getImageData(0, 0, width, height).data);
+    }
+  }
+
+  const { cells, table } = dedupeFrames(frames, width);
+  const columns = Math.max(1, Math.ceil(Math.sqrt(cells.length)));
+  const canvas = createCanvas(columns * width, Math.max(1, Math.ceil(cells.length / columns)) * height);
+  const ctx = canvas.getContext('2d');
+  cells.forEach((frame, cell) => {
+    const image = new ImageData(frames[frame], width, height);
+    ctx.putImageData(image, (cell % columns) * width, Math.floor(cell / columns) * height);
+  });
+
+  const tables = {};
+  for (const [name, [start, end]] of Object.entries(ranges)) tables[name] = table.slice(start, end);
+
+  return { canvas, cellWidth: width, cellHeight: height, columns, cells: cells.length, frames: frames.length, clips: tables };
+}
+
+/**
+ * Draw one frame table entry with its cell origin at (x, y)
+ * @param {CanvasRenderingContext2D} ctx - Target context
+ * @param {Object} sheet - Result of bakeSpriteSheet()
+ * @param {number} entry - Frame table entry
+ * @param {number} x - Destination of the cell origin
+ * @param {number} y - Destination of the cell origin
+ * @param {number} originX - Cell origin in sheet pixels (mirrored frames flip around it)
+ * @param {number} originY - Cell origin in sheet pixels
+ * @param {number} k - Destination pixels per sheet pixel
+ */
+export function drawSpriteFrame(ctx, sheet, entry, x, y, originX, originY, k = 1) {
+  if (entry === EMPTY_FRAME) return;
+  const cell = entry >> 1;
+  const sx = (cell % sheet.columns) * sheet.cellWidth;
+  const sy = Math.floor(cell / sheet.columns) * sheet.cellHeight;
+  const w = sheet.cellWidth * k;
+  const h = sheet.cellHeight * k;
+  if (entry & 1) {
+    ctx.save();
+    ctx.translate(x, y);
+    ctx.scale(-1, 1);
+    ctx.drawImage(sheet.canvas, sx, sy, sheet.cellWidth, sheet.cellHeight,
+      (originX - sheet.cellWidth) * k, -originY * k, w, h);
+    ctx.restore();
+  } else {
+    ctx.drawImage(sheet.canvas, sx, sy, sheet.cellWidth, sheet.cellHeight, x - originX * k, y - originY * k, w, h);
+  }
+}
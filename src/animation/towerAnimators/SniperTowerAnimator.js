@@ -4,6 +4,9 @@
 
 import { lerpFrame } from '../interpolation.js';
 import { AnimState } from '../AnimState.js';
+import { TURRET_ATLAS, TURRETS } from './turretSprites.js';
+import { TOWER_GLOW_ATLAS, TOWER_GLOW } from './towerGlow.js';
+import { assetURL } from '../../core/assetPack.js';
 
 // ═══════════════════════════════════════════════════════════════════════
 // TIER-SPECIFIC PARTS
@@ -60,6 +63,50 @@ const T3_PARTS = {
   arrowR: { x: 14, y: -65, w: 10, h: 2, color: '#8B7355' },
 };
 
+
+// Turret and glow atlases, loaded once; towers draw neither until it is ready
+let turretAtlas = null;
+let glowAtlas = null;
+
+function loadAtlases() {
+  if (turretAtlas || typeof Image === 'undefined') return;
+  turretAtlas = new Image();
+  turretAtlas.src = assetURL(TURRET_ATLAS);
+  glowAtlas = new Image();
+  glowAtlas.src = assetURL(TOWER_GLOW_ATLAS);
+}
+
+function ready(image) {
+  return image && image.complete && image.naturalWidth > 0;
+}
+
+/**
+ * Cell of a pre-rotated turret strip for an aim angle
+ * @param {number} angle - Radians, as Math.atan2(dy, dx) in screen space
+ * @param {number} frames - Cells in the strip
+ * @returns {number} Cell index in [0, frames)
+ */
+export function turretFrame(angle, frames) {
+  return ((Math.round((angle * frames) / (2 * Math.PI)) % frames) + frames) % frames;
+}
+
+/**
+ * Where a pre-rotated turret pivots on a tier's 2D structure: the baked
+ * anchor (fractions of the model's projected box, turretSprites.js) mapped
+ * onto the box the parts cover, bottom at y = 0
+ * @param {Object} parts - Tier parts ({ x, y, w, h } each)
+ * @param {number[]} anchor - [fx, fy] from TURRETS
+ * @returns {{x: number, y: number}}
+ */
+export function turretAnchor(parts, anchor) {
+  const all = Object.values(parts);
+  const left = Math.min(...all.map((p) => p.x));
+  const right = Math.max(...all.map((p) => p.x + p.w));
+  const top = Math.min(...all.map((p) => p.y));
+  const bottom = Math.max(...all.map((p) => p.y + p.h));
+  return { x: left + anchor[0] * (right - left), y: top + anchor[1] * (bottom - top) };
+}
+
 // ═══════════════════════════════════════════════════════════════════════
 // ANIMATION KEYFRAMES
 // ═══════════════════════════════════════════════════════════════════════
@@ -129,6 +176,8 @@ export class SniperTowerAnimator {
     this.state = AnimState.IDLE;
     this.time = 0;
     this.parts = tier === 1 ? T1_PARTS : tier === 2 ? T2_PARTS : T3_PARTS;
+    this.aim = 0;
+    loadAtlases();
   }
 
   update(deltaTime) {
@@ -155,10 +204,20 @@ export class SniperTowerAnimator {
     if (this.tier === 1) this._renderT1(ctx, frame);
     else if (this.tier === 2) this._renderT2(ctx, frame);
     else this._renderT3(ctx, frame);
+    this._renderGlow(ctx);
+    this._renderTurret(ctx);
     
     ctx.restore();
   }
 
+  /**
+   * Aim the turret (tiers with a baked turret strip)
+   * @param {number} angle - Radians, as Math.atan2(dy, dx) in screen space
+   */
+  setAim(angle) {
+    this.aim = angle;
+  }
+
   triggerFire() {
     this.setState(AnimState.FIRE);
   }
@@ -177,6 +236,32 @@ export class SniperTowerAnimator {
     return this.state;
   }
 
+  // Emissive (Glow/GlowGold) faces of the static structure: one additive pre-blurred layer
+  _renderGlow(ctx) {
+    const g = TOWER_GLOW.sniper[this.tier];
+    if (!g || !ready(glowAtlas)) return;
+    ctx.save();
+    ctx.globalCompositeOperation = 'lighter';
+    ctx.drawImage(glowAtlas, g.sx, g.sy, g.w, g.h, g.x, g.y, g.w, g.h);
+    ctx.restore();
+  }
+
+  _renderTurret(ctx) {
+    const turret = TURRETS.sniper[this.tier];
+    if (!turret || !ready(turretAtlas)) return;
+    const anchor = turretAnchor(this.parts, turret.anchor);
+    const cell = turretFrame(this.aim, turret.frames);
+    ctx.drawImage(turretAtlas, cell * turret.w, turret.row, turret.w, turret.h,
+      anchor.x - turret.pivot[0], anchor.y - turret.pivot[1], turret.w, turret.h);
+    const glow = turret.glow;
+    if (!glow) return;
+    ctx.save();
+    ctx.globalCompositeOperation = 'lighter';
+    ctx.drawImage(turretAtlas, cell * glow.w, glow.row, glow.w, glow.h,
+      anchor.x - glow.pivot[0], anchor.y - glow.pivot[1], glow.w, glow.h);
+    ctx.restore();
+  }
+
   _getCurrentFrame() {
     const frames = this.state === AnimState.FIRE ? this._getFireFrames() : this._getIdleFrames();
     const fps = this.state === AnimState.FIRE ? 6 : 2;
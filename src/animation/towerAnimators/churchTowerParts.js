@@ -0,0 +1,69 @@
+// src/animation/towerAnimators/churchTowerParts.js
+// Generated by assets/towers/models/church_part_table.py from the church tower
+// generator layouts - do not edit by hand, re-run the exporter instead.
+// CHURCH_LEVELS is the sprite mip chain, largest first: scale is sprite pixels
+// per 1x pixel. Parts are sorted back to front; rects[level] holds x, y, w, h
+// (level pixels from the tower's bottom centre) and sx, sy (position in that
+// level's atlas) per part. glowRects[level] is the same for the tier's
+// pre-blurred additive glow layer.
+
+export const CHURCH_LEVELS = [
+  { scale: 2, atlas: './assets/towers/animation/church_parts@2x.png', glowAtlas: './assets/towers/animation/church_glow@2x.png' },
+  { scale: 1, atlas: './assets/towers/animation/church_parts.png', glowAtlas: './assets/towers/animation/church_glow.png' },
+  { scale: 0.5, atlas: './assets/towers/animation/church_parts@0.5x.png', glowAtlas: './assets/towers/animation/church_glow@0.5x.png' },
+  { scale: 0.25, atlas: './assets/towers/animation/church_parts@0.25x.png', glowAtlas: './assets/towers/animation/church_glow@0.25x.png' },
+];
+
+export const CHURCH_PARTS = {
+  1: {
+    names: ['base', 'foundation', 'wall', 'doorway', 'windowLeft', 'roofBase', 'roof', 'doorArch', 'cross', 'windowRight'],
+    colors: ['#8a7d70', '#6b5e4f', '#998c80', '#292929', '#4a6b99', '#6b5e4f', '#3b2929', '#8a7d70', '#d4b038', '#994a6b'],
+    glow: [4, 9],
+    rects: [
+      new Int16Array([-64, -42, 128, 42, 163, 383, -70, -74, 140, 58, 283, 264, -60, -131, 120, 69, 183, 192, -38, -77, 17, 31, 491, 383, -58, -128, 11, 27, 133, 433, -66, -159, 132, 54, 0, 328, -40, -174, 80, 49, 0, 383, -40, -87, 21, 14, 416, 433, -8, -203, 16, 27, 145, 433, -15, -110, 11, 27, 162, 433]),
+      new Int16Array([-32, -21, 64, 21, 104, 198, -35, -37, 70, 29, 145, 135, -30, -66, 60, 35, 93, 98, -19, -39, 9, 16, 28, 225, -29, -64, 6, 14, 98, 225, -33, -80, 66, 28, 44, 168, -20, -87, 40, 25, 20, 198, -20, -44, 11, 8, 14, 243, -4, -102, 8, 14, 105, 225, -8, -55, 6, 14, 114, 225]),
+      new Int16Array([-16, -11, 32, 11, 66, 103, -18, -19, 36, 15, 62, 70, -15, -33, 30, 18, 97, 29, -10, -20, 5, 9, 7, 117, -15, -32, 4, 7, 102, 117, -17, -40, 34, 14, 13, 87, -10, -44, 20, 13, 88, 87, -10, -22, 6, 4, 64, 128, -2, -51, 4, 7, 107, 117, -4, -28, 3, 8, 51, 117]),
+      new Int16Array([-8, -6, 16, 6, 0, 66, -9, -10, 18, 8, 21, 39, -8, -17, 16, 10, 27, 16, -5, -10, 3, 5, 21, 66, -8, -16, 3, 4, 20, 73, -9, -20, 18, 7, 28, 49, -5, -22, 10, 7, 47, 49, -5, -11, 3, 2, 35, 79, -1, -26, 2, 4, 24, 73, -2, -14, 2, 4, 27, 73]),
+    ],
+    glowRects: [
+      new Int16Array([-71, -141, 82, 71, 228, 0]),
+      new Int16Array([-36, -71, 42, 36, 117, 0]),
+      new Int16Array([-18, -36, 21, 19, 61, 0]),
+      new Int16Array([-9, -18, 11, 10, 33, 0]),
+    ],
+  },
+  2: {
+    names: ['base', 'foundation', 'windowL2', 'towerLeft', 'windowL1', 'nave', 'bellOpenLeft', 'spireLeft', 'doorway', 'roofBase', 'roof', 'crossLeft', 'doorArchInner', 'doorArchOuter', 'roseWindow', 'windowR2', 'windowR1', 'towerRight', 'bellOpenRight', 'spireRight', 'crossRight'],
+    colors: ['#8a7d70', '#6b5e4f', '#4a996b', '#8a7d70', '#6b4a99', '#998c80', '#292929', '#291f1f', '#292929', '#6b5e4f', '#3b2929', '#d4b038', '#998c80', '#8a7d70', '#994a6b', '#4a6b99', '#996b4a', '#8a7d70', '#292929', '#291f1f', '#d4b038'],
+    glow: [2, 4, 14, 15, 16],
+    rects: [
+      new Int16Array([-80, -52, 160, 52, 133, 328, -86, -93, 172, 73, 198, 110, -72, -108, 10, 28, 111, 433, -56, -237, 37, 51, 399, 328, -72, -139, 10, 29, 57, 433, -70, -161, 140, 81, 0, 110, -52, -216, 11, 21, 302, 433, -45, -260, 15, 29, 68, 433, -45, -102, 21, 37, 292, 383, -76, -197, 152, 65, 304, 192, -46, -205, 66, 52, 294, 328, -44, -282, 13, 21, 314, 433, -45, -111, 21, 14, 438, 433, -47, -115, 25, 17, 390, 433, -49, -145, 16, 33, 452, 383, -9, -82, 10, 29, 84, 433, -9, -112, 10, 28, 122, 433, 19, -206, 37, 52, 361, 328, 23, -184, 11, 20, 344, 433, 30, -229, 15, 29, 95, 433, 31, -251, 13, 22, 261, 433]),
+      new Int16Array([-40, -26, 80, 26, 145, 168, -43, -47, 86, 37, 100, 56, -36, -54, 5, 14, 121, 225, -28, -119, 19, 26, 226, 168, -36, -70, 5, 15, 67, 225, -35, -81, 70, 41, 0, 56, -26, -108, 6, 11, 198, 225, -23, -130, 8, 15, 73, 225, -23, -51, 11, 19, 169, 198, -38, -99, 76, 33, 154, 98, -23, -103, 33, 27, 111, 168, -22, -141, 7, 11, 205, 225, -23, -56, 11, 8, 26, 243, -24, -58, 13, 9, 0, 243, -25, -73, 9, 17, 243, 198, -5, -41, 6, 15, 82, 225, -5, -56, 6, 14, 127, 225, 9, -103, 19, 26, 0, 198, 11, -92, 6, 10, 228, 225, 15, -115, 8, 15, 89, 225, 15, -126, 7, 12, 161, 225]),
+      new Int16Array([-20, -13, 40, 13, 0, 103, -22, -24, 44, 19, 52, 29, -18, -27, 3, 7, 112, 117, -14, -60, 10, 14, 48, 87, -18, -35, 3, 8, 55, 117, -18, -41, 36, 21, 0, 29, -13, -54, 3, 6, 0, 128, -12, -65, 5, 8, 59, 117, -12, -26, 6, 10, 99, 103, -19, -50, 38, 17, 47, 51, -12, -52, 17, 14, 59, 87, -11, -71, 4, 6, 4, 128, -12, -28, 6, 4, 71, 128, -12, -29, 7, 5, 41, 128, -13, -37, 5, 9, 13, 117, -3, -21, 4, 8, 65, 117, -3, -28, 4, 7, 116, 117, 4, -52, 10, 14, 77, 87, 5, -46, 4, 5, 49, 128, 7, -58, 5, 8, 70, 117, 7, -63, 4, 6, 9, 128]),
+      new Int16Array([-10, -7, 20, 7, 0, 58, -11, -12, 22, 10, 0, 28, -9, -14, 2, 4, 30, 73, -7, -30, 5, 7, 21, 58, -9, -18, 2, 5, 25, 66, -9, -21, 18, 11, 23, 0, -7, -27, 2, 3, 8, 79, -6, -33, 3, 5, 28, 66, -6, -13, 3, 5, 32, 66, -10, -25, 20, 9, 0, 39, -6, -26, 9, 7, 27, 58, -6, -36, 3, 4, 33, 73, -6, -14, 3, 2, 39, 79, -6, -15, 4, 3, 11, 79, -7, -19, 3, 5, 36, 66, -2, -11, 3, 5, 40, 66, -2, -14, 3, 4, 37, 73, 2, -26, 5, 7, 37, 58, 2, -23, 3, 3, 16, 79, 3, -29, 3, 4, 41, 73, 3, -32, 3, 4, 45, 73]),
+    ],
+    glowRects: [
+      new Int16Array([-87, -159, 104, 120, 123, 0]),
+      new Int16Array([-44, -80, 53, 61, 63, 0]),
+      new Int16Array([-22, -40, 27, 31, 33, 0]),
+      new Int16Array([-11, -20, 14, 16, 18, 0]),
+    ],
+  },
+  3: {
+    names: ['base', 'foundation', 'windowL2', 'towerLeft', 'cathedral', 'windowL3', 'bellOpenLeft', 'windowL1', 'spireLeft', 'doorway', 'roofBase', 'roof', 'doorArchInner', 'doorArchOuter', 'centralTowerBase', 'crossLeft', 'roseOuter', 'roseMiddle', 'roseCenter', 'windowR3', 'centralTower', 'windowR2', 'centralBellOpen', 'centralSpire', 'towerRight', 'windowR1', 'bellOpenRight', 'spireRight', 'crossCenter', 'crossRight'],
+    colors: ['#8a7d70', '#6b5e4f', '#4a996b', '#8a7d70', '#998c80', '#996b4a', '#292929', '#6b4a99', '#291f1f', '#292929', '#6b5e4f', '#3b2929', '#998c80', '#8a7d70', '#6b5e4f', '#d4b038', '#4a6b99', '#994a6b', '#4a996b', '#4a996b', '#8a7d70', '#4a6b99', '#292929', '#291f1f', '#8a7d70', '#994a6b', '#292929', '#291f1f', '#d4b038', '#d4b038'],
+    glow: [2, 5, 7, 16, 17, 18, 19, 21, 25],
+    rects: [
+      new Int16Array([-95, -63, 190, 63, 0, 264, -103, -112, 206, 86, 175, 0, -90, -152, 12, 35, 375, 383, -68, -294, 45, 60, 191, 264, -87, -202, 174, 109, 0, 0, -78, -147, 12, 35, 388, 383, -64, -268, 15, 27, 174, 433, -90, -190, 11, 35, 401, 383, -56, -323, 21, 36, 353, 383, -58, -119, 29, 48, 81, 383, -91, -235, 182, 71, 0, 192, -56, -247, 86, 57, 424, 264, -60, -131, 33, 19, 356, 433, -62, -136, 37, 24, 223, 433, -32, -247, 56, 30, 0, 433, -53, -345, 15, 21, 328, 433, -64, -179, 22, 48, 111, 383, -58, -173, 16, 37, 314, 383, -52, -166, 10, 22, 275, 433, -23, -123, 12, 34, 413, 383, -28, -319, 56, 76, 141, 110, -11, -118, 12, 34, 426, 383, -25, -287, 21, 32, 469, 383, -14, -353, 28, 44, 134, 383, 23, -255, 45, 59, 237, 264, -11, -156, 12, 34, 439, 383, 27, -230, 15, 27, 190, 433, 35, -285, 21, 37, 331, 383, -8, -386, 16, 27, 206, 433, 38, -307, 15, 22, 286, 433]),
+      new Int16Array([-48, -32, 96, 32, 0, 135, -52, -56, 104, 43, 89, 0, -45, -76, 6, 18, 214, 198, -34, -147, 23, 30, 97, 135, -44, -101, 88, 55, 0, 0, -39, -74, 6, 18, 221, 198, -32, -134, 8, 14, 134, 225, -45, -95, 6, 18, 228, 198, -28, -162, 11, 19, 181, 198, -29, -60, 15, 25, 61, 198, -46, -118, 92, 36, 0, 98, -28, -124, 43, 29, 0, 168, -30, -66, 17, 10, 235, 225, -31, -68, 19, 12, 169, 225, -16, -124, 28, 16, 38, 225, -27, -173, 8, 11, 213, 225, -32, -90, 11, 25, 77, 198, -29, -87, 8, 19, 193, 198, -26, -83, 5, 11, 222, 225, -12, -62, 7, 18, 235, 198, -14, -160, 28, 39, 71, 56, -6, -59, 7, 17, 0, 225, -13, -144, 11, 17, 8, 225, -7, -177, 14, 23, 89, 198, 11, -128, 23, 30, 121, 135, -6, -78, 7, 17, 20, 225, 13, -115, 8, 14, 143, 225, 17, -143, 11, 19, 202, 198, -4, -193, 8, 14, 152, 225, 19, -154, 8, 12, 189, 225]),
+      new Int16Array([-24, -16, 48, 16, 0, 70, -26, -28, 52, 22, 45, 0, -23, -38, 4, 9, 19, 117, -17, -74, 12, 16, 49, 70, -22, -51, 44, 28, 0, 0, -20, -37, 4, 9, 24, 117, -16, -67, 4, 7, 121, 117, -23, -48, 4, 10, 106, 103, -14, -81, 6, 10, 111, 103, -15, -30, 8, 13, 41, 103, -23, -59, 46, 18, 0, 51, -14, -62, 22, 15, 99, 70, -15, -33, 9, 5, 54, 128, -16, -34, 10, 6, 14, 128, -8, -62, 14, 8, 76, 117, -14, -87, 5, 6, 25, 128, -16, -45, 6, 13, 50, 103, -15, -44, 5, 10, 118, 103, -13, -42, 3, 6, 31, 128, -6, -31, 4, 9, 29, 117, -7, -80, 14, 20, 37, 29, -3, -30, 4, 9, 34, 117, -7, -72, 6, 9, 39, 117, -4, -89, 8, 12, 57, 103, 5, -64, 12, 15, 0, 87, -3, -39, 4, 9, 46, 117, 6, -58, 5, 8, 91, 117, 8, -72, 6, 10, 0, 117, -2, -97, 4, 8, 97, 117, 9, -77, 5, 6, 35, 128]),
+      new Int16Array([-12, -8, 24, 8, 40, 39, -13, -14, 26, 11, 0, 16, -12, -19, 3, 5, 44, 66, -9, -37, 7, 8, 0, 49, -11, -26, 22, 15, 0, 0, -10, -19, 2, 5, 48, 66, -8, -34, 2, 4, 49, 73, -12, -24, 3, 5, 51, 66, -7, -41, 3, 6, 17, 66, -8, -15, 5, 7, 43, 58, -12, -30, 24, 10, 23, 28, -7, -31, 11, 8, 8, 49, -8, -17, 5, 3, 20, 79, -8, -17, 5, 3, 26, 79, -4, -31, 7, 4, 52, 73, -7, -44, 3, 4, 60, 73, -8, -23, 3, 7, 49, 58, -8, -22, 3, 5, 55, 66, -7, -21, 2, 3, 32, 79, -3, -16, 2, 5, 59, 66, -4, -40, 8, 10, 48, 28, -2, -15, 3, 5, 0, 73, -4, -36, 4, 5, 4, 73, -2, -45, 4, 7, 53, 58, 2, -32, 7, 8, 20, 49, -2, -20, 3, 5, 9, 73, 3, -29, 3, 4, 0, 79, 4, -36, 3, 5, 13, 73, -1, -49, 2, 5, 17, 73, 4, -39, 3, 4, 4, 79]),
+    ],
+    glowRects: [
+      new Int16Array([-105, -205, 122, 136, 0, 0]),
+      new Int16Array([-53, -103, 62, 69, 0, 0]),
+      new Int16Array([-27, -52, 32, 35, 0, 0]),
+      new Int16Array([-14, -26, 17, 18, 0, 0]),
+    ],
+  },
+};
@@ -0,0 +1,18 @@
+// src/animation/towerAnimators/towerGlow.js
+// Generated by assets/towers/models/tower_glow.py from the tower builders
+// - do not edit by hand, re-run the exporter instead.
+// Per tower and tier, the pre-blurred additive glow layer of its emissive
+// (Glow/GlowGold) faces: x, y are pixels from the tower's bottom centre, sx, sy
+// the layer's place in the atlas. Draw it with 'lighter' compositing.
+
+export const TOWER_GLOW_ATLAS = './assets/towers/animation/tower_glow.png';
+
+export const TOWER_GLOW = {
+  sniper: {
+    3: { x: -49, y: -142, w: 98, h: 158, sx: 0, sy: 0 },
+  },
+  basic: {
+    2: { x: -12, y: -79, w: 24, h: 18, sx: 0, sy: 159 },
+    3: { x: -10, y: -113, w: 20, h: 20, sx: 99, sy: 0 },
+  },
+};
@@ -0,0 +1,18 @@
+// src/animation/towerAnimators/turretSprites.js
+// Generated by assets/towers/models/turret_sprites.py from the tower builders
+// - do not edit by hand, re-run the exporter instead.
+// Each tier is one row of the atlas: `frames` cells of w x h starting at y = row.
+// Cell k shows the weapon aimed along screen angle 2*PI*k/frames (atan2, y down);
+// pivot is the turning point inside a cell, in pixels. glow is the same for the
+// row of pre-blurred additive glow cells (null when the weapon has no emissive faces).
+// anchor is where the turning point sits on the tower, as fractions (x, y down)
+// of the tower's projected box; the animator maps it onto its structure.
+
+export const TURRET_ATLAS = './assets/towers/animation/turrets.png';
+
+export const TURRETS = {
+  sniper: {
+    2: { frames: 32, w: 24, h: 14, row: 0, pivot: [12, 7], glow: { w: 40, h: 28, row: 15, pivot: [20, 14] }, anchor: [0.5, 0.2476] },
+    3: { frames: 32, w: 34, h: 20, row: 44, pivot: [17, 10], glow: { w: 50, h: 36, row: 65, pivot: [25, 18] }, anchor: [0.5057, 0.2455] },
+  },
+};
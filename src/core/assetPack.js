@@ -0,0 +1,104 @@
+// src/core/assetPack.js
+// Reader for .tdgpak asset packs (assets/tdgpak.py)
+// One read at startup; entries are sliced out of the pack on demand
+
+const MAGIC = 'TDPK';
+
+export const ASSET_PACK_URL = './assets/game.tdgpak';
+
+let mounted = null;
+
+/**
+ * Parse a pack's index; payloads stay in the buffer until read
+ * @param {ArrayBuffer} buffer - Contents of a .tdgpak
+ * @returns {Object} { version, align, buffer, entries: Map(name -> entry) }
+ */
+export function parseAssetPack(buffer) {
+  const view = new DataView(buffer);
+  const magic = String.fromCharCode(...new Uint8Array(buffer, 0, 4));
+  if (magic !== MAGIC) {
+    throw new Error(`Not an asset pack (magic "${magic}")`);
+  }
+  const version = view.getUint16(4, true);
+  const indexBytes = view.getUint32(8, true);
+  const index = JSON.parse(new TextDecoder().decode(new Uint8Array(buffer, 12, indexBytes)));
+  const entries = new Map(index.entries.map((entry) => [entry.name, entry]));
+  return { version, align: index.align, buffer, entries };
+}
+
+/**
+ * Fetch a pack and make it the one fetchAsset() reads from
+ * @param {string} url - Path to the .tdgpak
+ * @returns {Promise<Object>} Parsed pack
+ */
+export async function loadAssetPack(url = ASSET_PACK_URL) {
+  const response = await fetch(url);
+  if (!response.ok) {
+    throw new Error(`Failed to load asset pack: ${response.status} ${response.statusText}`);
+  }
+  return mountAssetPack(parseAssetPack(await response.arrayBuffer()));
+}
+
+/**
+ * Serve assets from a parsed pack (null unmounts)
+ */
+export function mountAssetPack(pack) {
+  mounted = pack;
+  return pack;
+}
+
+/**
+ * Pack entry name of a URL as the game writes it ('./maps/x.json' -> 'maps/x.json')
+ */
+export function assetName(url) {
+  return url.replace(/^\.?\//, '').replace(/[?#].*$/, '');
+}
+
+/**
+ * Stored bytes of an entry as a view into the pack (no copy); deflated
+ * entries are still compressed
+ * @returns {Uint8Array|null}
+ */
+export function entryBytes(pack, name) {
+  const entry = pack && pack.entries.get(name);
+  return entry ? new Uint8Array(pack.buffer, entry.offset, entry.length) : null;
+}
+
+/**
+ * Unpacked bytes of an entry: a view for stored entries, inflated otherwise
+ * @returns {Promise<Uint8Array|null>}
+ */
+export async function readEntry(pack, name) {
+  const bytes = entryBytes(pack, name);
+  if (!bytes) return null;
+  if (pack.entries.get(name).codec !== 'deflate') return bytes;
+  const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream('deflate'));
+  return new Uint8Array(await new Response(stream).arrayBuffer());
+}
+
+/**
+ * fetch() that answers from the mounted pack when it holds the file
+ * @param {string} url - Asset URL relative to index.html
+ * @returns {Promise<Response>}
+ */
+export async function fetchAsset(url) {
+  const bytes = await readEntry(mounted, assetName(url));
+  return bytes ? new Response(bytes) : fetch(url);
+}
+
+/**
+ * URL for an <img>: an object URL over the packed bytes when the pack
+ * holds the file stored (images are never deflated), else the URL itself
+ * @param {string} url - Asset URL relative to index.html
+ * @returns {string}
+ */
+export function assetURL(url) {
+  const name = assetName(url);
+  const entry = mounted && mounted.entries.get(name);
+  if (!entry || entry.codec !== 'none') return url;
+  if (!entry.objectURL) {
+    const type = name.endsWith('.png') ? 'image/png' : '';
+    entry.objectURL = URL.createObjectURL(new Blob([entryBytes(mounted, name)], { type }));
+  }
+  return entry.objectURL;
+}
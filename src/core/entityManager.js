@@ -237,6 +237,8 @@ class EntityManager {
         enemy.initialize({
             type: type,
             path: [...path], // Clone path
+            // Arc-length table compiled for this path, if any
+            pathTable: path === this.path ? this.pathTable || null : null,
             x: path[0]?.x || 0,
             y: path[0]?.y || 0
         });
@@ -253,11 +255,12 @@ class EntityManager {
      */
     spawnProjectile(tower, target) {
         const projectile = this.projectilePool.acquire();
+        const origin = tower.getLaunchPoint();
 
         // Use new initialize() method instead of manual property setting
         projectile.initialize({
-            x: tower.x + tower.width / 2,
-            y: tower.y + tower.height / 2,
+            x: origin.x,
+            y: origin.y,
             target: target,
             damage: tower.damage
         });
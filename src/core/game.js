@@ -7,6 +7,15 @@ import PathManager from '../entities/pathManager.js';
 import Config from '../config.js';
 import WaveManager from './waveManager.js';
 import { gameEvents, GameEvents } from './EventEmitter.js';
+import { EnemyAnimator } from '../entities/enemyAnimator.js';
+import { SamuraiAnimator } from '../animation/enemyAnimators/SamuraiAnimator.js';
+import { loadPoseBank } from '../animation/poseBank.js';
+import { loadAnimationPack } from '../animation/animationPack.js';
+import { loadMapGrid, isBuildable, matchesMap } from './mapGrid.js';
+import { loadPathTable } from './pathTable.js';
+import { loadMapBackground } from './mapBackground.js';
+import { loadAssetPack, fetchAsset, ASSET_PACK_URL } from './assetPack.js';
+import { loadTowerMetas, getTowerMeta, footprintSize } from './towerMeta.js';
 
 class Game extends GameLoop {
     constructor(canvasId = Config.canvas.id) {
@@ -55,6 +64,8 @@ class Game extends GameLoop {
         this.selectedTower = null;      // Placed tower that is selected for info/upgrade
         this.upgradeButtonRect = null;  // Bounding box of the upgrade button in the info panel
         this.hoveredCell = null;
+        this.mapGrid = null;            // Compiled placement grid of the loaded map (maps/compile_maps.py)
+        this.mapBackground = null;      // Prerendered static layer of the loaded map (maps/bake_backgrounds.py)
         this.placementError = null;
         this.placementErrorTimer = 0;
 
@@ -436,11 +447,80 @@ class Game extends GameLoop {
 
     init() {
         this.setupDefaultPath();
+        // Loose files are fetched one by one unless the asset pack loads first
+        this.loadAssetPack(ASSET_PACK_URL)
+            .then(() => Promise.all([
+                this.loadAnimationPack('./assets/enemies/animation/samurai-animations.anim.bin'),
+                this.loadPoseBank('./assets/enemies/animation/samurai-poses.bin'),
+                this.loadTowerMetas(),
+            ]));
         this.state = 'mainMenu';
         // Start the render loop immediately so main menu is visible
         this.start();
     }
 
+    /**
+     * Load the compiled samurai curves (compile_animations.py); enemies use
+     * them for walk and death whenever the pose bank is not in use
+     * @param {string} url - Path to the .anim.bin
+     */
+    async loadAnimationPack(url) {
+        try {
+            const pack = await loadAnimationPack(url);
+            EnemyAnimator.useAnimationPack(pack);
+            SamuraiAnimator.useAnimationPack(pack);
+            console.log('[Game] Animation pack loaded:', Object.keys(pack.clips).join(', '));
+        } catch (error) {
+            console.warn('[Game] Animation pack unavailable, using keyframe tables:', error);
+        }
+    }
+
+    /**
+     * Load tower metadata sidecars (assets/towers/models/tower_meta.py);
+     * tiers without one place and fire from their box as before
+     */
+    async loadTowerMetas() {
+        const names = await loadTowerMetas(Object.keys(Config.tower));
+        console.log('[Game] Tower metadata loaded:', names.join(', ') || 'none');
+    }
+
+    /**
+     * Mount the asset pack (assets/tdgpak.py) so loaders read from it
+     * @param {string} url - Path to the .tdgpak
+     */
+    async loadAssetPack(url) {
+        try {
+            const pack = await loadAssetPack(url);
+            console.log(`[Game] Asset pack loaded: ${pack.entries.size} files`);
+        } catch (error) {
+            console.warn('[Game] Asset pack unavailable, loading loose files:', error);
+        }
+    }
+
+    /**
+     * Load baked samurai poses and bake enemy sprite sheets from them;
+     * enemies interpolate keyframes until (or unless) that finishes
+     * @param {string} url - Path to the pose bank written by bake_samurai_poses.py
+     */
+    async loadPoseBank(url) {
+        try {
+            const bank = await loadPoseBank(url);
+            EnemyAnimator.usePoseBank(bank);
+            SamuraiAnimator.usePoseBank(bank);
+            console.log('[Game] Pose bank loaded:', Object.keys(bank.clips).join(', '));
+
+            // Enemy.render() draws at height / 110 (model height in local units)
+            const scales = {};
+            for (const [type, cfg] of Object.entries(Config.enemy)) scales[type] = cfg.height / 110;
+            const sheets = EnemyAnimator.bakeSprites(scales, window.devicePixelRatio || 1);
+            for (const [type, sheet] of Object.entries(sheets)) {
+                console.log(`[Game] Enemy sprites baked: ${type} ${sheet.frames} frames -> ${sheet.cells} cells`);
+            }
+        } catch (error) {
+            console.warn('[Game] Baked poses unavailable, using keyframes:', error);
+        }
+    }
+
     setupDefaultPath() {
         this.pathManager.addWaypoint(0, 100);
         this.pathManager.addWaypoint(200, 100);
@@ -448,14 +528,19 @@ class Game extends GameLoop {
         this.pathManager.addWaypoint(600, 300);
         this.pathManager.addWaypoint(600, 500);
         this.pathManager.addWaypoint(800, 500);
+        this.mapGrid = null;
+        this.mapBackground = null;
 
         // Set path on entityManager for WaveManager to use
         this.entityManager.path = this.pathManager.getWaypoints();
+        this.entityManager.pathTable = this.pathManager.arcTable;
     }
 
     loadLevel(level) {
         this.currentLevel = level;
         this.pathManager = new PathManager();
+        this.mapGrid = null;
+        this.mapBackground = null;
         if (level.path) {
             level.path.forEach(wp => this.pathManager.addWaypoint(wp.x, wp.y));
         }
@@ -474,7 +559,7 @@ class Game extends GameLoop {
     async loadMapFromFile(mapPath) {
         try {
             console.log('[Game] Loading map from:', mapPath);
-            const response = await fetch(mapPath);
+            const response = await fetchAsset(mapPath);
 
             if (!response.ok) {
                 throw new Error(`Failed to load map: ${response.status} ${response.statusText}`);
@@ -498,6 +583,7 @@ class Game extends GameLoop {
 
             // Set path on entity manager for WaveManager
             this.entityManager.path = this.pathManager.getWaypoints();
+            this.entityManager.pathTable = null;
 
             // Load settings
             if (mapData.settings) {
@@ -509,6 +595,35 @@ class Game extends GameLoop {
             this.currentMapName = mapData.name || 'Unknown Map';
             this.currentMapDescription = mapData.description || '';
 
+            // Compiled placement grid; without it placement measures the path segments
+            this.mapGrid = null;
+            try {
+                const grid = await loadMapGrid(mapPath.replace(/\.json$/, '.grid.bin'));
+                if (matchesMap(grid, mapData)) {
+                    this.mapGrid = grid;
+                } else {
+                    console.warn('[Game] Map grid was compiled from another path, checking path segments');
+                }
+            } catch (error) {
+                console.warn('[Game] Map grid unavailable, checking path segments:', error);
+            }
+
+            // Arc-length table; without it enemies steer between waypoints
+            try {
+                this.pathManager.setArcTable(await loadPathTable(mapPath.replace(/\.json$/, '.path.bin')));
+            } catch (error) {
+                console.warn('[Game] Path table unavailable, walking waypoints:', error);
+            }
+            this.entityManager.pathTable = this.pathManager.arcTable;
+
+            // Prerendered background; without it the path is stroked every frame
+            this.mapBackground = null;
+            try {
+                this.mapBackground = await loadMapBackground(mapPath, window.devicePixelRatio || 1);
+            } catch (error) {
+                console.warn('[Game] Map background unavailable, drawing the path:', error);
+            }
+
             console.log('[Game] Map loaded successfully:', this.currentMapName);
             return true;
 
@@ -644,6 +759,7 @@ class Game extends GameLoop {
         if (this.pathManager && this.entityManager) {
             const currentPath = this.pathManager.getWaypoints();
             this.entityManager.path = currentPath;
+            this.entityManager.pathTable = this.pathManager.arcTable;
         }
         console.log('[Game] Game restarted');
     }
@@ -781,15 +897,25 @@ class Game extends GameLoop {
 
         const waypoints = this.pathManager.getWaypoints();
         const pathWidth = 40; // Path visual width from config
-        const towerSize = Math.max(towerConfig.width, towerConfig.height);
+        // Ground footprint of the tier 1 model when its metadata is loaded
+        const meta = getTowerMeta(this.selectedTowerType, 1);
+        const boxSize = Math.max(towerConfig.width, towerConfig.height);
+        const towerSize = meta ? footprintSize(meta, boxSize) : boxSize;
 
         // Calculate required clearance: half path width + half tower size + safety buffer
         const requiredClearance = (pathWidth / 2) + (towerSize / 2) + 15;
 
         console.log('[Game] Checking position', x, y, 'clearance needed:', requiredClearance);
 
+        // Compiled grid: path clearance and canvas bounds are one bitmap lookup
+        const grid = this.mapGrid;
+        if (grid && !isBuildable(grid, x, y, towerSize)) {
+            console.log('[Game] Cell not buildable for size', towerSize);
+            return false;
+        }
+
         // Check distance to each path segment
-        for (let i = 0; i < waypoints.length - 1; i++) {
+        for (let i = 0; !grid && i < waypoints.length - 1; i++) {
             const dist = this.pointToLineDistance(
                 x, y,
                 waypoints[i].x, waypoints[i].y,
@@ -816,8 +942,8 @@ class Game extends GameLoop {
 
         // Check if tower would be within canvas bounds
         const halfSize = towerSize / 2;
-        if (x - halfSize < 0 || x + halfSize > Config.canvas.width ||
-            y - halfSize < 0 || y + halfSize > Config.canvas.height) {
+        if (!grid && (x - halfSize < 0 || x + halfSize > Config.canvas.width ||
+            y - halfSize < 0 || y + halfSize > Config.canvas.height)) {
             console.log('[Game] Tower would be outside canvas bounds');
             return false;
         }
@@ -865,8 +991,12 @@ class Game extends GameLoop {
 
     render() {
         this.renderer.clear();
-        this.renderer.drawRect(0, 0, Config.canvas.width, Config.canvas.height, '#2d2d2d');
-        this.renderPath();
+        if (this.mapBackground) {
+            this.renderer.drawSprite(this.mapBackground, 0, 0, Config.canvas.width, Config.canvas.height);
+        } else {
+            this.renderer.drawRect(0, 0, Config.canvas.width, Config.canvas.height, '#2d2d2d');
+            this.renderPath();
+        }
         this.entityManager.render(this.renderer);
         this.renderTowerPlacementPreview();
         this.renderSelectedTowerPanel();
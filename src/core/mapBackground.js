@@ -0,0 +1,43 @@
+// src/core/mapBackground.js
+// Prerendered map backgrounds (maps/bake_backgrounds.py)
+// One drawImage per frame instead of filling the canvas and stroking the path
+
+import { fetchAsset, assetURL } from './assetPack.js';
+
+export const BACKGROUND_MANIFEST = './maps/backgrounds/manifest.json';
+
+/**
+ * Image of a manifest entry for a pixel ratio: the smallest scale that
+ * covers it, else the largest there is
+ * @param {Object} entry - manifest.maps[name]
+ * @param {number} pixelRatio - window.devicePixelRatio
+ * @returns {Object|null} { scale, file, width, height }
+ */
+export function pickBackground(entry, pixelRatio = 1) {
+  if (!entry || !entry.images || entry.images.length === 0) return null;
+  const images = [...entry.images].sort((a, b) => a.scale - b.scale);
+  return images.find((image) => image.scale >= pixelRatio) || images[images.length - 1];
+}
+
+/**
+ * Load the prerendered background of a map
+ * @param {string} mapPath - Map JSON path, e.g. './maps/spiral.json'
+ * @param {number} pixelRatio - window.devicePixelRatio
+ * @param {string} manifestUrl - Background manifest
+ * @returns {Promise<HTMLImageElement>} Decoded image; rejects when the map has none
+ */
+export async function loadMapBackground(mapPath, pixelRatio = 1, manifestUrl = BACKGROUND_MANIFEST) {
+  const response = await fetchAsset(manifestUrl);
+  if (!response.ok) {
+    throw new Error(`Failed to load background manifest: ${response.status} ${response.statusText}`);
+  }
+  const manifest = await response.json();
+  const name = mapPath.split('/').pop().replace(/\.json$/, '');
+  const image = pickBackground(manifest.maps[name], pixelRatio);
+  if (!image) throw new Error(`No prerendered background for map "${name}"`);
+
+  const img = new Image();
+  img.src = assetURL(manifestUrl.replace(/[^/]*$/, '') + image.file);
+  await img.decode();
+  return img;
+}
@@ -0,0 +1,107 @@
+// src/core/mapGrid.js
+// Reader for compiled map grids (maps/compile_maps.py)
+// Per-cell path distance and buildable bitmaps make placement checks a lookup
+
+import { fetchAsset } from './assetPack.js';
+
+const MAGIC = 'TDGM';
+
+/**
+ * Parse a compiled map grid
+ * @param {ArrayBuffer} buffer - Contents of a .grid.bin written by the compiler
+ * @returns {Object} Grid with its header fields, the sdf and one bitmap per tower size
+ */
+export function parseMapGrid(buffer) {
+  const view = new DataView(buffer);
+  const magic = String.fromCharCode(...new Uint8Array(buffer, 0, 4));
+  if (magic !== MAGIC) {
+    throw new Error(`Not a map grid (magic "${magic}")`);
+  }
+  const version = view.getUint16(4, true);
+  const headerBytes = view.getUint32(8, true);
+  const header = JSON.parse(new TextDecoder().decode(new Uint8Array(buffer, 12, headerBytes)));
+
+  const cells = header.rows * header.cols;
+  let at = 12 + headerBytes;
+  const sdf = new Int16Array(buffer, at, cells);
+  at += sdf.byteLength;
+  const bitmaps = {};
+  for (const size of header.towerSizes) {
+    bitmaps[size] = new Uint8Array(buffer, at, (cells + 7) >> 3);
+    at += bitmaps[size].byteLength;
+  }
+  return { version, ...header, sdf, bitmaps };
+}
+
+/**
+ * Fetch and parse a compiled map grid
+ * @param {string} url - Path to the .grid.bin
+ * @returns {Promise<Object>}
+ */
+export async function loadMapGrid(url) {
+  const response = await fetchAsset(url);
+  if (!response.ok) {
+    throw new Error(`Failed to load map grid: ${response.status} ${response.statusText}`);
+  }
+  return parseMapGrid(await response.arrayBuffer());
+}
+
+/**
+ * Whether a grid was compiled from a map's current canvas and path. A map
+ * JSON edited without re-running the compiler leaves a stale grid behind,
+ * which would check placement against the old path.
+ * @param {Object} grid - Parsed grid
+ * @param {Object} mapData - Map document (canvas, path.width, path.waypoints)
+ * @param {number} tolerance - Pixels a waypoint may be off
+ * @returns {boolean}
+ */
+export function matchesMap(grid, mapData, tolerance = 0.01) {
+  const { canvas, path } = mapData;
+  const points = grid.waypoints;
+  if (!points || points.length !== path.waypoints.length * 2) return false;
+  if (grid.width !== canvas.width || grid.height !== canvas.height || grid.pathWidth !== path.width) return false;
+  return path.waypoints.every((p, i) =>
+    Math.abs(points[2 * i] - p.x) <= tolerance && Math.abs(points[2 * i + 1] - p.y) <= tolerance);
+}
+
+/**
+ * Cell containing a point, or -1 outside the map
+ */
+export function cellIndex(grid, x, y) {
+  const col = Math.floor(x / grid.cellSize);
+  const row = Math.floor(y / grid.cellSize);
+  if (col < 0 || row < 0 || col >= grid.cols || row >= grid.rows) return -1;
+  return row * grid.cols + col;
+}
+
+/**
+ * Signed distance from a point's cell to the path edge (negative on the path)
+ * @returns {number} Pixels; -Infinity outside the map
+ */
+export function pathDistance(grid, x, y) {
+  const cell = cellIndex(grid, x, y);
+  return cell < 0 ? -Infinity : grid.sdf[cell] / grid.sdfScale;
+}
+
+/**
+ * Whether a tower of a given footprint may stand centred at a point: clear
+ * of the path and inside the map. Uses the baked bitmap for that size, or
+ * the distance field for sizes the compiler did not bake. The distance is
+ * known at the cell centre only, so the cell must clear the path by its
+ * half diagonal more: no point passes that the exact segment check rejects.
+ * @param {Object} grid - Parsed grid
+ * @param {number} x - Tower centre
+ * @param {number} y - Tower centre
+ * @param {number} size - Tower footprint in pixels
+ * @returns {boolean}
+ */
+export function isBuildable(grid, x, y, size) {
+  const cell = cellIndex(grid, x, y);
+  if (cell < 0) return false;
+  const bits = grid.bitmaps[size];
+  if (bits) return ((bits[cell >> 3] >> (cell & 7)) & 1) === 1;
+
+  const half = size / 2;
+  if (x - half < 0 || x + half > grid.width || y - half < 0 || y + half > grid.height) return false;
+  return grid.sdf[cell] / grid.sdfScale >= half + grid.margin + grid.cellSize * Math.SQRT1_2;
+}
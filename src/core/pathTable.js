@@ -0,0 +1,84 @@
+// src/core/pathTable.js
+// Reader for arc-length path tables (maps/compile_maps.py)
+// Position along the path becomes one interpolated lookup by distance travelled
+
+import { fetchAsset } from './assetPack.js';
+
+const MAGIC = 'TDGL';
+
+/**
+ * Parse a compiled path table
+ * @param {ArrayBuffer} buffer - Contents of a .path.bin written by the compiler
+ * @returns {Object} Table with length, step, cumulative (per waypoint) and samples (x, y, heading)
+ */
+export function parsePathTable(buffer) {
+  const view = new DataView(buffer);
+  const magic = String.fromCharCode(...new Uint8Array(buffer, 0, 4));
+  if (magic !== MAGIC) {
+    throw new Error(`Not a path table (magic "${magic}")`);
+  }
+  const version = view.getUint16(4, true);
+  const headerBytes = view.getUint32(8, true);
+  const header = JSON.parse(new TextDecoder().decode(new Uint8Array(buffer, 12, headerBytes)));
+
+  let at = 12 + headerBytes;
+  const cumulative = new Float32Array(buffer, at, header.waypoints);
+  at += cumulative.byteLength;
+  const samples = new Float32Array(buffer, at, header.samples * 3);
+  return { version, ...header, cumulative, samples };
+}
+
+/**
+ * Fetch and parse a compiled path table
+ * @param {string} url - Path to the .path.bin
+ * @returns {Promise<Object>}
+ */
+export async function loadPathTable(url) {
+  const response = await fetchAsset(url);
+  if (!response.ok) {
+    throw new Error(`Failed to load path table: ${response.status} ${response.statusText}`);
+  }
+  return parsePathTable(await response.arrayBuffer());
+}
+
+/**
+ * Whether a table was compiled from these waypoints: the cumulative length
+ * at every waypoint agrees with the segment lengths, and the table passes
+ * through every waypoint (within one sample step, the most a corner is cut).
+ * @param {Object} table - Parsed table
+ * @param {Array<{x: number, y: number}>} waypoints - Current path
+ * @param {number} tolerance - Pixels the cumulative lengths may be off (Float32 rounding)
+ * @returns {boolean}
+ */
+export function matchesWaypoints(table, waypoints, tolerance = 0.01) {
+  if (table.waypoints !== waypoints.length || waypoints.length < 2) return false;
+  const point = {};
+  let length = 0;
+  for (let i = 0; i < waypoints.length; i++) {
+    if (i > 0) length += Math.hypot(waypoints[i].x - waypoints[i - 1].x, waypoints[i].y - waypoints[i - 1].y);
+    if (Math.abs(table.cumulative[i] - length) > tolerance * Math.max(1, length / 1000)) return false;
+    samplePath(table, table.cumulative[i], point);
+    if (Math.hypot(point.x - waypoints[i].x, point.y - waypoints[i].y) > table.step) return false;
+  }
+  return true;
+}
+
+/**
+ * Point on the path a given distance from the start, clamped to the ends
+ * @param {Object} table - Parsed table
+ * @param {number} distance - Arc length in pixels
+ * @param {Object} [out] - Object to write x, y and heading into (avoids an allocation)
+ * @returns {{x: number, y: number, heading: number}}
+ */
+export function samplePath(table, distance, out = {}) {
+  const { samples } = table;
+  const last = samples.length / 3 - 1;
+  const f = Math.min(Math.max(distance / table.step, 0), last);
+  const i = Math.min(Math.floor(f), last - 1);
+  const t = f - i;
+  const a = i * 3;
+  out.x = samples[a] + (samples[a + 3] - samples[a]) * t;
+  out.y = samples[a + 1] + (samples[a + 4] - samples[a + 1]) * t;
+  out.heading = samples[t < 1 ? a + 2 : a + 5];
+  return out;
+}
@@ -0,0 +1,108 @@
+// src/core/towerMeta.js
+// Reader for tower metadata sidecars (assets/towers/models/tower_meta.py)
+// Ground footprint and projectile anchors of each tower tier, scaled to the tower's box
+
+import { fetchAsset } from './assetPack.js';
+
+export const TOWER_META_DIR = './assets/towers/models/';
+
+// '<type>_t<tier>' -> parsed metadata
+const loaded = new Map();
+
+/**
+ * Parse a <tower>.meta.json sidecar
+ * @param {Object} json - Parsed sidecar
+ * @returns {Object} { name, aabb, footprint, footprintArea, anchor, muzzle, pivots }; anchor,
+ *   muzzle and pivots are [x, y] fractions of the sprite box, muzzle is null when the tier has none
+ */
+export function parseTowerMeta(json) {
+  if (!json || !json.aabb || !json.footprint || !json.screen) {
+    throw new Error('Not a tower metadata sidecar');
+  }
+  const pivots = json.screen.pivots || {};
+  return {
+    name: json.name,
+    aabb: json.aabb,
+    footprint: json.footprint,
+    footprintArea: json.footprint_area,
+    anchor: json.screen.top_anchor,
+    muzzle: pivots.muzzle || null,
+    pivots,
+  };
+}
+
+/**
+ * Fetch and parse one sidecar
+ * @param {string} url - Path to the .meta.json
+ * @returns {Promise<Object>}
+ */
+export async function loadTowerMeta(url) {
+  const response = await fetchAsset(url);
+  if (!response.ok) {
+    throw new Error(`Failed to load tower metadata: ${response.status} ${response.statusText}`);
+  }
+  return parseTowerMeta(await response.json());
+}
+
+/**
+ * Load the sidecars of every tower type and tier; tiers without one keep
+ * the box-centred defaults
+ * @param {string[]} types - Tower types, e.g. Object.keys(Config.tower)
+ * @param {number} tiers - Highest tier
+ * @param {string} dir - Directory holding <type>_t<tier>.meta.json
+ * @returns {Promise<string[]>} Names that loaded
+ */
+export async function loadTowerMetas(types, tiers = 3, dir = TOWER_META_DIR) {
+  const names = types.flatMap((type) => Array.from({ length: tiers }, (_, i) => `${type}_t${i + 1}`));
+  const results = await Promise.allSettled(names.map((name) => loadTowerMeta(`${dir}${name}.meta.json`)));
+  const done = [];
+  results.forEach((result, i) => {
+    if (result.status === 'fulfilled') {
+      loaded.set(names[i], result.value);
+      done.push(names[i]);
+    }
+  });
+  return done;
+}
+
+/**
+ * Register parsed metadata for a tower tier
+ */
+export function setTowerMeta(type, tier, meta) {
+  if (meta) loaded.set(`${type}_t${tier}`, meta);
+  else loaded.delete(`${type}_t${tier}`);
+}
+
+/**
+ * Loaded metadata of a tower tier, or null
+ */
+export function getTowerMeta(type, tier) {
+  return loaded.get(`${type}_t${tier}`) || null;
+}
+
+/**
+ * Where projectiles leave a tower: the muzzle, else the top anchor, placed
+ * in the tower's box (top-left x, y)
+ * @returns {{ x: number, y: number }}
+ */
+export function launchPoint(meta, x, y, width, height) {
+  const [fx, fy] = meta.muzzle || meta.anchor;
+  return { x: x + fx * width, y: y + fy * height };
+}
+
+/**
+ * Size in pixels of a tower's ground footprint, for a tower whose box is
+ * `size` pixels across: the box spans the model's AABB, the footprint only
+ * what stands on the ground
+ * @param {Object} meta - Parsed metadata
+ * @param {number} size - Box size in pixels
+ * @returns {number}
+ */
+export function footprintSize(meta, size) {
+  const xs = meta.footprint.map((p) => p[0]);
+  const zs = meta.footprint.map((p) => p[1]);
+  const ground = Math.max(Math.max(...xs) - Math.min(...xs), Math.max(...zs) - Math.min(...zs));
+  const { min, max } = meta.aabb;
+  const extent = Math.max(max[0] - min[0], max[2] - min[2]);
+  return extent > 0 ? size * Math.min(1, ground / extent) : size;
+}
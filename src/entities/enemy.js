@@ -7,6 +7,10 @@ import BaseEntity from './baseEntity.js';
 import Config from '../config.js';
 import { GameEvents } from '../core/EventEmitter.js';
 import { EnemyAnimator, AnimState } from './enemyAnimator.js';
+import { samplePath } from '../core/pathTable.js';
+
+// Scratch point for arc-length lookups (one enemy updates at a time)
+const pathPoint = { x: 0, y: 0, heading: 0 };
 
 class Enemy extends BaseEntity {
     constructor(x, y, type = 'basic') {
@@ -18,6 +22,8 @@ class Enemy extends BaseEntity {
         this.speed = config.speed;
         this.path = [];
         this.currentPathIndex = 0;
+        this.pathTable = null;        // Arc-length table of the path, null = steer between waypoints
+        this.distanceTravelled = 0;
         this.damage = config.damage;
         this.reward = config.reward;
         this.color = config.color;
@@ -34,6 +40,7 @@ class Enemy extends BaseEntity {
      * @param {Object} params - Initialization parameters
      * @param {string} params.type - Enemy type ('basic', 'fast', 'tank')
      * @param {Array} params.path - Path waypoints for enemy to follow
+     * @param {Object} [params.pathTable] - Arc-length table for the same path (src/core/pathTable.js)
      * @param {number} params.x - Starting x position
      * @param {number} params.y - Starting y position
      */
@@ -53,6 +60,8 @@ class Enemy extends BaseEntity {
         // Set path
         this.path = params.path || [];
         this.currentPathIndex = 0;
+        this.pathTable = params.pathTable || null;
+        this.distanceTravelled = 0;
 
         // Reset animator for this type
         this.animator.reset(type);
@@ -66,9 +75,11 @@ class Enemy extends BaseEntity {
         });
     }
 
-    setPath(path) {
+    setPath(path, pathTable = null) {
         this.path = path;
         this.currentPathIndex = 0;
+        this.pathTable = pathTable;
+        this.distanceTravelled = 0;
     }
 
     /**
@@ -77,6 +88,7 @@ class Enemy extends BaseEntity {
     onSpawn() {
         // Reset path progress when spawned
         this.currentPathIndex = 0;
+        this.distanceTravelled = 0;
         this.animator.setState(AnimState.WALK);
         this.dying = false;
     }
@@ -88,6 +100,8 @@ class Enemy extends BaseEntity {
         // Clear references for garbage collection
         this.path = [];
         this.currentPathIndex = 0;
+        this.pathTable = null;
+        this.distanceTravelled = 0;
         this.dying = false;
     }
 
@@ -147,6 +161,11 @@ class Enemy extends BaseEntity {
             return;
         }
 
+        if (this.pathTable) {
+            this.followPathTable(deltaTime);
+            return;
+        }
+
         // Calculate movement towards next waypoint
         const target = this.path[this.currentPathIndex];
 
@@ -185,6 +204,38 @@ class Enemy extends BaseEntity {
         this.y += directionY * this.speed * deltaTime;
     }
 
+    /**
+     * Advance along the compiled arc-length table: one lookup by distance
+     * travelled instead of steering towards the next waypoint
+     * @param {number} deltaTime
+     */
+    followPathTable(deltaTime) {
+        const table = this.pathTable;
+        this.distanceTravelled += this.speed * deltaTime;
+
+        // Keep currentPathIndex meaning "next waypoint" for progress and end checks
+        const cumulative = table.cumulative;
+        while (this.currentPathIndex < cumulative.length &&
+               this.distanceTravelled >= cumulative[this.currentPathIndex]) {
+            this.currentPathIndex++;
+        }
+
+        samplePath(table, this.distanceTravelled, pathPoint);
+        this.x = pathPoint.x;
+        this.y = pathPoint.y;
+
+        if (this.distanceTravelled >= table.length) {
+            this.currentPathIndex = this.path.length;
+            this.active = false;
+            this.events.emit(GameEvents.ENEMY_REACHED_END, {
+                enemy: this,
+                type: this.type,
+                damage: this.damage,
+                position: { x: this.x, y: this.y }
+            });
+        }
+    }
+
     render(renderer) {
         // Use the animator to render the samurai model
         // Scale factor maps model to Config enemy size (basic=30px, fast=20px, tank=40px)
@@ -249,6 +300,8 @@ class Enemy extends BaseEntity {
         this.pooled = true;
         this.path = [];
         this.currentPathIndex = 0;
+        this.pathTable = null;
+        this.distanceTravelled = 0;
         this.target = null;
         this.dying = false;
         this.animator.reset(type);
@@ -260,6 +313,7 @@ class Enemy extends BaseEntity {
      */
     getProgress() {
         if (this.path.length === 0) return 0;
+        if (this.pathTable) return Math.min(this.distanceTravelled / this.pathTable.length, 1);
         return this.currentPathIndex / this.path.length;
     }
 }
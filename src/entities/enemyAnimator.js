@@ -6,6 +6,21 @@
  */
 
 import MiniBossAnimator from '../animation/enemyAnimators/MiniBossAnimator.js';
+import { poseFrameIndex, poseFrameOffset } from '../animation/poseBank.js';
+import { sampleClip } from '../animation/animationPack.js';
+import { EMPTY_FRAME, bakeSpriteSheet, drawSpriteFrame } from '../animation/spriteBaker.js';
+
+// Baked walk/death matrices shared by every animator (see usePoseBank)
+let poseBank = null;
+
+// Compiled walk/death curves (see useAnimationPack); null = the keyframes below
+let animationPack = null;
+
+// Baked sprite sheets per enemy type (see bakeSprites)
+let spriteSheets = {};
+
+// Extra room around the part rects for details that stick out (helmet crest)
+const SPRITE_MARGIN = 8;
 
 // ─── Body part layout (relative to center-bottom origin) ───
 const PARTS = {
@@ -105,6 +120,73 @@ const AnimState = {
  * own bespoke renderer without changing the enemy.js interface.
  */
 class EnemyAnimator {
+  /**
+   * Draw walk and death from a baked pose bank instead of interpolating
+   * keyframes (assets/enemies/blender/bake_samurai_poses.py)
+   * @param {Object|null} bank - Result of loadPoseBank(), or null for keyframes
+   */
+  static usePoseBank(bank) {
+    poseBank = bank;
+    spriteSheets = {};
+  }
+
+  /**
+   * Sample walk and death from compiled curves instead of the keyframe
+   * tables (assets/enemies/blender/compile_animations.py)
+   * @param {Object|null} pack - Result of loadAnimationPack(), or null for the tables
+   */
+  static useAnimationPack(pack) {
+    animationPack = pack;
+  }
+
+  /**
+   * Pre-render walk and death for each enemy type into a sprite sheet so a
+   * walking or dying enemy costs one drawImage. Needs a pose bank; frames
+   * that repeat (or mirror another frame) are stored once.
+   * @param {Object<string, number>} scales - Enemy type -> render scale it is drawn at
+   * @param {number} resolution - Sheet pixels per screen pixel
+   * @returns {Object} Sheets by type
+   */
+  static bakeSprites(scales, resolution = 1) {
+    spriteSheets = {};
+    if (!poseBank) return spriteSheets;
+
+    // Bounds of every posed part over both clips, in model units
+    let minX = Infinity, minY = Infinity, maxX = -Infinity, maxY = -Infinity;
+    const { data, frameFloats, channelIndex } = poseBank;
+    for (let base = 0; base < data.length; base += frameFloats) {
+      for (const [name, p] of Object.entries(PARTS)) {
+        const m = base + channelIndex[name] * 6;
+        for (const [x, y] of [[p.x, p.y], [p.x + p.w, p.y], [p.x, p.y + p.h], [p.x + p.w, p.y + p.h]]) {
+          const tx = data[m] * x + data[m + 2] * y + data[m + 4];
+          const ty = data[m + 1] * x + data[m + 3] * y + data[m + 5];
+          minX = Math.min(minX, tx); maxX = Math.max(maxX, tx);
+          minY = Math.min(minY, ty); maxY = Math.max(maxY, ty);
+        }
+      }
+    }
+
+    for (const [type, scale] of Object.entries(scales)) {
+      if (!PALETTES[type]) continue;
+      const s = scale * resolution;
+      const originX = Math.ceil((SPRITE_MARGIN - minX) * s);
+      const originY = Math.ceil((SPRITE_MARGIN - minY) * s);
+      const animator = new EnemyAnimator(type);
+      const sheet = bakeSpriteSheet({
+        clips: { walk: poseBank.clips.walk.frames, death: poseBank.clips.death.frames },
+        width: originX + Math.ceil((maxX + SPRITE_MARGIN) * s),
+        height: originY + Math.ceil((maxY + SPRITE_MARGIN) * s),
+        drawFrame: (ctx, clip, i) => {
+          animator.state = clip;
+          animator.time = (i + 0.5) / poseBank.substeps;
+          animator.render(ctx, originX, originY, s);
+        },
+      });
+      spriteSheets[type] = { ...sheet, originX, originY, scale: s };
+    }
+    return spriteSheets;
+  }
+
   constructor(type = 'basic') {
     this.type = type;
 
@@ -223,6 +305,8 @@ class EnemyAnimator {
         };
     }
 
+    if (animationPack?.clips[this.state]) return sampleClip(animationPack, this.state, rawFrame);
+
     const frameIdx = Math.floor(rawFrame);
     const t = rawFrame - frameIdx;
     const nextIdx = loop ? (frameIdx + 1) % totalFrames : Math.min(frameIdx + 1, totalFrames - 1);
@@ -239,9 +323,24 @@ class EnemyAnimator {
    */
   render(ctx, cx, cy, scale = 0.5) {
     if (this._delegate) { this._delegate.render(ctx, cx, cy, scale); return; }
-    const frame = this.getCurrentFrame();
-    const opacity = frame.opacity ?? 1;
-    const isFlash = (frame.flash || this.flashTimer > 0);
+    // Walk and death read a baked frame when a pose bank is loaded
+    const clip = poseBank && this.state !== AnimState.IDLE ? this.state : null;
+
+    // Baked sprite: one drawImage (hit flashes still draw the parts in white)
+    const sheet = clip && this.flashTimer <= 0 ? spriteSheets[this.type] : null;
+    if (sheet) {
+      const entry = sheet.clips[clip][poseFrameIndex(poseBank, clip, this.time)];
+      if (entry === EMPTY_FRAME) return; // Fully faded, skip render
+      drawSpriteFrame(ctx, sheet, entry, cx, cy, sheet.originX, sheet.originY, scale / sheet.scale);
+      this._renderParticles(ctx, cx, cy);
+      return;
+    }
+
+    const base = clip ? poseFrameOffset(poseBank, clip, this.time) : -1;
+    const frame = clip ? null : this.getCurrentFrame();
+    const data = poseBank?.data;
+    const opacity = clip ? data[base + poseBank.frameFloats - 2] : (frame.opacity ?? 1);
+    const isFlash = (clip ? data[base + poseBank.frameFloats - 1] > 0 : frame.flash) || this.flashTimer > 0;
     const pal = this.palette;
 
     if (opacity <= 0.01) return; // Fully faded, skip render
@@ -251,48 +350,51 @@ class EnemyAnimator {
     ctx.scale(scale, scale);
     ctx.globalAlpha = opacity;
 
-    const drawPart = (partDef, frameData, pivot, color) => {
-      const rot = ((frameData?.rot || 0) * Math.PI) / 180;
-      const offY = frameData?.y || 0;
+    // Move the origin to a part's posed pivot
+    const enterPart = (name) => {
+      const pivot = PIVOTS[name];
       ctx.save();
-      ctx.translate(pivot.x, pivot.y + offY);
-      ctx.rotate(rot);
+      if (clip) {
+        const m = base + poseBank.channelIndex[name] * 6;
+        ctx.transform(data[m], data[m + 1], data[m + 2], data[m + 3], data[m + 4], data[m + 5]);
+        ctx.translate(pivot.x, pivot.y);
+      } else {
+        ctx.translate(pivot.x, pivot.y + (frame[name]?.y || 0));
+        ctx.rotate(((frame[name]?.rot || 0) * Math.PI) / 180);
+      }
+    };
+
+    const drawPart = (name, color) => {
+      const partDef = PARTS[name];
+      enterPart(name);
       ctx.fillStyle = isFlash ? '#fff' : color;
-      ctx.fillRect(partDef.x - pivot.x, partDef.y - pivot.y, partDef.w, partDef.h);
+      ctx.fillRect(partDef.x - PIVOTS[name].x, partDef.y - PIVOTS[name].y, partDef.w, partDef.h);
       ctx.restore();
     };
 
     // Draw order: back limbs → torso → front limbs → head → weapon
-    drawPart(PARTS.lLeg, frame.lLeg, PIVOTS.lLeg, pal.cloth);
-    drawPart(PARTS.lArm, frame.lArm, PIVOTS.lArm, pal.cloth);
-    drawPart(PARTS.torso, frame.torso, PIVOTS.torso, pal.armor);
+    drawPart('lLeg', pal.cloth);
+    drawPart('lArm', pal.cloth);
+    drawPart('torso', pal.armor);
 
     // Armor detail lines
     if (!isFlash) {
-      const tRot = ((frame.torso?.rot || 0) * Math.PI) / 180;
-      const tY = frame.torso?.y || 0;
-      ctx.save();
-      ctx.translate(PIVOTS.torso.x, PIVOTS.torso.y + tY);
-      ctx.rotate(tRot);
+      enterPart('torso');
       ctx.fillStyle = pal.armorDetail;
       ctx.fillRect(-15, -28, 30, 4);
       ctx.fillRect(-13, -22, 26, 3);
       ctx.restore();
     }
 
-    drawPart(PARTS.rLeg, frame.rLeg, PIVOTS.rLeg, pal.cloth);
-    drawPart(PARTS.rArm, frame.rArm, PIVOTS.rArm, pal.cloth);
-    drawPart(PARTS.blade, frame.blade, PIVOTS.blade, pal.blade);
-    drawPart(PARTS.handle, frame.handle, PIVOTS.handle, pal.handle);
-    drawPart(PARTS.head, frame.head, PIVOTS.head, pal.skin);
+    drawPart('rLeg', pal.cloth);
+    drawPart('rArm', pal.cloth);
+    drawPart('blade', pal.blade);
+    drawPart('handle', pal.handle);
+    drawPart('head', pal.skin);
 
     // Face details
     if (!isFlash) {
-      const hRot = ((frame.head?.rot || 0) * Math.PI) / 180;
-      const hY = frame.head?.y || 0;
-      ctx.save();
-      ctx.translate(PIVOTS.head.x, PIVOTS.head.y + hY);
-      ctx.rotate(hRot);
+      enterPart('head');
       ctx.fillStyle = '#000';
       ctx.fillRect(-7, -8, 3, 2);  // Left eye
       ctx.fillRect(4, -8, 3, 2);   // Right eye
@@ -300,15 +402,11 @@ class EnemyAnimator {
       ctx.restore();
     }
 
-    drawPart(PARTS.helmet, frame.helmet, PIVOTS.helmet, pal.helmet);
+    drawPart('helmet', pal.helmet);
 
     // Helmet crest
     if (!isFlash) {
-      const hmRot = ((frame.helmet?.rot || 0) * Math.PI) / 180;
-      const hmY = frame.helmet?.y || 0;
-      ctx.save();
-      ctx.translate(PIVOTS.helmet.x, PIVOTS.helmet.y + hmY);
-      ctx.rotate(hmRot);
+      enterPart('helmet');
       ctx.fillStyle = pal.crest;
       ctx.fillRect(-2, -13, 4, 8);
       ctx.restore();
@@ -316,7 +414,12 @@ class EnemyAnimator {
 
     ctx.restore();
 
-    // Draw particles (in world space, not scaled)
+    this._renderParticles(ctx, cx, cy);
+  }
+
+  /** @private Draw particles (in world space, not scaled) */
+  _renderParticles(ctx, cx, cy) {
+    if (!this.particles.length) return;
     ctx.save();
     for (const p of this.particles) {
       if (p.life <= 0) continue;
@@ -3,23 +3,43 @@
  * Handles enemy path management for the tower defense game
  */
 
+import { samplePath, matchesWaypoints } from '../core/pathTable.js';
+
 class PathManager {
     constructor() {
         this.waypoints = [];
+        this.arcTable = null; // Compiled arc-length table (maps/compile_maps.py), null = walk the waypoints
+    }
+
+    /**
+     * Attach a compiled arc-length table for the current waypoints.
+     * A table compiled from other waypoints (a map edited without
+     * recompiling) is refused; any change to the waypoints drops it again.
+     * @param {Object|null} table - Parsed table from loadPathTable
+     */
+    setArcTable(table) {
+        if (table && !matchesWaypoints(table, this.waypoints)) {
+            console.warn('[PathManager] Arc table does not match the waypoints, ignoring it');
+            table = null;
+        }
+        this.arcTable = table;
     }
 
     addWaypoint(x, y) {
         this.waypoints.push({ x, y });
+        this.arcTable = null;
     }
 
     removeWaypoint(index) {
         if (index >= 0 && index < this.waypoints.length) {
             this.waypoints.splice(index, 1);
+            this.arcTable = null;
         }
     }
 
     clearWaypoints() {
         this.waypoints = [];
+        this.arcTable = null;
     }
 
     getWaypoints() {
@@ -48,6 +68,7 @@ class PathManager {
      */
     getPathLength() {
         if (this.waypoints.length < 2) return 0;
+        if (this.arcTable) return this.arcTable.length;
 
         let totalLength = 0;
 
@@ -68,6 +89,10 @@ class PathManager {
     getPointAtProgress(progress) {
         if (this.waypoints.length === 0) return { x: 0, y: 0 };
         if (this.waypoints.length === 1) return { ...this.waypoints[0] };
+        if (this.arcTable) {
+            const { x, y } = samplePath(this.arcTable, progress * this.arcTable.length);
+            return { x, y };
+        }
 
         const totalLength = this.getPathLength();
         let targetDistance = progress * totalLength;
@@ -1,5 +1,6 @@
 import { TowerAnimator } from './towerAnimator.js';
 import Config from '../config.js';
+import { getTowerMeta, launchPoint } from '../core/towerMeta.js';
 
 export default class Tower {
   constructor(x, y, type = 'basic', tier = 1) {
@@ -39,6 +40,7 @@ export default class Tower {
 
     // Rotate tower towards target
     this.angle = Math.atan2(target.y - cy, target.x - cx);
+    this.animator.setAim(this.angle);
 
     // Firing logic — lastFire accumulates ms since last shot
     if (this.lastFire >= this.fireRate) {
@@ -48,6 +50,17 @@ export default class Tower {
     }
   }
 
+  /**
+   * Where this tower's projectiles start: the tier's muzzle or top anchor
+   * (towerMeta.js) when its metadata is loaded, else the box centre
+   * @returns {{ x: number, y: number }}
+   */
+  getLaunchPoint() {
+    const meta = getTowerMeta(this.type, this.tier);
+    if (meta) return launchPoint(meta, this.x, this.y, this.width, this.height);
+    return { x: this.x + this.width / 2, y: this.y + this.height / 2 };
+  }
+
   render(renderer, scale = 1) {
     // this.x, this.y is the top-left corner (set by placeTower)
     // Compute center for drawing and animator
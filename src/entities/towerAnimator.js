@@ -56,6 +56,12 @@ export class TowerAnimator {
     this._impl.setTier(tier);
   }
 
+  setAim(angle) {
+    if (this._impl.setAim) {
+      this._impl.setAim(angle);
+    }
+  }
+
   setState(state) {
     if (this._impl.setState) {
       this._impl.setState(state);
@@ -0,0 +1,90 @@
+// tests/animationPack.test.js
+import { readFileSync } from 'fs';
+import { parseAnimationPack, sampleClip } from '../src/animation/animationPack.js';
+
+const read = (path) => readFileSync(new URL(path, import.meta.url));
+
+function loadPack(path) {
+  const buf = read(path);
+  return parseAnimationPack(buf.buffer.slice(buf.byteOffset, buf.byteOffset + buf.length));
+}
+
+describe('animationPack', () => {
+  const source = JSON.parse(read('../assets/enemies/animation/samurai-animations.json'));
+  const pack = loadPack('../assets/enemies/animation/samurai-animations.anim.bin');
+
+  test('rejects buffers without the magic', () => {
+    expect(() => parseAnimationPack(new ArrayBuffer(16))).toThrow('Not an animation pack');
+  });
+
+  test('reproduces every source key', () => {
+    for (const name of ['walk', 'death']) {
+      source[name].frames.forEach((key, i) => {
+        const frame = sampleClip(pack, name, i);
+        for (const [part, props] of Object.entries(key)) {
+          if (typeof props !== 'object') continue;
+          for (const [prop, value] of Object.entries(props)) {
+            expect(frame[part]?.[prop] ?? 0).toBeCloseTo(value, 2);
+          }
+        }
+        if ('opacity' in key) expect(frame.opacity).toBeCloseTo(key.opacity, 4);
+        expect(frame.flash ?? false).toBe(!!key.flash);
+      });
+    }
+  });
+
+  test('walk wraps back to its first key', () => {
+    const length = pack.clips.walk.length;
+    expect(sampleClip(pack, 'walk', length).lLeg.rot).toBeCloseTo(sampleClip(pack, 'walk', 0).lLeg.rot);
+  });
+
+  test('church tower clips are keyed by their config path', () => {
+    const church = loadPack('../assets/towers/church_tower_config.anim.bin');
+    const frame = sampleClip(church, 'tiers.T3.animations.holySmite', 4);
+    expect(frame.smite).toBe(true);
+    expect(frame.glow).toBeCloseTo(1.5);
+  });
+});
+
+describe('animators on a compiled pack', () => {
+  const pack = loadPack('../assets/enemies/animation/samurai-animations.anim.bin');
+
+  test('walk and death hit the keyframe tables on every key', async () => {
+    const { default: EnemyAnimator } = await import('../src/entities/enemyAnimator.js');
+    const animator = new EnemyAnimator('basic');
+    for (const state of ['walk', 'death']) {
+      animator.setState(state);
+      for (let time = 0; time < 11; time++) {
+        animator.time = time;
+        EnemyAnimator.useAnimationPack(null);
+        const table = animator.getCurrentFrame();
+        EnemyAnimator.useAnimationPack(pack);
+        const sampled = animator.getCurrentFrame();
+        for (const part of ['lLeg', 'rArm', 'torso', 'blade']) {
+          expect(sampled[part]?.rot ?? 0).toBeCloseTo(table[part].rot ?? 0, 0);
+          expect(sampled[part]?.y ?? 0).toBeCloseTo(table[part].y ?? 0, 0);
+        }
+        if (state === 'death') {
+          expect(sampled.opacity).toBeCloseTo(table.opacity, 2);
+        }
+      }
+    }
+    EnemyAnimator.useAnimationPack(null);
+  });
+
+  test('flags switch on at their key and off at the midpoint like the keyframe tables', async () => {
+    const { default: EnemyAnimator } = await import('../src/entities/enemyAnimator.js');
+    const animator = new EnemyAnimator('basic');
+    animator.setState('death');
+    for (let time = 0; time < 9; time += 0.25) {
+      animator.time = time;
+      EnemyAnimator.useAnimationPack(null);
+      const table = !!animator.getCurrentFrame().flash;
+      EnemyAnimator.useAnimationPack(pack);
+      expect(!!animator.getCurrentFrame().flash).toBe(table);
+    }
+    const flashAt = (time) => { animator.time = time; return !!animator.getCurrentFrame().flash; };
+    expect([0.25, 0.75, 5.75, 6.25, 6.75].map(flashAt)).toEqual([true, false, false, true, false]);
+    EnemyAnimator.useAnimationPack(null);
+  });
+});
@@ -0,0 +1,76 @@
+// tests/assetPack.test.js
+import { deflateSync } from 'zlib';
+import {
+  parseAssetPack, mountAssetPack, readEntry, entryBytes, fetchAsset, assetName,
+} from '../src/core/assetPack.js';
+
+// Same layout as assets/tdgpak.py write_pack()
+function buildPack(files, align = 64) {
+  const encoder = new TextEncoder();
+  const entries = Object.entries(files).map(([name, { data, deflate }]) => {
+    const stored = deflate ? new Uint8Array(deflateSync(data)) : data;
+    return { name, offset: 0, length: stored.length, size: data.length, codec: deflate ? 'deflate' : 'none', stored };
+  });
+  let index = new Uint8Array(0);
+  for (;;) {
+    let at = 12 + index.length;
+    for (const e of entries) {
+      at += (align - (at % align)) % align;
+      e.offset = at;
+      at += e.length;
+    }
+    const json = JSON.stringify({ align, entries: entries.map(({ stored, ...e }) => e) });
+    const pad = (align - ((12 + json.length) % align)) % align;
+    const next = encoder.encode(json + ' '.repeat(pad));
+    const settled = next.length === index.length;
+    index = next;
+    if (settled) break;
+  }
+  const last = entries[entries.length - 1];
+  const out = new Uint8Array(last.offset + last.length);
+  out.set(encoder.encode('TDPK'));
+  const view = new DataView(out.buffer);
+  view.setUint16(4, 1, true);
+  view.setUint32(8, index.length, true);
+  out.set(index, 12);
+  for (const e of entries) out.set(e.stored, e.offset);
+  return out.buffer;
+}
+
+describe('asset pack reader', () => {
+  const floats = new Float32Array([1.5, -2, 3.25]);
+  const text = JSON.stringify({ name: 'Packed Map', path: { width: 40 } });
+  const pack = parseAssetPack(buildPack({
+    'maps/bin.path.bin': { data: new Uint8Array(floats.buffer) },
+    'maps/packed.json': { data: new TextEncoder().encode(text), deflate: true },
+  }));
+
+  test('index lists the entries at aligned offsets', () => {
+    expect(pack.version).toBe(1);
+    expect([...pack.entries.keys()]).toEqual(['maps/bin.path.bin', 'maps/packed.json']);
+    for (const entry of pack.entries.values()) expect(entry.offset % pack.align).toBe(0);
+  });
+
+  test('stored entries are views into the pack', () => {
+    const bytes = entryBytes(pack, 'maps/bin.path.bin');
+    expect(bytes.buffer).toBe(pack.buffer);
+    expect([...new Float32Array(pack.buffer, bytes.byteOffset, 3)]).toEqual([...floats]);
+    expect(entryBytes(pack, 'missing.json')).toBe(null);
+  });
+
+  test('deflated entries are inflated on read', async () => {
+    const bytes = await readEntry(pack, 'maps/packed.json');
+    expect(new TextDecoder().decode(bytes)).toBe(text);
+  });
+
+  test('fetchAsset answers from the mounted pack', async () => {
+    expect(assetName('./maps/packed.json?v=2')).toBe('maps/packed.json');
+    mountAssetPack(pack);
+    try {
+      const map = await (await fetchAsset('./maps/packed.json')).json();
+      expect(map.name).toBe('Packed Map');
+    } finally {
+      mountAssetPack(null);
+    }
+  });
+});
@@ -0,0 +1,39 @@
+// tests/churchTowerParts.test.js
+import { CHURCH_LEVELS, CHURCH_PARTS } from '../src/animation/towerAnimators/churchTowerParts.js';
+import { pickLevel } from '../src/animation/towerAnimators/ChurchTowerAnimator.js';
+
+describe('church tower sprite mip chain', () => {
+  test('levels run from the largest scale down', () => {
+    const scales = CHURCH_LEVELS.map((level) => level.scale);
+    expect(scales).toEqual([...scales].sort((a, b) => b - a));
+    expect(scales).toContain(1);
+  });
+
+  test('every level places each part where the 1x table does', () => {
+    const base = CHURCH_LEVELS.findIndex((level) => level.scale === 1);
+    for (const tier of Object.values(CHURCH_PARTS)) {
+      expect(tier.rects.length).toBe(CHURCH_LEVELS.length);
+      CHURCH_LEVELS.forEach(({ scale }, level) => {
+        const rects = tier.rects[level];
+        expect(rects.length).toBe(tier.names.length * 6);
+        for (let r = 0; r < rects.length; r += 6) {
+          // same top-left corner within one pixel of the coarser level
+          const tolerance = Math.max(1, 1 / scale) + 1e-9;
+          expect(Math.abs(rects[r] / scale - tier.rects[base][r])).toBeLessThanOrEqual(tolerance);
+          expect(Math.abs(rects[r + 1] / scale - tier.rects[base][r + 1])).toBeLessThanOrEqual(tolerance);
+        }
+      });
+    }
+  });
+
+  test('pickLevel chooses the closest level that is not much too small', () => {
+    const scaleOf = (pixelScale) => CHURCH_LEVELS[pickLevel(pixelScale)].scale;
+    expect(scaleOf(1)).toBe(1);
+    expect(scaleOf(2)).toBe(2);
+    expect(scaleOf(1.5)).toBe(2);
+    expect(scaleOf(0.5)).toBe(0.5);
+    expect(scaleOf(0.3)).toBe(0.25);
+    expect(scaleOf(0.01)).toBe(0.25);
+    expect(scaleOf(4)).toBe(2);
+  });
+});
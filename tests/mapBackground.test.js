@@ -0,0 +1,33 @@
+// tests/mapBackground.test.js
+import { readFileSync, existsSync } from 'fs';
+import { pickBackground } from '../src/core/mapBackground.js';
+
+const manifest = JSON.parse(readFileSync(new URL('../maps/backgrounds/manifest.json', import.meta.url), 'utf8'));
+
+function pngSize(file) {
+  const buf = readFileSync(new URL(`../maps/backgrounds/${file}`, import.meta.url));
+  return [buf.readUInt32BE(16), buf.readUInt32BE(20)];
+}
+
+describe('prerendered map backgrounds', () => {
+  test('every map has a background per shipped pixel ratio', () => {
+    for (const map of ['default', 'straight', 'serpentine', 'spiral']) {
+      const entry = manifest.maps[map];
+      expect(entry.source).toBe(`${map}.json`);
+      expect(entry.images.map((image) => image.scale)).toEqual([1, 2]);
+      for (const image of entry.images) {
+        expect(existsSync(new URL(`../maps/backgrounds/${image.file}`, import.meta.url))).toBe(true);
+        expect(pngSize(image.file)).toEqual([entry.width * image.scale, entry.height * image.scale]);
+      }
+    }
+  });
+
+  test('the smallest image covering the pixel ratio is picked', () => {
+    const entry = manifest.maps.default;
+    expect(pickBackground(entry, 1).scale).toBe(1);
+    expect(pickBackground(entry, 1.25).scale).toBe(2);
+    expect(pickBackground(entry, 2).scale).toBe(2);
+    expect(pickBackground(entry, 3).scale).toBe(2);
+    expect(pickBackground(undefined, 1)).toBe(null);
+  });
+});
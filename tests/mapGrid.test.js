@@ -0,0 +1,104 @@
+// tests/mapGrid.test.js
+import { readFileSync } from 'fs';
+import { parseMapGrid, pathDistance, isBuildable, matchesMap } from '../src/core/mapGrid.js';
+
+function load(name) {
+  const buf = readFileSync(new URL(`../maps/${name}.grid.bin`, import.meta.url));
+  return parseMapGrid(buf.buffer.slice(buf.byteOffset, buf.byteOffset + buf.length));
+}
+
+function segmentDistance(px, py, waypoints) {
+  let best = Infinity;
+  for (let i = 0; i < waypoints.length - 1; i++) {
+    const a = waypoints[i];
+    const b = waypoints[i + 1];
+    const dx = b.x - a.x;
+    const dy = b.y - a.y;
+    const t = Math.max(0, Math.min(1, ((px - a.x) * dx + (py - a.y) * dy) / (dx * dx + dy * dy || 1)));
+    best = Math.min(best, Math.hypot(px - a.x - t * dx, py - a.y - t * dy));
+  }
+  return best;
+}
+
+describe('compiled map grids', () => {
+  const map = JSON.parse(readFileSync(new URL('../maps/default.json', import.meta.url), 'utf8'));
+  const grid = load('default');
+
+  test('header matches the map', () => {
+    expect(grid.width).toBe(map.canvas.width);
+    expect(grid.height).toBe(map.canvas.height);
+    expect(grid.cols * grid.cellSize).toBeGreaterThanOrEqual(map.canvas.width);
+    expect(grid.sdf.length).toBe(grid.rows * grid.cols);
+  });
+
+  test('distance field agrees with the path segments at cell centres', () => {
+    const half = grid.cellSize / 2;
+    for (let row = 0; row < grid.rows; row += 7) {
+      for (let col = 0; col < grid.cols; col += 7) {
+        const x = col * grid.cellSize + half;
+        const y = row * grid.cellSize + half;
+        const exact = segmentDistance(x, y, map.path.waypoints) - map.path.width / 2;
+        expect(Math.abs(pathDistance(grid, x, y) - exact)).toBeLessThan(0.05);
+      }
+    }
+  });
+
+  test('bitmaps follow the placement clearance', () => {
+    const first = map.path.waypoints[0];
+    expect(pathDistance(grid, first.x + 1, first.y)).toBeLessThan(0);
+    const reach = grid.cellSize * Math.SQRT1_2;
+    const edge = grid.cellSize / 2;
+    for (const size of grid.towerSizes) {
+      expect(isBuildable(grid, first.x + 1, first.y, size)).toBe(false);
+      const clearance = map.path.width / 2 + size / 2 + grid.margin;
+      const half = size / 2 + edge;
+      for (let row = 0; row < grid.rows; row += 5) {
+        for (let col = 0; col < grid.cols; col += 5) {
+          const x = (col + 0.5) * grid.cellSize;
+          const y = (row + 0.5) * grid.cellSize;
+          const inside = x >= half && x + half <= grid.width && y >= half && y + half <= grid.height;
+          const clear = segmentDistance(x, y, map.path.waypoints) >= clearance + reach;
+          expect(isBuildable(grid, x, y, size)).toBe(inside && clear);
+        }
+      }
+    }
+  });
+
+  test('no point of a buildable cell is closer to the path than the exact check allows', () => {
+    const size = 40;
+    const clearance = map.path.width / 2 + size / 2 + grid.margin;
+    const offsets = [0, 0.25, 0.5, 0.75, 0.999].map((f) => f * grid.cellSize);
+    for (let row = 0; row < grid.rows; row += 3) {
+      for (let col = 0; col < grid.cols; col += 3) {
+        const x0 = col * grid.cellSize;
+        const y0 = row * grid.cellSize;
+        if (!isBuildable(grid, x0, y0, size)) continue;
+        for (const dx of offsets) {
+          for (const dy of offsets) {
+            const x = x0 + dx;
+            const y = y0 + dy;
+            expect(segmentDistance(x, y, map.path.waypoints)).toBeGreaterThanOrEqual(clearance);
+            expect(x - size / 2).toBeGreaterThanOrEqual(0);
+            expect(y + size / 2).toBeLessThanOrEqual(grid.height);
+          }
+        }
+      }
+    }
+  });
+
+  test('a grid compiled from another path does not match the map', () => {
+    expect(matchesMap(grid, map)).toBe(true);
+    const moved = map.path.waypoints.map((p, i) => (i === 1 ? { x: p.x, y: p.y + 10 } : p));
+    expect(matchesMap(grid, { ...map, path: { ...map.path, waypoints: moved } })).toBe(false);
+    expect(matchesMap(grid, { ...map, path: { ...map.path, width: map.path.width + 10 } })).toBe(false);
+    expect(matchesMap({ ...grid, waypoints: undefined }, map)).toBe(false);
+  });
+
+  test('sizes without a bitmap fall back to the distance field', () => {
+    const x = 400;
+    const y = 60;
+    const baked = isBuildable(grid, x, y, 30);
+    expect(isBuildable({ ...grid, bitmaps: {} }, x, y, 30)).toBe(baked);
+    expect(isBuildable(grid, -5, y, 30)).toBe(false);
+  });
+});
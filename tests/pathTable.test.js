@@ -0,0 +1,99 @@
+// tests/pathTable.test.js
+import { readFileSync } from 'fs';
+import { parsePathTable, samplePath, matchesWaypoints } from '../src/core/pathTable.js';
+import PathManager from '../src/entities/pathManager.js';
+import Enemy from '../src/entities/enemy.js';
+import { GameEvents } from '../src/core/EventEmitter.js';
+
+function load(name) {
+  const buf = readFileSync(new URL(`../maps/${name}.path.bin`, import.meta.url));
+  return parsePathTable(buf.buffer.slice(buf.byteOffset, buf.byteOffset + buf.length));
+}
+
+function managerFor(name) {
+  const map = JSON.parse(readFileSync(new URL(`../maps/${name}.json`, import.meta.url), 'utf8'));
+  const manager = new PathManager();
+  map.path.waypoints.forEach((wp) => manager.addWaypoint(wp.x, wp.y));
+  return manager;
+}
+
+describe('arc-length path tables', () => {
+  const table = load('spiral');
+  const manager = managerFor('spiral');
+
+  test('cumulative lengths match the waypoint walk', () => {
+    expect(table.cumulative.length).toBe(manager.getWaypointCount());
+    expect(table.length).toBeCloseTo(manager.getPathLength(), 3);
+    expect(table.cumulative[0]).toBe(0);
+    expect(table.cumulative[table.cumulative.length - 1]).toBeCloseTo(table.length, 3);
+  });
+
+  test('lookups agree with the waypoint walk', () => {
+    for (let d = 0; d <= table.length; d += 13.7) {
+      const exact = manager.getPointAtProgress(d / table.length);
+      const point = samplePath(table, d);
+      // corners are cut by at most half a sample step
+      expect(Math.hypot(point.x - exact.x, point.y - exact.y)).toBeLessThanOrEqual(table.step / 2 + 1e-3);
+    }
+  });
+
+  test('lookups clamp to the ends and carry the heading', () => {
+    const start = manager.getStart();
+    const end = manager.getEnd();
+    const before = samplePath(table, -10);
+    const after = samplePath(table, table.length + 10);
+    expect([before.x, before.y]).toEqual([start.x, start.y]);
+    expect([after.x, after.y]).toEqual([end.x, end.y]);
+    const [a, b] = manager.getWaypoints();
+    expect(samplePath(table, 1).heading).toBeCloseTo(Math.atan2(b.y - a.y, b.x - a.x), 5);
+  });
+
+  test('path manager uses the table only while it matches the waypoints', () => {
+    const withTable = managerFor('spiral');
+    withTable.setArcTable(table);
+    expect(withTable.arcTable).toBe(table);
+    expect(withTable.getPathLength()).toBe(table.length);
+    withTable.addWaypoint(0, 0);
+    expect(withTable.arcTable).toBe(null);
+    withTable.setArcTable(table);
+    expect(withTable.arcTable).toBe(null);
+  });
+
+  test('a table compiled from an edited map is refused', () => {
+    const waypoints = managerFor('spiral').getWaypoints();
+    expect(matchesWaypoints(table, waypoints)).toBe(true);
+    // same count, one waypoint moved
+    const moved = waypoints.map((p, i) => (i === 2 ? { x: p.x + 25, y: p.y } : p));
+    expect(matchesWaypoints(table, moved)).toBe(false);
+    // same segment lengths, whole path shifted
+    const shifted = waypoints.map((p) => ({ x: p.x + 40, y: p.y }));
+    expect(matchesWaypoints(table, shifted)).toBe(false);
+    const stale = new PathManager();
+    moved.forEach((p) => stale.addWaypoint(p.x, p.y));
+    stale.setArcTable(table);
+    expect(stale.arcTable).toBe(null);
+  });
+
+  test('enemies walk the table to the end of the path', () => {
+    const enemy = new Enemy(0, 0);
+    const path = manager.getWaypoints();
+    enemy.initialize({ type: 'basic', path: [...path], pathTable: table, x: path[0].x, y: path[0].y });
+    enemy.onSpawn();
+    let reached = null;
+    const onEnd = (data) => { reached = data; };
+    enemy.events.on(GameEvents.ENEMY_REACHED_END, onEnd);
+    let steps = 0;
+    while (enemy.active && steps < 10000) {
+      enemy.update(0.05);
+      steps++;
+      const exact = manager.getPointAtProgress(Math.min(enemy.distanceTravelled / table.length, 1));
+      expect(Math.hypot(enemy.x - exact.x, enemy.y - exact.y)).toBeLessThanOrEqual(table.step / 2 + 1e-3);
+    }
+    enemy.events.off(GameEvents.ENEMY_REACHED_END, onEnd);
+    expect(enemy.active).toBe(false);
+    expect(reached.enemy).toBe(enemy);
+    expect(enemy.currentPathIndex).toBe(path.length);
+    expect(enemy.getProgress()).toBe(1);
+    expect(steps).toBe(Math.ceil(table.length / (enemy.speed * 0.05)));
+  });
+});
@@ -0,0 +1,39 @@
+// tests/poseBank.test.js
+import { readFileSync } from 'fs';
+import { parsePoseBank, poseFrameOffset } from '../src/animation/poseBank.js';
+
+function loadBank() {
+  const buf = readFileSync(new URL('../assets/enemies/animation/samurai-poses.bin', import.meta.url));
+  return parsePoseBank(buf.buffer.slice(buf.byteOffset, buf.byteOffset + buf.length));
+}
+
+describe('poseBank', () => {
+  test('parses header and frame data', () => {
+    const bank = loadBank();
+    expect(bank.channels).toContain('torso');
+    expect(bank.channelIndex.torso).toBe(bank.channels.indexOf('torso'));
+    const frames = bank.clips.walk.frames + bank.clips.death.frames;
+    expect(bank.data.length).toBe(frames * bank.frameFloats);
+  });
+
+  test('rejects buffers without the magic', () => {
+    expect(() => parsePoseBank(new ArrayBuffer(16))).toThrow('Not a pose bank');
+  });
+
+  test('walk wraps and death holds its last frame', () => {
+    const bank = loadBank();
+    const walk = bank.clips.walk;
+    const keys = walk.frames / bank.substeps;
+    expect(poseFrameOffset(bank, 'walk', keys)).toBe(poseFrameOffset(bank, 'walk', 0));
+    const death = bank.clips.death;
+    const last = (death.offset + death.frames - 1) * bank.frameFloats;
+    expect(poseFrameOffset(bank, 'death', 1000)).toBe(last);
+  });
+
+  test('unposed part bakes to the identity matrix', () => {
+    const bank = loadBank();
+    const m = poseFrameOffset(bank, 'walk', 0) + bank.channelIndex.torso * 6;
+    // torso key 0 is { y: 0, rot: 0 } -> identity matrix
+    [1, 0, 0, 1, 0, 0].forEach((v, i) => expect(bank.data[m + i]).toBeCloseTo(v));
+  });
+});
@@ -0,0 +1,77 @@
+// tests/serve.test.js
+import http from 'http';
+import os from 'os';
+import path from 'path';
+import { mkdtempSync, writeFileSync, utimesSync } from 'fs';
+import { brotliCompressSync, gzipSync } from 'zlib';
+import { acceptedEncodings, createHandler } from '../scripts/serve.mjs';
+
+function get(port, file, encoding) {
+  return new Promise((resolve, reject) => {
+    http.get({ port, path: file, headers: encoding ? { 'accept-encoding': encoding } : {} }, (res) => {
+      const chunks = [];
+      res.on('data', (c) => chunks.push(c));
+      res.on('end', () => resolve({ res, body: Buffer.concat(chunks) }));
+    }).on('error', reject);
+  });
+}
+
+describe('acceptedEncodings', () => {
+  test('parses a browser header', () => {
+    expect([...acceptedEncodings('gzip, deflate, br, zstd')]).toEqual(['gzip', 'deflate', 'br', 'zstd']);
+  });
+
+  test('drops codings with q=0', () => {
+    expect([...acceptedEncodings('br;q=0, gzip;q=0.5')]).toEqual(['gzip']);
+  });
+
+  test('empty header accepts nothing', () => {
+    expect(acceptedEncodings().size).toBe(0);
+  });
+});
+
+describe('createHandler', () => {
+  const root = mkdtempSync(path.join(os.tmpdir(), 'serve-'));
+  const text = 'v 0 0 0\n'.repeat(500);
+  writeFileSync(path.join(root, 'model.obj'), text);
+  writeFileSync(path.join(root, 'model.obj.br'), brotliCompressSync(text));
+  writeFileSync(path.join(root, 'model.obj.gz'), gzipSync(text));
+  writeFileSync(path.join(root, 'stale.json'), '{}');
+  writeFileSync(path.join(root, 'stale.json.br'), brotliCompressSync('{"old":1}'));
+  const past = new Date(Date.now() - 60000);
+  utimesSync(path.join(root, 'stale.json.br'), past, past);
+
+  let server;
+  let port;
+  beforeAll(() => new Promise((resolve) => {
+    server = http.createServer(createHandler(root)).listen(0, () => {
+      port = server.address().port;
+      resolve();
+    });
+  }));
+  afterAll(() => new Promise((resolve) => server.close(resolve)));
+
+  test('prefers brotli', async () => {
+    const { res, body } = await get(port, '/model.obj', 'gzip, br');
+    expect(res.headers['content-encoding']).toBe('br');
+    expect(res.headers.vary).toBe('Accept-Encoding');
+    expect(body.equals(brotliCompressSync(text))).toBe(true);
+  });
+
+  test('falls back to gzip, then raw', async () => {
+    expect((await get(port, '/model.obj', 'gzip')).res.headers['content-encoding']).toBe('gzip');
+    const { res, body } = await get(port, '/model.obj');
+    expect(res.headers['content-encoding']).toBeUndefined();
+    expect(body.toString()).toBe(text);
+  });
+
+  test('ignores siblings older than the source', async () => {
+    const { res, body } = await get(port, '/stale.json', 'br');
+    expect(res.headers['content-encoding']).toBeUndefined();
+    expect(body.toString()).toBe('{}');
+  });
+
+  test('404 for missing files', async () => {
+    expect((await get(port, '/nope.js')).res.statusCode).toBe(404);
+  });
+});
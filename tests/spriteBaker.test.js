@@ -0,0 +1,31 @@
+// tests/spriteBaker.test.js
+import { EMPTY_FRAME, dedupeFrames, hashPixels } from '../src/animation/spriteBaker.js';
+
+// 3x2 RGBA frame from a list of 6 grey levels (alpha 255 when non-zero)
+function frame(levels) {
+  const px = new Uint8ClampedArray(levels.length * 4);
+  levels.forEach((v, i) => px.set([v, v, v, v ? 255 : 0], i * 4));
+  return px;
+}
+
+describe('spriteBaker', () => {
+  test('mirrored hash matches the hash of the flipped frame', () => {
+    const a = frame([1, 2, 3, 4, 5, 6]);
+    const flipped = frame([3, 2, 1, 6, 5, 4]);
+    expect(hashPixels(a, 3, true)).toBe(hashPixels(flipped, 3));
+    expect(hashPixels(a, 3)).not.toBe(hashPixels(flipped, 3));
+  });
+
+  test('identical and mirrored frames share a cell', () => {
+    const frames = [
+      frame([1, 2, 3, 4, 5, 6]),
+      frame([7, 7, 7, 7, 7, 7]),
+      frame([1, 2, 3, 4, 5, 6]),
+      frame([3, 2, 1, 6, 5, 4]),
+      frame([0, 0, 0, 0, 0, 0]),
+    ];
+    const { cells, table } = dedupeFrames(frames, 3);
+    expect(cells).toEqual([0, 1]);
+    expect(Array.from(table)).toEqual([0, 2, 0, 1, EMPTY_FRAME]);
+  });
+});
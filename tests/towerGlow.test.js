@@ -0,0 +1,18 @@
+// tests/towerGlow.test.js
+import { TOWER_GLOW } from '../src/animation/towerAnimators/towerGlow.js';
+
+describe('builder tower glow layers', () => {
+  test('only upgraded tiers glow, above the ground', () => {
+    for (const tiers of Object.values(TOWER_GLOW)) {
+      expect(tiers[1]).toBeUndefined();
+      for (const g of Object.values(tiers)) {
+        expect(g.w).toBeGreaterThan(0);
+        expect(g.h).toBeGreaterThan(0);
+        expect(g.y).toBeLessThan(0);
+        expect(g.x).toBeLessThan(0);
+        expect(g.x + g.w).toBeGreaterThan(0);
+      }
+    }
+    expect(TOWER_GLOW.sniper[3]).toBeDefined();
+  });
+});
@@ -0,0 +1,61 @@
+// tests/towerMeta.test.js
+import { readFileSync } from 'fs';
+import { parseTowerMeta, setTowerMeta, getTowerMeta, launchPoint, footprintSize } from '../src/core/towerMeta.js';
+import Tower from '../src/entities/tower.js';
+
+function load(name) {
+  return parseTowerMeta(JSON.parse(readFileSync(new URL(`../assets/towers/models/${name}.meta.json`, import.meta.url), 'utf8')));
+}
+
+describe('tower metadata sidecars', () => {
+  test('parse the anchors and footprint', () => {
+    const meta = load('sniper_t3');
+    expect(meta.name).toBe('sniper_t3');
+    expect(meta.footprint.length).toBeGreaterThanOrEqual(3);
+    expect(meta.muzzle).toHaveLength(2);
+    expect(meta.anchor[1]).toBeLessThan(0.05);
+    expect(load('sniper_t1').muzzle).toBeNull();
+  });
+
+  test('rejects other JSON', () => {
+    expect(() => parseTowerMeta({ name: 'x' })).toThrow();
+  });
+
+  test('projectiles leave from the muzzle, else the top anchor', () => {
+    const t3 = load('sniper_t3');
+    const p = launchPoint(t3, 100, 200, 40, 40);
+    expect(p.x).toBeCloseTo(100 + t3.muzzle[0] * 40);
+    expect(p.y).toBeCloseTo(200 + t3.muzzle[1] * 40);
+    const t1 = load('sniper_t1');
+    expect(launchPoint(t1, 0, 0, 40, 40).y).toBeCloseTo(t1.anchor[1] * 40);
+  });
+
+  test('footprint is never larger than the box', () => {
+    for (const name of ['sniper_t1', 'sniper_t2', 'sniper_t3', 'basic_t2', 'basic_t3']) {
+      const size = footprintSize(load(name), 40);
+      expect(size).toBeGreaterThan(0);
+      expect(size).toBeLessThanOrEqual(40);
+    }
+  });
+
+  test('footprint is what stands on the ground, not the overhang', () => {
+    const meta = {
+      aabb: { min: [-10, 0, -10], max: [10, 30, 10] },
+      footprint: [[-5, -5], [5, -5], [5, 5], [-5, 5]],
+    };
+    expect(footprintSize(meta, 40)).toBeCloseTo(20);
+    const t1 = load('sniper_t1');
+    expect(t1.footprint.every(([x, z]) => Math.abs(x) < t1.aabb.max[0] && Math.abs(z) < t1.aabb.max[2])).toBe(true);
+    expect(footprintSize(t1, 40)).toBeLessThan(40);
+  });
+
+  test('towers fire from the box centre until their tier has metadata', () => {
+    const tower = new Tower(100, 100, 'sniper', 3);
+    setTowerMeta('sniper', 3, null);
+    expect(tower.getLaunchPoint()).toEqual({ x: 100 + tower.width / 2, y: 100 + tower.height / 2 });
+    setTowerMeta('sniper', 3, load('sniper_t3'));
+    expect(getTowerMeta('sniper', 3).name).toBe('sniper_t3');
+    expect(tower.getLaunchPoint().y).toBeLessThan(100 + tower.height / 2);
+    setTowerMeta('sniper', 3, null);
+  });
+});
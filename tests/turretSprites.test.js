@@ -0,0 +1,50 @@
+// tests/turretSprites.test.js
+import { TURRETS } from '../src/animation/towerAnimators/turretSprites.js';
+import { turretFrame, turretAnchor } from '../src/animation/towerAnimators/SniperTowerAnimator.js';
+
+describe('pre-rotated turret sprites', () => {
+  test('every baked tier has a full strip with its pivot inside the cell', () => {
+    for (const tiers of Object.values(TURRETS)) {
+      for (const t of Object.values(tiers)) {
+        expect(t.frames).toBeGreaterThan(0);
+        expect(t.pivot[0]).toBeGreaterThanOrEqual(0);
+        expect(t.pivot[0]).toBeLessThanOrEqual(t.w);
+        expect(t.pivot[1]).toBeGreaterThanOrEqual(0);
+        expect(t.pivot[1]).toBeLessThanOrEqual(t.h);
+      }
+    }
+  });
+
+  test('glow rows follow their strip and hold the same pivot, grown by the blur', () => {
+    for (const tiers of Object.values(TURRETS)) {
+      for (const t of Object.values(tiers)) {
+        if (!t.glow) continue;
+        expect(t.glow.row).toBeGreaterThan(t.row + t.h - 1);
+        expect(t.glow.w).toBeGreaterThan(t.w);
+        expect(t.glow.pivot[0] - t.pivot[0]).toBe((t.glow.w - t.w) / 2);
+      }
+    }
+  });
+
+  test('the baked anchor lands on the structure', () => {
+    const parts = { base: { x: -40, y: -10, w: 80, h: 10 }, roof: { x: -30, y: -190, w: 60, h: 20 } };
+    expect(turretAnchor(parts, [0.5, 0])).toEqual({ x: 0, y: -190 });
+    expect(turretAnchor(parts, [0, 1])).toEqual({ x: -40, y: 0 });
+    for (const t of Object.values(TURRETS.sniper)) {
+      const a = turretAnchor(parts, t.anchor);
+      expect(a.y).toBeLessThan(-95);
+      expect(a.y).toBeGreaterThan(-190);
+      expect(Math.abs(a.x)).toBeLessThan(5);
+    }
+  });
+
+  test('turretFrame maps aim angles to the nearest cell', () => {
+    expect(turretFrame(0, 32)).toBe(0);
+    expect(turretFrame(Math.PI / 2, 32)).toBe(8);
+    expect(turretFrame(Math.PI, 32)).toBe(16);
+    expect(turretFrame(-Math.PI / 2, 32)).toBe(24);
+    expect(turretFrame(-0.01, 32)).toBe(0);
+    expect(turretFrame(2 * Math.PI - 0.05, 32)).toBe(0);
+    expect(turretFrame(2 * Math.PI / 32 * 0.6, 32)).toBe(1);
+  });
+});